@@ -0,0 +1,98 @@
+"""
+Benchmark: eager vs lazy syntax classification in syntax-aware search
+
+Compares the number of lines tokenized and the wall time of:
+- eager: every line classified with tokenization.is_syntax_match() before
+  matching (how syntax-aware search used to work)
+- lazy: search_files(syntax_aware=True), which lexes a file only when it has
+  a candidate hit and skips classification for syntax_mode="all"
+
+Usage: python benchmark_syntax_tokenization.py [path] [pattern]
+Without a path, a synthetic tree of Python files is generated.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from greaper.algorithms import tokenization
+from greaper import syntax
+from greaper.core import search_files
+from greaper.filewalker import get_files_to_search
+
+MODES = ["all", "comment", "string", "code"]
+
+def make_tree(root, n_files=300, n_lines=200):
+    for i in range(n_files):
+        body = []
+        for j in range(n_lines):
+            if j % 50 == 0:
+                body.append('"""\nDocstring block\n"""\n')
+            body.append(f"value_{j} = {j}  # hay\n")
+            # Only every tenth file contains the pattern
+            if i % 10 == 0 and j % 40 == 0:
+                body.append("# needle in a comment\nneedle = value_0\n")
+        with open(os.path.join(root, f"mod_{i:03d}.py"), "w", encoding="utf-8") as f:
+            f.write("".join(body))
+
+class CallCounter:
+    """Wrap a function and count how many times it is called."""
+
+    def __init__(self, owner, name):
+        self.owner = owner
+        self.name = name
+        self.original = getattr(owner, name)
+        self.calls = 0
+
+    def __enter__(self):
+        original = self.original
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return original(*args, **kwargs)
+        setattr(self.owner, self.name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        setattr(self.owner, self.name, self.original)
+
+def eager_search(pattern, path, mode):
+    """Baseline: classify every line, then match."""
+    results = []
+    for file in get_files_to_search(path):
+        if isinstance(file, tuple):
+            continue
+        with open(file, encoding="utf-8", errors="ignore") as f:
+            for i, line in enumerate(f):
+                if tokenization.is_syntax_match(line, mode) and pattern in line:
+                    results.append((str(file), i + 1))
+    return results
+
+def run(path, pattern):
+    print(f"{'mode':<8} {'eager lines':>12} {'lazy lines':>11} {'eager s':>9} {'lazy s':>8} {'hits':>6}")
+    for mode in MODES:
+        with CallCounter(tokenization, "tokenize_line") as eager_calls:
+            start = time.perf_counter()
+            expected = eager_search(pattern, path, mode)
+            eager_time = time.perf_counter() - start
+        syntax._FILE_CACHE.clear()  # measure each mode from a cold cache
+        with CallCounter(syntax.Lexer, "feed") as lazy_calls:
+            start = time.perf_counter()
+            hits = search_files(pattern, path=path, syntax_aware=True, syntax_mode=mode, max_results=10**9)
+            lazy_time = time.perf_counter() - start
+        if mode == "all":
+            assert len(hits) == len(expected), "lazy and eager searches disagree"
+        print(
+            f"{mode:<8} {eager_calls.calls:>12} {lazy_calls.calls:>11} "
+            f"{eager_time:>9.3f} {lazy_time:>8.3f} {len(hits):>6}"
+        )
+
+if __name__ == "__main__":
+    pattern = sys.argv[2] if len(sys.argv) > 2 else "needle"
+    if len(sys.argv) > 1:
+        run(sys.argv[1], pattern)
+    else:
+        with tempfile.TemporaryDirectory() as root:
+            make_tree(root)
+            run(root, pattern)
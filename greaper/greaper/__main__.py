@@ -0,0 +1,5 @@
+import sys
+
+from greaper.cli import main
+
+sys.exit(main())
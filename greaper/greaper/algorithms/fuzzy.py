@@ -1,22 +1,23 @@
 try:
-    from greaper.cython_ext.fuzzy_cython import levenshtein, similarity_ratio, fuzzy_search
+    from greaper.cython_ext.fuzzy_cython import (
+        levenshtein, similarity_ratio, fuzzy_search, bounded_levenshtein, fuzzy_score_block, best_window,
+    )
+    CYTHON_FUZZY = True
 except ImportError:
+    CYTHON_FUZZY = False
+
     # Fallback to pure Python implementations
     def levenshtein(s1, s2):
-        if len(s1) < len(s2):
-            return levenshtein(s2, s1)
-        if len(s2) == 0:
-            return len(s1)
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1]
+        return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))
+
+    def bounded_levenshtein(s1, s2, max_distance):
+        """
+        Levenshtein distance between s1 and s2, or max_distance + 1 as soon as
+        it is known to exceed max_distance.
+        """
+        if len(s1) > len(s2):
+            s1, s2 = s2, s1
+        return _myers_distance(pattern_masks(s1), len(s1), s2, max_distance)
 
     def similarity_ratio(s1, s2):
         if not s1 and not s2:
@@ -26,13 +27,285 @@ except ImportError:
         return 1.0 - distance / max_len if max_len else 1.0
 
     def fuzzy_search(pattern, lines, threshold=0.7, context=0, max_results=1000):
+        matcher = FuzzyMatcher(pattern, threshold, strict=False)
         results = []
         for i, line in enumerate(lines):
-            score = similarity_ratio(pattern, line)
-            if score >= threshold:
+            score = matcher.score(line)
+            if score is not None:
                 before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
                 after = [lines[j].strip() for j in range(i+1, min(len(lines), i+1+context))] if context else []
                 results.append((i+1, line.strip(), before, after, score))
                 if len(results) >= max_results:
                     break
-        return results
\ No newline at end of file
+        return results
+
+    def fuzzy_score_block(pattern, lines, threshold=0.0, strict=False, parallel=False):
+        """
+        Score every line against pattern; lines that cannot pass threshold get -1.0.
+        Returns a list here (the Cython version returns a NumPy array); parallel is ignored.
+        """
+        matcher = FuzzyMatcher(pattern, threshold, strict=strict)
+        scores = []
+        for line in lines:
+            score = matcher.score(line)
+            scores.append(-1.0 if score is None else score)
+        return scores
+
+    def best_window(pattern, text, max_distance):
+        """
+        Best approximate occurrence of pattern inside text (semi-global alignment).
+        Returns (distance, start, end) for the leftmost, shortest window within
+        max_distance edits, or None.
+        """
+        m = len(pattern)
+        if m == 0 or m - max_distance > len(text):
+            return None
+        found = _myers_window_end(pattern_masks(pattern), m, text, max_distance)
+        if found is None:
+            return None
+        distance, end = found
+        # Align the reversed pattern backwards from end to find where the window starts
+        start = end - _myers_window_end(pattern_masks(pattern[::-1]), m, text[end - 1::-1], distance, first=True)[1]
+        return distance, start, end
+
+# Files with more lines than this are scored on several cores by fuzzy_score_block()
+PARALLEL_BLOCK_LINES = 100_000
+
+def pattern_masks(pattern):
+    """Map each character of pattern to the bitmask of its positions (Myers' Peq table)."""
+    masks = {}
+    bit = 1
+    for ch in pattern:
+        masks[ch] = masks.get(ch, 0) | bit
+        bit <<= 1
+    return masks
+
+def _myers_distance(masks, m, text, max_distance):
+    """
+    Global edit distance between a pattern (given as pattern_masks() and its
+    length m) and text, using Hyyrö's bit-parallel form of Myers' algorithm:
+    one column of the DP matrix per text character, held in two bit vectors.
+    Returns max_distance + 1 once the distance cannot stay within max_distance.
+    """
+    n = len(text)
+    if abs(n - m) > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    mask = (1 << m) - 1
+    top = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    score = m
+    remaining = n
+    get = masks.get
+    for ch in text:
+        eq = get(ch, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & mask)
+        mh = vp & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        remaining -= 1
+        # Each remaining character lowers the last row by at most one
+        if score - remaining > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (~(xv | ph) & mask)
+        vn = ph & xv
+    return score if score <= max_distance else max_distance + 1
+
+def _myers_window_end(masks, m, text, max_distance, first=False):
+    """
+    Semi-global variant of _myers_distance(): the pattern may start anywhere
+    in text. Returns (distance, end) for the smallest distance within
+    max_distance and the first end offset reaching it (or, with first=True,
+    the first end offset within max_distance at all), else None.
+    """
+    mask = (1 << m) - 1
+    top = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    score = m
+    best = max_distance + 1
+    best_end = -1
+    get = masks.get
+    for j, ch in enumerate(text):
+        eq = get(ch, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & mask)
+        mh = vp & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        if score < best:
+            best = score
+            best_end = j + 1
+            if first or score == 0:
+                break
+        # Row 0 stays 0: a match may start at any column
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (~(xv | ph) & mask)
+        vn = ph & xv
+    if best_end < 0:
+        return None
+    return best, best_end
+
+def _pieces_present(pattern, text, max_distance):
+    """
+    Pigeonhole filter: with at most max_distance edits, one of max_distance + 1
+    disjoint pieces of pattern must occur verbatim in text.
+    """
+    n_pieces = max_distance + 1
+    m = len(pattern)
+    if n_pieces > m:
+        return True
+    size, extra = divmod(m, n_pieces)
+    pos = 0
+    for i in range(n_pieces):
+        end = pos + size + (1 if i < extra else 0)
+        if pattern[pos:end] in text:
+            return True
+        pos = end
+    return False
+
+def max_distance_for(threshold, length, strict=True):
+    """
+    Largest edit distance d for which 1 - d / length still passes threshold
+    (> threshold if strict, else >=). Returns -1 if no distance passes.
+    """
+    if length == 0:
+        return 0
+    d = min(length, int((1.0 - threshold) * length) + 1)
+    while d >= 0:
+        ratio = 1.0 - d / length
+        if ratio > threshold or (not strict and ratio >= threshold):
+            return d
+        d -= 1
+    return -1
+
+class FuzzyMatcher:
+    """
+    similarity_ratio(pattern, line) against a threshold, prepared once per pattern.
+    Lines whose length difference alone rules out the threshold are rejected
+    without any DP, and the distance computation stops as soon as the
+    threshold is out of reach.
+
+    With window=True the pattern is instead matched against its best
+    substring of the line (see window()), scored as 1 - distance / len(pattern).
+    """
+
+    __slots__ = ("pattern", "threshold", "strict", "window_mode", "_masks", "_m", "_window_distance")
+
+    def __init__(self, pattern, threshold=0.7, strict=True, window=False):
+        self.pattern = pattern
+        self.threshold = threshold
+        self.strict = strict
+        self.window_mode = window
+        self._m = len(pattern)
+        self._masks = None if CYTHON_FUZZY else pattern_masks(pattern)
+        self._window_distance = max_distance_for(threshold, self._m, strict)
+
+    def __reduce__(self):
+        return FuzzyMatcher, (self.pattern, self.threshold, self.strict, self.window_mode)
+
+    def window(self, line):
+        """
+        Return (score, start, end) for the best-matching window of line, or None
+        if no window passes the threshold. start and end are offsets into line.
+        """
+        if self._m == 0 or self._window_distance < 0:
+            return None
+        if not _pieces_present(self.pattern, line, self._window_distance):
+            return None
+        found = best_window(self.pattern, line, self._window_distance)
+        if found is None:
+            return None
+        distance, start, end = found
+        return 1.0 - distance / self._m, start, end
+
+    def score(self, line):
+        """Return similarity_ratio(pattern, line) if it passes the threshold, else None."""
+        if self.window_mode:
+            found = self.window(line)
+            return None if found is None else found[0]
+        m = self._m
+        n = len(line)
+        length = m if m > n else n
+        if length == 0:
+            passed = 1.0 > self.threshold or (not self.strict and 1.0 >= self.threshold)
+            return 1.0 if passed else None
+        max_distance = max_distance_for(self.threshold, length, self.strict)
+        if max_distance < 0 or abs(n - m) > max_distance:
+            return None
+        if self._masks is None:
+            distance = bounded_levenshtein(self.pattern, line, max_distance)
+        else:
+            distance = _myers_distance(self._masks, m, line, max_distance)
+        if distance > max_distance:
+            return None
+        return 1.0 - distance / length
+
+    def matches(self, line):
+        return self.score(line) is not None
+
+    def span(self, line):
+        """(start, end) of the matched text: the best window, or the whole line without its newline."""
+        if self.window_mode:
+            found = self.window(line)
+            if found is not None:
+                return found[1], found[2]
+        return 0, len(line.rstrip("\r\n"))
+
+    def iter_matches(self, lines):
+        """
+        Yield (index, score) for the lines that pass the threshold.
+        With the Cython extension the whole list is scored in one
+        fuzzy_score_block() call; otherwise lines are scored lazily.
+        """
+        if not CYTHON_FUZZY or self.window_mode:
+            for i, line in enumerate(lines):
+                score = self.score(line)
+                if score is not None:
+                    yield i, score
+            return
+        if not isinstance(lines, list):
+            lines = list(lines)
+        scores = fuzzy_score_block(
+            self.pattern, lines, self.threshold, self.strict,
+            parallel=len(lines) > PARALLEL_BLOCK_LINES,
+        )
+        threshold = self.threshold
+        for i in range(len(lines)):
+            score = scores[i]
+            if score > threshold or (not self.strict and score >= threshold):
+                yield i, float(score)
+
+
+def fuzzy_search_window(pattern, lines, threshold=0.7, context=0, max_results=1000):
+    """
+    Best-window fuzzy search: like fuzzy_search(), but pattern is matched
+    against its best substring of each line rather than the whole line.
+    Returns (line_number, line, context_before, context_after, score, start, end)
+    where start:end is the matched window within the unstripped line.
+    """
+    matcher = FuzzyMatcher(pattern, threshold, strict=False, window=True)
+    results = []
+    for i, line in enumerate(lines):
+        found = matcher.window(line)
+        if found is None:
+            continue
+        score, start, end = found
+        before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
+        after = [lines[j].strip() for j in range(i+1, min(len(lines), i+1+context))] if context else []
+        results.append((i+1, line.strip(), before, after, score, start, end))
+        if len(results) >= max_results:
+            break
+    return results
@@ -1,15 +1,265 @@
 import re
+from functools import lru_cache
 
-def regex_search(pattern, lines, ignore_case=False, regex=False, word=False):
-    flags = re.IGNORECASE if ignore_case else 0
+try:
+    import re2  # optional: linear-time engine (pip install google-re2)
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # optional: multi-literal automaton (pip install pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+# Number of distinct queries kept compiled by compile_query()
+QUERY_CACHE_SIZE = 128
+
+def _source(pattern, regex, word):
+    """The re syntax for one pattern."""
     if regex:
-        compiled = re.compile(pattern, flags)
-    elif word:
-        compiled = re.compile(rf"\b{re.escape(pattern)}\b", flags)
+        return pattern
+    if word:
+        return rf"\b{re.escape(pattern)}\b"
+    return re.escape(pattern)
+
+def _bytes_source(pattern, word):
+    """
+    The bytes re syntax for one plain pattern, searched in raw UTF-8.
+    bytes \\b only knows ASCII word characters, so a word pattern only gets
+    it at an end whose character is ASCII; the hits are a superset of the
+    decoded matches and are confirmed on the decoded line.
+    """
+    literal = re.escape(pattern.encode("utf-8"))
+    if not word:
+        return literal
+    head = rb"\b" if pattern[:1].isascii() else b""
+    tail = rb"\b" if pattern[-1:].isascii() else b""
+    return head + literal + tail
+
+class Query:
+    """
+    A search pattern compiled once for the whole pipeline.
+    Picks the fastest engine for the pattern:
+    - "find": case-sensitive plain literal, matched with str.find / bytes.find
+    - "re2": regex accepted by the optional re2 backend
+    - "re": Python's re for everything else
+    """
+
+    __slots__ = ("pattern", "regex", "word", "ignore_case", "engine", "compiled", "literal", "_bytes_finder")
+
+    def __init__(self, pattern, regex=False, word=False, ignore_case=False):
+        self.pattern = pattern
+        self.regex = regex
+        self.word = word
+        self.ignore_case = ignore_case
+        self.literal = not regex and not word
+        flags = re.IGNORECASE if ignore_case else 0
+        source = _source(pattern, regex, word)
+        self._bytes_finder = False  # computed on first use
+        self.engine = "re"
+        self.compiled = None
+        if self.literal and not ignore_case and pattern:
+            self.engine = "find"
+        elif regex and re2 is not None:
+            try:
+                self.compiled = re2.compile(f"(?i){source}" if ignore_case else source)
+                self.engine = "re2"
+            except Exception:
+                pass  # unsupported syntax (backreferences, lookaround): use re
+        if self.compiled is None:
+            self.compiled = re.compile(source, flags)
+
+    def __reduce__(self):
+        # Compiled re2 objects do not pickle; recompile in worker processes
+        return compile_query, (self.pattern, self.regex, self.word, self.ignore_case)
+
+    def __repr__(self):
+        return f"Query({self.pattern!r}, engine={self.engine!r})"
+
+    def search(self, line):
+        """Return True if the pattern occurs in line."""
+        if self.engine == "find":
+            return self.pattern in line
+        return self.compiled.search(line) is not None
+
+    def span(self, line):
+        """Return the (start, end) of the first match in line, or (0, 0) if there is none."""
+        if self.engine == "find":
+            start = line.find(self.pattern)
+            return (0, 0) if start < 0 else (start, start + len(self.pattern))
+        m = self.compiled.search(line)
+        return (0, 0) if m is None else m.span()
+
+    def bytes_finder(self):
+        """
+        Return (find, verify) for scanning raw UTF-8 bytes, or None when the
+        pattern needs the line-by-line path. find(buf, pos) returns the
+        (start, end) of the next hit or None; verify re-checks a decoded line
+        (or is None).
+        """
+        if self._bytes_finder is False:
+            self._bytes_finder = self._make_bytes_finder()
+        return self._bytes_finder
+
+    def _make_bytes_finder(self):
+        pattern = self.pattern
+        if self.regex or not pattern or "\n" in pattern:
+            return None
+        # bytes regexes only fold ASCII case ('k' would miss the Kelvin sign): search decoded lines
+        if self.ignore_case:
+            return None
+        if self.engine == "find":
+            needle = pattern.encode("utf-8")
+            size = len(needle)
+
+            def find(buf, pos):
+                start = buf.find(needle, pos)
+                return None if start < 0 else (start, start + size)
+            return find, None
+        # bytes \b only knows ASCII word characters; confirm hits on the decoded line
+        verify = self.compiled.search if self.word else None
+        search = re.compile(_bytes_source(pattern, self.word)).search
+
+        def find(buf, pos):
+            m = search(buf, pos)
+            return None if m is None else m.span()
+        return find, verify
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_query(pattern, regex, word, ignore_case):
+    return Query(pattern, regex=regex, word=word, ignore_case=ignore_case)
+
+def compile_query(pattern, regex=False, word=False, ignore_case=False):
+    """Return the cached Query for these options, compiling it on first use."""
+    return _cached_query(pattern, bool(regex), bool(word), bool(ignore_case))
+
+class MultiQuery:
+    """
+    Several patterns searched in one pass over each line. Lines are found
+    with one combined matcher: an Aho-Corasick automaton for case-sensitive
+    literals when pyahocorasick is installed, otherwise a single regex
+    alternation. which(line) then names the patterns that hit the line.
+    """
+
+    __slots__ = (
+        "patterns", "regex", "word", "ignore_case", "engine", "compiled",
+        "_queries", "_automaton", "_bytes_finder",
+    )
+
+    def __init__(self, patterns, regex=False, word=False, ignore_case=False):
+        self.patterns = tuple(patterns)
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("patterns must be a non-empty list of non-empty patterns")
+        self.regex = regex
+        self.word = word
+        self.ignore_case = ignore_case
+        self._queries = [compile_query(p, regex=regex, word=word, ignore_case=ignore_case) for p in self.patterns]
+        self._automaton = None
+        self._bytes_finder = False  # computed on first use
+        # Longest literals first so a prefix does not shadow a longer pattern
+        order = self.patterns if regex else sorted(self.patterns, key=len, reverse=True)
+        try:
+            self.compiled = re.compile(
+                "|".join(f"(?:{_source(p, regex, word)})" for p in order),
+                re.IGNORECASE if ignore_case else 0,
+            )
+            self.engine = "re"
+        except re.error:
+            # e.g. global inline flags inside one pattern: test each pattern
+            self.compiled = None
+            self.engine = "each"
+        if not regex and not word and not ignore_case and ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for i, pattern in enumerate(self.patterns):
+                automaton.add_word(pattern, i)
+            automaton.make_automaton()
+            self._automaton = automaton
+            self.engine = "aho-corasick"
+
+    def __reduce__(self):
+        return compile_multi_query, (self.patterns, self.regex, self.word, self.ignore_case)
+
+    def __repr__(self):
+        return f"MultiQuery({len(self.patterns)} patterns, engine={self.engine!r})"
+
+    @property
+    def pattern(self):
+        return self.patterns[0]
+
+    def search(self, line):
+        """Return True if any pattern occurs in line."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(line), None) is not None
+        if self.compiled is None:
+            return any(q.search(line) for q in self._queries)
+        return self.compiled.search(line) is not None
+
+    def which(self, line):
+        """Return the patterns occurring in line, in the order they were given."""
+        if self._automaton is not None:
+            found = {i for _, i in self._automaton.iter(line)}
+            return tuple(p for i, p in enumerate(self.patterns) if i in found)
+        return tuple(q.pattern for q in self._queries if q.search(line))
+
+    def span(self, line):
+        """Return the (start, end) of the leftmost match of any pattern, or (0, 0)."""
+        if self._automaton is not None:
+            best = None
+            for end, i in self._automaton.iter(line):
+                start = end + 1 - len(self.patterns[i])
+                if best is None or start < best[0]:
+                    best = (start, end + 1)
+            return best or (0, 0)
+        if self.compiled is None:
+            spans = [q.span(line) for q in self._queries if q.search(line)]
+            return min(spans) if spans else (0, 0)
+        m = self.compiled.search(line)
+        return (0, 0) if m is None else m.span()
+
+    def bytes_finder(self):
+        """Like Query.bytes_finder(), for the combined literal patterns."""
+        if self._bytes_finder is False:
+            self._bytes_finder = self._make_bytes_finder()
+        return self._bytes_finder
+
+    def _make_bytes_finder(self):
+        if self.regex or any("\n" in p for p in self.patterns):
+            return None
+        # bytes regexes only fold ASCII case: search decoded lines
+        if self.ignore_case:
+            return None
+        order = sorted(self.patterns, key=len, reverse=True)
+        body = b"|".join(_bytes_source(p, self.word) for p in order)
+        # bytes \b only knows ASCII word characters; confirm hits on the decoded line
+        verify = self.compiled.search if self.word else None
+        search = re.compile(body).search
+
+        def find(buf, pos):
+            m = search(buf, pos)
+            return None if m is None else m.span()
+        return find, verify
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_multi_query(patterns, regex, word, ignore_case):
+    return MultiQuery(patterns, regex=regex, word=word, ignore_case=ignore_case)
+
+def compile_multi_query(patterns, regex=False, word=False, ignore_case=False):
+    """Return the cached MultiQuery for these patterns and options."""
+    return _cached_multi_query(tuple(patterns), bool(regex), bool(word), bool(ignore_case))
+
+def regex_search(pattern, lines, ignore_case=False, regex=False, word=False):
+    """
+    Return (index, line) for each line containing the pattern.
+    pattern may be a string or an already compiled Query or MultiQuery.
+    """
+    if isinstance(pattern, MultiQuery):
+        return [(i, line) for i, line in enumerate(lines) if pattern.search(line)]
+    if isinstance(pattern, Query):
+        query = pattern
     else:
-        compiled = re.compile(re.escape(pattern), flags)
-    results = []
-    for i, line in enumerate(lines):
-        if compiled.search(line):
-            results.append((i, line))
-    return results
\ No newline at end of file
+        query = compile_query(pattern, regex=regex, word=word, ignore_case=ignore_case)
+    if query.engine == "find":
+        needle = query.pattern
+        return [(i, line) for i, line in enumerate(lines) if needle in line]
+    search = query.compiled.search
+    return [(i, line) for i, line in enumerate(lines) if search(line)]
@@ -0,0 +1,61 @@
+import re
+from functools import lru_cache
+
+try:
+    from greaper.cython_ext.replace_cython import batch_replace
+    CYTHON_REPLACE = True
+except ImportError:
+    CYTHON_REPLACE = False
+
+    # Fallback to a pure Python implementation
+    def batch_replace(
+        lines,
+        pattern,
+        replacement,
+        regex=False,
+        ignore_case=False,
+        word=False,
+        max_replacements=0,
+        syntax_aware=False,
+        syntax_mode="all",
+    ):
+        """
+        Batch replace occurrences of pattern in lines, like the Cython version.
+        replacement is inserted as is, unless regex is set: then it is an re
+        replacement string (backslash escapes and group references are
+        expanded). max_replacements=0 means no limit.
+        Returns a list of replaced lines.
+        """
+        compiled = _compile_replace(pattern, regex, word, ignore_case)
+        # Literal replacements: escape backslashes so re does not expand them
+        template = replacement if regex else replacement.replace("\\", r"\\")
+        # Plain case-sensitive literals: skip lines without the text before running re
+        needle = pattern if not (regex or word or ignore_case) else None
+        keep = None
+        if syntax_aware and syntax_mode != "all":
+            from greaper.syntax import classify_lines, kind_matches
+            kinds = classify_lines(lines)
+            keep = lambda i: kind_matches(kinds[i], syntax_mode)
+        replaced_lines = []
+        remaining = max_replacements
+        for i, line in enumerate(lines):
+            if (needle is not None and needle not in line) or (keep is not None and not keep(i)):
+                replaced_lines.append(line)
+                continue
+            new_line, n = compiled.subn(template, line, count=remaining if max_replacements else 0)
+            replaced_lines.append(new_line)
+            if max_replacements:
+                remaining -= n
+                if remaining <= 0:
+                    replaced_lines.extend(lines[i + 1:])
+                    break
+        return replaced_lines
+
+@lru_cache(maxsize=128)
+def _compile_replace(pattern, regex, word, ignore_case):
+    flags = re.IGNORECASE if ignore_case else 0
+    if regex:
+        return re.compile(pattern, flags)
+    if word:
+        return re.compile(rf"\b{re.escape(pattern)}\b", flags)
+    return re.compile(re.escape(pattern), flags)
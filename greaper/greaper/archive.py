@@ -3,10 +3,16 @@ import tarfile
 import gzip
 import bz2
 import lzma
-import rarfile  # pip install rarfile
-import py7zr    # pip install py7zr
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 import io
+import os
+import queue
+import tempfile
+import threading
 
 # Add more extensions as needed
 ARCHIVE_EXTENSIONS = {
@@ -14,6 +20,32 @@ ARCHIVE_EXTENSIONS = {
     ".whl", ".egg", ".jar", ".nupkg", ".tar.gz", ".tar.bz2", ".tar.xz"
 }
 
+# How deep archives inside archives are expanded
+MAX_NESTED_DEPTH = 3
+# Number of archive listings kept by list_archive_files()
+LISTING_CACHE_SIZE = 256
+# Nested archives larger than this are spilled to a temporary file instead of memory
+SPOOL_THRESHOLD = 16 * 1024 * 1024
+# Members larger than this (uncompressed) are not loaded for searching
+MAX_MEMBER_SIZE = 64 * 1024 * 1024
+# Total bytes one pass may decompress, nested archives included (zip bomb guard)
+MAX_UNCOMPRESSED_SIZE = 4 * 1024 * 1024 * 1024
+_COPY_BLOCK = 1024 * 1024
+
+class ArchiveLimitError(Exception):
+    """Raised when a pass over an archive exceeds its uncompressed size budget."""
+
+class _Budget:
+    """Uncompressed-byte allowance shared by a session and its nested sessions."""
+
+    def __init__(self, limit):
+        self.remaining = limit
+
+    def charge(self, n):
+        self.remaining -= n
+        if self.remaining < 0:
+            raise ArchiveLimitError("archive exceeds the uncompressed size limit")
+
 def is_archive(filename):
     ext = Path(filename).suffix.lower()
     # Support double extensions like .tar.gz
@@ -23,143 +55,536 @@ def is_archive(filename):
         any(name.endswith(e) for e in ARCHIVE_EXTENSIONS)
     )
 
-def list_archive_files(archive_path, _depth=0, _max_depth=3):
+def archive_kind(filename):
+    """Return the container format for an archive name: zip, tar, gz, bz2, xz, 7z, rar (or None)."""
+    name = str(filename).lower()
+    if name.endswith((".zip", ".whl", ".egg", ".jar", ".nupkg")):
+        return "zip"
+    if name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
+        return "tar"
+    if name.endswith(".gz"):
+        return "gz"
+    if name.endswith(".bz2"):
+        return "bz2"
+    if name.endswith((".xz", ".lzma")):
+        return "xz"
+    if name.endswith(".7z"):
+        return "7z"
+    if name.endswith(".rar"):
+        return "rar"
+    return None
+
+_STREAM_OPENERS = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+def _backend(name):
+    """Import an optional archive backend (py7zr, rarfile) the first time its format is opened."""
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError(f"{name} package not installed. Run 'pip install {name}'") from None
+
+class ArchiveSession:
     """
-    Returns a list of file names inside the archive.
-    Supports nested archives up to _max_depth.
+    An archive opened once for a whole pass over its members.
+
+    source is a path or a binary file object; name (defaults to the path)
+    selects the format. Members are visited in stream order, so compressed
+    tarballs and solid 7z archives are decompressed a single time. Archives
+    nested inside the archive are expanded up to max_depth, and their
+    members are named "outer_member::inner_member".
+
+    Memory stays bounded: nested archives are streamed into a temporary
+    file once they exceed spool_threshold, members above max_member_size
+    are skipped, and the whole pass stops with ArchiveLimitError after
+    max_uncompressed_size bytes.
     """
-    if _depth > _max_depth:
-        return []
-    archive_path = str(archive_path)
-    files = []
-    try:
-        if archive_path.endswith((".zip", ".whl", ".egg", ".jar", ".nupkg")):
-            with zipfile.ZipFile(archive_path) as z:
-                for f in z.namelist():
-                    if not f.endswith("/"):
-                        files.append(f)
-                        # Nested archive support
-                        if is_archive(f) and _depth < _max_depth:
-                            data = z.read(f)
-                            files.extend(
-                                [f"{f}::{inner}" for inner in list_archive_files(io.BytesIO(data), _depth+1, _max_depth)]
-                            )
-        elif archive_path.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
-            with tarfile.open(archive_path) as t:
-                for m in t.getmembers():
-                    if m.isfile():
-                        files.append(m.name)
-                        # Nested archive support
-                        if is_archive(m.name) and _depth < _max_depth:
-                            f = t.extractfile(m)
-                            if f:
-                                data = f.read()
-                                files.extend(
-                                    [f"{m.name}::{inner}" for inner in list_archive_files(io.BytesIO(data), _depth+1, _max_depth)]
-                                )
-        elif archive_path.endswith(".gz"):
-            with gzip.open(archive_path, "rb") as f:
-                # GZ usually contains a single file, decompress and check if it's an archive
-                data = f.read()
-                if is_archive(archive_path[:-3]):
-                    files.extend(list_archive_files(io.BytesIO(data), _depth+1, _max_depth))
-        elif archive_path.endswith(".bz2"):
-            with bz2.open(archive_path, "rb") as f:
-                data = f.read()
-                if is_archive(archive_path[:-4]):
-                    files.extend(list_archive_files(io.BytesIO(data), _depth+1, _max_depth))
-        elif archive_path.endswith(".xz") or archive_path.endswith(".lzma"):
-            with lzma.open(archive_path, "rb") as f:
-                data = f.read()
-                if is_archive(archive_path[:-3]):
-                    files.extend(list_archive_files(io.BytesIO(data), _depth+1, _max_depth))
-        elif archive_path.endswith(".7z"):
-            with py7zr.SevenZipFile(archive_path, mode='r') as z:
-                for name in z.getnames():
-                    files.append(name)
-                    # Nested archive support
-                    if is_archive(name) and _depth < _max_depth:
-                        data = z.read([name])[name].read()
-                        files.extend(
-                            [f"{name}::{inner}" for inner in list_archive_files(io.BytesIO(data), _depth+1, _max_depth)]
-                        )
-        elif archive_path.endswith(".rar"):
-            with rarfile.RarFile(archive_path) as r:
-                for info in r.infolist():
-                    files.append(info.filename)
-                    if is_archive(info.filename) and _depth < _max_depth:
-                        data = r.read(info)
-                        files.extend(
-                            [f"{info.filename}::{inner}" for inner in list_archive_files(io.BytesIO(data), _depth+1, _max_depth)]
-                        )
-        elif isinstance(archive_path, io.BytesIO):
-            # Try as zip, tar, 7z, etc.
+
+    def __init__(
+        self,
+        source,
+        name=None,
+        depth=0,
+        max_depth=MAX_NESTED_DEPTH,
+        spool_threshold=SPOOL_THRESHOLD,
+        max_member_size=MAX_MEMBER_SIZE,
+        max_uncompressed_size=MAX_UNCOMPRESSED_SIZE,
+        _budget=None,
+    ):
+        self.source = source
+        self.name = str(name if name is not None else source)
+        self.kind = archive_kind(self.name)
+        self.depth = depth
+        self.max_depth = max_depth
+        self.spool_threshold = spool_threshold
+        self.max_member_size = max_member_size
+        self.max_uncompressed_size = max_uncompressed_size
+        self._budget = _budget or _Budget(max_uncompressed_size)
+        self._handle = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self):
+        if self._handle is not None:
+            return self._handle
+        source = self.source
+        kind = self.kind
+        if kind == "zip":
+            self._handle = zipfile.ZipFile(source)
+        elif kind == "tar":
+            # Stream mode: members are read sequentially, never seeking back
+            if isinstance(source, (str, os.PathLike)):
+                self._handle = tarfile.open(name=source, mode="r|*")
+            else:
+                self._handle = tarfile.open(fileobj=source, mode="r|*")
+        elif kind in _STREAM_OPENERS:
+            self._handle = _STREAM_OPENERS[kind](source, "rb")
+        elif kind == "7z":
+            self._handle = _backend("py7zr").SevenZipFile(source, mode="r")
+        elif kind == "rar":
+            self._handle = _backend("rarfile").RarFile(source)
+        else:
+            raise ValueError(f"Unsupported archive: {self.name}")
+        return self._handle
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _stream_member_name(self):
+        # A .gz/.bz2/.xz file holds one stream named after the file minus its suffix
+        return Path(self.name).stem
+
+    def _iter_raw(self, select):
+        """
+        Yield (name, size, stream) for every file member in stream order.
+        stream is a readable file object when select(name) is true, else None;
+        it is only valid until the next member is requested. size is the
+        uncompressed size when the format records it, else None.
+        """
+        handle = self.open()
+        kind = self.kind
+        if kind == "zip":
+            for info in handle.infolist():
+                if info.is_dir():
+                    continue
+                if select(info.filename):
+                    with handle.open(info) as stream:
+                        yield info.filename, info.file_size, stream
+                else:
+                    yield info.filename, info.file_size, None
+        elif kind == "tar":
+            for member in handle:
+                if member.isfile():
+                    stream = handle.extractfile(member) if select(member.name) else None
+                    yield member.name, member.size, stream
+        elif kind in _STREAM_OPENERS:
+            name = self._stream_member_name()
+            yield name, None, handle if select(name) else None
+        elif kind == "7z":
+            infos = [info for info in handle.list() if not info.is_directory]
+            targets = [info.filename for info in infos if select(info.filename)]
+            if not targets:
+                for info in infos:
+                    yield info.filename, info.uncompressed, None
+                return
+            # Solid archives decompress in one pass; extract to disk rather than memory
+            wanted = set(targets)
+            self._budget.charge(sum(info.uncompressed or 0 for info in infos if info.filename in wanted))
+            with tempfile.TemporaryDirectory(prefix="greaper-7z-") as tmp:
+                handle.extract(path=tmp, targets=targets)
+                for info in infos:
+                    if info.filename not in wanted:
+                        yield info.filename, info.uncompressed, None
+                        continue
+                    try:
+                        stream = open(os.path.join(tmp, info.filename), "rb")
+                    except OSError:
+                        continue
+                    with stream:
+                        yield info.filename, info.uncompressed, stream
+        elif kind == "rar":
+            for info in handle.infolist():
+                is_dir = info.is_dir() if hasattr(info, "is_dir") else info.isdir()
+                if is_dir:
+                    continue
+                if select(info.filename):
+                    with handle.open(info) as stream:
+                        yield info.filename, info.file_size, stream
+                else:
+                    yield info.filename, info.file_size, None
+
+    def _read_member(self, stream, size):
+        """Read a member into memory, or return None if it exceeds max_member_size."""
+        if size is not None and size > self.max_member_size:
+            return None
+        data = stream.read(self.max_member_size + 1)
+        if self.kind != "7z":  # 7z targets are charged when extracted
+            self._budget.charge(len(data))
+        if len(data) > self.max_member_size:
+            return None
+        return data
+
+    def _spool(self, stream):
+        """Copy a nested archive into memory, spilling to a temporary file above spool_threshold."""
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold)
+        try:
+            while True:
+                block = stream.read(_COPY_BLOCK)
+                if not block:
+                    break
+                if self.kind != "7z":
+                    self._budget.charge(len(block))
+                spool.write(block)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    def _expands(self, name):
+        return self.depth < self.max_depth and is_archive(name)
+
+    def _nested(self, name, fileobj):
+        return ArchiveSession(
+            fileobj,
+            name=name,
+            depth=self.depth + 1,
+            max_depth=self.max_depth,
+            spool_threshold=self.spool_threshold,
+            max_member_size=self.max_member_size,
+            max_uncompressed_size=self.max_uncompressed_size,
+            _budget=self._budget,
+        )
+
+    def list_members(self):
+        """Return the names of all file members, expanding nested archives."""
+        names = []
+        for name, _size, stream in self._iter_raw(self._expands):
+            if stream is None:
+                names.append(name)
+                continue
             try:
-                with zipfile.ZipFile(archive_path) as z:
-                    for f in z.namelist():
-                        if not f.endswith("/"):
-                            files.append(f)
+                with self._spool(stream) as spool, self._nested(name, spool) as nested:
+                    names.extend(f"{name}::{inner}" for inner in nested.list_members())
+            except ArchiveLimitError:
+                raise
             except Exception:
+                continue
+        return names
+
+    def iter_members(self, wanted=None):
+        """
+        Yield (name, data) for members in stream order, expanding nested archives.
+        wanted restricts the pass to these names (as produced by list_members());
+        other members are skipped without being decompressed where the format allows.
+        Members larger than max_member_size are skipped.
+        """
+        if wanted is not None:
+            wanted = set(wanted)
+            nested_wanted = {}
+            for w in wanted:
+                if "::" in w:
+                    outer, inner = w.split("::", 1)
+                    nested_wanted.setdefault(outer, []).append(inner)
+
+        def select(name):
+            if wanted is None:
+                return True
+            return name in wanted or name in nested_wanted
+
+        for name, size, stream in self._iter_raw(select):
+            if stream is None:
+                continue
+            expand = self._expands(name) and (wanted is None or name in nested_wanted)
+            if expand and (wanted is None or name not in wanted):
+                try:
+                    with self._spool(stream) as spool, self._nested(name, spool) as nested:
+                        sub_wanted = None if wanted is None else nested_wanted[name]
+                        for inner, inner_data in nested.iter_members(sub_wanted):
+                            yield f"{name}::{inner}", inner_data
+                except ArchiveLimitError:
+                    raise
+                except Exception:
+                    continue
+                continue
+            data = self._read_member(stream, size)
+            if data is None:
+                continue
+            if wanted is None or name in wanted:
+                yield name, data
+            if expand:
                 try:
-                    archive_path.seek(0)
-                    with tarfile.open(fileobj=archive_path) as t:
-                        for m in t.getmembers():
-                            if m.isfile():
-                                files.append(m.name)
+                    with self._nested(name, io.BytesIO(data)) as nested:
+                        for inner, inner_data in nested.iter_members(nested_wanted[name]):
+                            yield f"{name}::{inner}", inner_data
+                except ArchiveLimitError:
+                    raise
                 except Exception:
-                    pass
-        # Add more formats as needed
+                    continue
+
+    def iter_texts(self, wanted=None):
+        """Like iter_members(), but yields (name, text) decoded as UTF-8."""
+        for name, data in self.iter_members(wanted):
+            yield name, data.decode("utf-8", errors="ignore")
+
+    def read(self, name):
+        """Return the bytes of one member; nested members use '::' separators."""
+        for member, data in self.iter_members([name]):
+            if member == name:
+                return data
+        raise KeyError(name)
+
+@lru_cache(maxsize=LISTING_CACHE_SIZE)
+def _cached_listing(archive_path, mtime_ns, size, max_depth):
+    try:
+        with ArchiveSession(archive_path, max_depth=max_depth) as session:
+            return tuple(session.list_members())
     except Exception:
-        pass
-    return files
+        return ()
+
+def list_archive_files(archive_path, max_depth=MAX_NESTED_DEPTH):
+    """
+    Returns a list of file names inside the archive.
+    Supports nested archives up to max_depth ("outer::inner" names).
+    Listings are cached per archive path, size and mtime.
+    """
+    archive_path = os.path.abspath(str(archive_path))
+    try:
+        st = os.stat(archive_path)
+    except OSError:
+        return []
+    return list(_cached_listing(archive_path, st.st_mtime_ns, st.st_size, max_depth))
+
+def iter_archive_texts(archive_path, wanted=None):
+    """
+    Open an archive once and yield (inner_path, text) for its members in stream order.
+    wanted restricts the pass to the given inner paths. Stops quietly on a damaged archive.
+    """
+    try:
+        with ArchiveSession(archive_path) as session:
+            yield from session.iter_texts(wanted)
+    except Exception:
+        return
 
 def extract_file_from_archive(archive_path, file_inside):
     """
     Returns the contents of a file inside the archive as a string.
     Supports nested archives using '::' as a separator.
     """
-    if "::" in file_inside:
-        first, rest = file_inside.split("::", 1)
-        data = extract_file_from_archive(archive_path, first)
-        return extract_file_from_archive(io.BytesIO(data.encode("utf-8")), rest)
-    archive_path = str(archive_path)
     try:
-        if archive_path.endswith((".zip", ".whl", ".egg", ".jar", ".nupkg")):
-            with zipfile.ZipFile(archive_path) as z:
-                return z.read(file_inside).decode("utf-8", errors="ignore")
-        elif archive_path.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
-            with tarfile.open(archive_path) as t:
-                f = t.extractfile(file_inside)
-                return f.read().decode("utf-8", errors="ignore") if f else ""
-        elif archive_path.endswith(".gz"):
-            with gzip.open(archive_path, "rb") as f:
-                return f.read().decode("utf-8", errors="ignore")
-        elif archive_path.endswith(".bz2"):
-            with bz2.open(archive_path, "rb") as f:
-                return f.read().decode("utf-8", errors="ignore")
-        elif archive_path.endswith(".xz") or archive_path.endswith(".lzma"):
-            with lzma.open(archive_path, "rb") as f:
-                return f.read().decode("utf-8", errors="ignore")
-        elif archive_path.endswith(".7z"):
-            with py7zr.SevenZipFile(archive_path, mode='r') as z:
-                return z.read([file_inside])[file_inside].read().decode("utf-8", errors="ignore")
-        elif archive_path.endswith(".rar"):
-            with rarfile.RarFile(archive_path) as r:
-                return r.read(file_inside).decode("utf-8", errors="ignore")
-        elif isinstance(archive_path, io.BytesIO):
-            # Try as zip, tar, 7z, etc.
-            try:
-                with zipfile.ZipFile(archive_path) as z:
-                    return z.read(file_inside).decode("utf-8", errors="ignore")
-            except Exception:
-                try:
-                    archive_path.seek(0)
-                    with tarfile.open(fileobj=archive_path) as t:
-                        f = t.extractfile(file_inside)
-                        return f.read().decode("utf-8", errors="ignore") if f else ""
-                except Exception:
-                    pass
-        # Add more formats as needed
+        with ArchiveSession(archive_path) as session:
+            return session.read(file_inside).decode("utf-8", errors="ignore")
     except Exception:
-        pass
-    return ""
\ No newline at end of file
+        return ""
+
+# --- Parallel decompression ---
+
+# Decoded member bytes allowed in flight between pool workers and the scanner
+MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+# Members per task when a zip archive is split across workers
+ZIP_SLICE_MEMBERS = 64
+# Items buffered per task before its worker waits for the scanner
+_TASK_QUEUE_SIZE = 8
+_DONE = object()
+
+class _MemoryGate:
+    """
+    Byte budget shared by all pool workers.
+    Work for the job the scanner is currently reading always passes, so the
+    pool can never stall waiting on a job that has not been consumed yet.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_use = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, n, job):
+        with self._cond:
+            while self.in_use and self.in_use + n > self.limit and not (job.front or job.cancelled):
+                self._cond.wait(0.1)
+            self.in_use += n
+
+    def release(self, n):
+        with self._cond:
+            self.in_use -= n
+            self._cond.notify_all()
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+class ArchiveJob:
+    """
+    Members of one archive being decompressed on pool workers.
+    Iterate it to receive (inner_path, text) in archive order.
+    """
+
+    def __init__(self, pool, archive_path, slices):
+        self.archive_path = archive_path
+        self.front = False
+        self.cancelled = False
+        self._pool = pool
+        self._slices = slices
+        self._queues = [queue.Queue(maxsize=_TASK_QUEUE_SIZE) for _ in slices]
+        self._futures = [pool._executor.submit(self._run, q, wanted) for q, wanted in zip(self._queues, slices)]
+
+    def _put(self, q, item):
+        while not self.cancelled:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, q, wanted):
+        gate = self._pool._gate
+        try:
+            with ArchiveSession(self.archive_path) as session:
+                for name, data in session.iter_members(wanted):
+                    if self.cancelled:
+                        return
+                    gate.acquire(len(data), self)
+                    if not self._put(q, (name, data)):
+                        gate.release(len(data))
+                        return
+        except Exception:
+            pass  # a damaged archive ends its members early, as in iter_archive_texts()
+        finally:
+            self._put(q, _DONE)
+
+    def __iter__(self):
+        self.front = True
+        self._pool._gate.wake()
+        try:
+            for q, wanted, future in zip(self._queues, self._slices, self._futures):
+                if future.cancel():
+                    # Every worker is busy with later archives; read this part here
+                    yield from iter_archive_texts(self.archive_path, wanted)
+                    continue
+                while True:
+                    item = q.get()
+                    if item is _DONE:
+                        break
+                    name, data = item
+                    self._pool._gate.release(len(data))
+                    yield name, data.decode("utf-8", errors="ignore")
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            # Return the budget held by items nobody will read
+            for q in self._queues:
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _DONE:
+                        self._pool._gate.release(len(item[1]))
+            self._pool._gate.wake()
+
+def _zip_slices(wanted, size):
+    """Split wanted zip members into runs of about size, keeping each nested archive in one run."""
+    slices = []
+    current = []
+    last_outer = None
+    for name in wanted:
+        outer = name.split("::", 1)[0]
+        if len(current) >= size and outer != last_outer:
+            slices.append(current)
+            current = []
+        current.append(name)
+        last_outer = outer
+    if current:
+        slices.append(current)
+    return slices
+
+class ArchivePool:
+    """
+    Worker threads that decompress archives ahead of the scanner.
+    Independent archives decompress concurrently, and zip members (which
+    are independently seekable) are split across workers. zlib, bz2 and
+    lzma release the GIL, so decompression overlaps with regex scanning.
+    Decoded data waiting to be scanned is bounded by max_inflight_bytes.
+    """
+
+    def __init__(self, workers=None, max_inflight_bytes=MAX_INFLIGHT_BYTES):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="greaper-archive")
+        self._gate = _MemoryGate(max_inflight_bytes)
+        self._jobs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, archive_path, wanted=None):
+        """Start decompressing an archive; returns an ArchiveJob yielding (inner_path, text)."""
+        if wanted is None:
+            wanted = list_archive_files(archive_path)
+        if archive_kind(archive_path) == "zip" and len(wanted) > ZIP_SLICE_MEMBERS:
+            slices = _zip_slices(wanted, max(ZIP_SLICE_MEMBERS, len(wanted) // self.workers + 1))
+        else:
+            slices = [wanted]
+        job = ArchiveJob(self, archive_path, slices)
+        self._jobs = [j for j in self._jobs if not j.cancelled]
+        self._jobs.append(job)
+        return job
+
+    def prefetch(self, units, max_pending=None, lookahead=256):
+        """
+        Yield (archive_path, item) units in order, submitting archives early.
+        A unit is (None, file) for a plain file or (archive_path, wanted) for
+        an archive; archive units come back as (archive_path, ArchiveJob).
+        Plain files are passed on as soon as they arrive. While archives are
+        pending, up to lookahead units (max_pending archives) are read ahead
+        so later archives decompress while earlier units are being scanned.
+        """
+        max_pending = max_pending or self.workers * 2
+        units = iter(units)
+        buffer = deque()
+        pending = 0
+
+        def pull():
+            nonlocal pending
+            unit = next(units, None)
+            if unit is None:
+                return False
+            archive_path, item = unit
+            if archive_path is not None:
+                item = self.submit(archive_path, item)
+                pending += 1
+            buffer.append((archive_path, item))
+            return True
+
+        exhausted = False
+        while True:
+            if not buffer and not exhausted:
+                exhausted = not pull()
+            # Reading ahead only pays off while an archive is decompressing
+            while pending and not exhausted and len(buffer) < lookahead and pending < max_pending:
+                exhausted = not pull()
+            if not buffer:
+                return
+            archive_path, item = buffer.popleft()
+            if archive_path is not None:
+                pending -= 1
+            yield archive_path, item
+
+    def close(self):
+        for job in self._jobs:
+            job.cancel()
+        self._jobs = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,17 +1,15 @@
 import argparse
 import sys
+from itertools import chain
 from pathlib import Path
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.text import Text
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# grep-compatible exit codes for the scripted commands
+EXIT_MATCH = 0
+EXIT_NO_MATCH = 1
+EXIT_ERROR = 2
 
 def print_backend_info():
-    """Print which fuzzy backend is being used."""
+    """Print which fuzzy backend is being used and the state of the result cache."""
     try:
         from greaper.algorithms import fuzzy
         backend = getattr(fuzzy.levenshtein, "__module__", "")
@@ -21,42 +19,84 @@ def print_backend_info():
             print("[INFO] Using pure Python fuzzy backend.")
     except Exception as e:
         print(f"[ERROR] Could not determine fuzzy backend: {e}")
+    print_cache_info()
+
+def print_cache_info():
+    """Print result cache hits, misses and size against its budget."""
+    try:
+        from greaper.resultcache import get_result_cache
+        info = get_result_cache().stats()
+        print(
+            f"[INFO] Result cache: {info['hits']} hit(s), {info['misses']} miss(es), "
+            f"{info['entries']} entries, {info['mb']:.1f}/{info['budget_mb']:.0f} MB."
+        )
+    except Exception as e:
+        print(f"[ERROR] Could not read the result cache: {e}")
 
 def print_results(results, color=True, context=0):
-    """Print search results in a table or plain text."""
-    if not results:
+    """
+    Print search results in a table or plain text.
+    Accepts any iterable (e.g. iter_search_files()) and prints rows as they arrive.
+    Returns the number of results printed.
+    """
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
         print("No matches found.")
-        return
+        return 0
+    results = chain([first], results)
+    count = 0
+    # Multi-pattern searches add the patterns that hit each line
+    multi = len(first) > 5
 
-    if RICH_AVAILABLE and color:
+    if color:
+        # rich is only imported when a table is actually printed
+        try:
+            from rich.console import Console
+            from rich.live import Live
+            from rich.table import Table
+        except ImportError:
+            color = False
+    if color:
         console = Console()
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("File", style="cyan")
         table.add_column("Line", style="yellow")
         table.add_column("Match", style="white")
+        if multi:
+            table.add_column("Patterns", style="green")
         if context > 0:
             table.add_column("Context Before", style="dim")
             table.add_column("Context After", style="dim")
 
-        for file, line, match, before, after in results:
-            before_text = "\n".join(before) if context > 0 else ""
-            after_text = "\n".join(after) if context > 0 else ""
-            if context > 0:
-                table.add_row(str(file), str(line), match, before_text, after_text)
-            else:
-                table.add_row(str(file), str(line), match)
-        console.print(table)
-        console.print(f"[bold green]{len(results)} match(es) found.[/bold green]")
+        with Live(table, console=console, vertical_overflow="visible"):
+            for file, line, match, before, after, *hit in results:
+                row = [str(file), str(line), match]
+                if multi:
+                    row.append(", ".join(hit[0]))
+                if context > 0:
+                    row += ["\n".join(before), "\n".join(after)]
+                table.add_row(*row)
+                count += 1
+        console.print(f"[bold green]{count} match(es) found.[/bold green]")
     else:
-        for file, line, match, before, after in results:
+        for file, line, match, before, after, *hit in results:
             if context > 0:
-                for b in before:
-                    print(f"{file}:{line-context+before.index(b)}- {b}")
-            print(f"{file}:{line}: {match}")
+                for k, b in enumerate(before):
+                    print(f"{file}:{line-len(before)+k}- {b}")
+            tag = f" [{', '.join(hit[0])}]" if hit else ""
+            print(f"{file}:{line}: {match}{tag}", flush=True)
             if context > 0:
-                for a in after:
-                    print(f"{file}:{line+after.index(a)+1}+ {a}")
-        print(f"{len(results)} match(es) found.")
+                for k, a in enumerate(after):
+                    print(f"{file}:{line+k+1}+ {a}")
+            count += 1
+        print(f"{count} match(es) found.")
+    return count
+
+def read_patterns_file(path):
+    """Read one pattern per line, skipping blank lines."""
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\r\n") for line in f if line.strip()]
 
 def prompt_option(name, current, example=None, opt_type=str):
     """Prompt the user for an option, with type conversion and default fallback."""
@@ -110,6 +150,7 @@ def search_command(args):
     print("\nSearch options:")
     options = [
         ("fuzzy", args.fuzzy, "Use fuzzy search (y/n)", bool),
+        ("fuzzy_mode", getattr(args, "fuzzy_mode", "line"), "Fuzzy mode (line = whole line, window = best substring)", str),
         ("ignore_case", args.ignore_case, "Case-insensitive search (y/n)", bool),
         ("word", args.word, "Match whole words only (y/n)", bool),
         ("context", args.context, "Show N lines of context", int),
@@ -118,6 +159,9 @@ def search_command(args):
         ("include", args.include, "Glob patterns to include (e.g. *.py *.md, space-separated)", list),
         ("exclude", args.exclude, "Glob patterns to exclude (e.g. *.log *.tmp, space-separated)", list),
         ("max_results", args.max_results, "Maximum number of results", int),
+        ("patterns_file", getattr(args, "patterns_file", ""), "File with more patterns to search in the same pass, one per line (optional)", str),
+        ("jobs", getattr(args, "jobs", 1), "Worker processes (1 = serial, 0 = all cores)", int),
+        ("index", getattr(args, "index", False), "Use the trigram index if one was built (y/n)", bool),
         ("no_color", args.no_color, "Disable color output (y/n)", bool),
         ("tui", args.tui if hasattr(args, "tui") else False, "Launch the Textual TUI interface (y/n)", bool),
     ]
@@ -129,7 +173,7 @@ def search_command(args):
     print("\nReady to search with these settings:")
     print(f"  Pattern:      {pattern}")
     print(f"  Path:         {path}")
-    print(f"  Fuzzy:        {'ON' if args.fuzzy else 'OFF'}")
+    print(f"  Fuzzy:        {f'ON ({args.fuzzy_mode})' if args.fuzzy else 'OFF'}")
     print(f"  Ignore case:  {'ON' if args.ignore_case else 'OFF'}")
     print(f"  Whole word:   {'ON' if args.word else 'OFF'}")
     print(f"  Context:      {args.context}")
@@ -138,6 +182,10 @@ def search_command(args):
     print(f"  Include:      {' '.join(args.include)}")
     print(f"  Exclude:      {' '.join(args.exclude)}")
     print(f"  Max results:  {args.max_results}")
+    if args.patterns_file:
+        print(f"  Patterns:     {args.patterns_file}")
+    print(f"  Jobs:         {args.jobs if args.jobs else 'all cores'}")
+    print(f"  Index:        {'ON' if args.index else 'OFF'}")
     print(f"  Color:        {'OFF' if args.no_color else 'ON'}")
     print(f"  TUI:          {'ON' if args.tui else 'OFF'}")
     print("\nProceed? (Y/n, or type 'back' to edit options, 'exit' to quit)")
@@ -159,11 +207,14 @@ def search_command(args):
 
     print(f"\n[CLI] Searching for '{pattern}' in '{path}' ...")
     try:
-        from greaper.core import search_files
-        results = search_files(
+        from greaper.core import iter_search_files
+        stats = {}
+        patterns = read_patterns_file(args.patterns_file) if args.patterns_file else None
+        results = iter_search_files(
             pattern=pattern,
             path=path,
             fuzzy=args.fuzzy,
+            fuzzy_mode=args.fuzzy_mode,
             ignore_case=args.ignore_case,
             word=args.word,
             context=args.context,
@@ -172,21 +223,66 @@ def search_command(args):
             max_results=args.max_results,
             syntax_aware=args.syntax_aware,
             syntax_mode=args.syntax_mode,
+            jobs=args.jobs,
+            index=args.index,
+            stats=stats,
+            patterns=patterns,
+            result_cache=True,
         )
         print_results(results, color=not args.no_color, context=args.context)
+        print(
+            f"[INFO] Walked {stats.get('files', 0)} file(s) in {stats.get('walk_time', 0.0):.2f}s, "
+            f"scanned in {stats.get('scan_time', 0.0):.2f}s."
+        )
+        print_cache_info()
 
         # Prompt for next action after showing results
         while True:
             next_action = input("\nPress Enter to return to the main menu, or type 'exit' to quit: ").strip().lower()
             if next_action == "exit":
                 print("Exiting Greaper.")
-                exit(0)
+                sys.exit(0)
             if next_action == "":
                 return  # Return to main menu
             print("Invalid input. Please press Enter or type 'exit'.")
     except Exception as e:
         print(f"[ERROR] Search failed: {e}")
 
+def watch_command(args):
+    """Search once, then print updated hits whenever watched files change (Ctrl+C stops)."""
+    from greaper.watch import watch_search
+
+    pattern = args.pattern
+    while not pattern:
+        pattern = input("Enter search pattern:\n> ").strip()
+    path = args.path or "."
+    print(f"\n[CLI] Watching '{path}' for '{pattern}' (Ctrl+C to stop) ...")
+    updates = watch_search(
+        pattern=pattern,
+        path=path,
+        fuzzy=args.fuzzy,
+        ignore_case=args.ignore_case,
+        word=args.word,
+        context=args.context,
+        include=args.include,
+        exclude=args.exclude,
+        max_results=args.max_results,
+        interval=args.interval,
+        polling=args.polling,
+    )
+    try:
+        for file, results in updates:
+            if not results:
+                print(f"[watch] {file}: no matches", flush=True)
+                continue
+            print(f"[watch] {file}: {len(results)} match(es)", flush=True)
+            for _, line, match, *_ in results:
+                print(f"{file}:{line}: {match}", flush=True)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        updates.close()
+
 def replace_command(args):
     """Handle the 'replace' command interactively."""
     print("\n[Replace Mode]")
@@ -220,9 +316,44 @@ def replace_command(args):
         print("Replace cancelled.")
         return
 
+    if args.fuzzy:
+        print("[ERROR] Fuzzy matches cannot be replaced; turn fuzzy off.")
+        return
+
+    from greaper.core import batch_replace_files
     print(f"[CLI] Replace '{args.pattern}' with '{args.replacement}' in '{args.path}'")
-    print(f"  Fuzzy: {args.fuzzy} | Ignore case: {args.ignore_case} | Preview: {args.preview}")
-    # TODO: Implement replace logic
+    replace_kwargs = dict(
+        path=args.path,
+        ignore_case=args.ignore_case,
+        regex=getattr(args, "regex", False),
+        word=getattr(args, "word", False),
+        include=getattr(args, "include", None),
+        exclude=getattr(args, "exclude", None),
+        jobs=getattr(args, "jobs", 1),
+    )
+    try:
+        if args.preview:
+            changes = batch_replace_files(args.pattern, args.replacement, write=False, diff=True, **replace_kwargs)
+            if not changes:
+                print("No matches found.")
+                return
+            for change in changes:
+                print(change["diff"], end="")
+            lines = sum(len(change["lines"]) for change in changes)
+            print(f"\n{lines} line(s) in {len(changes)} file(s) would change.")
+            if input("Apply these changes? (y/N)\n> ").strip().lower() not in ("y", "yes"):
+                print("Replace cancelled.")
+                return
+        changes = batch_replace_files(args.pattern, args.replacement, **replace_kwargs)
+    except Exception as e:
+        print(f"[ERROR] Replace failed: {e}")
+        return
+    for change in changes:
+        if change.get("error"):
+            print(f"[WARN] {change['file']}: {change['error']}")
+    written = [change for change in changes if change["written"]]
+    lines = sum(len(change["lines"]) for change in written)
+    print(f"Replaced in {lines} line(s) across {len(written)} file(s).")
 
 def export_command(args):
     """Handle the 'export' command interactively."""
@@ -230,7 +361,7 @@ def export_command(args):
     options = [
         ("pattern", "", "Pattern to search for", str),
         ("path", ".", "Path to search", str),
-        ("format", "json", "Export format (vscode/sublime/jetbrains/vim/emacs/json/csv/md)", str),
+        ("format", "json", "Export format (vscode/sublime/jetbrains/vim/emacs/json/ndjson/csv/md/arrow/parquet/packed)", str),
         ("ignore_case", False, "Case-insensitive search (y/n)", bool),
         ("fuzzy", False, "Use fuzzy search (y/n)", bool),
         ("syntax_aware", False, "Syntax-aware search (y/n)", bool),
@@ -258,18 +389,54 @@ def export_command(args):
 
     print(f"[CLI] Exporting results to {args.format} format")
     from greaper.integraton import (
-        export_for_vscode, export_for_sublime, export_for_jetbrains,
-        export_for_vim_quickfix, export_for_emacs,
-        export_as_json, export_as_csv, export_as_markdown
+        export_for_vscode, export_for_jetbrains, export_for_emacs,
+        export_as_json, export_as_markdown,
+        stream_ndjson, stream_csv, stream_quickfix, stream_sublime,
+    )
+    # These formats are written while the search runs instead of being built in memory
+    stream_map = {
+        "ndjson": stream_ndjson,
+        "jsonl": stream_ndjson,
+        "csv": stream_csv,
+        "vim": stream_quickfix,
+        "sublime": stream_sublime,
+    }
+    search_kwargs = dict(
+        ignore_case=args.ignore_case,
+        fuzzy=args.fuzzy,
+        syntax_aware=args.syntax_aware,
+        syntax_mode=args.syntax_mode,
+        include=args.include,
+        exclude=args.exclude,
+        max_results=args.max_results,
     )
+    if args.format.lower() in ("arrow", "parquet", "packed"):
+        from greaper.integraton import export_as_columnar
+        if not getattr(args, "export_path", ""):
+            print(f"[ERROR] The {args.format} format needs an export path.")
+            return
+        used, count = export_as_columnar(
+            pattern=args.pattern, path=args.path, export_path=args.export_path,
+            format=args.format.lower(), **search_kwargs,
+        )
+        print(f"Exported {count} result(s) to {args.export_path} ({used})")
+        return
+    stream = stream_map.get(args.format.lower())
+    if stream:
+        export_path = args.export_path if getattr(args, "export_path", "") else None
+        if not export_path:
+            print("\n--- Export Output ---\n")
+        stream(pattern=args.pattern, path=args.path, export_path=export_path, **search_kwargs)
+        if export_path:
+            print(f"Exported results to {export_path}")
+        else:
+            print("\n--- End Export ---\n")
+        return
     export_map = {
         "vscode": export_for_vscode,
-        "sublime": export_for_sublime,
         "jetbrains": export_for_jetbrains,
-        "vim": export_for_vim_quickfix,
         "emacs": export_for_emacs,
         "json": export_as_json,
-        "csv": export_as_csv,
         "md": export_as_markdown,
         "markdown": export_as_markdown,
     }
@@ -281,14 +448,8 @@ def export_command(args):
     output = func(
         pattern=args.pattern,
         path=args.path,
-        ignore_case=args.ignore_case,
-        fuzzy=args.fuzzy,
-        syntax_aware=args.syntax_aware,
-        syntax_mode=args.syntax_mode,
-        include=args.include,
-        exclude=args.exclude,
-        max_results=args.max_results,
         export_path=args.export_path if hasattr(args, "export_path") and args.export_path else None,
+        **search_kwargs,
     )
     if not args.export_path:
         print("\n--- Export Output ---\n")
@@ -297,6 +458,30 @@ def export_command(args):
     else:
         print(f"Exported results to {args.export_path}")
 
+def index_command(args):
+    """Build, update or inspect the trigram index for a path."""
+    from greaper.index import TrigramIndex
+
+    action = (args.action or "update").lower()
+    if action not in ("build", "update", "stats"):
+        print(f"[ERROR] Unknown index action: {args.action} (use build, update or stats)")
+        return
+    with TrigramIndex(args.path or ".") as index:
+        if action == "stats":
+            if not index.exists():
+                print(f"No index for '{args.path}'. Run 'index' with action 'build' first.")
+                return
+            info = index.stats()
+            print(f"[Index] {info['files']} files, {info['postings']} postings in {info['index_path']}")
+            return
+        print(f"[CLI] {'Building' if action == 'build' else 'Updating'} index for '{args.path}' ...")
+        stats = index.build() if action == "build" else index.update()
+    print(
+        f"[Index] {stats['added']} added, {stats['updated']} updated, "
+        f"{stats['removed']} removed, {stats['unchanged']} unchanged "
+        f"in {stats['seconds']:.2f}s"
+    )
+
 def summarize_command(args):
     """Summarize code using HuggingFace Transformers."""
     from greaper.integraton import hf_summarize_code
@@ -327,6 +512,8 @@ def print_available_options():
     print("replace  - Replace a pattern in files (preview, fuzzy, future: archive-aware)")
     print("export   - Export search results for editors/tools (VS Code, Sublime, JetBrains, Vim, Emacs, JSON, CSV, Markdown)")
     print("summarize - Summarize code using HuggingFace Transformers")
+    print("index    - Build or update the trigram index that speeds up repeated searches")
+    print("watch    - Search, then re-scan only changed files and print updated hits")
     print("\n[Search Options]")
     print("  pattern         Pattern to search for (regex or fuzzy)")
     print("  path            Path to search (default: current directory, supports archives: .zip, .tar, .7z, .rar, etc.)")
@@ -339,10 +526,13 @@ def print_available_options():
     print("  --include       Glob patterns to include (e.g. *.py *.md)")
     print("  --exclude       Glob patterns to exclude (e.g. *.log *.tmp)")
     print("  --max-results   Maximum number of results")
+    print("  -j, --jobs      Worker processes for parallel search (0 = all cores)")
+    print("  --index         Only open files the trigram index says can match")
     print("  --no-color      Disable color output")
     print("  --tui           Launch the Textual TUI interface")
     print("\n[Export Options]")
-    print("  format          Export format: vscode, sublime, jetbrains, vim, emacs, json, csv, md/markdown")
+    print("  format          Export format: vscode, sublime, jetbrains, vim, emacs, json, ndjson, csv, md/markdown,")
+    print("                  arrow, parquet (need pyarrow) or packed (columnar binary; needs export_path)")
     print("  export_path     Export file path (optional, prints to stdout if omitted)")
     print("\n[Archive Support]")
     print("  Greaper will search inside .zip, .tar, .gz, .bz2, .xz, .lzma, .7z, .rar, .whl, .egg, .jar, .nupkg, and nested archives automatically!")
@@ -371,7 +561,7 @@ def interactive_prompt(options):
         val = input(prompt).strip()
         if val.lower() == "exit":
             print("Exiting Greaper.")
-            exit(0)
+            sys.exit(0)
         if val.lower() == "back":
             if idx > 0:
                 idx -= 1
@@ -414,7 +604,8 @@ def utilities_command(args=None):
     else:
         print("Cancelled or not found.")
 
-def main():
+def interactive_main():
+    """The interactive menu: pick a command, then answer prompts for its options."""
     print_available_options()
     user_cmd = input("> ").strip()
     if not user_cmd:
@@ -434,12 +625,31 @@ def main():
             ("include", ["*"], "Glob patterns to include (e.g. *.py *.md, space-separated)", list),
             ("exclude", [], "Glob patterns to exclude (e.g. *.log *.tmp, space-separated)", list),
             ("max_results", 1000, "Maximum number of results", int),
+            ("jobs", 1, "Worker processes (1 = serial, 0 = all cores)", int),
+            ("index", False, "Use the trigram index if one was built (y/n)", bool),
             ("no_color", False, "Disable color output (y/n)", bool),
             ("tui", False, "Launch the Textual TUI interface (y/n)", bool),
         ]
         args_dict = interactive_prompt(options)
         args = argparse.Namespace(**args_dict)
         search_command(args)
+    elif user_cmd == "watch":
+        options = [
+            ("pattern", "", "Pattern to search for", str),
+            ("path", ".", "Path to watch", str),
+            ("fuzzy", False, "Use fuzzy search (y/n)", bool),
+            ("ignore_case", False, "Case-insensitive search (y/n)", bool),
+            ("word", False, "Match whole words only (y/n)", bool),
+            ("context", 0, "Show N lines of context", int),
+            ("include", ["*"], "Glob patterns to include (e.g. *.py *.md, space-separated)", list),
+            ("exclude", [], "Glob patterns to exclude (e.g. *.log *.tmp, space-separated)", list),
+            ("max_results", 1000, "Maximum number of results", int),
+            ("interval", 1, "Seconds between checks when polling", int),
+            ("polling", False, "Poll file stats instead of using inotify (y/n)", bool),
+        ]
+        args_dict = interactive_prompt(options)
+        args = argparse.Namespace(**args_dict)
+        watch_command(args)
     elif user_cmd == "replace":
         options = [
             ("pattern", "", "Pattern to search for", str),
@@ -456,7 +666,7 @@ def main():
         options = [
             ("pattern", "", "Pattern to search for", str),
             ("path", ".", "Path to search", str),
-            ("format", "json", "Export format (vscode/sublime/jetbrains/vim/emacs/json/csv/md)", str),
+            ("format", "json", "Export format (vscode/sublime/jetbrains/vim/emacs/json/ndjson/csv/md/arrow/parquet/packed)", str),
             ("ignore_case", False, "Case-insensitive search (y/n)", bool),
             ("fuzzy", False, "Use fuzzy search (y/n)", bool),
             ("syntax_aware", False, "Syntax-aware search (y/n)", bool),
@@ -469,6 +679,14 @@ def main():
         args_dict = interactive_prompt(options)
         args = argparse.Namespace(**args_dict)
         export_command(args)
+    elif user_cmd == "index":
+        options = [
+            ("action", "update", "Index action (build/update/stats)", str),
+            ("path", ".", "Path to index", str),
+        ]
+        args_dict = interactive_prompt(options)
+        args = argparse.Namespace(**args_dict)
+        index_command(args)
     elif user_cmd == "importfix":
         importfix_command()
     elif user_cmd == "utilities":
@@ -483,5 +701,252 @@ def main():
     else:
         print("Unknown command. Exiting.")
 
+# --- Scripted (non-interactive) front end ---
+SEARCH_FORMATS = (
+    "text", "table", "ndjson", "jsonl", "csv", "vim", "sublime",
+    "vscode", "jetbrains", "emacs", "json", "md", "arrow", "parquet", "packed",
+)
+
+def _add_match_options(parser):
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="case-insensitive search")
+    parser.add_argument("-w", "--word", action="store_true", help="match whole words only")
+    parser.add_argument("-E", "--regex", action="store_true", help="treat patterns as regular expressions")
+    parser.add_argument("--include", action="append", metavar="GLOB", help="only search files matching GLOB (repeatable)")
+    parser.add_argument("--exclude", action="append", metavar="GLOB", help="skip files matching GLOB (repeatable)")
+    parser.add_argument("--no-ignore", action="store_true", help="do not honor .gitignore/.ignore files")
+    parser.add_argument("--syntax-mode", choices=("all", "comment", "string", "code", "mixed"), default="all",
+                        help="only match lines of this syntax kind")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N", help="worker processes (0 = one per CPU)")
+
+def build_parser():
+    """argparse parser for the scripted commands (search, replace, watch, index)."""
+    parser = argparse.ArgumentParser(
+        prog="greaper",
+        description="Fast, archive-aware code search. Run without arguments for the interactive menu.",
+    )
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report what importing greaper costs (python -X importtime) and exit")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    search = commands.add_parser("search", help="search files and print the hits",
+                                 description="Exit status: 0 if a line matched, 1 if none did, 2 on error.")
+    search.add_argument("pattern", nargs="?", help="pattern to search for")
+    search.add_argument("path", nargs="?", default=".", help="file or directory to search (default: .)")
+    search.add_argument("-e", "--regexp", action="append", metavar="PATTERN", help="add a pattern (repeatable)")
+    search.add_argument("--patterns-file", metavar="FILE", help="read more patterns from FILE, one per line")
+    search.add_argument("-f", "--fuzzy", action="store_true", help="fuzzy search")
+    search.add_argument("--fuzzy-mode", choices=("line", "window"), default="line")
+    search.add_argument("--threshold", type=float, default=0.7, help="fuzzy similarity threshold (default: 0.7)")
+    search.add_argument("-C", "--context", type=int, default=0, metavar="N", help="lines of context")
+    search.add_argument("-m", "--max-results", type=int, default=1000, metavar="N")
+    search.add_argument("--format", choices=SEARCH_FORMATS, default="text", help="output format (default: text)")
+    search.add_argument("-o", "--output", metavar="FILE", help="write the results to FILE instead of stdout")
+    search.add_argument("-q", "--quiet", action="store_true", help="print nothing; only set the exit status")
+    search.add_argument("--index", action="store_true", help="use the trigram index built for path")
+    search.add_argument("--cache", action="store_true", help="reuse and update the result cache")
+    _add_match_options(search)
+
+    replace = commands.add_parser("replace", help="replace a pattern in files",
+                                  description="Exit status: 0 if anything was (or would be) replaced, 1 if not, 2 on error.")
+    replace.add_argument("pattern")
+    replace.add_argument("replacement")
+    replace.add_argument("path", nargs="?", default=".")
+    replace.add_argument("-n", "--dry-run", action="store_true", help="print a diff instead of writing")
+    _add_match_options(replace)
+
+    watch = commands.add_parser("watch", help="search, then print updated hits as files change")
+    watch.add_argument("pattern")
+    watch.add_argument("path", nargs="?", default=".")
+    watch.add_argument("-f", "--fuzzy", action="store_true")
+    watch.add_argument("-i", "--ignore-case", action="store_true")
+    watch.add_argument("-w", "--word", action="store_true")
+    watch.add_argument("-C", "--context", type=int, default=0, metavar="N")
+    watch.add_argument("-m", "--max-results", type=int, default=1000, metavar="N")
+    watch.add_argument("--include", action="append", metavar="GLOB")
+    watch.add_argument("--exclude", action="append", metavar="GLOB")
+    watch.add_argument("--interval", type=float, default=1.0, help="seconds between checks when polling")
+    watch.add_argument("--polling", action="store_true", help="poll file stats instead of using inotify")
+
+    index = commands.add_parser("index", help="build, update or inspect the trigram index")
+    index.add_argument("action", nargs="?", default="update", choices=("build", "update", "stats"))
+    index.add_argument("path", nargs="?", default=".")
+    return parser
+
+def _search_kwargs(args):
+    return dict(
+        ignore_case=args.ignore_case,
+        word=args.word,
+        regex=args.regex,
+        include=args.include,
+        exclude=args.exclude,
+        ignore_files=not args.no_ignore,
+        syntax_aware=args.syntax_mode != "all",
+        syntax_mode=args.syntax_mode,
+        jobs=args.jobs,
+    )
+
+def _print_plain(results, context, out):
+    """grep-style lines (file:line: match, context as file:line- / file:line+). Returns the count."""
+    count = 0
+    for file, line, match, before, after, *hit in results:
+        for k, b in enumerate(before):
+            out.write(f"{file}:{line-len(before)+k}- {b}\n")
+        tag = f" [{', '.join(hit[0])}]" if hit else ""
+        out.write(f"{file}:{line}: {match}{tag}\n")
+        for k, a in enumerate(after):
+            out.write(f"{file}:{line+k+1}+ {a}\n")
+        count += 1
+    return count
+
+def run_search(args):
+    """The scripted search command. Returns the exit status."""
+    from greaper.core import iter_search_files
+
+    patterns = list(args.regexp or [])
+    if args.patterns_file:
+        patterns += read_patterns_file(args.patterns_file)
+    pattern = args.pattern
+    if patterns and pattern is not None and args.path == ".":
+        # "greaper search -e foo src": the positional is the path
+        pattern, args.path = None, pattern
+    if pattern is None and not patterns:
+        print("greaper: no pattern given", file=sys.stderr)
+        return EXIT_ERROR
+    if not Path(args.path).exists():
+        print(f"greaper: {args.path}: No such file or directory", file=sys.stderr)
+        return EXIT_ERROR
+    kwargs = dict(
+        _search_kwargs(args),
+        fuzzy=args.fuzzy,
+        fuzzy_mode=args.fuzzy_mode,
+        fuzzy_threshold=args.threshold,
+        context=args.context,
+        max_results=1 if args.quiet else args.max_results,
+        index=args.index,
+        result_cache=args.cache,
+        deterministic=True,
+        patterns=patterns or None,
+    )
+    fmt = args.format
+    if args.quiet:
+        found = next(iter_search_files(pattern, path=args.path, **kwargs), None) is not None
+        return EXIT_MATCH if found else EXIT_NO_MATCH
+    if fmt in ("text", "table"):
+        results = iter_search_files(pattern, path=args.path, **kwargs)
+        if fmt == "table":
+            count = print_results(results, color=True, context=args.context)
+        elif args.output:
+            with open(args.output, "w", encoding="utf-8") as out:
+                count = _print_plain(results, args.context, out)
+        else:
+            count = _print_plain(results, args.context, sys.stdout)
+        return EXIT_MATCH if count else EXIT_NO_MATCH
+
+    from greaper import integraton
+    export = dict(pattern=pattern, path=args.path, **kwargs)
+    if fmt in ("arrow", "parquet", "packed"):
+        if not args.output:
+            print(f"greaper: --format {fmt} needs --output", file=sys.stderr)
+            return EXIT_ERROR
+        _, count = integraton.export_as_columnar(export_path=args.output, format=fmt, **export)
+        return EXIT_MATCH if count else EXIT_NO_MATCH
+    streams = {
+        "ndjson": integraton.stream_ndjson,
+        "jsonl": integraton.stream_ndjson,
+        "csv": integraton.stream_csv,
+        "vim": integraton.stream_quickfix,
+        "sublime": integraton.stream_sublime,
+    }
+    if fmt in streams:
+        count = streams[fmt](export_path=args.output, **export)
+        return EXIT_MATCH if count else EXIT_NO_MATCH
+    exporters = {
+        "vscode": integraton.export_for_vscode,
+        "jetbrains": integraton.export_for_jetbrains,
+        "emacs": integraton.export_for_emacs,
+        "json": integraton.export_as_json,
+        "md": integraton.export_as_markdown,
+    }
+    # The buffered exporters return text; an empty document means no hits
+    output = exporters[fmt](**export)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output + "\n")
+    empty = {"json": "[]", "md": "| File | Line | Match |\n|------|------|-------|\n"}.get(fmt, "")
+    return EXIT_MATCH if output != empty else EXIT_NO_MATCH
+
+def run_replace(args):
+    """The scripted replace command. Returns the exit status."""
+    from greaper.core import batch_replace_files
+
+    if not Path(args.path).exists():
+        print(f"greaper: {args.path}: No such file or directory", file=sys.stderr)
+        return EXIT_ERROR
+    changes = batch_replace_files(
+        args.pattern, args.replacement, path=args.path,
+        write=not args.dry_run, diff=args.dry_run, **_search_kwargs(args),
+    )
+    replaced = failed = False
+    for change in changes:
+        if change.get("error"):
+            print(f"greaper: {change['file']}: {change['error']}", file=sys.stderr)
+            failed = True
+            continue
+        if args.dry_run:
+            sys.stdout.write(change["diff"])
+        replaced = True
+    if failed:
+        return EXIT_ERROR
+    return EXIT_MATCH if replaced else EXIT_NO_MATCH
+
+def main(argv=None):
+    """
+    Entry point. With no arguments, runs the interactive menu; otherwise
+    parses a scripted command and returns its exit status (0 = matches,
+    1 = no matches, 2 = error), like grep.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        interactive_main()
+        return EXIT_MATCH
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.profile_startup:
+        from greaper.startup import IMPORT_BUDGET_MS, import_time_ms, profile_imports, startup_report
+        records = profile_imports()
+        print(startup_report(records))
+        # An error status when over budget, so the report can gate a CI job
+        if import_time_ms(records) > IMPORT_BUDGET_MS:
+            print(f"greaper: importing greaper took longer than {IMPORT_BUDGET_MS:.0f} ms", file=sys.stderr)
+            return EXIT_ERROR
+        return EXIT_MATCH
+    if args.command is None:
+        parser.print_help()
+        return EXIT_ERROR
+    try:
+        if args.command == "search":
+            return run_search(args)
+        if args.command == "replace":
+            return run_replace(args)
+        if args.command == "watch":
+            watch_command(args)
+            return EXIT_MATCH
+        if args.command == "index":
+            index_command(args)
+            return EXIT_MATCH
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # e.g. "greaper search ... | head": stop quietly
+        sys.stderr.close()
+        return EXIT_MATCH
+    except Exception as e:
+        print(f"greaper: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    return EXIT_ERROR
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
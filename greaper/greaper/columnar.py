@@ -0,0 +1,271 @@
+"""
+Columnar result files for analytics: file, line, column, match and the
+context lines of every hit, stored column by column.
+
+With pyarrow installed results are written as Arrow IPC (.arrow/.feather)
+or Parquet (.parquet). Without it they are written in the packed format
+below, which needs nothing but the standard library to read and can be
+memory-mapped without parsing (see PackedResults).
+
+Packed format (little-endian, every section 8-byte aligned):
+    header      PACKED_HEADER: magic, version, hit/file/context-line counts
+    sections    one (offset, length) pair per name in PACKED_SECTIONS
+    file_id     uint32 per hit, index into the file table
+    line        uint32 per hit (1-based)
+    column      uint32 per hit (0-based, 0 when unknown)
+    match       uint64 offsets (hits + 1) into match_data, UTF-8
+    context     uint64 offsets (hits + 1) into the context-line table,
+                and uint32 n_before per hit (the rest are after lines)
+    context_*   uint64 offsets (context lines + 1) into context_data
+    file_*      uint64 offsets (files + 1) into file_data
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+try:
+    import pyarrow  # optional: Arrow IPC / Parquet output (pip install pyarrow)
+except ImportError:
+    pyarrow = None
+
+PACKED_MAGIC = b"GREAPERC"
+PACKED_VERSION = 1
+PACKED_HEADER = struct.Struct("<8sIIQQQ")
+PACKED_SECTIONS = (
+    "file_id", "line", "column",
+    "match_offsets", "match_data",
+    "context_start", "context_before",
+    "context_offsets", "context_data",
+    "file_offsets", "file_data",
+)
+_SECTION_TABLE = struct.Struct("<" + "QQ" * len(PACKED_SECTIONS))
+# Hits per Arrow record batch
+ARROW_BATCH_ROWS = 65536
+
+def result_column(result):
+    """0-based column of a result's match, or 0 when the result does not carry one."""
+    return getattr(result, "column", 0)
+
+def _little_endian(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+class _StringColumn:
+    """UTF-8 strings as one offsets array plus one data buffer."""
+
+    def __init__(self):
+        self.offsets = array("Q", [0])
+        self.data = bytearray()
+
+    def append(self, text):
+        self.data += text.encode("utf-8", errors="surrogateescape")
+        self.offsets.append(len(self.data))
+
+def write_packed(results, export_path):
+    """Write results in the packed columnar format. Returns the number of hits."""
+    file_ids = {}
+    files = _StringColumn()
+    file_id = array("I")
+    lines = array("I")
+    columns = array("I")
+    matches = _StringColumn()
+    context_start = array("Q", [0])
+    context_before = array("I")
+    context = _StringColumn()
+    for r in results:
+        label = str(r[0])
+        fid = file_ids.get(label)
+        if fid is None:
+            fid = file_ids[label] = len(file_ids)
+            files.append(label)
+        file_id.append(fid)
+        lines.append(r[1])
+        columns.append(result_column(r))
+        matches.append(r[2])
+        for text in r[3]:
+            context.append(text)
+        for text in r[4]:
+            context.append(text)
+        context_before.append(len(r[3]))
+        context_start.append(context_start[-1] + len(r[3]) + len(r[4]))
+    sections = {
+        "file_id": file_id, "line": lines, "column": columns,
+        "match_offsets": matches.offsets, "match_data": matches.data,
+        "context_start": context_start, "context_before": context_before,
+        "context_offsets": context.offsets, "context_data": context.data,
+        "file_offsets": files.offsets, "file_data": files.data,
+    }
+    table = []
+    offset = PACKED_HEADER.size + _SECTION_TABLE.size
+    blobs = []
+    for name in PACKED_SECTIONS:
+        blob = sections[name]
+        blob = bytes(blob) if isinstance(blob, bytearray) else _little_endian(blob).tobytes()
+        offset += -offset % 8
+        table += [offset, len(blob)]
+        blobs.append((offset, blob))
+        offset += len(blob)
+    with open(export_path, "wb") as f:
+        f.write(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, 0, len(lines), len(file_ids), len(context.offsets) - 1))
+        f.write(_SECTION_TABLE.pack(*table))
+        for start, blob in blobs:
+            f.write(b"\0" * (start - f.tell()))
+            f.write(blob)
+    return len(lines)
+
+class PackedResults:
+    """
+    Read-only view of a packed result file. The file is memory-mapped and
+    the numeric columns are exposed as memoryviews (file_id, line, column,
+    ...), so opening it costs nothing per hit; results[i] decodes one hit
+    as (file, line_number, match, context_before, context_after).
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.hits, self.file_count, self.context_count = PACKED_HEADER.unpack_from(self._mmap)
+        if magic != PACKED_MAGIC or version != PACKED_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a greaper packed result file (version {PACKED_VERSION})")
+        table = _SECTION_TABLE.unpack_from(self._mmap, PACKED_HEADER.size)
+        view = memoryview(self._mmap)
+        self._sections = {}
+        for i, name in enumerate(PACKED_SECTIONS):
+            offset, length = table[2 * i], table[2 * i + 1]
+            self._sections[name] = view[offset:offset + length]
+        for name, typecode in (
+            ("file_id", "I"), ("line", "I"), ("column", "I"),
+            ("match_offsets", "Q"), ("context_start", "Q"), ("context_before", "I"),
+            ("context_offsets", "Q"), ("file_offsets", "Q"),
+        ):
+            column = self._sections[name].cast(typecode)
+            if sys.byteorder == "big":
+                swapped = array(typecode, column)
+                swapped.byteswap()
+                column = memoryview(swapped)
+            self._sections[name] = column
+        self.files = [self._string("file", i) for i in range(self.file_count)]
+
+    def __getattr__(self, name):
+        sections = self.__dict__.get("_sections")
+        if sections is not None and name in sections:
+            return sections[name]
+        raise AttributeError(name)
+
+    def _string(self, kind, i):
+        offsets = self._sections[f"{kind}_offsets"]
+        return bytes(self._sections[f"{kind}_data"][offsets[i]:offsets[i + 1]]).decode("utf-8", errors="surrogateescape")
+
+    def __len__(self):
+        return self.hits
+
+    def __getitem__(self, i):
+        if not -self.hits <= i < self.hits:
+            raise IndexError(i)
+        i %= self.hits
+        start, end = self.context_start[i], self.context_start[i + 1]
+        n_before = self.context_before[i]
+        context = [self._string("context", j) for j in range(start, end)]
+        return (
+            self.files[self.file_id[i]], self.line[i], self._string("match", i),
+            context[:n_before], context[n_before:],
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(self.hits))
+
+    def close(self):
+        for section in self.__dict__.get("_sections", {}).values():
+            section.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_packed(path):
+    """Open a packed result file; see PackedResults."""
+    return PackedResults(path)
+
+def _arrow_schema():
+    pa = pyarrow
+    return pa.schema([
+        # A plain string column: IPC files cannot change a dictionary between batches
+        ("file", pa.string()),
+        ("line", pa.uint32()),
+        ("column", pa.uint32()),
+        ("match", pa.string()),
+        ("before", pa.list_(pa.string())),
+        ("after", pa.list_(pa.string())),
+    ])
+
+def _iter_arrow_batches(results, schema, batch_rows):
+    pa = pyarrow
+    while True:
+        rows = []
+        for r in results:
+            rows.append(r)
+            if len(rows) >= batch_rows:
+                break
+        if not rows:
+            return
+        yield pa.record_batch([
+            pa.array([str(r[0]) for r in rows], pa.string()),
+            pa.array([r[1] for r in rows], pa.uint32()),
+            pa.array([result_column(r) for r in rows], pa.uint32()),
+            pa.array([r[2] for r in rows], pa.string()),
+            pa.array([list(r[3]) for r in rows], pa.list_(pa.string())),
+            pa.array([list(r[4]) for r in rows], pa.list_(pa.string())),
+        ], schema=schema)
+        if len(rows) < batch_rows:
+            return
+
+def write_arrow(results, export_path, parquet=False, batch_rows=ARROW_BATCH_ROWS):
+    """
+    Write results as an Arrow IPC file (or Parquet with parquet=True) in
+    record batches of batch_rows hits. Requires pyarrow. Returns the number of hits.
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow package not installed. Run 'pip install pyarrow'")
+    schema = _arrow_schema()
+    results = iter(results)
+    count = 0
+    if parquet:
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(export_path, schema)
+    else:
+        import pyarrow.ipc
+        writer = pyarrow.ipc.new_file(export_path, schema)
+    try:
+        for batch in _iter_arrow_batches(results, schema, batch_rows):
+            if parquet:
+                writer.write_table(pyarrow.Table.from_batches([batch], schema=schema))
+            else:
+                writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        writer.close()
+    return count
+
+def write_columnar(results, export_path, format="auto"):
+    """
+    Write results to export_path in a columnar format: "arrow", "parquet",
+    "packed", or "auto" (Parquet for *.parquet, else Arrow when pyarrow is
+    installed, else packed). Returns (format_used, number_of_hits).
+    """
+    if format == "auto":
+        if pyarrow is None:
+            format = "packed"
+        else:
+            format = "parquet" if str(export_path).endswith(".parquet") else "arrow"
+    if format == "packed":
+        return format, write_packed(results, export_path)
+    if format in ("arrow", "parquet"):
+        return format, write_arrow(results, export_path, parquet=format == "parquet")
+    raise ValueError(f"unknown columnar format: {format}")
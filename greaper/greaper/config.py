@@ -0,0 +1,13 @@
+"""
+Shared settings for Greaper's on-disk indexes and caches.
+Set GREAPER_CACHE_DIR to move everything Greaper persists between runs,
+and GREAPER_RESULT_CACHE_MB to size the search result cache.
+"""
+
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("GREAPER_CACHE_DIR") or Path.home() / ".cache" / "greaper")
+
+# Size budget of the search result cache (resultcache.ResultCache), in megabytes
+RESULT_CACHE_MB = float(os.environ.get("GREAPER_RESULT_CACHE_MB") or 64)
@@ -1,8 +1,16 @@
+import difflib
+import io
+import mmap
 import os
+import re
 import sys
-from pathlib import Path
-from greaper.filewalker import get_files_to_search
-from greaper.archive import extract_file_from_archive
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import groupby, islice
+from greaper.filewalker import iter_files_to_search
+from greaper.archive import ArchivePool, extract_file_from_archive, iter_archive_texts
 
 # --- John Wick Import Resolver ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14,9 +22,12 @@ if project_root not in sys.path:
 # --- End John Wick Import Resolver ---
 
 # Import algorithms (Python fallback)
-from greaper.algorithms.regex import regex_search
-from greaper.algorithms.fuzzy import similarity_ratio, fuzzy_search
-from greaper.algorithms.tokenization import is_syntax_match
+from greaper.algorithms.regex import MultiQuery, compile_multi_query, compile_query, regex_search
+from greaper.algorithms.fuzzy import FuzzyMatcher
+from greaper.algorithms.replace import batch_replace
+from greaper.syntax import classify_lines, file_syntax, kind_matches, language_for
+from greaper.resultcache import get_result_cache, query_key
+from greaper.results import LineTable, Match, intern_file
 
 # Try to import Cython-accelerated search loop if available
 try:
@@ -24,9 +35,382 @@ try:
     CYTHON_SEARCH = True
 except ImportError:
     CYTHON_SEARCH = False
+try:
+    from cython_ext.search_cython import scan_literal
+    CYTHON_KERNEL = True
+except ImportError:
+    CYTHON_KERNEL = False
+
+# Files handed to each worker process in parallel mode
+DEFAULT_CHUNK_SIZE = 64
+# Slice size used when counting newlines in a mapped file
+_NEWLINE_COUNT_BLOCK = 1 << 20
+# Hit lines returned per scan_literal() call
+KERNEL_BATCH = 4096
+_LONE_CR = re.compile(rb"\r(?!\n)")
+
+def _split_lines(text):
+    """Split decoded text like a text-mode readlines(): universal newlines, ends kept as "\n"."""
+    return io.StringIO(text, newline=None).readlines()
+
+def _read_lines(file):
+    """
+    Read a file or (archive_path, inner_path) member.
+    Returns (file_label, lines), or None if it cannot be read.
+    """
+    if isinstance(file, tuple):
+        archive_path, inner_path = file
+        try:
+            content = extract_file_from_archive(archive_path, inner_path)
+        except Exception:
+            return None
+        return f"{archive_path}::{inner_path}", _split_lines(content)
+    try:
+        with open(file, encoding="utf-8", errors="ignore") as f:
+            return str(file), f.readlines()
+    except Exception:
+        return None
+
+def _syntax_filter(file_label, lines, syntax_mode):
+    """
+    Return keep(index) for syntax-aware search. The file is lexed once, on
+    the first candidate hit, so files without hits are never tokenized.
+    lines may be a callable producing the lines.
+    """
+    syntax = None
+
+    def keep(index):
+        nonlocal syntax
+        if syntax is None:
+            syntax = file_syntax(file_label, lines)
+        return syntax.matches(index, syntax_mode)
+    return keep
+
+def _make_query(pattern, fuzzy, ignore_case, word, regex, fuzzy_threshold, fuzzy_mode="line"):
+    """Prepare the per-search matcher: a FuzzyMatcher in fuzzy mode, else a compiled Query."""
+    if fuzzy:
+        return FuzzyMatcher(pattern, fuzzy_threshold, window=fuzzy_mode == "window")
+    return compile_query(pattern, regex=regex, word=word, ignore_case=ignore_case)
+
+def _count_newlines(buf, start, end):
+    count = 0
+    while start < end:
+        stop = min(end, start + _NEWLINE_COUNT_BLOCK)
+        count += buf[start:stop].count(b"\n")
+        start = stop
+    return count
+
+def _decode_line(buf, start, end):
+    return buf[start:end].decode("utf-8", errors="ignore")
+
+def _iter_hit_lines(buf, size, find):
+    """Yield (line_number, start, end) for each line of buf where find(buf, pos) hits."""
+    line_number = 1
+    counted_to = 0
+    pos = 0
+    while pos < size:
+        hit = find(buf, pos)
+        if hit is None:
+            return
+        start = buf.rfind(b"\n", 0, hit[0]) + 1
+        end = buf.find(b"\n", hit[1])
+        if end == -1:
+            end = size
+        line_number += _count_newlines(buf, counted_to, start)
+        counted_to = start
+        pos = end + 1
+        yield line_number, start, end
 
-def search_files(
+def _iter_kernel_hit_lines(buf, needle):
+    """_iter_hit_lines() for a plain literal, found in batches by the Cython kernel."""
+    pos = 0
+    line_number = 1
+    while True:
+        numbers, starts, ends, pos, line_number = scan_literal(buf, needle, pos, line_number, KERNEL_BATCH)
+        yield from zip(numbers, starts, ends)
+        if len(numbers) < KERNEL_BATCH:
+            return
+
+def _search_mmap(
+    path,
+    find,
+    verify=None,
+    context=0,
+    syntax_aware=False,
+    syntax_mode="all",
+    max_results=1000,
+    needle=None,
+    which=None,
+    span=None,
+):
+    """
+    Bytes mode: scan the memory-mapped file with find(buf, pos) from Query.bytes_finder().
+    Line numbers are only computed for lines that actually hit, and context
+    lines only when a Match is asked for them.
+    needle is the literal for plain case-sensitive searches; when the Cython
+    kernel is built it scans for it instead of find(), without the GIL.
+    Matches are only built for the first max_results accepted lines.
+    which(line), if given, names the patterns hit; span(line) locates the match.
+    """
+    results = []
+    if max_results <= 0:
+        return results
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return results
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if b"\r" in buf and _LONE_CR.search(buf):
+                # Text-mode reads also break lines at a lone "\r"; the scan only knows "\n"
+                raise ValueError("lone carriage returns")
+            file_label = str(path)
+            file_id = intern_file(file_label)
+            table = LineTable(file_label) if context else None
+            if syntax_aware:
+                keep = _syntax_filter(file_label, lambda: _decode_line(buf, 0, size).split("\n"), syntax_mode)
+            if needle is not None and CYTHON_KERNEL:
+                hit_lines = _iter_kernel_hit_lines(buf, needle)
+            else:
+                hit_lines = _iter_hit_lines(buf, size, find)
+            try:
+                for line_number, start, end in hit_lines:
+                    line = _decode_line(buf, start, end)
+                    if verify is not None and not verify(line):
+                        continue
+                    if syntax_aware and not keep(line_number - 1):
+                        continue
+                    column, match_end = span(line) if span is not None else (0, 0)
+                    results.append(Match(
+                        file_id, line_number, column, match_end, line.strip(),
+                        context, table, which(line) if which else None,
+                    ))
+                    if len(results) >= max_results:
+                        break
+            finally:
+                hit_lines.close()  # before the buffer is unmapped
+    return results
+
+def _search_file(
+    file,
     pattern,
+    fuzzy=False,
+    ignore_case=False,
+    word=False,
+    context=0,
+    syntax_aware=False,
+    syntax_mode="all",
+    max_results=1000,
+    regex=False,
+    fuzzy_threshold=0.7,
+    bytes_mode=True,
+    lines=None,
+    fuzzy_mode="line",
+    query=None,
+):
+    """
+    Search a single file (or archive member).
+    Returns at most max_results Match records, which read like
+    (file, line_number, match, context_before, context_after) tuples.
+    If lines is given (e.g. an archive member already decoded), file is only used as the label.
+    query is the compiled Query for pattern (a FuzzyMatcher in fuzzy mode); it is
+    built here if omitted. With a MultiQuery each result gets a sixth element:
+    the tuple of patterns that hit the line.
+    """
+    if syntax_mode == "all":
+        syntax_aware = False  # every line qualifies; nothing to classify
+    if query is None:
+        query = _make_query(pattern, fuzzy, ignore_case, word, regex, fuzzy_threshold, fuzzy_mode)
+    which = query.which if isinstance(query, MultiQuery) else None
+    if lines is None and bytes_mode and not fuzzy and not isinstance(file, tuple):
+        finder = query.bytes_finder()
+        if finder is not None:
+            try:
+                return _search_mmap(
+                    file, *finder, context=context, syntax_aware=syntax_aware,
+                    needle=query.pattern.encode("utf-8") if query.engine == "find" else None,
+                    syntax_mode=syntax_mode, max_results=max_results, which=which, span=query.span,
+                )
+            except (OSError, ValueError):
+                pass  # unmappable (e.g. special files) or old Mac line breaks: read lines
+
+    if lines is not None:
+        file_label = str(file)
+    else:
+        read = _read_lines(file)
+        if read is None:
+            return []
+        file_label, lines = read
+
+    if syntax_aware:
+        keep = _syntax_filter(file_label, lines, syntax_mode)
+    file_id = intern_file(file_label)
+    table = LineTable(file_label, lines) if context else None
+    span = query.span
+
+    def make_match(i, line):
+        column, end = span(line)
+        return Match(file_id, i + 1, column, end, line.strip(), context, table, which(line) if which else None)
+
+    # Use Cython-accelerated search if available
+    if CYTHON_SEARCH and not fuzzy and query.compiled is not None:
+        # Syntax filtering happens here, with the same lexer as the other paths;
+        # context comes from the line table, so the loop does not build it.
+        # The flags are already compiled into query.compiled.
+        file_results = search_lines(
+            lines, pattern, fuzzy, 0, word, 0,
+            len(lines) if syntax_aware else max_results, regex,
+            False, syntax_mode, query.compiled
+        )
+        if syntax_aware:
+            file_results = [r for r in file_results if keep(r[0] - 1)]
+        return [make_match(r[0] - 1, lines[r[0] - 1]) for r in file_results[:max_results]]
+
+    # Pure Python fallback using algorithms
+    results = []
+    if fuzzy:
+        matches = ((i, lines[i]) for i, _ in query.iter_matches(lines))
+    else:
+        matches = regex_search(query, lines)
+    for i, line in matches:
+        if syntax_aware and not keep(i):
+            continue
+        results.append(make_match(i, line))
+        if len(results) >= max_results:
+            break
+    return results
+
+def _archive_of(file):
+    return file[0] if isinstance(file, tuple) else None
+
+def _iter_units(files):
+    """Group files into (None, file) units and (archive_path, wanted_members) units."""
+    for archive_path, group in groupby(files, key=_archive_of):
+        if archive_path is None:
+            for file in group:
+                yield None, file
+        else:
+            yield archive_path, [inner for _, inner in group]
+
+def _cached_search_file(file, options, cache_key):
+    """
+    _search_file() through the result cache: a file whose size and mtime
+    are unchanged since the same query last ran is not read again.
+    Only complete (untruncated) result lists are stored, without their
+    context lines (the query key fixes how many each hit has).
+    """
+    try:
+        st = os.stat(file)
+    except OSError:
+        return _search_file(file, **options)
+    cache = get_result_cache()
+    path = os.path.abspath(file)
+    max_results = options["max_results"]
+    cached = cache.get(cache_key, path, st.st_size, st.st_mtime_ns)
+    if cached is not None:
+        label = str(file)
+        file_id = intern_file(label)
+        # Context lines stay lazy: the file is unchanged, so they are read from it on demand
+        context = options.get("context", 0)
+        table = LineTable(label) if context else None
+        return [
+            Match(file_id, line_number, column, end, text, context, table, patterns)
+            for line_number, column, end, text, patterns in cached[:max_results]
+        ]
+    results = _search_file(file, **options)
+    if len(results) < max_results:
+        records = [(m.line_number, m.column, m.end, m.text, m.patterns) for m in results]
+        cache.put(cache_key, path, st.st_size, st.st_mtime_ns, records)
+    return results
+
+def _iter_results(files, options, archive_pool=None, cache_key=None):
+    """
+    Search files in order, yielding at most options["max_results"] results.
+    Consecutive members of the same archive are read in one pass over the
+    archive instead of reopening it per member. With an archive_pool,
+    upcoming archives are decompressed on its workers while earlier files
+    are scanned. With a cache_key (see resultcache.query_key()), plain
+    files go through the result cache.
+    """
+    max_results = options["max_results"]
+    found = 0
+    units = _iter_units(files)
+    if archive_pool is not None:
+        units = archive_pool.prefetch(units)
+    for archive_path, item in units:
+        if archive_path is None:
+            sources = ((item, None),)
+        else:
+            members = item if archive_pool is not None else iter_archive_texts(archive_path, item)
+            sources = (
+                (f"{archive_path}::{inner}", _split_lines(text))
+                for inner, text in members
+            )
+        for file, lines in sources:
+            file_options = dict(options, max_results=max_results - found)
+            if cache_key is not None and lines is None:
+                file_results = _cached_search_file(file, file_options, cache_key)
+            else:
+                file_results = _search_file(file, lines=lines, **file_options)
+            yield from file_results
+            found += len(file_results)
+            if found >= max_results:
+                return
+
+def _search_chunk(files, options, cache_key=None):
+    """
+    Worker entry point for parallel mode: search a batch of files in order.
+    Stops early once the batch alone has produced max_results hits.
+    """
+    results = list(_iter_results(files, options, cache_key=cache_key))
+    if cache_key is not None:
+        get_result_cache().flush()
+    return results
+
+def _chunked(items, size):
+    """Yield successive lists of up to size items."""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _iter_parallel(files, options, jobs, chunk_size, deterministic, cache_key=None):
+    """
+    Shard files across a process pool in chunks and yield results as workers finish.
+    At most 2 * jobs chunks are in flight; closing the generator cancels the rest.
+    With deterministic=True, chunks are yielded in submission order, which
+    reproduces the serial result order.
+    """
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    max_in_flight = jobs * 2
+    try:
+        if deterministic:
+            queue = deque()
+            for chunk in _chunked(files, chunk_size):
+                queue.append(pool.submit(_search_chunk, chunk, options, cache_key))
+                if len(queue) >= max_in_flight:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            in_flight = set()
+            for chunk in _chunked(files, chunk_size):
+                in_flight.add(pool.submit(_search_chunk, chunk, options, cache_key))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        # Drop queued chunks; running ones finish in the background.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def iter_search_files(
+    pattern=None,
     path=".",
     fuzzy=False,
     ignore_case=False,
@@ -39,71 +423,316 @@ def search_files(
     max_results=1000,
     regex=False,
     fuzzy_threshold=0.7,
+    fuzzy_mode="line",
+    jobs=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    deterministic=False,
+    index=None,
+    ignore_files=True,
+    walk_threads=1,
+    stats=None,
+    bytes_mode=True,
+    archive_workers=None,
+    patterns=None,
+    result_cache=False,
 ):
     """
-    Search files for a pattern.
-    Returns a list of (file, line_number, match, context_before, context_after)
+    Search files for a pattern, yielding results as soon as they are found.
+    Yields at most max_results results.Match records; they read like
+    (file, line_number, match, context_before, context_after) tuples and
+    also carry the match's column and span. Files are scanned while the tree is still
+    being walked, so the first hit does not wait for the full file list.
+
+    jobs > 1 (or 0/None for one per CPU) searches chunks of chunk_size files
+    in worker processes. Results then arrive in completion order unless
+    deterministic=True, which keeps the serial order.
+
+    index=True uses the trigram index built for path ("greaper index"), or
+    pass the index file path. Only candidate files are then opened; fuzzy
+    searches and patterns without usable trigrams still scan everything.
+
+    fuzzy_mode="window" scores the best-matching substring of each line
+    (semi-global alignment) instead of the whole line, so short patterns can
+    match inside long lines; algorithms.fuzzy.fuzzy_search_window() also
+    reports where the window is.
+
+    bytes_mode lets case-sensitive plain and whole-word searches memory-map
+    each file and scan it as bytes instead of decoding it line by line; the
+    results are the same as with bytes_mode=False (files with lone "\r"
+    line breaks are read as lines).
+
+    ignore_files honors .gitignore/.ignore files while walking, and
+    archive_workers sets the threads that decompress archive members ahead
+    of the scanner in serial mode (None picks a default, 0 reads archives
+    inline); worker processes always read their archives inline.
+
+    walk_threads > 1 lists directories concurrently. If a stats dict is
+    given it receives "files", "walk_time", "scan_time" and "elapsed" (seconds).
+
+    patterns searches several patterns (plus pattern, if given) in one pass.
+    Results then carry a sixth element: the tuple of patterns that hit the
+    line. Not available in fuzzy mode.
+
+    result_cache=True reuses the per-file results of earlier runs of the same
+    query for files whose size and mtime have not changed, and stores new
+    ones (see resultcache.ResultCache; it writes under GREAPER_CACHE_DIR).
+    The CLI and the TUI turn it on; by default every file is rescanned.
     """
-    files_to_search = get_files_to_search(path=path, include=include, exclude=exclude)
-    results = []
-    pat_flags = 0
-    if ignore_case:
-        pat_flags |= 2  # re.IGNORECASE
-
-    for file in files_to_search:
-        # --- Handle archive members ---
-        if isinstance(file, tuple):
-            archive_path, inner_path = file
-            try:
-                content = extract_file_from_archive(archive_path, inner_path)
-                lines = content.splitlines(keepends=True)
-                file_label = f"{archive_path}::{inner_path}"
-            except Exception:
-                continue
-        else:
+    if patterns:
+        patterns = ([pattern] if pattern else []) + list(patterns)
+        if fuzzy:
+            raise ValueError("patterns cannot be combined with fuzzy search")
+        query = compile_multi_query(patterns, regex=regex, word=word, ignore_case=ignore_case)
+        pattern = patterns[0]
+    elif pattern:
+        query = _make_query(pattern, fuzzy, ignore_case, word, regex, fuzzy_threshold, fuzzy_mode)
+    else:
+        raise ValueError("a pattern or patterns is required")
+    started = time.perf_counter()
+    if stats is None:
+        stats = {}
+    walker = iter_files_to_search(
+        path=path,
+        include=include,
+        exclude=exclude,
+        ignore_files=ignore_files,
+        threads=walk_threads,
+        stats=stats,
+    )
+    files_to_search = walker
+    if index and not fuzzy:
+        from greaper.index import TrigramIndex
+        with TrigramIndex(path, index_path=None if index is True else index) as trigram_index:
+            is_candidate = trigram_index.candidate_filter(patterns or pattern, regex=regex)
+        if is_candidate is not None:
+            files_to_search = filter(is_candidate, files_to_search)
+    options = dict(
+        pattern=pattern,
+        fuzzy=fuzzy,
+        ignore_case=ignore_case,
+        word=word,
+        context=context,
+        syntax_aware=syntax_aware,
+        syntax_mode=syntax_mode,
+        max_results=max_results,
+        regex=regex,
+        fuzzy_threshold=fuzzy_threshold,
+        fuzzy_mode=fuzzy_mode,
+        bytes_mode=bytes_mode,
+        # Compiled once here and shared by every file (and pickled to workers)
+        query=query,
+    )
+    cache_key = query_key(options) if result_cache else None
+    if not jobs:
+        jobs = os.cpu_count() or 1
+
+    try:
+        if jobs > 1:
+            parallel = _iter_parallel(files_to_search, options, jobs, chunk_size, deterministic, cache_key)
             try:
-                with open(file, encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-                file_label = str(file)
-            except Exception:
-                continue
-
-        # Use Cython-accelerated search if available
-        if CYTHON_SEARCH:
-            file_results = search_lines(
-                lines, pattern, fuzzy, pat_flags, word, context, max_results, regex,
-                syntax_aware, syntax_mode
-            )
-            results.extend([(file_label, *r) for r in file_results])
-            if len(results) >= max_results:
-                return results[:max_results]
+                yield from islice(parallel, max_results)
+            finally:
+                parallel.close()
+            return
+
+        if archive_workers == 0:
+            yield from _iter_results(files_to_search, options, cache_key=cache_key)
+            return
+        with ArchivePool(workers=archive_workers) as archive_pool:
+            yield from _iter_results(files_to_search, options, archive_pool, cache_key)
+    finally:
+        # Close the walker first so its walk time is recorded
+        walker.close()
+        if cache_key is not None:
+            get_result_cache().flush()
+        stats["elapsed"] = time.perf_counter() - started
+        stats["scan_time"] = stats["elapsed"] - stats.get("walk_time", 0.0)
+
+def search_files(pattern=None, path=".", **kwargs):
+    """
+    Search files for a pattern.
+    Returns a list of Match records that read like (file, line_number, match,
+    context_before, context_after) tuples (plus the patterns hit when
+    patterns= is given).
+    Accepts the same options as iter_search_files(), its streaming variant.
+    """
+    return list(iter_search_files(pattern, path=path, **kwargs))
+
+def _write_atomic(path, data, expect_mtime_ns):
+    """
+    Replace path's contents with data via a temp file in the same directory
+    and os.replace(), keeping its permissions. A symlink is kept: the file it
+    points to is the one replaced. Returns False (and leaves the file alone)
+    if it was modified since it was read.
+    """
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    if st.st_mtime_ns != expect_mtime_ns:
+        return False
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".greaper-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(temp_path, st.st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+def _replace_file(file, pattern, replacement, options, write=True, diff=False):
+    """
+    Apply batch_replace() to one file. Returns a change record, or None if
+    nothing would change. Only lines of the requested syntax kind are touched
+    when syntax_aware is set.
+    """
+    try:
+        st = os.stat(file)
+        with open(file, "rb") as f:
+            text = f.read().decode("utf-8", errors="surrogateescape")
+    except OSError as e:
+        return {"file": str(file), "lines": [], "written": False, "diff": None, "error": str(e)}
+    # Line breaks as the search saw them (universal newlines), but kept as written
+    lines = io.StringIO(text, newline="").readlines()
+    syntax_mode = options.get("syntax_mode", "all")
+    if options.get("syntax_aware") and syntax_mode != "all":
+        # Classify exactly these lines; the memoized kinds came from the search's copy
+        kinds = classify_lines(lines, language_for(file))
+        selected = [i for i in range(len(lines)) if kind_matches(kinds[i], syntax_mode)]
+    else:
+        selected = range(len(lines))
+    replaced = batch_replace(
+        [lines[i] for i in selected],
+        pattern,
+        replacement,
+        regex=options.get("regex", False),
+        ignore_case=options.get("ignore_case", False),
+        word=options.get("word", False),
+        max_replacements=options.get("max_replacements", 0),
+    )
+    new_lines = list(lines)
+    changed = []
+    for i, new_line in zip(selected, replaced):
+        if new_line != lines[i]:
+            new_lines[i] = new_line
+            changed.append(i + 1)
+    if not changed:
+        return None
+    record = {"file": str(file), "lines": changed, "written": False, "diff": None}
+    if diff:
+        record["diff"] = "".join(difflib.unified_diff(
+            lines, new_lines, fromfile=f"{file} (original)", tofile=f"{file} (replaced)",
+        ))
+    if write:
+        data = "".join(new_lines).encode("utf-8", errors="surrogateescape")
+        try:
+            record["written"] = _write_atomic(file, data, st.st_mtime_ns)
+            if not record["written"]:
+                record["error"] = "modified while replacing; skipped"
+        except OSError as e:
+            record["error"] = str(e)
+    return record
+
+def _replace_chunk(files, pattern, replacement, options, write, diff):
+    """Worker entry point for batch_replace_files(): handle a batch of files in order."""
+    records = (_replace_file(file, pattern, replacement, options, write, diff) for file in files)
+    return [record for record in records if record is not None]
+
+def _iter_candidate_files(pattern, path, search_kwargs):
+    """
+    Distinct plain files with at least one hit, in search order (archive
+    members are skipped). A file reached through symlinks is only yielded
+    the first time, so it is never rewritten twice.
+    """
+    previous = None
+    seen = set()
+    for result in iter_search_files(pattern, path=path, **search_kwargs):
+        file = result[0]
+        if file == previous or ("::" in str(file) and not os.path.exists(str(file))):
             continue
+        previous = file
+        real = os.path.realpath(file)
+        if real in seen:
+            continue
+        seen.add(real)
+        yield file
 
-        # Pure Python fallback using algorithms
-        if fuzzy:
-            for i, line in enumerate(lines):
-                if syntax_aware and not is_syntax_match(line, syntax_mode):
-                    continue
-                if similarity_ratio(pattern, line) > fuzzy_threshold:
-                    before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
-                    after = [lines[j].strip() for j in range(i+1, min(len(lines), i+1+context))] if context else []
-                    results.append(
-                        (file_label, i+1, line.strip(), before, after)
-                    )
-                    if len(results) >= max_results:
-                        return results
-        else:
-            matches = regex_search(
-                pattern, lines, ignore_case=ignore_case, regex=regex, word=word
-            )
-            for i, line in matches:
-                if syntax_aware and not is_syntax_match(line, syntax_mode):
-                    continue
-                before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
-                after = [lines[j].strip() for j in range(i+1, min(len(lines), i+1+context))] if context else []
-                results.append(
-                    (file_label, i+1, line.strip(), before, after)
-                )
-                if len(results) >= max_results:
-                    return results
-    return results
\ No newline at end of file
+def batch_replace_files(
+    pattern,
+    replacement,
+    path=".",
+    regex=False,
+    ignore_case=False,
+    word=False,
+    syntax_aware=False,
+    syntax_mode="all",
+    include=None,
+    exclude=None,
+    max_replacements=0,
+    write=True,
+    diff=False,
+    jobs=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    index=None,
+    ignore_files=True,
+):
+    """
+    Replace pattern with replacement in every file under path.
+    Candidate files are found with the normal search (so index, include and
+    exclude apply and files without a hit are never rewritten); each one is
+    then rewritten with batch_replace() and replaced atomically (temp file
+    plus rename), skipping files modified in the meantime. Archive members
+    are not rewritten.
+
+    replacement is inserted as is, unless regex is set: then it is an re
+    replacement string with group references. max_replacements limits
+    replacements per file (0 = no limit). write=False computes the changes
+    without touching any file; diff=True adds a unified diff to each record,
+    for previews. jobs > 1 (or 0/None for one per CPU) rewrites chunks of
+    chunk_size files in worker processes.
+
+    Returns one dict per changed file, in search order: "file", "lines"
+    (changed 1-based line numbers), "written", "diff" and, on failure, "error".
+    """
+    search_kwargs = dict(
+        regex=regex,
+        ignore_case=ignore_case,
+        word=word,
+        syntax_aware=syntax_aware,
+        syntax_mode=syntax_mode,
+        include=include,
+        exclude=exclude,
+        max_results=sys.maxsize,
+        index=index,
+        ignore_files=ignore_files,
+        archive_workers=0,
+        # The files are about to change; their results would only go stale
+        result_cache=False,
+    )
+    options = dict(
+        regex=regex,
+        ignore_case=ignore_case,
+        word=word,
+        syntax_aware=syntax_aware,
+        syntax_mode=syntax_mode,
+        max_replacements=max_replacements,
+    )
+    candidates = _iter_candidate_files(pattern, path, search_kwargs)
+    if not jobs:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        return _replace_chunk(candidates, pattern, replacement, options, write, diff)
+    changes = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = deque()
+        for chunk in _chunked(candidates, chunk_size):
+            futures.append(pool.submit(_replace_chunk, chunk, pattern, replacement, options, write, diff))
+            # Keep a bounded number of chunks in flight, collected in order
+            while len(futures) >= jobs * 2:
+                changes.extend(futures.popleft().result())
+        while futures:
+            changes.extend(futures.popleft().result())
+    return changes
@@ -4,14 +4,20 @@
 {
     "distutils": {
         "depends": [
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include\\numpy\\arrayobject.h",
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include\\numpy\\arrayscalars.h",
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include\\numpy\\ndarrayobject.h",
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include\\numpy\\ndarraytypes.h",
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include\\numpy\\ufuncobject.h"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayscalars.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarraytypes.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ufuncobject.h"
+        ],
+        "extra_compile_args": [
+            "-fopenmp"
+        ],
+        "extra_link_args": [
+            "-fopenmp"
         ],
         "include_dirs": [
-            "C:\\Users\\storage\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages\\numpy\\_core\\include"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
         ],
         "name": "cython_ext.fuzzy_cython",
         "sources": [
@@ -1139,8 +1145,9 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "numpy/ndarraytypes.h"
 #include "numpy/arrayscalars.h"
 #include "numpy/ufuncobject.h"
-#include "pythread.h"
+#include <stdint.h>
 #include <stdlib.h>
+#include "pythread.h"
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1370,7 +1377,7 @@ static const char *__pyx_filename;
 static const char* const __pyx_f[] = {
   "cython_ext/fuzzy_cython.pyx",
   "<stringsource>",
-  "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd",
+  "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd",
   "cpython/type.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
@@ -1593,7 +1600,7 @@ typedef struct {
 
 /* #### Code section: numeric_typedefs ### */
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":787
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":744
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -1602,7 +1609,7 @@ typedef struct {
 */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":788
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":745
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -1611,26 +1618,26 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
 */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":789
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":746
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_int64      int64_t
- * #ctypedef npy_int96      int96_t
+ * 
 */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":790
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":747
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_int96      int96_t
- * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t
 */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":794
- * #ctypedef npy_int128     int128_t
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":749
+ * ctypedef npy_int64      int64_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint16     uint16_t
@@ -1638,7 +1645,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
 */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":795
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":750
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1647,26 +1654,26 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":796
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":751
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint64     uint64_t
- * #ctypedef npy_uint96     uint96_t
+ * 
 */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":797
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":752
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_uint96     uint96_t
- * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t
 */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":801
- * #ctypedef npy_uint128    uint128_t
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":754
+ * ctypedef npy_uint64     uint64_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_float64    float64_t
@@ -1674,7 +1681,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":802
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":755
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1683,7 +1690,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
 */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":809
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":762
  * ctypedef double complex complex128_t
  * 
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1692,7 +1699,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
 */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":810
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":763
  * 
  * ctypedef npy_longlong   longlong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1701,7 +1708,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
 */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":812
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":765
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1710,7 +1717,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":813
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":766
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1719,7 +1726,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
 */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":815
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":768
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1728,7 +1735,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
 */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":816
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":769
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1737,7 +1744,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
 */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":817
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":770
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1791,7 +1798,7 @@ struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
 struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search;
 
-/* "cython_ext/fuzzy_cython.pyx":67
+/* "cython_ext/fuzzy_cython.pyx":159
  *     return 1.0 - dist / max_len
  * 
  * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
@@ -2566,6 +2573,62 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 #endif
 
+/* unicode_iter.proto */
+static CYTHON_INLINE int __Pyx_init_unicode_iteration(
+    PyObject* ustring, Py_ssize_t *length, void** data, int *kind);
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* CallUnboundCMethod1.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* GetItemIntUnicode.proto */
+#define __Pyx_GetItemInt_Unicode(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Unicode_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "string index out of range"), (Py_UCS4)-1))
+static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
+                                                           int wraparound, int boundscheck);
+
+/* PyLongBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
 /* PyObjectVectorCallKwBuilder.proto */
 CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
 #if CYTHON_VECTORCALL
@@ -2608,41 +2671,24 @@ static Py_ssize_t __Pyx_zeros[] = { 0, 0, 0, 0, 0, 0, 0, 0 };
 /* BufferIndexError.proto */
 static void __Pyx_RaiseBufferIndexError(int axis);
 
-/* GetItemIntUnicode.proto */
-#define __Pyx_GetItemInt_Unicode(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Unicode_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "string index out of range"), (Py_UCS4)-1))
-static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
-                                                           int wraparound, int boundscheck);
+#define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
+/* ErrOccurredWithGIL.proto */
+static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void);
 
-/* PyLongBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
-#endif
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-        L->ob_item[len] = x;
-        #else
-        PyList_SET_ITEM(list, len, x);
-        #endif
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* BufferIndexErrorNogil.proto */
+static void __Pyx_RaiseBufferIndexErrorNogil(int axis);
+
+/* SharedInFreeThreading.proto */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_shared_in_cpython_freethreading(x) shared(x)
 #else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#define __Pyx_shared_in_cpython_freethreading(x)
 #endif
 
 /* CallTypeTraverse.proto */
@@ -2899,7 +2945,13 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 PyObject *original_obj);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_nn___pyx_t_5numpy_int32_t(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn_uint32_t__const__(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int64_t__const__(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *, int writable_flag);
 
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
@@ -3073,11 +3125,14 @@ static CYTHON_INLINE void __Pyx_XCLEAR_MEMVIEW(__Pyx_memviewslice *, int, int);
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE uint64_t __Pyx_PyLong_As_uint64_t(PyObject *);
+
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_uint64_t(uint64_t value);
 
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyLong_From_npy_int32(npy_int32 value);
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
@@ -3208,6 +3263,10 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
 
 /* Module declarations from "numpy" */
 
+/* Module declarations from "libc.stdint" */
+
+/* Module declarations from "libc.stdlib" */
+
 /* Module declarations from "cython_ext.fuzzy_cython" */
 static PyObject *__pyx_collections_abc_Sequence = 0;
 static PyObject *generic = 0;
@@ -3218,9 +3277,19 @@ static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
 static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int, int, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython__myers64(PyObject *, PyObject *, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython__banded(PyObject *, PyObject *, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython_bounded_levenshtein(PyObject *, PyObject *, int, int __pyx_skip_dispatch); /*proto*/
 static int __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
 static double __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
 static PyObject *__pyx_f_10cython_ext_12fuzzy_cython_fuzzy_search(PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search *__pyx_optional_args); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_10cython_ext_12fuzzy_cython__peq(uint32_t, uint64_t *, uint32_t *, uint64_t *, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython__myers64_codes(uint32_t const *, Py_ssize_t, int, uint64_t *, uint32_t *, uint64_t *, int, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython__banded_codes(uint32_t const *, Py_ssize_t, uint32_t const *, Py_ssize_t, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython__max_distance(double, int, int); /*proto*/
+static double __pyx_f_10cython_ext_12fuzzy_cython__score_line(uint32_t const *, int, uint32_t const *, Py_ssize_t, uint64_t *, uint32_t *, uint64_t *, int, double, int); /*proto*/
+static int __pyx_f_10cython_ext_12fuzzy_cython__window_end(PyObject *, PyObject *, int, int, int *); /*proto*/
+static PyObject *__pyx_f_10cython_ext_12fuzzy_cython_best_window(PyObject *, PyObject *, int, int __pyx_skip_dispatch); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char const *, char *); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo const *); /*proto*/
@@ -3256,7 +3325,11 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
-static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t = { "int64_t", NULL, sizeof(__pyx_t_5numpy_int64_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_5numpy_int64_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_5numpy_int64_t), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t = { "float64_t", NULL, sizeof(__pyx_t_5numpy_float64_t), { 0 }, 0, 'R', 0, 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn_uint32_t__const__ = { "const uint32_t", NULL, sizeof(uint32_t const ), { 0 }, 0, __PYX_IS_UNSIGNED(uint32_t const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(uint32_t const ), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t__const__ = { "const int64_t", NULL, sizeof(__pyx_t_5numpy_int64_t const ), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_5numpy_int64_t const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_5numpy_int64_t const ), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "cython_ext.fuzzy_cython"
 extern int __pyx_module_is_main_cython_ext__fuzzy_cython;
@@ -3265,9 +3338,9 @@ int __pyx_module_is_main_cython_ext__fuzzy_cython = 0;
 /* Implementation of "cython_ext.fuzzy_cython" */
 /* #### Code section: global_var ### */
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin___import__;
 static PyObject *__pyx_builtin_ValueError;
-static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_AssertionError;
@@ -3279,12 +3352,17 @@ static PyObject *__pyx_builtin_ImportError;
 static const char __pyx_k_[] = ": ";
 static const char __pyx_k_O[] = "O";
 static const char __pyx_k_c[] = "c";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_k[] = "k";
+static const char __pyx_k_m[] = "m";
+static const char __pyx_k_n[] = "n";
 static const char __pyx_k_x[] = "x";
 static const char __pyx_k__2[] = ".";
 static const char __pyx_k__3[] = ">";
 static const char __pyx_k__4[] = "'";
 static const char __pyx_k__5[] = ")";
-static const char __pyx_k__6[] = "?";
+static const char __pyx_k__6[] = "";
+static const char __pyx_k__7[] = "?";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
@@ -3292,9 +3370,11 @@ static const char __pyx_k_s1[] = "s1";
 static const char __pyx_k_s2[] = "s2";
 static const char __pyx_k_abc[] = "abc";
 static const char __pyx_k_and[] = " and ";
+static const char __pyx_k_get[] = "get";
 static const char __pyx_k_got[] = " (got ";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_pat[] = "pat";
 static const char __pyx_k_pop[] = "pop";
 static const char __pyx_k_base[] = "base";
 static const char __pyx_k_dict[] = "__dict__";
@@ -3309,23 +3389,27 @@ static const char __pyx_k_spec[] = "__spec__";
 static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_text[] = "text";
 static const char __pyx_k_ASCII[] = "ASCII";
 static const char __pyx_k_at_0x[] = " at 0x";
 static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_codes[] = "codes";
 static const char __pyx_k_count[] = "count";
 static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
+static const char __pyx_k_found[] = "found";
 static const char __pyx_k_index[] = "index";
-static const char __pyx_k_int32[] = "int32";
+static const char __pyx_k_int64[] = "int64";
 static const char __pyx_k_lines[] = "lines";
 static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_other[] = "other";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
 static const char __pyx_k_strip[] = "strip";
 static const char __pyx_k_zeros[] = "zeros";
-static const char __pyx_k_arange[] = "arange";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
@@ -3335,41 +3419,60 @@ static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_object[] = " object>";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_scores[] = "scores";
+static const char __pyx_k_strict[] = "strict";
 static const char __pyx_k_struct[] = "struct";
+static const char __pyx_k_uint32[] = "uint32";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_context[] = "context";
 static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_float64[] = "float64";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_memview[] = "memview";
+static const char __pyx_k_n_lines[] = "n_lines";
+static const char __pyx_k_n_other[] = "n_other";
+static const char __pyx_k_offsets[] = "offsets";
 static const char __pyx_k_pattern[] = "pattern";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_Sequence[] = "Sequence";
 static const char __pyx_k_add_note[] = "add_note";
+static const char __pyx_k_ascii_eq[] = "ascii_eq";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_itemsize[] = "itemsize";
+static const char __pyx_k_other_eq[] = "other_eq";
+static const char __pyx_k_parallel[] = "parallel";
+static const char __pyx_k_pat_view[] = "pat_view";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_register[] = "register";
 static const char __pyx_k_set_name[] = "__set_name__";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_code_view[] = "code_view";
 static const char __pyx_k_enumerate[] = "enumerate";
 static const char __pyx_k_isenabled[] = "isenabled";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_threshold[] = "threshold";
 static const char __pyx_k_IndexError[] = "IndexError";
+static const char __pyx_k_Q_at83auCq[] = "\320\000\025\220Q\360\n\000\005\014\320\013\036\230a\230t\2408\2503\250a\250u\260C\260q\270\001";
 static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_frombuffer[] = "frombuffer";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_score_view[] = "score_view";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_best_window[] = "best_window";
 static const char __pyx_k_levenshtein[] = "levenshtein";
 static const char __pyx_k_max_results[] = "max_results";
+static const char __pyx_k_offset_view[] = "offset_view";
+static const char __pyx_k_encode_lines[] = "encode_lines";
 static const char __pyx_k_fuzzy_search[] = "fuzzy_search";
 static const char __pyx_k_initializing[] = "_initializing";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
+static const char __pyx_k_max_distance[] = "max_distance";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_MemoryView_of[] = "<MemoryView of ";
 static const char __pyx_k_class_getitem[] = "__class_getitem__";
@@ -3381,10 +3484,13 @@ static const char __pyx_k_collections_abc[] = "collections.abc";
 static const char __pyx_k_dtype_is_object[] = "dtype_is_object";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_similarity_ratio[] = "similarity_ratio";
+static const char __pyx_k_ascontiguousarray[] = "ascontiguousarray";
+static const char __pyx_k_fuzzy_score_block[] = "fuzzy_score_block";
 static const char __pyx_k_pyx_unpickle_Enum[] = "__pyx_unpickle_Enum";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_strided_and_direct[] = "<strided and direct>";
+static const char __pyx_k_bounded_levenshtein[] = "bounded_levenshtein";
 static const char __pyx_k_strided_and_indirect[] = "<strided and indirect>";
 static const char __pyx_k_Invalid_shape_in_axis[] = "Invalid shape in axis ";
 static const char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
@@ -3398,9 +3504,12 @@ static const char __pyx_k_Step_may_not_be_zero_axis_d[] = "Step may not be zero
 static const char __pyx_k_cython_ext_fuzzy_cython_pyx[] = "cython_ext/fuzzy_cython.pyx";
 static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
+static const char __pyx_k_1A_2_F_2Rs_U_1_q_E_Bc_uAQ_Bk_E[] = "\200\001\360\n\000\005\031\230\003\2301\230A\330\0042\260\"\260F\270!\2702\270R\270s\300&\310\002\310!\340\004\010\210\005\210U\220!\2201\330\010\017\210q\220\002\220\"\220E\230\027\240\001\240\023\240B\240c\250\021\250%\250u\260A\260Q\330\004\014\210B\210k\230\021\230\"\230E\240\021\240&\250\007\250q\260\016\270f\300B\300a\330\004\013\2107\220!";
+static const char __pyx_k_Q_s_4r_AQ_E_Q_3aq_3aq_uBe2Q_Ba[] = "\320\000\035\230Q\360\016\000\005\010\200s\210!\2104\210r\220\023\220A\220Q\330\010\014\210E\220\024\220Q\330\004\013\2103\210a\210q\330\004\013\2103\210a\210q\330\004\007\200u\210B\210e\2202\220Q\330\010\017\210}\230B\230a\330\004\007\200u\210C\210q\330\010\017\210q\330\004\007\200s\210#\210Q\330\010\017\210q\330\004\007\200u\210C\210q\330\010\017\210x\220q\230\004\230D\240\001\330\004\013\2107\220!\2204\220t\2301";
+static const char __pyx_k_SST_z_z_z_Qa_QgV2Q_R_A_6QSST_k[] = "\320\000*\320*@\320@S\320ST\360\022\000\005\010\200z\220\021\220'\230\021\330\010\017\210z\230\021\340\010\017\210z\230\034\240Q\240a\330\004)\250\022\320+=\270Q\270g\300V\3102\310Q\330\004-\250R\320/A\300\021\300)\3106\320QS\320ST\330\004\036\230k\250\026\250q\260\003\2602\260Q\330\0043\2602\260V\2701\270K\300x\310r\320QX\320X[\320[a\320ac\320cd\330\004\"\240!\330\004(\250\002\250+\260Q\260g\270W\300A\300^\320SY\320Y[\320[\\\330\004\021\220\023\220A\220Q\360\010\000\005\030\220q\360\n\000\005 \230q\240\010\250\001\250\026\250w\260a\340\004\007\200x\210s\220!\330\010\017\210q\330\004\013\2101\210I\220Q\220f\230I\240V\2501\250H\260A\330\004\010\210\005\210U\220!\2201\330\010\020\220\001\220\025\220a\330\004\007\200r\210\023\210A\330\010\014\210E\220\025\220a\220q\330\014\020\220\010\230\001\230\021\330\014\017\210r\220\022\2201\330\020\030\230\001\230\026\230z\250\022\2503\250a\330\020\021\330\014\025\220Q\330\014\020\220\005\220U\230!\2301\330\020\023\2205\230\001\230\023\230C\230q\330\024\034\230E\240\021\330\014\017\210v\220R\220q\330\020\030\230\001\330\020\025\220Q\220i\230q\330\020\030\230\001\230\031\240!\330\020\033\2301\330\014\024\220A\220Z\230z\250\022\2503\250a\340\004\007\200q\330\014\027\220q\230\001\330\014\026\220a\220u\230K\240q\330\020\025\220S\230\005\230R\230{\250!\2504\250{\270!\2702\270R\270s\300\"\300K\310q\320PQ\330\020\032\230'\240\032\2509\260K\270q\360\006\000\016\017\330\014\020\220\005\220U\230!\2301\330\020\032\230!\2305\240\013\2501\330\024\031\230\023\230E\240\022\240;\250a\250t\260;\270a\270r\300\022\3003\300b\310\013\320ST\320TU\330\024\036\230g\240Z\250y\270\013\3001\340\004\013\2101";
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
+static const char __pyx_k_AQ_Q_r_Bc_2_Cq_q_9F_q_y_q_q_t4t[] = "\200\001\360\014\000\005\022\220\023\220A\220Q\330\004\023\220:\230Q\330\004\007\200r\210\023\210B\210c\220\022\2202\220]\240\"\240C\240q\250\001\330\010\017\210q\330\004\017\210{\230!\2309\240F\250.\270\007\270q\300\001\330\004\007\200y\220\002\220!\330\010\017\210q\340\004\017\210q\220\007\220t\2304\230t\2401\240D\250\002\250$\250d\260*\270F\300!\3001\330\004\013\210:\220T\230\022\2306\240\021";
 static const char __pyx_k_BBSSffg_s_1_Q_a_U_1_uAQ_6_A_Qe1[] = "\320\000B\320BS\320Sf\320fg\360\n\000\005\030\220s\230!\2301\330\004\035\230Q\330\004\016\210a\330\004\010\210\005\210U\220!\2201\330\010\017\210u\220A\220Q\330\010\020\320\020 \240\001\240\031\250!\330\010\013\2106\220\023\220A\330\014\025\220Q\220e\2301\230B\230f\240C\240t\2505\260\005\260U\270#\270Q\270a\270z\310\027\320P]\320]^\330\014\024\220A\220U\230!\2302\230V\2403\240d\250%\250u\260A\260Q\260a\260w\270i\300q\310\001\310\021\310!\310>\320Yf\320fg\330\014\023\2207\230\"\230A\230Q\230c\240\024\240V\2504\250x\260w\270a\330\014\035\230Q\330\014\017\210~\230S\240\001\330\020\021\330\004\013\2101";
-static const char __pyx_k_Q_Cq_Cq_uCq_q_uCq_q_s_Q_q_42WAU[] = "\320\000\025\220Q\360\n\000\005\025\220C\220q\230\001\330\004\024\220C\220q\230\001\360\010\000\005\010\200u\210C\210q\330\010\017\210q\330\004\007\200u\210C\210q\330\010\017\210q\330\004\007\200s\210#\210Q\330\010\017\210q\360\006\000\0054\2602\260W\270A\270U\300\"\300C\300v\310R\310q\330\0043\2602\260V\2701\270E\300\022\3003\300f\310B\310a\330\004%\240Q\330\004%\240Q\340\004\010\210\005\210U\220!\2203\220e\2302\230Q\330\010\023\2201\220E\230\021\330\010\014\210E\220\025\220a\220s\230%\230r\240\021\330\014\023\2205\230\002\230!\2302\230R\230s\240#\240R\240q\250\002\250\"\250H\260A\330\014\027\220q\230\005\230T\240\021\330\020\033\2301\230B\230b\240\003\2402\240Q\330\020\033\2301\230C\230r\240\021\330\020\033\2301\230B\230b\240\003\2402\240Q\360\006\000\t\026\220^\240=\260\001\340\004\013\210;\220a\220q";
 static const char __pyx_k_All_dimensions_preceding_dimensi[] = "All dimensions preceding dimension %d must be indexed and not sliced";
 static const char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
 static const char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create a buffer that is contiguous in memory.";
@@ -3461,9 +3570,13 @@ static void __pyx_memoryviewslice___pyx_pf_15View_dot_MemoryView_16_memoryviewsl
 static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_15View_dot_MemoryView___pyx_unpickle_Enum(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2); /* proto */
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2similarity_ratio(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2); /* proto */
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_4fuzzy_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_context, int __pyx_v_max_results); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_bounded_levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, int __pyx_v_max_distance); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_4similarity_ratio(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_6fuzzy_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_context, int __pyx_v_max_results); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_8encode_lines(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lines); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_10fuzzy_score_block(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_strict, int __pyx_v_parallel); /* proto */
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_12best_window(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_text, int __pyx_v_max_distance); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3530,11 +3643,12 @@ typedef struct {
   PyTypeObject *__pyx_MemviewEnum_type;
   PyTypeObject *__pyx_memoryview_type;
   PyTypeObject *__pyx_memoryviewslice_type;
+  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
-  PyObject *__pyx_slice[1];
+  PyObject *__pyx_slice[2];
   PyObject *__pyx_tuple[3];
-  PyObject *__pyx_codeobj_tab[3];
-  PyObject *__pyx_string_tab[140];
+  PyObject *__pyx_codeobj_tab[7];
+  PyObject *__pyx_string_tab[172];
   PyObject *__pyx_float_0_7;
   PyObject *__pyx_int_0;
   PyObject *__pyx_int_1;
@@ -3614,109 +3728,141 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u__4 __pyx_string_tab[34]
 #define __pyx_kp_u__5 __pyx_string_tab[35]
 #define __pyx_kp_u__6 __pyx_string_tab[36]
-#define __pyx_n_u_abc __pyx_string_tab[37]
-#define __pyx_kp_u_add_note __pyx_string_tab[38]
-#define __pyx_n_u_allocate_buffer __pyx_string_tab[39]
-#define __pyx_kp_u_and __pyx_string_tab[40]
-#define __pyx_n_u_arange __pyx_string_tab[41]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[42]
-#define __pyx_kp_u_at_0x __pyx_string_tab[43]
-#define __pyx_n_u_base __pyx_string_tab[44]
-#define __pyx_n_u_c __pyx_string_tab[45]
-#define __pyx_n_u_class __pyx_string_tab[46]
-#define __pyx_n_u_class_getitem __pyx_string_tab[47]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[48]
-#define __pyx_kp_u_collections_abc __pyx_string_tab[49]
-#define __pyx_n_u_context __pyx_string_tab[50]
-#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[51]
-#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[52]
-#define __pyx_n_u_count __pyx_string_tab[53]
-#define __pyx_n_u_cython_ext_fuzzy_cython __pyx_string_tab[54]
-#define __pyx_kp_u_cython_ext_fuzzy_cython_pyx __pyx_string_tab[55]
-#define __pyx_n_u_dict __pyx_string_tab[56]
-#define __pyx_kp_u_disable __pyx_string_tab[57]
-#define __pyx_n_u_dtype __pyx_string_tab[58]
-#define __pyx_n_u_dtype_is_object __pyx_string_tab[59]
-#define __pyx_kp_u_enable __pyx_string_tab[60]
-#define __pyx_n_u_encode __pyx_string_tab[61]
-#define __pyx_n_u_enumerate __pyx_string_tab[62]
-#define __pyx_n_u_error __pyx_string_tab[63]
-#define __pyx_n_u_flags __pyx_string_tab[64]
-#define __pyx_n_u_format __pyx_string_tab[65]
-#define __pyx_n_u_fortran __pyx_string_tab[66]
-#define __pyx_n_u_func __pyx_string_tab[67]
-#define __pyx_n_u_fuzzy_search __pyx_string_tab[68]
-#define __pyx_kp_u_gc __pyx_string_tab[69]
-#define __pyx_n_u_getstate __pyx_string_tab[70]
-#define __pyx_kp_u_got __pyx_string_tab[71]
-#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[72]
-#define __pyx_n_u_id __pyx_string_tab[73]
-#define __pyx_n_u_import __pyx_string_tab[74]
-#define __pyx_n_u_index __pyx_string_tab[75]
-#define __pyx_n_u_initializing __pyx_string_tab[76]
-#define __pyx_n_u_int32 __pyx_string_tab[77]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[78]
-#define __pyx_kp_u_isenabled __pyx_string_tab[79]
-#define __pyx_n_u_itemsize __pyx_string_tab[80]
-#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[81]
-#define __pyx_n_u_levenshtein __pyx_string_tab[82]
-#define __pyx_n_u_lines __pyx_string_tab[83]
-#define __pyx_n_u_main __pyx_string_tab[84]
-#define __pyx_n_u_max_results __pyx_string_tab[85]
-#define __pyx_n_u_memview __pyx_string_tab[86]
-#define __pyx_n_u_mode __pyx_string_tab[87]
-#define __pyx_n_u_module __pyx_string_tab[88]
-#define __pyx_n_u_name __pyx_string_tab[89]
-#define __pyx_n_u_name_2 __pyx_string_tab[90]
-#define __pyx_n_u_ndim __pyx_string_tab[91]
-#define __pyx_n_u_new __pyx_string_tab[92]
-#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[93]
-#define __pyx_n_u_np __pyx_string_tab[94]
-#define __pyx_n_u_numpy __pyx_string_tab[95]
-#define __pyx_kp_u_numpy__core_multiarray_failed_to __pyx_string_tab[96]
-#define __pyx_kp_u_numpy__core_umath_failed_to_impo __pyx_string_tab[97]
-#define __pyx_n_u_obj __pyx_string_tab[98]
-#define __pyx_kp_u_object __pyx_string_tab[99]
-#define __pyx_n_u_pack __pyx_string_tab[100]
-#define __pyx_n_u_pattern __pyx_string_tab[101]
-#define __pyx_n_u_pickle __pyx_string_tab[102]
-#define __pyx_n_u_pop __pyx_string_tab[103]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[104]
-#define __pyx_n_u_pyx_state __pyx_string_tab[105]
-#define __pyx_n_u_pyx_type __pyx_string_tab[106]
-#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[107]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[108]
-#define __pyx_n_u_qualname __pyx_string_tab[109]
-#define __pyx_n_u_range __pyx_string_tab[110]
-#define __pyx_n_u_reduce __pyx_string_tab[111]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[112]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[113]
-#define __pyx_n_u_register __pyx_string_tab[114]
-#define __pyx_n_u_s1 __pyx_string_tab[115]
-#define __pyx_n_u_s2 __pyx_string_tab[116]
-#define __pyx_n_u_set_name __pyx_string_tab[117]
-#define __pyx_n_u_setstate __pyx_string_tab[118]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[119]
-#define __pyx_n_u_shape __pyx_string_tab[120]
-#define __pyx_n_u_similarity_ratio __pyx_string_tab[121]
-#define __pyx_n_u_size __pyx_string_tab[122]
-#define __pyx_n_u_spec __pyx_string_tab[123]
-#define __pyx_n_u_start __pyx_string_tab[124]
-#define __pyx_n_u_step __pyx_string_tab[125]
-#define __pyx_n_u_stop __pyx_string_tab[126]
-#define __pyx_kp_u_strided_and_direct __pyx_string_tab[127]
-#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[128]
-#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[129]
-#define __pyx_n_u_strip __pyx_string_tab[130]
-#define __pyx_n_u_struct __pyx_string_tab[131]
-#define __pyx_n_u_test __pyx_string_tab[132]
-#define __pyx_n_u_threshold __pyx_string_tab[133]
-#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[134]
-#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[135]
-#define __pyx_n_u_unpack __pyx_string_tab[136]
-#define __pyx_n_u_update __pyx_string_tab[137]
-#define __pyx_n_u_x __pyx_string_tab[138]
-#define __pyx_n_u_zeros __pyx_string_tab[139]
+#define __pyx_kp_u__7 __pyx_string_tab[37]
+#define __pyx_n_u_abc __pyx_string_tab[38]
+#define __pyx_kp_u_add_note __pyx_string_tab[39]
+#define __pyx_n_u_allocate_buffer __pyx_string_tab[40]
+#define __pyx_kp_u_and __pyx_string_tab[41]
+#define __pyx_n_u_ascii_eq __pyx_string_tab[42]
+#define __pyx_n_u_ascontiguousarray __pyx_string_tab[43]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[44]
+#define __pyx_kp_u_at_0x __pyx_string_tab[45]
+#define __pyx_n_u_base __pyx_string_tab[46]
+#define __pyx_n_u_best_window __pyx_string_tab[47]
+#define __pyx_n_u_bounded_levenshtein __pyx_string_tab[48]
+#define __pyx_n_u_c __pyx_string_tab[49]
+#define __pyx_n_u_class __pyx_string_tab[50]
+#define __pyx_n_u_class_getitem __pyx_string_tab[51]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[52]
+#define __pyx_n_u_code_view __pyx_string_tab[53]
+#define __pyx_n_u_codes __pyx_string_tab[54]
+#define __pyx_kp_u_collections_abc __pyx_string_tab[55]
+#define __pyx_n_u_context __pyx_string_tab[56]
+#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[57]
+#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[58]
+#define __pyx_n_u_count __pyx_string_tab[59]
+#define __pyx_n_u_cython_ext_fuzzy_cython __pyx_string_tab[60]
+#define __pyx_kp_u_cython_ext_fuzzy_cython_pyx __pyx_string_tab[61]
+#define __pyx_n_u_dict __pyx_string_tab[62]
+#define __pyx_kp_u_disable __pyx_string_tab[63]
+#define __pyx_n_u_dtype __pyx_string_tab[64]
+#define __pyx_n_u_dtype_is_object __pyx_string_tab[65]
+#define __pyx_n_u_empty __pyx_string_tab[66]
+#define __pyx_kp_u_enable __pyx_string_tab[67]
+#define __pyx_n_u_encode __pyx_string_tab[68]
+#define __pyx_n_u_encode_lines __pyx_string_tab[69]
+#define __pyx_n_u_enumerate __pyx_string_tab[70]
+#define __pyx_n_u_error __pyx_string_tab[71]
+#define __pyx_n_u_flags __pyx_string_tab[72]
+#define __pyx_n_u_float64 __pyx_string_tab[73]
+#define __pyx_n_u_format __pyx_string_tab[74]
+#define __pyx_n_u_fortran __pyx_string_tab[75]
+#define __pyx_n_u_found __pyx_string_tab[76]
+#define __pyx_n_u_frombuffer __pyx_string_tab[77]
+#define __pyx_n_u_func __pyx_string_tab[78]
+#define __pyx_n_u_fuzzy_score_block __pyx_string_tab[79]
+#define __pyx_n_u_fuzzy_search __pyx_string_tab[80]
+#define __pyx_kp_u_gc __pyx_string_tab[81]
+#define __pyx_n_u_get __pyx_string_tab[82]
+#define __pyx_n_u_getstate __pyx_string_tab[83]
+#define __pyx_kp_u_got __pyx_string_tab[84]
+#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[85]
+#define __pyx_n_u_i __pyx_string_tab[86]
+#define __pyx_n_u_id __pyx_string_tab[87]
+#define __pyx_n_u_import __pyx_string_tab[88]
+#define __pyx_n_u_index __pyx_string_tab[89]
+#define __pyx_n_u_initializing __pyx_string_tab[90]
+#define __pyx_n_u_int64 __pyx_string_tab[91]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[92]
+#define __pyx_kp_u_isenabled __pyx_string_tab[93]
+#define __pyx_n_u_itemsize __pyx_string_tab[94]
+#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[95]
+#define __pyx_n_u_k __pyx_string_tab[96]
+#define __pyx_n_u_levenshtein __pyx_string_tab[97]
+#define __pyx_n_u_lines __pyx_string_tab[98]
+#define __pyx_n_u_m __pyx_string_tab[99]
+#define __pyx_n_u_main __pyx_string_tab[100]
+#define __pyx_n_u_max_distance __pyx_string_tab[101]
+#define __pyx_n_u_max_results __pyx_string_tab[102]
+#define __pyx_n_u_memview __pyx_string_tab[103]
+#define __pyx_n_u_mode __pyx_string_tab[104]
+#define __pyx_n_u_module __pyx_string_tab[105]
+#define __pyx_n_u_n __pyx_string_tab[106]
+#define __pyx_n_u_n_lines __pyx_string_tab[107]
+#define __pyx_n_u_n_other __pyx_string_tab[108]
+#define __pyx_n_u_name __pyx_string_tab[109]
+#define __pyx_n_u_name_2 __pyx_string_tab[110]
+#define __pyx_n_u_ndim __pyx_string_tab[111]
+#define __pyx_n_u_new __pyx_string_tab[112]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[113]
+#define __pyx_n_u_np __pyx_string_tab[114]
+#define __pyx_n_u_numpy __pyx_string_tab[115]
+#define __pyx_kp_u_numpy__core_multiarray_failed_to __pyx_string_tab[116]
+#define __pyx_kp_u_numpy__core_umath_failed_to_impo __pyx_string_tab[117]
+#define __pyx_n_u_obj __pyx_string_tab[118]
+#define __pyx_kp_u_object __pyx_string_tab[119]
+#define __pyx_n_u_offset_view __pyx_string_tab[120]
+#define __pyx_n_u_offsets __pyx_string_tab[121]
+#define __pyx_n_u_other __pyx_string_tab[122]
+#define __pyx_n_u_other_eq __pyx_string_tab[123]
+#define __pyx_n_u_pack __pyx_string_tab[124]
+#define __pyx_n_u_parallel __pyx_string_tab[125]
+#define __pyx_n_u_pat __pyx_string_tab[126]
+#define __pyx_n_u_pat_view __pyx_string_tab[127]
+#define __pyx_n_u_pattern __pyx_string_tab[128]
+#define __pyx_n_u_pickle __pyx_string_tab[129]
+#define __pyx_n_u_pop __pyx_string_tab[130]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[131]
+#define __pyx_n_u_pyx_state __pyx_string_tab[132]
+#define __pyx_n_u_pyx_type __pyx_string_tab[133]
+#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[134]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[135]
+#define __pyx_n_u_qualname __pyx_string_tab[136]
+#define __pyx_n_u_range __pyx_string_tab[137]
+#define __pyx_n_u_reduce __pyx_string_tab[138]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[139]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[140]
+#define __pyx_n_u_register __pyx_string_tab[141]
+#define __pyx_n_u_s1 __pyx_string_tab[142]
+#define __pyx_n_u_s2 __pyx_string_tab[143]
+#define __pyx_n_u_score_view __pyx_string_tab[144]
+#define __pyx_n_u_scores __pyx_string_tab[145]
+#define __pyx_n_u_set_name __pyx_string_tab[146]
+#define __pyx_n_u_setstate __pyx_string_tab[147]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[148]
+#define __pyx_n_u_shape __pyx_string_tab[149]
+#define __pyx_n_u_similarity_ratio __pyx_string_tab[150]
+#define __pyx_n_u_size __pyx_string_tab[151]
+#define __pyx_n_u_spec __pyx_string_tab[152]
+#define __pyx_n_u_start __pyx_string_tab[153]
+#define __pyx_n_u_step __pyx_string_tab[154]
+#define __pyx_n_u_stop __pyx_string_tab[155]
+#define __pyx_n_u_strict __pyx_string_tab[156]
+#define __pyx_kp_u_strided_and_direct __pyx_string_tab[157]
+#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[158]
+#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[159]
+#define __pyx_n_u_strip __pyx_string_tab[160]
+#define __pyx_n_u_struct __pyx_string_tab[161]
+#define __pyx_n_u_test __pyx_string_tab[162]
+#define __pyx_n_u_text __pyx_string_tab[163]
+#define __pyx_n_u_threshold __pyx_string_tab[164]
+#define __pyx_n_u_uint32 __pyx_string_tab[165]
+#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[166]
+#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[167]
+#define __pyx_n_u_unpack __pyx_string_tab[168]
+#define __pyx_n_u_update __pyx_string_tab[169]
+#define __pyx_n_u_x __pyx_string_tab[170]
+#define __pyx_n_u_zeros __pyx_string_tab[171]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -3761,10 +3907,10 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_type___pyx_memoryview);
   Py_CLEAR(clear_module_state->__pyx_memoryviewslice_type);
   Py_CLEAR(clear_module_state->__pyx_type___pyx_memoryviewslice);
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_slice[i]); }
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_slice[i]); }
   for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<140; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<7; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<172; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   Py_CLEAR(clear_module_state->__pyx_float_0_7);
   Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_1);
@@ -3817,10 +3963,10 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_type___pyx_memoryview);
   Py_VISIT(traverse_module_state->__pyx_memoryviewslice_type);
   Py_VISIT(traverse_module_state->__pyx_type___pyx_memoryviewslice);
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_slice[i]); }
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_slice[i]); }
   for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<140; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<7; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<172; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_float_0_7);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_0);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_1);
@@ -17196,7 +17342,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":286
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":243
  *         cdef int type_num
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17207,7 +17353,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":288
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":245
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:
  *             return PyDataType_ELSIZE(self)             # <<<<<<<<<<<<<<
@@ -17217,7 +17363,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   __pyx_r = PyDataType_ELSIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":286
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":243
  *         cdef int type_num
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17230,7 +17376,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":290
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":247
  *             return PyDataType_ELSIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17241,7 +17387,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":292
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":249
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:
  *             return PyDataType_ALIGNMENT(self)             # <<<<<<<<<<<<<<
@@ -17251,7 +17397,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   __pyx_r = PyDataType_ALIGNMENT(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":290
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":247
  *             return PyDataType_ELSIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17264,7 +17410,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":296
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":253
  *         # Use fields/names with care as they may be NULL.  You must check
  *         # for this using PyDataType_HASFIELDS.
  *         @property             # <<<<<<<<<<<<<<
@@ -17278,7 +17424,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("fields", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":298
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":255
  *         @property
  *         cdef inline object fields(self):
  *             return <object>PyDataType_FIELDS(self)             # <<<<<<<<<<<<<<
@@ -17291,7 +17437,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   __pyx_r = ((PyObject *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":296
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":253
  *         # Use fields/names with care as they may be NULL.  You must check
  *         # for this using PyDataType_HASFIELDS.
  *         @property             # <<<<<<<<<<<<<<
@@ -17306,7 +17452,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":300
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":257
  *             return <object>PyDataType_FIELDS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17320,7 +17466,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("names", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":302
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":259
  *         @property
  *         cdef inline tuple names(self):
  *             return <tuple>PyDataType_NAMES(self)             # <<<<<<<<<<<<<<
@@ -17333,7 +17479,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   __pyx_r = ((PyObject*)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":300
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":257
  *             return <object>PyDataType_FIELDS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17348,7 +17494,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":307
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":264
  *         # valid (the pointer can be NULL). Most users should access
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property             # <<<<<<<<<<<<<<
@@ -17359,7 +17505,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
 static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarray(PyArray_Descr *__pyx_v_self) {
   PyArray_ArrayDescr *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":309
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":266
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:
  *             return PyDataType_SUBARRAY(self)             # <<<<<<<<<<<<<<
@@ -17369,7 +17515,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   __pyx_r = PyDataType_SUBARRAY(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":307
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":264
  *         # valid (the pointer can be NULL). Most users should access
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property             # <<<<<<<<<<<<<<
@@ -17382,7 +17528,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":311
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":268
  *             return PyDataType_SUBARRAY(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17393,7 +17539,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
 static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr *__pyx_v_self) {
   npy_uint64 __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":314
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":271
  *         cdef inline npy_uint64 flags(self) noexcept nogil:
  *             """The data types flags."""
  *             return PyDataType_FLAGS(self)             # <<<<<<<<<<<<<<
@@ -17403,7 +17549,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   __pyx_r = PyDataType_FLAGS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":311
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":268
  *             return PyDataType_SUBARRAY(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17416,7 +17562,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":323
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":280
  *     ctypedef class numpy.broadcast [object PyArrayMultiIterObject, check_size ignore]:
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17427,7 +17573,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":326
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":283
  *         cdef inline int numiter(self) noexcept nogil:
  *             """The number of arrays that need to be broadcast to the same shape."""
  *             return PyArray_MultiIter_NUMITER(self)             # <<<<<<<<<<<<<<
@@ -17437,7 +17583,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   __pyx_r = PyArray_MultiIter_NUMITER(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":323
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":280
  *     ctypedef class numpy.broadcast [object PyArrayMultiIterObject, check_size ignore]:
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17450,7 +17596,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":328
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":285
  *             return PyArray_MultiIter_NUMITER(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17461,7 +17607,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":331
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":288
  *         cdef inline npy_intp size(self) noexcept nogil:
  *             """The total broadcasted size."""
  *             return PyArray_MultiIter_SIZE(self)             # <<<<<<<<<<<<<<
@@ -17471,7 +17617,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":328
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":285
  *             return PyArray_MultiIter_NUMITER(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17484,7 +17630,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":333
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":290
  *             return PyArray_MultiIter_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17495,7 +17641,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":336
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":293
  *         cdef inline npy_intp index(self) noexcept nogil:
  *             """The current (1-d) index into the broadcasted result."""
  *             return PyArray_MultiIter_INDEX(self)             # <<<<<<<<<<<<<<
@@ -17505,7 +17651,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   __pyx_r = PyArray_MultiIter_INDEX(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":333
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":290
  *             return PyArray_MultiIter_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17518,7 +17664,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":338
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":295
  *             return PyArray_MultiIter_INDEX(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17529,7 +17675,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":341
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":298
  *         cdef inline int nd(self) noexcept nogil:
  *             """The number of dimensions in the broadcasted result."""
  *             return PyArray_MultiIter_NDIM(self)             # <<<<<<<<<<<<<<
@@ -17539,7 +17685,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   __pyx_r = PyArray_MultiIter_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":338
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":295
  *             return PyArray_MultiIter_INDEX(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17552,7 +17698,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":343
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":300
  *             return PyArray_MultiIter_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17563,7 +17709,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":346
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":303
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:
  *             """The shape of the broadcasted result."""
  *             return PyArray_MultiIter_DIMS(self)             # <<<<<<<<<<<<<<
@@ -17573,7 +17719,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   __pyx_r = PyArray_MultiIter_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":343
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":300
  *             return PyArray_MultiIter_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17586,7 +17732,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":348
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":305
  *             return PyArray_MultiIter_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17597,7 +17743,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
 static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiIterObject *__pyx_v_self) {
   void **__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":352
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":309
  *             """An array of iterator objects that holds the iterators for the arrays to be broadcast together.
  *             On return, the iterators are adjusted for broadcasting."""
  *             return PyArray_MultiIter_ITERS(self)             # <<<<<<<<<<<<<<
@@ -17607,7 +17753,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_ITERS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":348
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":305
  *             return PyArray_MultiIter_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17620,7 +17766,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":366
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":323
  *         # Instead, we use properties that map to the corresponding C-API functions.
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17631,7 +17777,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
 static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject *__pyx_v_self) {
   PyObject *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":370
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":327
  *             """Returns a borrowed reference to the object owning the data/memory.
  *             """
  *             return PyArray_BASE(self)             # <<<<<<<<<<<<<<
@@ -17641,7 +17787,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   __pyx_r = PyArray_BASE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":366
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":323
  *         # Instead, we use properties that map to the corresponding C-API functions.
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17654,7 +17800,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":372
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":329
  *             return PyArray_BASE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17668,7 +17814,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   PyArray_Descr *__pyx_t_1;
   __Pyx_RefNannySetupContext("descr", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":376
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":333
  *             """Returns an owned reference to the dtype of the array.
  *             """
  *             return <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
@@ -17681,7 +17827,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   __pyx_r = ((PyArray_Descr *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":372
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":329
  *             return PyArray_BASE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17696,7 +17842,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":378
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":335
  *             return <dtype>PyArray_DESCR(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17707,7 +17853,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
 static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":382
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":339
  *             """Returns the number of dimensions in the array.
  *             """
  *             return PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -17717,7 +17863,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   __pyx_r = PyArray_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":378
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":335
  *             return <dtype>PyArray_DESCR(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17730,7 +17876,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":384
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":341
  *             return PyArray_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17741,7 +17887,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":390
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":347
  *             Can return NULL for 0-dimensional arrays.
  *             """
  *             return PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -17751,7 +17897,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   __pyx_r = PyArray_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":384
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":341
  *             return PyArray_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17764,7 +17910,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":392
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":349
  *             return PyArray_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17775,7 +17921,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":397
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":354
  *             The number of elements matches the number of dimensions of the array (ndim).
  *             """
  *             return PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -17785,7 +17931,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   __pyx_r = PyArray_STRIDES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":392
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":349
  *             return PyArray_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17798,7 +17944,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":399
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":356
  *             return PyArray_STRIDES(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17809,7 +17955,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":403
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":360
  *             """Returns the total size (in number of elements) of the array.
  *             """
  *             return PyArray_SIZE(self)             # <<<<<<<<<<<<<<
@@ -17819,7 +17965,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   __pyx_r = PyArray_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":399
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":356
  *             return PyArray_STRIDES(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17832,7 +17978,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":405
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":362
  *             return PyArray_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17843,7 +17989,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
 static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__pyx_v_self) {
   char *__pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":412
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":369
  *             of `PyArray_DATA()` instead, which returns a 'void*'.
  *             """
  *             return PyArray_BYTES(self)             # <<<<<<<<<<<<<<
@@ -17853,7 +17999,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   __pyx_r = PyArray_BYTES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":405
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":362
  *             return PyArray_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17866,7 +18012,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":824
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -17883,7 +18029,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":825
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":778
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -17891,13 +18037,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
  * cdef inline object PyArray_MultiIterNew2(a, b):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 825, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 778, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":824
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -17916,7 +18062,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":827
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -17933,7 +18079,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":828
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":781
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -17941,13 +18087,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 828, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 781, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":827
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -17966,7 +18112,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":830
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -17983,7 +18129,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":831
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":784
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -17991,13 +18137,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 831, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 784, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":830
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -18016,7 +18162,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":833
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -18033,7 +18179,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":834
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":787
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -18041,13 +18187,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 834, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 787, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":833
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -18066,7 +18212,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":836
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -18083,7 +18229,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":837
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":790
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -18091,13 +18237,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
  * cdef inline tuple PyDataType_SHAPE(dtype d):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 837, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 790, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":836
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -18116,7 +18262,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":839
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -18131,7 +18277,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   PyObject *__pyx_t_2;
   __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":840
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -18141,7 +18287,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   __pyx_t_1 = PyDataType_HASSUBARRAY(__pyx_v_d);
   if (__pyx_t_1) {
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":841
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":794
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):
  *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
@@ -18154,7 +18300,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     __pyx_r = ((PyObject*)__pyx_t_2);
     goto __pyx_L0;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":840
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -18163,7 +18309,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
 */
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":843
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":796
  *         return <tuple>d.subarray.shape
  *     else:
  *         return ()             # <<<<<<<<<<<<<<
@@ -18177,7 +18323,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     goto __pyx_L0;
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":839
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -18192,7 +18338,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1035
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -18206,7 +18352,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1036
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":996
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -18215,16 +18361,16 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
 */
   Py_INCREF(__pyx_v_base);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1037
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":997
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
  * 
  * cdef inline object get_array_base(ndarray arr):
 */
-  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 1037, __pyx_L1_error)
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 997, __pyx_L1_error)
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1035
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -18239,7 +18385,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_L0:;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1039
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -18254,7 +18400,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1040
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1000
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -18263,7 +18409,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1041
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -18273,7 +18419,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_base == NULL);
   if (__pyx_t_1) {
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1042
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1002
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -18284,7 +18430,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1041
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -18293,7 +18439,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 */
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1043
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1003
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -18305,7 +18451,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1039
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -18320,7 +18466,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1047
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -18347,7 +18493,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_array", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1048
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18363,16 +18509,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1049
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1009
  * cdef inline int import_array() except -1:
  *     try:
  *         __pyx_import_array()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")
 */
-      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1049, __pyx_L3_error)
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1009, __pyx_L3_error)
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1048
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18386,7 +18532,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1050
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1010
  *     try:
  *         __pyx_import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18396,12 +18542,12 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1050, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1010, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1051
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
@@ -18417,16 +18563,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
         __pyx_t_8 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1051, __pyx_L5_except_error)
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1011, __pyx_L5_except_error)
         __Pyx_GOTREF(__pyx_t_8);
       }
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1051, __pyx_L5_except_error)
+      __PYX_ERR(2, 1011, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1048
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18442,7 +18588,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1047
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -18467,7 +18613,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1053
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -18494,7 +18640,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_umath", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1054
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18510,16 +18656,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1055
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1015
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
 */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1055, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1015, __pyx_L3_error)
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1054
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18533,7 +18679,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1056
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1016
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18543,12 +18689,12 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1056, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1016, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1057
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -18564,16 +18710,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
         __pyx_t_8 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1057, __pyx_L5_except_error)
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1017, __pyx_L5_except_error)
         __Pyx_GOTREF(__pyx_t_8);
       }
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1057, __pyx_L5_except_error)
+      __PYX_ERR(2, 1017, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1054
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18589,7 +18735,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1053
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -18614,7 +18760,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1059
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -18641,7 +18787,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_ufunc", 0);
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1060
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18657,16 +18803,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1061
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1021
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
 */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1061, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1021, __pyx_L3_error)
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1060
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18680,7 +18826,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1062
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1022
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18690,12 +18836,12 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1062, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1022, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1063
+      /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -18711,16 +18857,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
         __pyx_t_8 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1063, __pyx_L5_except_error)
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1023, __pyx_L5_except_error)
         __Pyx_GOTREF(__pyx_t_8);
       }
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1063, __pyx_L5_except_error)
+      __PYX_ERR(2, 1023, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1060
+    /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18736,7 +18882,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1059
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -18761,7 +18907,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1066
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18772,7 +18918,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
 static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1078
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1038
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
@@ -18782,7 +18928,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1066
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18795,7 +18941,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1081
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18806,7 +18952,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
 static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1093
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1053
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
@@ -18816,7 +18962,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1081
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18829,7 +18975,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1096
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18840,7 +18986,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
 static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
   npy_datetime __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1103
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1063
  *     also needed.  That can be found using `get_datetime64_unit`.
  *     """
  *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -18850,7 +18996,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1096
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18863,7 +19009,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1106
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18874,7 +19020,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
 static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
   npy_timedelta __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1110
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1070
  *     returns the int64 value underlying scalar numpy timedelta64 object
  *     """
  *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -18884,7 +19030,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1106
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18897,7 +19043,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   return __pyx_r;
 }
 
-/* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1113
+/* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18908,7 +19054,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
 static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
   NPY_DATETIMEUNIT __pyx_r;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1117
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1077
  *     returns the unit part of the dtype for a numpy datetime64 object.
  *     """
  *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
@@ -18918,7 +19064,7 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
   goto __pyx_L0;
 
-  /* "../../AppData/Local/Programs/Python/Python312/Lib/site-packages/numpy/__init__.cython-30.pxd":1113
+  /* "../../../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18931,10 +19077,10 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   return __pyx_r;
 }
 
-/* "cython_ext/fuzzy_cython.pyx":6
- * cimport numpy as np
+/* "cython_ext/fuzzy_cython.pyx":9
+ * from libc.stdlib cimport malloc, free
  * 
- * cdef inline int min3(int a, int b, int c):             # <<<<<<<<<<<<<<
+ * cdef inline int min3(int a, int b, int c) nogil:             # <<<<<<<<<<<<<<
  *     """Return the minimum of three integers."""
  *     if a < b:
 */
@@ -18943,8 +19089,8 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
   int __pyx_r;
   int __pyx_t_1;
 
-  /* "cython_ext/fuzzy_cython.pyx":8
- * cdef inline int min3(int a, int b, int c):
+  /* "cython_ext/fuzzy_cython.pyx":11
+ * cdef inline int min3(int a, int b, int c) nogil:
  *     """Return the minimum of three integers."""
  *     if a < b:             # <<<<<<<<<<<<<<
  *         if a < c:
@@ -18953,7 +19099,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
   __pyx_t_1 = (__pyx_v_a < __pyx_v_b);
   if (__pyx_t_1) {
 
-    /* "cython_ext/fuzzy_cython.pyx":9
+    /* "cython_ext/fuzzy_cython.pyx":12
  *     """Return the minimum of three integers."""
  *     if a < b:
  *         if a < c:             # <<<<<<<<<<<<<<
@@ -18963,7 +19109,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
     __pyx_t_1 = (__pyx_v_a < __pyx_v_c);
     if (__pyx_t_1) {
 
-      /* "cython_ext/fuzzy_cython.pyx":10
+      /* "cython_ext/fuzzy_cython.pyx":13
  *     if a < b:
  *         if a < c:
  *             return a             # <<<<<<<<<<<<<<
@@ -18973,7 +19119,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
       __pyx_r = __pyx_v_a;
       goto __pyx_L0;
 
-      /* "cython_ext/fuzzy_cython.pyx":9
+      /* "cython_ext/fuzzy_cython.pyx":12
  *     """Return the minimum of three integers."""
  *     if a < b:
  *         if a < c:             # <<<<<<<<<<<<<<
@@ -18982,7 +19128,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
 */
     }
 
-    /* "cython_ext/fuzzy_cython.pyx":12
+    /* "cython_ext/fuzzy_cython.pyx":15
  *             return a
  *         else:
  *             return c             # <<<<<<<<<<<<<<
@@ -18994,8 +19140,8 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
       goto __pyx_L0;
     }
 
-    /* "cython_ext/fuzzy_cython.pyx":8
- * cdef inline int min3(int a, int b, int c):
+    /* "cython_ext/fuzzy_cython.pyx":11
+ * cdef inline int min3(int a, int b, int c) nogil:
  *     """Return the minimum of three integers."""
  *     if a < b:             # <<<<<<<<<<<<<<
  *         if a < c:
@@ -19003,7 +19149,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
 */
   }
 
-  /* "cython_ext/fuzzy_cython.pyx":14
+  /* "cython_ext/fuzzy_cython.pyx":17
  *             return c
  *     else:
  *         if b < c:             # <<<<<<<<<<<<<<
@@ -19014,7 +19160,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
     __pyx_t_1 = (__pyx_v_b < __pyx_v_c);
     if (__pyx_t_1) {
 
-      /* "cython_ext/fuzzy_cython.pyx":15
+      /* "cython_ext/fuzzy_cython.pyx":18
  *     else:
  *         if b < c:
  *             return b             # <<<<<<<<<<<<<<
@@ -19024,7 +19170,7 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
       __pyx_r = __pyx_v_b;
       goto __pyx_L0;
 
-      /* "cython_ext/fuzzy_cython.pyx":14
+      /* "cython_ext/fuzzy_cython.pyx":17
  *             return c
  *     else:
  *         if b < c:             # <<<<<<<<<<<<<<
@@ -19033,12 +19179,12 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
 */
     }
 
-    /* "cython_ext/fuzzy_cython.pyx":17
+    /* "cython_ext/fuzzy_cython.pyx":20
  *             return b
  *         else:
  *             return c             # <<<<<<<<<<<<<<
  * 
- * cpdef int levenshtein(str s1, str s2):
+ * cdef int _myers64(str pattern, str text, int max_distance):
 */
     /*else*/ {
       __pyx_r = __pyx_v_c;
@@ -19046,10 +19192,10 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
     }
   }
 
-  /* "cython_ext/fuzzy_cython.pyx":6
- * cimport numpy as np
+  /* "cython_ext/fuzzy_cython.pyx":9
+ * from libc.stdlib cimport malloc, free
  * 
- * cdef inline int min3(int a, int b, int c):             # <<<<<<<<<<<<<<
+ * cdef inline int min3(int a, int b, int c) nogil:             # <<<<<<<<<<<<<<
  *     """Return the minimum of three integers."""
  *     if a < b:
 */
@@ -19059,825 +19205,1411 @@ static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython_min3(int __pyx_v_a,
   return __pyx_r;
 }
 
-/* "cython_ext/fuzzy_cython.pyx":19
+/* "cython_ext/fuzzy_cython.pyx":22
  *             return c
  * 
- * cpdef int levenshtein(str s1, str s2):             # <<<<<<<<<<<<<<
+ * cdef int _myers64(str pattern, str text, int max_distance):             # <<<<<<<<<<<<<<
  *     """
- *     Compute the Levenshtein distance between two Unicode strings.
-*/
-
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1levenshtein(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static int __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  int __pyx_v_len1;
-  int __pyx_v_len2;
+ *     Bit-parallel global edit distance (Hyyr's variant of Myers' algorithm)
+*/
+
+static int __pyx_f_10cython_ext_12fuzzy_cython__myers64(PyObject *__pyx_v_pattern, PyObject *__pyx_v_text, int __pyx_v_max_distance) {
+  int __pyx_v_m;
+  int __pyx_v_n;
+  uint64_t __pyx_v_ascii_eq[0x80];
+  PyObject *__pyx_v_other_eq = 0;
+  uint64_t __pyx_v_mask;
+  uint64_t __pyx_v_top;
+  uint64_t __pyx_v_vp;
+  uint64_t __pyx_v_vn;
+  uint64_t __pyx_v_eq;
+  uint64_t __pyx_v_xv;
+  uint64_t __pyx_v_xh;
+  uint64_t __pyx_v_ph;
+  uint64_t __pyx_v_mh;
+  uint64_t __pyx_v_bit;
+  int __pyx_v_score;
+  int __pyx_v_remaining;
+  Py_UCS4 __pyx_v_ch;
   int __pyx_v_i;
-  int __pyx_v_j;
-  PyArrayObject *__pyx_v_prev_row = 0;
-  PyArrayObject *__pyx_v_curr_row = 0;
-  __Pyx_memviewslice __pyx_v_prev_row_mv = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_curr_row_mv = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_cost = NULL;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_curr_row;
-  __Pyx_Buffer __pyx_pybuffer_curr_row;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_prev_row;
-  __Pyx_Buffer __pyx_pybuffer_prev_row;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  uint64_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  size_t __pyx_t_9;
-  __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  long __pyx_t_11;
-  long __pyx_t_12;
-  int __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  int __pyx_t_15;
-  long __pyx_t_16;
-  long __pyx_t_17;
-  long __pyx_t_18;
-  Py_UCS4 __pyx_t_19;
-  Py_UCS4 __pyx_t_20;
-  int __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  Py_ssize_t __pyx_t_23;
-  int __pyx_t_24;
-  __Pyx_memviewslice __pyx_t_25 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_7;
+  void *__pyx_t_8;
+  int __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_UCS4 __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  long __pyx_t_14;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("levenshtein", 0);
-  __pyx_pybuffer_prev_row.pybuffer.buf = NULL;
-  __pyx_pybuffer_prev_row.refcount = 0;
-  __pyx_pybuffernd_prev_row.data = NULL;
-  __pyx_pybuffernd_prev_row.rcbuffer = &__pyx_pybuffer_prev_row;
-  __pyx_pybuffer_curr_row.pybuffer.buf = NULL;
-  __pyx_pybuffer_curr_row.refcount = 0;
-  __pyx_pybuffernd_curr_row.data = NULL;
-  __pyx_pybuffernd_curr_row.rcbuffer = &__pyx_pybuffer_curr_row;
-
-  /* "cython_ext/fuzzy_cython.pyx":24
- *     Handles all edge cases, including empty strings.
+  __Pyx_RefNannySetupContext("_myers64", 0);
+
+  /* "cython_ext/fuzzy_cython.pyx":28
+ *     Returns max_distance + 1 once the distance cannot stay within max_distance.
  *     """
- *     cdef int len1 = len(s1)             # <<<<<<<<<<<<<<
- *     cdef int len2 = len(s2)
- *     cdef int i, j
+ *     cdef int m = len(pattern)             # <<<<<<<<<<<<<<
+ *     cdef int n = len(text)
+ *     cdef uint64_t ascii_eq[128]
 */
-  if (unlikely(__pyx_v_s1 == Py_None)) {
+  if (unlikely(__pyx_v_pattern == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 24, __pyx_L1_error)
+    __PYX_ERR(0, 28, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 24, __pyx_L1_error)
-  __pyx_v_len1 = __pyx_t_1;
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_pattern); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_1;
 
-  /* "cython_ext/fuzzy_cython.pyx":25
+  /* "cython_ext/fuzzy_cython.pyx":29
  *     """
- *     cdef int len1 = len(s1)
- *     cdef int len2 = len(s2)             # <<<<<<<<<<<<<<
- *     cdef int i, j
- * 
+ *     cdef int m = len(pattern)
+ *     cdef int n = len(text)             # <<<<<<<<<<<<<<
+ *     cdef uint64_t ascii_eq[128]
+ *     cdef dict other_eq = {}
 */
-  if (unlikely(__pyx_v_s2 == Py_None)) {
+  if (unlikely(__pyx_v_text == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 25, __pyx_L1_error)
+    __PYX_ERR(0, 29, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 25, __pyx_L1_error)
-  __pyx_v_len2 = __pyx_t_1;
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_text); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
 
-  /* "cython_ext/fuzzy_cython.pyx":29
- * 
- *     # Edge cases
- *     if len1 == 0:             # <<<<<<<<<<<<<<
- *         return len2
- *     if len2 == 0:
+  /* "cython_ext/fuzzy_cython.pyx":31
+ *     cdef int n = len(text)
+ *     cdef uint64_t ascii_eq[128]
+ *     cdef dict other_eq = {}             # <<<<<<<<<<<<<<
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
 */
-  __pyx_t_2 = (__pyx_v_len1 == 0);
-  if (__pyx_t_2) {
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_other_eq = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-    /* "cython_ext/fuzzy_cython.pyx":30
- *     # Edge cases
- *     if len1 == 0:
- *         return len2             # <<<<<<<<<<<<<<
- *     if len2 == 0:
- *         return len1
+  /* "cython_ext/fuzzy_cython.pyx":32
+ *     cdef uint64_t ascii_eq[128]
+ *     cdef dict other_eq = {}
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF             # <<<<<<<<<<<<<<
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1
 */
-    __pyx_r = __pyx_v_len2;
-    goto __pyx_L0;
+  __pyx_t_4 = (__pyx_v_m < 64);
+  if (__pyx_t_4) {
+    __pyx_t_3 = ((((uint64_t)1) << __pyx_v_m) - 1);
+  } else {
+    __pyx_t_3 = ((uint64_t)0xFFFFFFFFFFFFFFFF);
+  }
+  __pyx_v_mask = __pyx_t_3;
+
+  /* "cython_ext/fuzzy_cython.pyx":33
+ *     cdef dict other_eq = {}
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)             # <<<<<<<<<<<<<<
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1
+ *     cdef int score = m
+*/
+  __pyx_v_top = (((uint64_t)1) << (__pyx_v_m - 1));
+
+  /* "cython_ext/fuzzy_cython.pyx":34
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1             # <<<<<<<<<<<<<<
+ *     cdef int score = m
+ *     cdef int remaining = n
+*/
+  __pyx_v_vp = __pyx_v_mask;
+  __pyx_v_vn = 0;
+  __pyx_v_bit = 1;
+
+  /* "cython_ext/fuzzy_cython.pyx":35
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1
+ *     cdef int score = m             # <<<<<<<<<<<<<<
+ *     cdef int remaining = n
+ *     cdef Py_UCS4 ch
+*/
+  __pyx_v_score = __pyx_v_m;
+
+  /* "cython_ext/fuzzy_cython.pyx":36
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1
+ *     cdef int score = m
+ *     cdef int remaining = n             # <<<<<<<<<<<<<<
+ *     cdef Py_UCS4 ch
+ *     cdef int i
+*/
+  __pyx_v_remaining = __pyx_v_n;
 
-    /* "cython_ext/fuzzy_cython.pyx":29
+  /* "cython_ext/fuzzy_cython.pyx":40
+ *     cdef int i
  * 
- *     # Edge cases
- *     if len1 == 0:             # <<<<<<<<<<<<<<
- *         return len2
- *     if len2 == 0:
+ *     for i in range(128):             # <<<<<<<<<<<<<<
+ *         ascii_eq[i] = 0
+ *     for ch in pattern:
 */
+  for (__pyx_t_5 = 0; __pyx_t_5 < 0x80; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "cython_ext/fuzzy_cython.pyx":41
+ * 
+ *     for i in range(128):
+ *         ascii_eq[i] = 0             # <<<<<<<<<<<<<<
+ *     for ch in pattern:
+ *         if ch < 128:
+*/
+    (__pyx_v_ascii_eq[__pyx_v_i]) = 0;
   }
 
-  /* "cython_ext/fuzzy_cython.pyx":31
- *     if len1 == 0:
- *         return len2
- *     if len2 == 0:             # <<<<<<<<<<<<<<
- *         return len1
- *     if s1 == s2:
+  /* "cython_ext/fuzzy_cython.pyx":42
+ *     for i in range(128):
+ *         ascii_eq[i] = 0
+ *     for ch in pattern:             # <<<<<<<<<<<<<<
+ *         if ch < 128:
+ *             ascii_eq[ch] |= bit
 */
-  __pyx_t_2 = (__pyx_v_len2 == 0);
-  if (__pyx_t_2) {
+  if (unlikely(__pyx_v_pattern == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
+    __PYX_ERR(0, 42, __pyx_L1_error)
+  }
+  __Pyx_INCREF(__pyx_v_pattern);
+  __pyx_t_6 = __pyx_v_pattern;
+  __pyx_t_9 = __Pyx_init_unicode_iteration(__pyx_t_6, (&__pyx_t_7), (&__pyx_t_8), (&__pyx_t_5)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 42, __pyx_L1_error)
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_7; __pyx_t_10++) {
+    __pyx_t_1 = __pyx_t_10;
+    __pyx_v_ch = __Pyx_PyUnicode_READ(__pyx_t_5, __pyx_t_8, __pyx_t_1);
 
-    /* "cython_ext/fuzzy_cython.pyx":32
- *         return len2
- *     if len2 == 0:
- *         return len1             # <<<<<<<<<<<<<<
- *     if s1 == s2:
- *         return 0
+    /* "cython_ext/fuzzy_cython.pyx":43
+ *         ascii_eq[i] = 0
+ *     for ch in pattern:
+ *         if ch < 128:             # <<<<<<<<<<<<<<
+ *             ascii_eq[ch] |= bit
+ *         else:
 */
-    __pyx_r = __pyx_v_len1;
-    goto __pyx_L0;
+    __pyx_t_4 = (__pyx_v_ch < 0x80);
+    if (__pyx_t_4) {
 
-    /* "cython_ext/fuzzy_cython.pyx":31
- *     if len1 == 0:
- *         return len2
- *     if len2 == 0:             # <<<<<<<<<<<<<<
- *         return len1
- *     if s1 == s2:
+      /* "cython_ext/fuzzy_cython.pyx":44
+ *     for ch in pattern:
+ *         if ch < 128:
+ *             ascii_eq[ch] |= bit             # <<<<<<<<<<<<<<
+ *         else:
+ *             other_eq[ch] = other_eq.get(ch, 0) | bit
 */
-  }
+      __pyx_t_11 = __pyx_v_ch;
+      (__pyx_v_ascii_eq[__pyx_t_11]) = ((__pyx_v_ascii_eq[__pyx_t_11]) | __pyx_v_bit);
 
-  /* "cython_ext/fuzzy_cython.pyx":33
- *     if len2 == 0:
- *         return len1
- *     if s1 == s2:             # <<<<<<<<<<<<<<
- *         return 0
- * 
+      /* "cython_ext/fuzzy_cython.pyx":43
+ *         ascii_eq[i] = 0
+ *     for ch in pattern:
+ *         if ch < 128:             # <<<<<<<<<<<<<<
+ *             ascii_eq[ch] |= bit
+ *         else:
 */
-  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_s1, __pyx_v_s2, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 33, __pyx_L1_error)
-  if (__pyx_t_2) {
+      goto __pyx_L7;
+    }
 
-    /* "cython_ext/fuzzy_cython.pyx":34
- *         return len1
- *     if s1 == s2:
- *         return 0             # <<<<<<<<<<<<<<
+    /* "cython_ext/fuzzy_cython.pyx":46
+ *             ascii_eq[ch] |= bit
+ *         else:
+ *             other_eq[ch] = other_eq.get(ch, 0) | bit             # <<<<<<<<<<<<<<
+ *         bit <<= 1
  * 
- *     # Allocate two rows for dynamic programming using NumPy arrays
 */
-    __pyx_r = 0;
-    goto __pyx_L0;
+    /*else*/ {
+      __pyx_t_2 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_12 = __Pyx_PyDict_GetItemDefault(__pyx_v_other_eq, __pyx_t_2, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyLong_From_uint64_t(__pyx_v_bit); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_13 = PyNumber_Or(__pyx_t_12, __pyx_t_2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      if (unlikely((PyDict_SetItem(__pyx_v_other_eq, __pyx_t_2, __pyx_t_13) < 0))) __PYX_ERR(0, 46, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    }
+    __pyx_L7:;
 
-    /* "cython_ext/fuzzy_cython.pyx":33
- *     if len2 == 0:
- *         return len1
- *     if s1 == s2:             # <<<<<<<<<<<<<<
- *         return 0
+    /* "cython_ext/fuzzy_cython.pyx":47
+ *         else:
+ *             other_eq[ch] = other_eq.get(ch, 0) | bit
+ *         bit <<= 1             # <<<<<<<<<<<<<<
  * 
+ *     for ch in text:
 */
+    __pyx_v_bit = (__pyx_v_bit << 1);
   }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "cython_ext/fuzzy_cython.pyx":37
+  /* "cython_ext/fuzzy_cython.pyx":49
+ *         bit <<= 1
  * 
- *     # Allocate two rows for dynamic programming using NumPy arrays
- *     cdef np.ndarray[np.int32_t, ndim=1] prev_row = np.arange(len2 + 1, dtype=np.int32)             # <<<<<<<<<<<<<<
- *     cdef np.ndarray[np.int32_t, ndim=1] curr_row = np.zeros(len2 + 1, dtype=np.int32)
- *     cdef np.int32_t[:] prev_row_mv = prev_row
+ *     for ch in text:             # <<<<<<<<<<<<<<
+ *         if ch < 128:
+ *             eq = ascii_eq[ch]
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_arange); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyLong_From_long((__pyx_v_len2 + 1)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_9 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
-    assert(__pyx_t_4);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
-    __Pyx_INCREF(__pyx_t_4);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
-    __pyx_t_9 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_5};
-    __pyx_t_7 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 37, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_8, __pyx_t_7, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_6, __pyx_callargs+__pyx_t_9, (2-__pyx_t_9) | (__pyx_t_9*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 37, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_mstate_global->__pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 37, __pyx_L1_error)
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_prev_row.rcbuffer->pybuffer, (PyObject*)((PyArrayObject *)__pyx_t_3), &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_prev_row = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_prev_row.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 37, __pyx_L1_error)
-    } else {__pyx_pybuffernd_prev_row.diminfo[0].strides = __pyx_pybuffernd_prev_row.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_prev_row.diminfo[0].shape = __pyx_pybuffernd_prev_row.rcbuffer->pybuffer.shape[0];
-    }
+  if (unlikely(__pyx_v_text == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
+    __PYX_ERR(0, 49, __pyx_L1_error)
   }
-  __pyx_v_prev_row = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
+  __Pyx_INCREF(__pyx_v_text);
+  __pyx_t_6 = __pyx_v_text;
+  __pyx_t_9 = __Pyx_init_unicode_iteration(__pyx_t_6, (&__pyx_t_1), (&__pyx_t_8), (&__pyx_t_5)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 49, __pyx_L1_error)
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_1; __pyx_t_10++) {
+    __pyx_t_7 = __pyx_t_10;
+    __pyx_v_ch = __Pyx_PyUnicode_READ(__pyx_t_5, __pyx_t_8, __pyx_t_7);
 
-  /* "cython_ext/fuzzy_cython.pyx":38
- *     # Allocate two rows for dynamic programming using NumPy arrays
- *     cdef np.ndarray[np.int32_t, ndim=1] prev_row = np.arange(len2 + 1, dtype=np.int32)
- *     cdef np.ndarray[np.int32_t, ndim=1] curr_row = np.zeros(len2 + 1, dtype=np.int32)             # <<<<<<<<<<<<<<
- *     cdef np.int32_t[:] prev_row_mv = prev_row
- *     cdef np.int32_t[:] curr_row_mv = curr_row
+    /* "cython_ext/fuzzy_cython.pyx":50
+ * 
+ *     for ch in text:
+ *         if ch < 128:             # <<<<<<<<<<<<<<
+ *             eq = ascii_eq[ch]
+ *         elif other_eq:
 */
-  __pyx_t_6 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyLong_From_long((__pyx_v_len2 + 1)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_9 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_8);
-    assert(__pyx_t_6);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_8);
-    __Pyx_INCREF(__pyx_t_6);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_8, __pyx__function);
-    __pyx_t_9 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_6, __pyx_t_7};
-    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 38, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_5, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_8, __pyx_callargs+__pyx_t_9, (2-__pyx_t_9) | (__pyx_t_9*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_mstate_global->__pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 38, __pyx_L1_error)
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_curr_row.rcbuffer->pybuffer, (PyObject*)((PyArrayObject *)__pyx_t_3), &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_curr_row = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_curr_row.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 38, __pyx_L1_error)
-    } else {__pyx_pybuffernd_curr_row.diminfo[0].strides = __pyx_pybuffernd_curr_row.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_curr_row.diminfo[0].shape = __pyx_pybuffernd_curr_row.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_v_curr_row = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
+    __pyx_t_4 = (__pyx_v_ch < 0x80);
+    if (__pyx_t_4) {
 
-  /* "cython_ext/fuzzy_cython.pyx":39
- *     cdef np.ndarray[np.int32_t, ndim=1] prev_row = np.arange(len2 + 1, dtype=np.int32)
- *     cdef np.ndarray[np.int32_t, ndim=1] curr_row = np.zeros(len2 + 1, dtype=np.int32)
- *     cdef np.int32_t[:] prev_row_mv = prev_row             # <<<<<<<<<<<<<<
- *     cdef np.int32_t[:] curr_row_mv = curr_row
- * 
+      /* "cython_ext/fuzzy_cython.pyx":51
+ *     for ch in text:
+ *         if ch < 128:
+ *             eq = ascii_eq[ch]             # <<<<<<<<<<<<<<
+ *         elif other_eq:
+ *             eq = other_eq.get(ch, 0)
 */
-  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_nn___pyx_t_5numpy_int32_t(((PyObject *)__pyx_v_prev_row), PyBUF_WRITABLE); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __pyx_v_prev_row_mv = __pyx_t_10;
-  __pyx_t_10.memview = NULL;
-  __pyx_t_10.data = NULL;
+      __pyx_v_eq = (__pyx_v_ascii_eq[__pyx_v_ch]);
 
-  /* "cython_ext/fuzzy_cython.pyx":40
- *     cdef np.ndarray[np.int32_t, ndim=1] curr_row = np.zeros(len2 + 1, dtype=np.int32)
- *     cdef np.int32_t[:] prev_row_mv = prev_row
- *     cdef np.int32_t[:] curr_row_mv = curr_row             # <<<<<<<<<<<<<<
+      /* "cython_ext/fuzzy_cython.pyx":50
  * 
- *     for i in range(1, len1 + 1):
+ *     for ch in text:
+ *         if ch < 128:             # <<<<<<<<<<<<<<
+ *             eq = ascii_eq[ch]
+ *         elif other_eq:
 */
-  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_nn___pyx_t_5numpy_int32_t(((PyObject *)__pyx_v_curr_row), PyBUF_WRITABLE); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __pyx_v_curr_row_mv = __pyx_t_10;
-  __pyx_t_10.memview = NULL;
-  __pyx_t_10.data = NULL;
+      goto __pyx_L10;
+    }
 
-  /* "cython_ext/fuzzy_cython.pyx":42
- *     cdef np.int32_t[:] curr_row_mv = curr_row
- * 
- *     for i in range(1, len1 + 1):             # <<<<<<<<<<<<<<
- *         curr_row_mv[0] = i
- *         for j in range(1, len2 + 1):
+    /* "cython_ext/fuzzy_cython.pyx":52
+ *         if ch < 128:
+ *             eq = ascii_eq[ch]
+ *         elif other_eq:             # <<<<<<<<<<<<<<
+ *             eq = other_eq.get(ch, 0)
+ *         else:
 */
-  __pyx_t_11 = (__pyx_v_len1 + 1);
-  __pyx_t_12 = __pyx_t_11;
-  for (__pyx_t_13 = 1; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
-    __pyx_v_i = __pyx_t_13;
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_other_eq); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 52, __pyx_L1_error)
+    if (__pyx_t_4) {
 
-    /* "cython_ext/fuzzy_cython.pyx":43
- * 
- *     for i in range(1, len1 + 1):
- *         curr_row_mv[0] = i             # <<<<<<<<<<<<<<
- *         for j in range(1, len2 + 1):
- *             cost = 0 if s1[i - 1] == s2[j - 1] else 1
+      /* "cython_ext/fuzzy_cython.pyx":53
+ *             eq = ascii_eq[ch]
+ *         elif other_eq:
+ *             eq = other_eq.get(ch, 0)             # <<<<<<<<<<<<<<
+ *         else:
+ *             eq = 0
 */
-    __pyx_t_14 = 0;
-    __pyx_t_15 = -1;
-    if (__pyx_t_14 < 0) {
-      __pyx_t_14 += __pyx_v_curr_row_mv.shape[0];
-      if (unlikely(__pyx_t_14 < 0)) __pyx_t_15 = 0;
-    } else if (unlikely(__pyx_t_14 >= __pyx_v_curr_row_mv.shape[0])) __pyx_t_15 = 0;
-    if (unlikely(__pyx_t_15 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_15);
-      __PYX_ERR(0, 43, __pyx_L1_error)
+      __pyx_t_13 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 53, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_other_eq, __pyx_t_13, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_3 = __Pyx_PyLong_As_uint64_t(__pyx_t_2); if (unlikely((__pyx_t_3 == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_v_eq = __pyx_t_3;
+
+      /* "cython_ext/fuzzy_cython.pyx":52
+ *         if ch < 128:
+ *             eq = ascii_eq[ch]
+ *         elif other_eq:             # <<<<<<<<<<<<<<
+ *             eq = other_eq.get(ch, 0)
+ *         else:
+*/
+      goto __pyx_L10;
     }
-    *((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_curr_row_mv.data + __pyx_t_14 * __pyx_v_curr_row_mv.strides[0]) )) = __pyx_v_i;
 
-    /* "cython_ext/fuzzy_cython.pyx":44
- *     for i in range(1, len1 + 1):
- *         curr_row_mv[0] = i
- *         for j in range(1, len2 + 1):             # <<<<<<<<<<<<<<
- *             cost = 0 if s1[i - 1] == s2[j - 1] else 1
- *             curr_row_mv[j] = min3(
-*/
-    __pyx_t_16 = (__pyx_v_len2 + 1);
-    __pyx_t_17 = __pyx_t_16;
-    for (__pyx_t_15 = 1; __pyx_t_15 < __pyx_t_17; __pyx_t_15+=1) {
-      __pyx_v_j = __pyx_t_15;
-
-      /* "cython_ext/fuzzy_cython.pyx":45
- *         curr_row_mv[0] = i
- *         for j in range(1, len2 + 1):
- *             cost = 0 if s1[i - 1] == s2[j - 1] else 1             # <<<<<<<<<<<<<<
- *             curr_row_mv[j] = min3(
- *                 curr_row_mv[j - 1] + 1,      # insertion
-*/
-      __pyx_t_18 = (__pyx_v_i - 1);
-      __pyx_t_19 = __Pyx_GetItemInt_Unicode(__pyx_v_s1, __pyx_t_18, long, 1, __Pyx_PyLong_From_long, 0, 1, 1); if (unlikely(__pyx_t_19 == (Py_UCS4)-1)) __PYX_ERR(0, 45, __pyx_L1_error)
-      __pyx_t_18 = (__pyx_v_j - 1);
-      __pyx_t_20 = __Pyx_GetItemInt_Unicode(__pyx_v_s2, __pyx_t_18, long, 1, __Pyx_PyLong_From_long, 0, 1, 1); if (unlikely(__pyx_t_20 == (Py_UCS4)-1)) __PYX_ERR(0, 45, __pyx_L1_error)
-      __pyx_t_2 = (__pyx_t_19 == __pyx_t_20);
-      if (__pyx_t_2) {
-        __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
-        __pyx_t_3 = __pyx_mstate_global->__pyx_int_0;
-      } else {
-        __Pyx_INCREF(__pyx_mstate_global->__pyx_int_1);
-        __pyx_t_3 = __pyx_mstate_global->__pyx_int_1;
-      }
-      __Pyx_XDECREF_SET(__pyx_v_cost, __pyx_t_3);
-      __pyx_t_3 = 0;
+    /* "cython_ext/fuzzy_cython.pyx":55
+ *             eq = other_eq.get(ch, 0)
+ *         else:
+ *             eq = 0             # <<<<<<<<<<<<<<
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+*/
+    /*else*/ {
+      __pyx_v_eq = 0;
+    }
+    __pyx_L10:;
+
+    /* "cython_ext/fuzzy_cython.pyx":56
+ *         else:
+ *             eq = 0
+ *         xv = eq | vn             # <<<<<<<<<<<<<<
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)
+*/
+    __pyx_v_xv = (__pyx_v_eq | __pyx_v_vn);
+
+    /* "cython_ext/fuzzy_cython.pyx":57
+ *             eq = 0
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq             # <<<<<<<<<<<<<<
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+*/
+    __pyx_v_xh = ((((__pyx_v_eq & __pyx_v_vp) + __pyx_v_vp) ^ __pyx_v_vp) | __pyx_v_eq);
+
+    /* "cython_ext/fuzzy_cython.pyx":58
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)             # <<<<<<<<<<<<<<
+ *         mh = vp & xh
+ *         if ph & top:
+*/
+    __pyx_v_ph = (__pyx_v_vn | ((~(__pyx_v_xh | __pyx_v_vp)) & __pyx_v_mask));
+
+    /* "cython_ext/fuzzy_cython.pyx":59
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh             # <<<<<<<<<<<<<<
+ *         if ph & top:
+ *             score += 1
+*/
+    __pyx_v_mh = (__pyx_v_vp & __pyx_v_xh);
+
+    /* "cython_ext/fuzzy_cython.pyx":60
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+ *         if ph & top:             # <<<<<<<<<<<<<<
+ *             score += 1
+ *         elif mh & top:
+*/
+    __pyx_t_4 = ((__pyx_v_ph & __pyx_v_top) != 0);
+    if (__pyx_t_4) {
 
-      /* "cython_ext/fuzzy_cython.pyx":47
- *             cost = 0 if s1[i - 1] == s2[j - 1] else 1
- *             curr_row_mv[j] = min3(
- *                 curr_row_mv[j - 1] + 1,      # insertion             # <<<<<<<<<<<<<<
- *                 prev_row_mv[j] + 1,          # deletion
- *                 prev_row_mv[j - 1] + cost    # substitution
+      /* "cython_ext/fuzzy_cython.pyx":61
+ *         mh = vp & xh
+ *         if ph & top:
+ *             score += 1             # <<<<<<<<<<<<<<
+ *         elif mh & top:
+ *             score -= 1
 */
-      __pyx_t_14 = (__pyx_v_j - 1);
-      __pyx_t_21 = -1;
-      if (__pyx_t_14 < 0) {
-        __pyx_t_14 += __pyx_v_curr_row_mv.shape[0];
-        if (unlikely(__pyx_t_14 < 0)) __pyx_t_21 = 0;
-      } else if (unlikely(__pyx_t_14 >= __pyx_v_curr_row_mv.shape[0])) __pyx_t_21 = 0;
-      if (unlikely(__pyx_t_21 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_21);
-        __PYX_ERR(0, 47, __pyx_L1_error)
-      }
+      __pyx_v_score = (__pyx_v_score + 1);
 
-      /* "cython_ext/fuzzy_cython.pyx":48
- *             curr_row_mv[j] = min3(
- *                 curr_row_mv[j - 1] + 1,      # insertion
- *                 prev_row_mv[j] + 1,          # deletion             # <<<<<<<<<<<<<<
- *                 prev_row_mv[j - 1] + cost    # substitution
- *             )
+      /* "cython_ext/fuzzy_cython.pyx":60
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+ *         if ph & top:             # <<<<<<<<<<<<<<
+ *             score += 1
+ *         elif mh & top:
 */
-      __pyx_t_22 = __pyx_v_j;
-      __pyx_t_21 = -1;
-      if (__pyx_t_22 < 0) {
-        __pyx_t_22 += __pyx_v_prev_row_mv.shape[0];
-        if (unlikely(__pyx_t_22 < 0)) __pyx_t_21 = 0;
-      } else if (unlikely(__pyx_t_22 >= __pyx_v_prev_row_mv.shape[0])) __pyx_t_21 = 0;
-      if (unlikely(__pyx_t_21 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_21);
-        __PYX_ERR(0, 48, __pyx_L1_error)
-      }
+      goto __pyx_L11;
+    }
 
-      /* "cython_ext/fuzzy_cython.pyx":49
- *                 curr_row_mv[j - 1] + 1,      # insertion
- *                 prev_row_mv[j] + 1,          # deletion
- *                 prev_row_mv[j - 1] + cost    # substitution             # <<<<<<<<<<<<<<
- *             )
- *         # Swap rows for next iteration
+    /* "cython_ext/fuzzy_cython.pyx":62
+ *         if ph & top:
+ *             score += 1
+ *         elif mh & top:             # <<<<<<<<<<<<<<
+ *             score -= 1
+ *         remaining -= 1
 */
-      __pyx_t_23 = (__pyx_v_j - 1);
-      __pyx_t_21 = -1;
-      if (__pyx_t_23 < 0) {
-        __pyx_t_23 += __pyx_v_prev_row_mv.shape[0];
-        if (unlikely(__pyx_t_23 < 0)) __pyx_t_21 = 0;
-      } else if (unlikely(__pyx_t_23 >= __pyx_v_prev_row_mv.shape[0])) __pyx_t_21 = 0;
-      if (unlikely(__pyx_t_21 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_21);
-        __PYX_ERR(0, 49, __pyx_L1_error)
-      }
-      __pyx_t_3 = __Pyx_PyLong_From_npy_int32((*((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_prev_row_mv.data + __pyx_t_23 * __pyx_v_prev_row_mv.strides[0]) )))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_8 = PyNumber_Add(__pyx_t_3, __pyx_v_cost); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_21 = __Pyx_PyLong_As_int(__pyx_t_8); if (unlikely((__pyx_t_21 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_4 = ((__pyx_v_mh & __pyx_v_top) != 0);
+    if (__pyx_t_4) {
 
-      /* "cython_ext/fuzzy_cython.pyx":46
- *         for j in range(1, len2 + 1):
- *             cost = 0 if s1[i - 1] == s2[j - 1] else 1
- *             curr_row_mv[j] = min3(             # <<<<<<<<<<<<<<
- *                 curr_row_mv[j - 1] + 1,      # insertion
- *                 prev_row_mv[j] + 1,          # deletion
+      /* "cython_ext/fuzzy_cython.pyx":63
+ *             score += 1
+ *         elif mh & top:
+ *             score -= 1             # <<<<<<<<<<<<<<
+ *         remaining -= 1
+ *         # Each remaining character lowers the last row by at most one
+*/
+      __pyx_v_score = (__pyx_v_score - 1);
+
+      /* "cython_ext/fuzzy_cython.pyx":62
+ *         if ph & top:
+ *             score += 1
+ *         elif mh & top:             # <<<<<<<<<<<<<<
+ *             score -= 1
+ *         remaining -= 1
 */
-      __pyx_t_24 = __pyx_f_10cython_ext_12fuzzy_cython_min3(((*((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_curr_row_mv.data + __pyx_t_14 * __pyx_v_curr_row_mv.strides[0]) ))) + 1), ((*((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_prev_row_mv.data + __pyx_t_22 * __pyx_v_prev_row_mv.strides[0]) ))) + 1), __pyx_t_21); if (unlikely(__pyx_t_24 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 46, __pyx_L1_error)
-      __pyx_t_22 = __pyx_v_j;
-      __pyx_t_21 = -1;
-      if (__pyx_t_22 < 0) {
-        __pyx_t_22 += __pyx_v_curr_row_mv.shape[0];
-        if (unlikely(__pyx_t_22 < 0)) __pyx_t_21 = 0;
-      } else if (unlikely(__pyx_t_22 >= __pyx_v_curr_row_mv.shape[0])) __pyx_t_21 = 0;
-      if (unlikely(__pyx_t_21 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_21);
-        __PYX_ERR(0, 46, __pyx_L1_error)
-      }
-      *((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_curr_row_mv.data + __pyx_t_22 * __pyx_v_curr_row_mv.strides[0]) )) = __pyx_t_24;
     }
+    __pyx_L11:;
 
-    /* "cython_ext/fuzzy_cython.pyx":52
- *             )
- *         # Swap rows for next iteration
- *         prev_row_mv, curr_row_mv = curr_row_mv, prev_row_mv             # <<<<<<<<<<<<<<
+    /* "cython_ext/fuzzy_cython.pyx":64
+ *         elif mh & top:
+ *             score -= 1
+ *         remaining -= 1             # <<<<<<<<<<<<<<
+ *         # Each remaining character lowers the last row by at most one
+ *         if score - remaining > max_distance:
+*/
+    __pyx_v_remaining = (__pyx_v_remaining - 1);
+
+    /* "cython_ext/fuzzy_cython.pyx":66
+ *         remaining -= 1
+ *         # Each remaining character lowers the last row by at most one
+ *         if score - remaining > max_distance:             # <<<<<<<<<<<<<<
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+*/
+    __pyx_t_4 = ((__pyx_v_score - __pyx_v_remaining) > __pyx_v_max_distance);
+    if (__pyx_t_4) {
+
+      /* "cython_ext/fuzzy_cython.pyx":67
+ *         # Each remaining character lowers the last row by at most one
+ *         if score - remaining > max_distance:
+ *             return max_distance + 1             # <<<<<<<<<<<<<<
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask
+*/
+      __pyx_r = (__pyx_v_max_distance + 1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L0;
+
+      /* "cython_ext/fuzzy_cython.pyx":66
+ *         remaining -= 1
+ *         # Each remaining character lowers the last row by at most one
+ *         if score - remaining > max_distance:             # <<<<<<<<<<<<<<
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":68
+ *         if score - remaining > max_distance:
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask             # <<<<<<<<<<<<<<
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)
+*/
+    __pyx_v_ph = (((__pyx_v_ph << 1) | 1) & __pyx_v_mask);
+
+    /* "cython_ext/fuzzy_cython.pyx":69
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask             # <<<<<<<<<<<<<<
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv
+*/
+    __pyx_v_mh = ((__pyx_v_mh << 1) & __pyx_v_mask);
+
+    /* "cython_ext/fuzzy_cython.pyx":70
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)             # <<<<<<<<<<<<<<
+ *         vn = ph & xv
+ *     return score if score <= max_distance else max_distance + 1
+*/
+    __pyx_v_vp = (__pyx_v_mh | ((~(__pyx_v_xv | __pyx_v_ph)) & __pyx_v_mask));
+
+    /* "cython_ext/fuzzy_cython.pyx":71
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv             # <<<<<<<<<<<<<<
+ *     return score if score <= max_distance else max_distance + 1
  * 
- *     return prev_row_mv[len2]
 */
-    __pyx_t_10 = __pyx_v_curr_row_mv;
-    __PYX_INC_MEMVIEW(&__pyx_t_10, 1);
-    __pyx_t_25 = __pyx_v_prev_row_mv;
-    __PYX_INC_MEMVIEW(&__pyx_t_25, 1);
-    __PYX_XCLEAR_MEMVIEW(&__pyx_v_prev_row_mv, 1);
-    __pyx_v_prev_row_mv = __pyx_t_10;
-    __pyx_t_10.memview = NULL;
-    __pyx_t_10.data = NULL;
-    __PYX_XCLEAR_MEMVIEW(&__pyx_v_curr_row_mv, 1);
-    __pyx_v_curr_row_mv = __pyx_t_25;
-    __pyx_t_25.memview = NULL;
-    __pyx_t_25.data = NULL;
+    __pyx_v_vn = (__pyx_v_ph & __pyx_v_xv);
   }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "cython_ext/fuzzy_cython.pyx":54
- *         prev_row_mv, curr_row_mv = curr_row_mv, prev_row_mv
- * 
- *     return prev_row_mv[len2]             # <<<<<<<<<<<<<<
+  /* "cython_ext/fuzzy_cython.pyx":72
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv
+ *     return score if score <= max_distance else max_distance + 1             # <<<<<<<<<<<<<<
  * 
- * cpdef double similarity_ratio(str s1, str s2):
+ * cdef int _banded(str s1, str s2, int max_distance):
 */
-  __pyx_t_22 = __pyx_v_len2;
-  __pyx_t_13 = -1;
-  if (__pyx_t_22 < 0) {
-    __pyx_t_22 += __pyx_v_prev_row_mv.shape[0];
-    if (unlikely(__pyx_t_22 < 0)) __pyx_t_13 = 0;
-  } else if (unlikely(__pyx_t_22 >= __pyx_v_prev_row_mv.shape[0])) __pyx_t_13 = 0;
-  if (unlikely(__pyx_t_13 != -1)) {
-    __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 54, __pyx_L1_error)
-  }
-  __pyx_r = (*((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_prev_row_mv.data + __pyx_t_22 * __pyx_v_prev_row_mv.strides[0]) )));
+  __pyx_t_4 = (__pyx_v_score <= __pyx_v_max_distance);
+  if (__pyx_t_4) {
+    __pyx_t_14 = __pyx_v_score;
+  } else {
+    __pyx_t_14 = (__pyx_v_max_distance + 1);
+  }
+  __pyx_r = __pyx_t_14;
   goto __pyx_L0;
 
-  /* "cython_ext/fuzzy_cython.pyx":19
+  /* "cython_ext/fuzzy_cython.pyx":22
  *             return c
  * 
- * cpdef int levenshtein(str s1, str s2):             # <<<<<<<<<<<<<<
+ * cdef int _myers64(str pattern, str text, int max_distance):             # <<<<<<<<<<<<<<
  *     """
- *     Compute the Levenshtein distance between two Unicode strings.
+ *     Bit-parallel global edit distance (Hyyr's variant of Myers' algorithm)
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_25, 1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_curr_row.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_prev_row.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._myers64", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_curr_row.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_prev_row.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_prev_row);
-  __Pyx_XDECREF((PyObject *)__pyx_v_curr_row);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_prev_row_mv, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_curr_row_mv, 1);
-  __Pyx_XDECREF(__pyx_v_cost);
+  __Pyx_XDECREF(__pyx_v_other_eq);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1levenshtein(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_levenshtein, "\n    Compute the Levenshtein distance between two Unicode strings.\n    Handles all edge cases, including empty strings.\n    ");
-static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_1levenshtein = {"levenshtein", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_1levenshtein, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_levenshtein};
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1levenshtein(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_s1 = 0;
-  PyObject *__pyx_v_s2 = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+/* "cython_ext/fuzzy_cython.pyx":74
+ *     return score if score <= max_distance else max_distance + 1
+ * 
+ * cdef int _banded(str s1, str s2, int max_distance):             # <<<<<<<<<<<<<<
+ *     """
+ *     Levenshtein DP restricted to the diagonal band |i - j| <= max_distance,
+*/
+
+static int __pyx_f_10cython_ext_12fuzzy_cython__banded(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, int __pyx_v_max_distance) {
+  int __pyx_v_len1;
+  int __pyx_v_len2;
+  int __pyx_v_big;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_cost;
+  int __pyx_v_best;
+  int __pyx_v_value;
+  int *__pyx_v_prev;
+  int *__pyx_v_curr;
+  int *__pyx_v_tmp;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  long __pyx_t_8;
+  long __pyx_t_9;
+  int __pyx_t_10;
+  long __pyx_t_11;
+  Py_UCS4 __pyx_t_12;
+  Py_UCS4 __pyx_t_13;
+  char const *__pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("levenshtein (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_s1,&__pyx_mstate_global->__pyx_n_u_s2,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 19, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 19, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 19, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "levenshtein", 0) < 0) __PYX_ERR(0, 19, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("levenshtein", 1, 2, 2, i); __PYX_ERR(0, 19, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 19, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 19, __pyx_L3_error)
-    }
-    __pyx_v_s1 = ((PyObject*)values[0]);
-    __pyx_v_s2 = ((PyObject*)values[1]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("levenshtein", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 19, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s1), (&PyUnicode_Type), 1, "s1", 1))) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s2), (&PyUnicode_Type), 1, "s2", 1))) __PYX_ERR(0, 19, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_levenshtein(__pyx_self, __pyx_v_s1, __pyx_v_s2);
+  __Pyx_RefNannySetupContext("_banded", 0);
 
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
+  /* "cython_ext/fuzzy_cython.pyx":79
+ *     stopping as soon as a whole row exceeds max_distance. len(s1) <= len(s2).
+ *     """
+ *     cdef int len1 = len(s1)             # <<<<<<<<<<<<<<
+ *     cdef int len2 = len(s2)
+ *     cdef int big = max_distance + 1
+*/
+  if (unlikely(__pyx_v_s1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 79, __pyx_L1_error)
   }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_v_len1 = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":80
+ *     """
+ *     cdef int len1 = len(s1)
+ *     cdef int len2 = len(s2)             # <<<<<<<<<<<<<<
+ *     cdef int big = max_distance + 1
+ *     cdef int i, j, lo, hi, cost, best, value
+*/
+  if (unlikely(__pyx_v_s2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 80, __pyx_L1_error)
   }
-  __pyx_L7_cleaned_up:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_v_len2 = __pyx_t_1;
 
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("levenshtein", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(__pyx_v_s1, __pyx_v_s2, 1); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 19, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
+  /* "cython_ext/fuzzy_cython.pyx":81
+ *     cdef int len1 = len(s1)
+ *     cdef int len2 = len(s2)
+ *     cdef int big = max_distance + 1             # <<<<<<<<<<<<<<
+ *     cdef int i, j, lo, hi, cost, best, value
+ *     cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))
+*/
+  __pyx_v_big = (__pyx_v_max_distance + 1);
+
+  /* "cython_ext/fuzzy_cython.pyx":83
+ *     cdef int big = max_distance + 1
+ *     cdef int i, j, lo, hi, cost, best, value
+ *     cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+*/
+  __pyx_v_prev = ((int *)malloc(((__pyx_v_len2 + 1) * (sizeof(int)))));
+
+  /* "cython_ext/fuzzy_cython.pyx":84
+ *     cdef int i, j, lo, hi, cost, best, value
+ *     cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:
+*/
+  __pyx_v_curr = ((int *)malloc(((__pyx_v_len2 + 1) * (sizeof(int)))));
+
+  /* "cython_ext/fuzzy_cython.pyx":86
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:             # <<<<<<<<<<<<<<
+ *         free(prev)
+ *         free(curr)
+*/
+  __pyx_t_3 = (__pyx_v_prev == NULL);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_curr == NULL);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "cython_ext/fuzzy_cython.pyx":87
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:
+ *         free(prev)             # <<<<<<<<<<<<<<
+ *         free(curr)
+ *         raise MemoryError()
+*/
+    free(__pyx_v_prev);
+
+    /* "cython_ext/fuzzy_cython.pyx":88
+ *     if prev == NULL or curr == NULL:
+ *         free(prev)
+ *         free(curr)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     try:
+*/
+    free(__pyx_v_curr);
+
+    /* "cython_ext/fuzzy_cython.pyx":89
+ *         free(prev)
+ *         free(curr)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     try:
+ *         for j in range(len2 + 1):
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 89, __pyx_L1_error)
+
+    /* "cython_ext/fuzzy_cython.pyx":86
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:             # <<<<<<<<<<<<<<
+ *         free(prev)
+ *         free(curr)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":90
+ *         free(curr)
+ *         raise MemoryError()
+ *     try:             # <<<<<<<<<<<<<<
+ *         for j in range(len2 + 1):
+ *             prev[j] = j if j <= max_distance else big
+*/
+  /*try:*/ {
+
+    /* "cython_ext/fuzzy_cython.pyx":91
+ *         raise MemoryError()
+ *     try:
+ *         for j in range(len2 + 1):             # <<<<<<<<<<<<<<
+ *             prev[j] = j if j <= max_distance else big
+ *         for i in range(1, len1 + 1):
+*/
+    __pyx_t_4 = (__pyx_v_len2 + 1);
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_j = __pyx_t_6;
+
+      /* "cython_ext/fuzzy_cython.pyx":92
+ *     try:
+ *         for j in range(len2 + 1):
+ *             prev[j] = j if j <= max_distance else big             # <<<<<<<<<<<<<<
+ *         for i in range(1, len1 + 1):
+ *             lo = i - max_distance if i > max_distance else 1
+*/
+      __pyx_t_2 = (__pyx_v_j <= __pyx_v_max_distance);
+      if (__pyx_t_2) {
+        __pyx_t_7 = __pyx_v_j;
+      } else {
+        __pyx_t_7 = __pyx_v_big;
+      }
+      (__pyx_v_prev[__pyx_v_j]) = __pyx_t_7;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":93
+ *         for j in range(len2 + 1):
+ *             prev[j] = j if j <= max_distance else big
+ *         for i in range(1, len1 + 1):             # <<<<<<<<<<<<<<
+ *             lo = i - max_distance if i > max_distance else 1
+ *             hi = i + max_distance if i + max_distance < len2 else len2
+*/
+    __pyx_t_4 = (__pyx_v_len1 + 1);
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 1; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "cython_ext/fuzzy_cython.pyx":94
+ *             prev[j] = j if j <= max_distance else big
+ *         for i in range(1, len1 + 1):
+ *             lo = i - max_distance if i > max_distance else 1             # <<<<<<<<<<<<<<
+ *             hi = i + max_distance if i + max_distance < len2 else len2
+ *             curr[0] = i if i <= max_distance else big
+*/
+      __pyx_t_2 = (__pyx_v_i > __pyx_v_max_distance);
+      if (__pyx_t_2) {
+        __pyx_t_7 = (__pyx_v_i - __pyx_v_max_distance);
+      } else {
+        __pyx_t_7 = 1;
+      }
+      __pyx_v_lo = __pyx_t_7;
+
+      /* "cython_ext/fuzzy_cython.pyx":95
+ *         for i in range(1, len1 + 1):
+ *             lo = i - max_distance if i > max_distance else 1
+ *             hi = i + max_distance if i + max_distance < len2 else len2             # <<<<<<<<<<<<<<
+ *             curr[0] = i if i <= max_distance else big
+ *             if lo > 1:
+*/
+      __pyx_t_2 = ((__pyx_v_i + __pyx_v_max_distance) < __pyx_v_len2);
+      if (__pyx_t_2) {
+        __pyx_t_7 = (__pyx_v_i + __pyx_v_max_distance);
+      } else {
+        __pyx_t_7 = __pyx_v_len2;
+      }
+      __pyx_v_hi = __pyx_t_7;
+
+      /* "cython_ext/fuzzy_cython.pyx":96
+ *             lo = i - max_distance if i > max_distance else 1
+ *             hi = i + max_distance if i + max_distance < len2 else len2
+ *             curr[0] = i if i <= max_distance else big             # <<<<<<<<<<<<<<
+ *             if lo > 1:
+ *                 curr[lo - 1] = big
+*/
+      __pyx_t_2 = (__pyx_v_i <= __pyx_v_max_distance);
+      if (__pyx_t_2) {
+        __pyx_t_7 = __pyx_v_i;
+      } else {
+        __pyx_t_7 = __pyx_v_big;
+      }
+      (__pyx_v_curr[0]) = __pyx_t_7;
+
+      /* "cython_ext/fuzzy_cython.pyx":97
+ *             hi = i + max_distance if i + max_distance < len2 else len2
+ *             curr[0] = i if i <= max_distance else big
+ *             if lo > 1:             # <<<<<<<<<<<<<<
+ *                 curr[lo - 1] = big
+ *             best = curr[0] if lo == 1 else big
+*/
+      __pyx_t_2 = (__pyx_v_lo > 1);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":98
+ *             curr[0] = i if i <= max_distance else big
+ *             if lo > 1:
+ *                 curr[lo - 1] = big             # <<<<<<<<<<<<<<
+ *             best = curr[0] if lo == 1 else big
+ *             for j in range(lo, hi + 1):
+*/
+        (__pyx_v_curr[(__pyx_v_lo - 1)]) = __pyx_v_big;
+
+        /* "cython_ext/fuzzy_cython.pyx":97
+ *             hi = i + max_distance if i + max_distance < len2 else len2
+ *             curr[0] = i if i <= max_distance else big
+ *             if lo > 1:             # <<<<<<<<<<<<<<
+ *                 curr[lo - 1] = big
+ *             best = curr[0] if lo == 1 else big
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":99
+ *             if lo > 1:
+ *                 curr[lo - 1] = big
+ *             best = curr[0] if lo == 1 else big             # <<<<<<<<<<<<<<
+ *             for j in range(lo, hi + 1):
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1
+*/
+      __pyx_t_2 = (__pyx_v_lo == 1);
+      if (__pyx_t_2) {
+        __pyx_t_7 = (__pyx_v_curr[0]);
+      } else {
+        __pyx_t_7 = __pyx_v_big;
+      }
+      __pyx_v_best = __pyx_t_7;
+
+      /* "cython_ext/fuzzy_cython.pyx":100
+ *                 curr[lo - 1] = big
+ *             best = curr[0] if lo == 1 else big
+ *             for j in range(lo, hi + 1):             # <<<<<<<<<<<<<<
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+*/
+      __pyx_t_8 = (__pyx_v_hi + 1);
+      __pyx_t_9 = __pyx_t_8;
+      for (__pyx_t_7 = __pyx_v_lo; __pyx_t_7 < __pyx_t_9; __pyx_t_7+=1) {
+        __pyx_v_j = __pyx_t_7;
+
+        /* "cython_ext/fuzzy_cython.pyx":101
+ *             best = curr[0] if lo == 1 else big
+ *             for j in range(lo, hi + 1):
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1             # <<<<<<<<<<<<<<
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+ *                 if value > big:
+*/
+        __pyx_t_11 = (__pyx_v_i - 1);
+        __pyx_t_12 = __Pyx_GetItemInt_Unicode(__pyx_v_s1, __pyx_t_11, long, 1, __Pyx_PyLong_From_long, 0, 1, 1); if (unlikely(__pyx_t_12 == (Py_UCS4)-1)) __PYX_ERR(0, 101, __pyx_L7_error)
+        __pyx_t_11 = (__pyx_v_j - 1);
+        __pyx_t_13 = __Pyx_GetItemInt_Unicode(__pyx_v_s2, __pyx_t_11, long, 1, __Pyx_PyLong_From_long, 0, 1, 1); if (unlikely(__pyx_t_13 == (Py_UCS4)-1)) __PYX_ERR(0, 101, __pyx_L7_error)
+        __pyx_t_2 = (__pyx_t_12 == __pyx_t_13);
+        if (__pyx_t_2) {
+          __pyx_t_10 = 0;
+        } else {
+          __pyx_t_10 = 1;
+        }
+        __pyx_v_cost = __pyx_t_10;
+
+        /* "cython_ext/fuzzy_cython.pyx":102
+ *             for j in range(lo, hi + 1):
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)             # <<<<<<<<<<<<<<
+ *                 if value > big:
+ *                     value = big
+*/
+        __pyx_t_10 = __pyx_f_10cython_ext_12fuzzy_cython_min3(((__pyx_v_curr[(__pyx_v_j - 1)]) + 1), ((__pyx_v_prev[__pyx_v_j]) + 1), ((__pyx_v_prev[(__pyx_v_j - 1)]) + __pyx_v_cost)); if (unlikely(__pyx_t_10 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L7_error)
+        __pyx_v_value = __pyx_t_10;
+
+        /* "cython_ext/fuzzy_cython.pyx":103
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+ *                 if value > big:             # <<<<<<<<<<<<<<
+ *                     value = big
+ *                 curr[j] = value
+*/
+        __pyx_t_2 = (__pyx_v_value > __pyx_v_big);
+        if (__pyx_t_2) {
+
+          /* "cython_ext/fuzzy_cython.pyx":104
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+ *                 if value > big:
+ *                     value = big             # <<<<<<<<<<<<<<
+ *                 curr[j] = value
+ *                 if value < best:
+*/
+          __pyx_v_value = __pyx_v_big;
+
+          /* "cython_ext/fuzzy_cython.pyx":103
+ *                 cost = 0 if s1[i - 1] == s2[j - 1] else 1
+ *                 value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+ *                 if value > big:             # <<<<<<<<<<<<<<
+ *                     value = big
+ *                 curr[j] = value
+*/
+        }
+
+        /* "cython_ext/fuzzy_cython.pyx":105
+ *                 if value > big:
+ *                     value = big
+ *                 curr[j] = value             # <<<<<<<<<<<<<<
+ *                 if value < best:
+ *                     best = value
+*/
+        (__pyx_v_curr[__pyx_v_j]) = __pyx_v_value;
+
+        /* "cython_ext/fuzzy_cython.pyx":106
+ *                     value = big
+ *                 curr[j] = value
+ *                 if value < best:             # <<<<<<<<<<<<<<
+ *                     best = value
+ *             if hi < len2:
+*/
+        __pyx_t_2 = (__pyx_v_value < __pyx_v_best);
+        if (__pyx_t_2) {
+
+          /* "cython_ext/fuzzy_cython.pyx":107
+ *                 curr[j] = value
+ *                 if value < best:
+ *                     best = value             # <<<<<<<<<<<<<<
+ *             if hi < len2:
+ *                 curr[hi + 1] = big
+*/
+          __pyx_v_best = __pyx_v_value;
+
+          /* "cython_ext/fuzzy_cython.pyx":106
+ *                     value = big
+ *                 curr[j] = value
+ *                 if value < best:             # <<<<<<<<<<<<<<
+ *                     best = value
+ *             if hi < len2:
+*/
+        }
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":108
+ *                 if value < best:
+ *                     best = value
+ *             if hi < len2:             # <<<<<<<<<<<<<<
+ *                 curr[hi + 1] = big
+ *             if best > max_distance:
+*/
+      __pyx_t_2 = (__pyx_v_hi < __pyx_v_len2);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":109
+ *                     best = value
+ *             if hi < len2:
+ *                 curr[hi + 1] = big             # <<<<<<<<<<<<<<
+ *             if best > max_distance:
+ *                 return big
+*/
+        (__pyx_v_curr[(__pyx_v_hi + 1)]) = __pyx_v_big;
+
+        /* "cython_ext/fuzzy_cython.pyx":108
+ *                 if value < best:
+ *                     best = value
+ *             if hi < len2:             # <<<<<<<<<<<<<<
+ *                 curr[hi + 1] = big
+ *             if best > max_distance:
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":110
+ *             if hi < len2:
+ *                 curr[hi + 1] = big
+ *             if best > max_distance:             # <<<<<<<<<<<<<<
+ *                 return big
+ *             tmp = prev
+*/
+      __pyx_t_2 = (__pyx_v_best > __pyx_v_max_distance);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":111
+ *                 curr[hi + 1] = big
+ *             if best > max_distance:
+ *                 return big             # <<<<<<<<<<<<<<
+ *             tmp = prev
+ *             prev = curr
+*/
+        __pyx_r = __pyx_v_big;
+        goto __pyx_L6_return;
+
+        /* "cython_ext/fuzzy_cython.pyx":110
+ *             if hi < len2:
+ *                 curr[hi + 1] = big
+ *             if best > max_distance:             # <<<<<<<<<<<<<<
+ *                 return big
+ *             tmp = prev
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":112
+ *             if best > max_distance:
+ *                 return big
+ *             tmp = prev             # <<<<<<<<<<<<<<
+ *             prev = curr
+ *             curr = tmp
+*/
+      __pyx_v_tmp = __pyx_v_prev;
+
+      /* "cython_ext/fuzzy_cython.pyx":113
+ *                 return big
+ *             tmp = prev
+ *             prev = curr             # <<<<<<<<<<<<<<
+ *             curr = tmp
+ *         return prev[len2] if prev[len2] <= max_distance else big
+*/
+      __pyx_v_prev = __pyx_v_curr;
+
+      /* "cython_ext/fuzzy_cython.pyx":114
+ *             tmp = prev
+ *             prev = curr
+ *             curr = tmp             # <<<<<<<<<<<<<<
+ *         return prev[len2] if prev[len2] <= max_distance else big
+ *     finally:
+*/
+      __pyx_v_curr = __pyx_v_tmp;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":115
+ *             prev = curr
+ *             curr = tmp
+ *         return prev[len2] if prev[len2] <= max_distance else big             # <<<<<<<<<<<<<<
+ *     finally:
+ *         free(prev)
+*/
+    __pyx_t_2 = ((__pyx_v_prev[__pyx_v_len2]) <= __pyx_v_max_distance);
+    if (__pyx_t_2) {
+      __pyx_t_6 = (__pyx_v_prev[__pyx_v_len2]);
+    } else {
+      __pyx_t_6 = __pyx_v_big;
+    }
+    __pyx_r = __pyx_t_6;
+    goto __pyx_L6_return;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":117
+ *         return prev[len2] if prev[len2] <= max_distance else big
+ *     finally:
+ *         free(prev)             # <<<<<<<<<<<<<<
+ *         free(curr)
+ * 
+*/
+  /*finally:*/ {
+    __pyx_L7_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
+       __Pyx_ExceptionSwap(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20);
+      if ( unlikely(__Pyx_GetException(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17) < 0)) __Pyx_ErrFetch(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __Pyx_XGOTREF(__pyx_t_20);
+      __pyx_t_6 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_14 = __pyx_filename;
+      {
+        free(__pyx_v_prev);
+
+        /* "cython_ext/fuzzy_cython.pyx":118
+ *     finally:
+ *         free(prev)
+ *         free(curr)             # <<<<<<<<<<<<<<
+ * 
+ * cpdef int bounded_levenshtein(str s1, str s2, int max_distance):
+*/
+        free(__pyx_v_curr);
+      }
+      __Pyx_XGIVEREF(__pyx_t_18);
+      __Pyx_XGIVEREF(__pyx_t_19);
+      __Pyx_XGIVEREF(__pyx_t_20);
+      __Pyx_ExceptionReset(__pyx_t_18, __pyx_t_19, __pyx_t_20);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_XGIVEREF(__pyx_t_16);
+      __Pyx_XGIVEREF(__pyx_t_17);
+      __Pyx_ErrRestore(__pyx_t_15, __pyx_t_16, __pyx_t_17);
+      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
+      __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_14;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6_return: {
+      __pyx_t_7 = __pyx_r;
+
+      /* "cython_ext/fuzzy_cython.pyx":117
+ *         return prev[len2] if prev[len2] <= max_distance else big
+ *     finally:
+ *         free(prev)             # <<<<<<<<<<<<<<
+ *         free(curr)
+ * 
+*/
+      free(__pyx_v_prev);
+
+      /* "cython_ext/fuzzy_cython.pyx":118
+ *     finally:
+ *         free(prev)
+ *         free(curr)             # <<<<<<<<<<<<<<
+ * 
+ * cpdef int bounded_levenshtein(str s1, str s2, int max_distance):
+*/
+      free(__pyx_v_curr);
+      __pyx_r = __pyx_t_7;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":74
+ *     return score if score <= max_distance else max_distance + 1
+ * 
+ * cdef int _banded(str s1, str s2, int max_distance):             # <<<<<<<<<<<<<<
+ *     """
+ *     Levenshtein DP restricted to the diagonal band |i - j| <= max_distance,
+*/
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._banded", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "cython_ext/fuzzy_cython.pyx":56
- *     return prev_row_mv[len2]
+/* "cython_ext/fuzzy_cython.pyx":120
+ *         free(curr)
  * 
- * cpdef double similarity_ratio(str s1, str s2):             # <<<<<<<<<<<<<<
+ * cpdef int bounded_levenshtein(str s1, str s2, int max_distance):             # <<<<<<<<<<<<<<
  *     """
- *     Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.
+ *     Levenshtein distance between s1 and s2, or max_distance + 1 as soon as it
 */
 
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3similarity_ratio(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1bounded_levenshtein(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static double __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  int __pyx_v_max_len;
-  int __pyx_v_dist;
-  double __pyx_r;
+static int __pyx_f_10cython_ext_12fuzzy_cython_bounded_levenshtein(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, int __pyx_v_max_distance, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  int __pyx_v_len1;
+  int __pyx_v_len2;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
   Py_ssize_t __pyx_t_1;
   Py_ssize_t __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bounded_levenshtein", 0);
+  __Pyx_INCREF(__pyx_v_s1);
+  __Pyx_INCREF(__pyx_v_s2);
 
-  /* "cython_ext/fuzzy_cython.pyx":61
- *     Handles all edge cases.
+  /* "cython_ext/fuzzy_cython.pyx":127
  *     """
- *     cdef int max_len = max(len(s1), len(s2))             # <<<<<<<<<<<<<<
- *     if max_len == 0:
- *         return 1.0
+ *     cdef int len1, len2
+ *     if len(s1) > len(s2):             # <<<<<<<<<<<<<<
+ *         s1, s2 = s2, s1
+ *     len1 = len(s1)
 */
+  if (unlikely(__pyx_v_s1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 127, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 127, __pyx_L1_error)
   if (unlikely(__pyx_v_s2 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 61, __pyx_L1_error)
+    __PYX_ERR(0, 127, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_3) {
+
+    /* "cython_ext/fuzzy_cython.pyx":128
+ *     cdef int len1, len2
+ *     if len(s1) > len(s2):
+ *         s1, s2 = s2, s1             # <<<<<<<<<<<<<<
+ *     len1 = len(s1)
+ *     len2 = len(s2)
+*/
+    __pyx_t_4 = __pyx_v_s2;
+    __pyx_t_5 = __pyx_v_s1;
+    __pyx_v_s1 = ((PyObject*)__pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_v_s2 = ((PyObject*)__pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":127
+ *     """
+ *     cdef int len1, len2
+ *     if len(s1) > len(s2):             # <<<<<<<<<<<<<<
+ *         s1, s2 = s2, s1
+ *     len1 = len(s1)
+*/
   }
-  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
+
+  /* "cython_ext/fuzzy_cython.pyx":129
+ *     if len(s1) > len(s2):
+ *         s1, s2 = s2, s1
+ *     len1 = len(s1)             # <<<<<<<<<<<<<<
+ *     len2 = len(s2)
+ *     if len2 - len1 > max_distance:
+*/
   if (unlikely(__pyx_v_s1 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 61, __pyx_L1_error)
+    __PYX_ERR(0, 129, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
-  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
-  if (__pyx_t_4) {
-    __pyx_t_3 = __pyx_t_1;
-  } else {
-    __pyx_t_3 = __pyx_t_2;
+  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_v_len1 = __pyx_t_2;
+
+  /* "cython_ext/fuzzy_cython.pyx":130
+ *         s1, s2 = s2, s1
+ *     len1 = len(s1)
+ *     len2 = len(s2)             # <<<<<<<<<<<<<<
+ *     if len2 - len1 > max_distance:
+ *         return max_distance + 1
+*/
+  if (unlikely(__pyx_v_s2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 130, __pyx_L1_error)
   }
-  __pyx_v_max_len = __pyx_t_3;
+  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_v_len2 = __pyx_t_2;
 
-  /* "cython_ext/fuzzy_cython.pyx":62
- *     """
- *     cdef int max_len = max(len(s1), len(s2))
- *     if max_len == 0:             # <<<<<<<<<<<<<<
- *         return 1.0
- *     cdef int dist = levenshtein(s1, s2)
+  /* "cython_ext/fuzzy_cython.pyx":131
+ *     len1 = len(s1)
+ *     len2 = len(s2)
+ *     if len2 - len1 > max_distance:             # <<<<<<<<<<<<<<
+ *         return max_distance + 1
+ *     if len1 == 0:
 */
-  __pyx_t_4 = (__pyx_v_max_len == 0);
-  if (__pyx_t_4) {
+  __pyx_t_3 = ((__pyx_v_len2 - __pyx_v_len1) > __pyx_v_max_distance);
+  if (__pyx_t_3) {
 
-    /* "cython_ext/fuzzy_cython.pyx":63
- *     cdef int max_len = max(len(s1), len(s2))
- *     if max_len == 0:
- *         return 1.0             # <<<<<<<<<<<<<<
- *     cdef int dist = levenshtein(s1, s2)
- *     return 1.0 - dist / max_len
+    /* "cython_ext/fuzzy_cython.pyx":132
+ *     len2 = len(s2)
+ *     if len2 - len1 > max_distance:
+ *         return max_distance + 1             # <<<<<<<<<<<<<<
+ *     if len1 == 0:
+ *         return len2
 */
-    __pyx_r = 1.0;
+    __pyx_r = (__pyx_v_max_distance + 1);
     goto __pyx_L0;
 
-    /* "cython_ext/fuzzy_cython.pyx":62
- *     """
- *     cdef int max_len = max(len(s1), len(s2))
- *     if max_len == 0:             # <<<<<<<<<<<<<<
- *         return 1.0
- *     cdef int dist = levenshtein(s1, s2)
+    /* "cython_ext/fuzzy_cython.pyx":131
+ *     len1 = len(s1)
+ *     len2 = len(s2)
+ *     if len2 - len1 > max_distance:             # <<<<<<<<<<<<<<
+ *         return max_distance + 1
+ *     if len1 == 0:
 */
   }
 
-  /* "cython_ext/fuzzy_cython.pyx":64
- *     if max_len == 0:
- *         return 1.0
- *     cdef int dist = levenshtein(s1, s2)             # <<<<<<<<<<<<<<
- *     return 1.0 - dist / max_len
- * 
+  /* "cython_ext/fuzzy_cython.pyx":133
+ *     if len2 - len1 > max_distance:
+ *         return max_distance + 1
+ *     if len1 == 0:             # <<<<<<<<<<<<<<
+ *         return len2
+ *     if s1 == s2:
 */
-  __pyx_t_5 = __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(__pyx_v_s1, __pyx_v_s2, 0); if (unlikely(__pyx_t_5 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 64, __pyx_L1_error)
-  __pyx_v_dist = __pyx_t_5;
+  __pyx_t_3 = (__pyx_v_len1 == 0);
+  if (__pyx_t_3) {
 
-  /* "cython_ext/fuzzy_cython.pyx":65
- *         return 1.0
- *     cdef int dist = levenshtein(s1, s2)
- *     return 1.0 - dist / max_len             # <<<<<<<<<<<<<<
- * 
- * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):
+    /* "cython_ext/fuzzy_cython.pyx":134
+ *         return max_distance + 1
+ *     if len1 == 0:
+ *         return len2             # <<<<<<<<<<<<<<
+ *     if s1 == s2:
+ *         return 0
+*/
+    __pyx_r = __pyx_v_len2;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":133
+ *     if len2 - len1 > max_distance:
+ *         return max_distance + 1
+ *     if len1 == 0:             # <<<<<<<<<<<<<<
+ *         return len2
+ *     if s1 == s2:
 */
-  if (unlikely(__pyx_v_max_len == 0)) {
-    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 65, __pyx_L1_error)
   }
-  __pyx_r = (1.0 - (((double)__pyx_v_dist) / ((double)__pyx_v_max_len)));
-  goto __pyx_L0;
 
-  /* "cython_ext/fuzzy_cython.pyx":56
- *     return prev_row_mv[len2]
- * 
- * cpdef double similarity_ratio(str s1, str s2):             # <<<<<<<<<<<<<<
+  /* "cython_ext/fuzzy_cython.pyx":135
+ *     if len1 == 0:
+ *         return len2
+ *     if s1 == s2:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if len1 <= 64:
+*/
+  __pyx_t_3 = (__Pyx_PyUnicode_Equals(__pyx_v_s1, __pyx_v_s2, Py_EQ)); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 135, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "cython_ext/fuzzy_cython.pyx":136
+ *         return len2
+ *     if s1 == s2:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     if len1 <= 64:
+ *         return _myers64(s1, s2, max_distance)
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":135
+ *     if len1 == 0:
+ *         return len2
+ *     if s1 == s2:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if len1 <= 64:
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":137
+ *     if s1 == s2:
+ *         return 0
+ *     if len1 <= 64:             # <<<<<<<<<<<<<<
+ *         return _myers64(s1, s2, max_distance)
+ *     return _banded(s1, s2, max_distance)
+*/
+  __pyx_t_3 = (__pyx_v_len1 <= 64);
+  if (__pyx_t_3) {
+
+    /* "cython_ext/fuzzy_cython.pyx":138
+ *         return 0
+ *     if len1 <= 64:
+ *         return _myers64(s1, s2, max_distance)             # <<<<<<<<<<<<<<
+ *     return _banded(s1, s2, max_distance)
+ * 
+*/
+    __pyx_t_6 = __pyx_f_10cython_ext_12fuzzy_cython__myers64(__pyx_v_s1, __pyx_v_s2, __pyx_v_max_distance); if (unlikely(__pyx_t_6 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 138, __pyx_L1_error)
+    __pyx_r = __pyx_t_6;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":137
+ *     if s1 == s2:
+ *         return 0
+ *     if len1 <= 64:             # <<<<<<<<<<<<<<
+ *         return _myers64(s1, s2, max_distance)
+ *     return _banded(s1, s2, max_distance)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":139
+ *     if len1 <= 64:
+ *         return _myers64(s1, s2, max_distance)
+ *     return _banded(s1, s2, max_distance)             # <<<<<<<<<<<<<<
+ * 
+ * cpdef int levenshtein(str s1, str s2):
+*/
+  __pyx_t_6 = __pyx_f_10cython_ext_12fuzzy_cython__banded(__pyx_v_s1, __pyx_v_s2, __pyx_v_max_distance); if (unlikely(__pyx_t_6 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_r = __pyx_t_6;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":120
+ *         free(curr)
+ * 
+ * cpdef int bounded_levenshtein(str s1, str s2, int max_distance):             # <<<<<<<<<<<<<<
  *     """
- *     Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.
+ *     Levenshtein distance between s1 and s2, or max_distance + 1 as soon as it
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.bounded_levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_s1);
+  __Pyx_XDECREF(__pyx_v_s2);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3similarity_ratio(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1bounded_levenshtein(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_2similarity_ratio, "\n    Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.\n    Handles all edge cases.\n    ");
-static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_3similarity_ratio = {"similarity_ratio", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_3similarity_ratio, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_2similarity_ratio};
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3similarity_ratio(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_bounded_levenshtein, "\n    Levenshtein distance between s1 and s2, or max_distance + 1 as soon as it\n    is known to exceed max_distance. Uses the bit-parallel kernel when the\n    shorter string fits a machine word, else a banded DP.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_1bounded_levenshtein = {"bounded_levenshtein", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_1bounded_levenshtein, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_bounded_levenshtein};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_1bounded_levenshtein(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -19886,17 +20618,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ) {
   PyObject *__pyx_v_s1 = 0;
   PyObject *__pyx_v_s2 = 0;
+  int __pyx_v_max_distance;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("similarity_ratio (wrapper)", 0);
+  __Pyx_RefNannySetupContext("bounded_levenshtein (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -19906,54 +20639,61 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_s1,&__pyx_mstate_global->__pyx_n_u_s2,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_s1,&__pyx_mstate_global->__pyx_n_u_s2,&__pyx_mstate_global->__pyx_n_u_max_distance,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 56, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 120, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 120, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 56, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 120, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 56, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 120, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "similarity_ratio", 0) < 0) __PYX_ERR(0, 56, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("similarity_ratio", 1, 2, 2, i); __PYX_ERR(0, 56, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "bounded_levenshtein", 0) < 0) __PYX_ERR(0, 120, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("bounded_levenshtein", 1, 3, 3, i); __PYX_ERR(0, 120, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 2)) {
+    } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 56, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 120, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 56, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 120, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 120, __pyx_L3_error)
     }
     __pyx_v_s1 = ((PyObject*)values[0]);
     __pyx_v_s2 = ((PyObject*)values[1]);
+    __pyx_v_max_distance = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_max_distance == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 120, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("similarity_ratio", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 56, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("bounded_levenshtein", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 120, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.bounded_levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s1), (&PyUnicode_Type), 1, "s1", 1))) __PYX_ERR(0, 56, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s2), (&PyUnicode_Type), 1, "s2", 1))) __PYX_ERR(0, 56, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_2similarity_ratio(__pyx_self, __pyx_v_s1, __pyx_v_s2);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s1), (&PyUnicode_Type), 1, "s1", 1))) __PYX_ERR(0, 120, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s2), (&PyUnicode_Type), 1, "s2", 1))) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_bounded_levenshtein(__pyx_self, __pyx_v_s1, __pyx_v_s2, __pyx_v_max_distance);
 
   /* function exit code */
   goto __pyx_L0;
@@ -19972,18 +20712,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2similarity_ratio(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2) {
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_bounded_levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, int __pyx_v_max_distance) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("similarity_ratio", 0);
+  __Pyx_RefNannySetupContext("bounded_levenshtein", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(__pyx_v_s1, __pyx_v_s2, 1); if (unlikely(__pyx_t_1 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(0, 56, __pyx_L1_error)
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_bounded_levenshtein(__pyx_v_s1, __pyx_v_s2, __pyx_v_max_distance, 1); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 120, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -19992,7 +20732,7 @@ static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2similarity_ratio(CYTHON_U
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.bounded_levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -20000,662 +20740,5596 @@ static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2similarity_ratio(CYTHON_U
   return __pyx_r;
 }
 
-/* "cython_ext/fuzzy_cython.pyx":67
- *     return 1.0 - dist / max_len
+/* "cython_ext/fuzzy_cython.pyx":141
+ *     return _banded(s1, s2, max_distance)
  * 
- * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
+ * cpdef int levenshtein(str s1, str s2):             # <<<<<<<<<<<<<<
  *     """
- *     Fuzzy search for pattern in a list of lines.
+ *     Compute the Levenshtein distance between two Unicode strings.
 */
 
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5fuzzy_search(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3levenshtein(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_10cython_ext_12fuzzy_cython_fuzzy_search(PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search *__pyx_optional_args) {
-  double __pyx_v_threshold = ((double)0.7);
-  int __pyx_v_context = ((int)0);
-  int __pyx_v_max_results = ((int)0x3E8);
-  int __pyx_v_n_lines;
-  int __pyx_v_results_found;
-  PyObject *__pyx_v_results = NULL;
-  PyObject *__pyx_v_i = NULL;
-  PyObject *__pyx_v_line = NULL;
-  double __pyx_v_score;
-  PyObject *__pyx_v_before = NULL;
-  PyObject *__pyx_v_after = NULL;
-  PyObject *__pyx_7genexpr__pyx_v_j = NULL;
-  PyObject *__pyx_8genexpr1__pyx_v_j = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
+static int __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  int __pyx_r;
   Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
-  PyObject *(*__pyx_t_7)(PyObject *);
-  double __pyx_t_8;
-  int __pyx_t_9;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  long __pyx_t_14;
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
-  int __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  PyObject *(*__pyx_t_19)(PyObject *);
-  int __pyx_t_20;
-  PyObject *__pyx_t_21 = NULL;
-  int __pyx_t_22;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fuzzy_search", 0);
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_threshold = __pyx_optional_args->threshold;
-      if (__pyx_optional_args->__pyx_n > 1) {
-        __pyx_v_context = __pyx_optional_args->context;
-        if (__pyx_optional_args->__pyx_n > 2) {
-          __pyx_v_max_results = __pyx_optional_args->max_results;
-        }
-      }
-    }
-  }
 
-  /* "cython_ext/fuzzy_cython.pyx":72
- *     Returns a list of (line_number, line, context_before, context_after) for matches above threshold.
+  /* "cython_ext/fuzzy_cython.pyx":146
+ *     Handles all edge cases, including empty strings.
  *     """
- *     cdef int n_lines = len(lines)             # <<<<<<<<<<<<<<
- *     cdef int results_found = 0
- *     results = []
+ *     return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))             # <<<<<<<<<<<<<<
+ * 
+ * cpdef double similarity_ratio(str s1, str s2):
 */
-  if (unlikely(__pyx_v_lines == Py_None)) {
+  if (unlikely(__pyx_v_s2 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 72, __pyx_L1_error)
+    __PYX_ERR(0, 146, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_lines); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
-  __pyx_v_n_lines = __pyx_t_1;
-
-  /* "cython_ext/fuzzy_cython.pyx":73
- *     """
- *     cdef int n_lines = len(lines)
- *     cdef int results_found = 0             # <<<<<<<<<<<<<<
- *     results = []
- *     for i in range(n_lines):
-*/
-  __pyx_v_results_found = 0;
-
-  /* "cython_ext/fuzzy_cython.pyx":74
- *     cdef int n_lines = len(lines)
- *     cdef int results_found = 0
- *     results = []             # <<<<<<<<<<<<<<
- *     for i in range(n_lines):
- *         line = lines[i]
-*/
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_results = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "cython_ext/fuzzy_cython.pyx":75
- *     cdef int results_found = 0
- *     results = []
- *     for i in range(n_lines):             # <<<<<<<<<<<<<<
- *         line = lines[i]
- *         score = similarity_ratio(pattern, line)
-*/
-  __pyx_t_3 = NULL;
-  __Pyx_INCREF(__pyx_builtin_range);
-  __pyx_t_4 = __pyx_builtin_range; 
-  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_n_lines); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = 1;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_5};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 146, __pyx_L1_error)
+  if (unlikely(__pyx_v_s1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 146, __pyx_L1_error)
   }
-  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_4 = __pyx_t_2; __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_1 = 0;
-    __pyx_t_7 = NULL;
+  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
   } else {
-    __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __pyx_t_3 = __pyx_t_2;
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_7)) {
-      if (likely(PyList_CheckExact(__pyx_t_4))) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
-          #endif
-          if (__pyx_t_1 >= __pyx_temp) break;
-        }
-        __pyx_t_2 = __Pyx_PyList_GetItemRef(__pyx_t_4, __pyx_t_1);
-        ++__pyx_t_1;
-      } else {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
-          #endif
-          if (__pyx_t_1 >= __pyx_temp) break;
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1));
-        #else
-        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1);
-        #endif
-        ++__pyx_t_1;
-      }
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
-    } else {
-      __pyx_t_2 = __pyx_t_7(__pyx_t_4);
-      if (unlikely(!__pyx_t_2)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 75, __pyx_L1_error)
-          PyErr_Clear();
-        }
-        break;
-      }
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_2);
-    __pyx_t_2 = 0;
+  __pyx_t_5 = __pyx_f_10cython_ext_12fuzzy_cython_bounded_levenshtein(__pyx_v_s1, __pyx_v_s2, __pyx_t_3, 0); if (unlikely(__pyx_t_5 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
 
-    /* "cython_ext/fuzzy_cython.pyx":76
- *     results = []
- *     for i in range(n_lines):
- *         line = lines[i]             # <<<<<<<<<<<<<<
- *         score = similarity_ratio(pattern, line)
- *         if score >= threshold:
+  /* "cython_ext/fuzzy_cython.pyx":141
+ *     return _banded(s1, s2, max_distance)
+ * 
+ * cpdef int levenshtein(str s1, str s2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Compute the Levenshtein distance between two Unicode strings.
 */
-    if (unlikely(__pyx_v_lines == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 76, __pyx_L1_error)
-    }
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_v_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_2);
-    __pyx_t_2 = 0;
 
-    /* "cython_ext/fuzzy_cython.pyx":77
- *     for i in range(n_lines):
- *         line = lines[i]
- *         score = similarity_ratio(pattern, line)             # <<<<<<<<<<<<<<
- *         if score >= threshold:
- *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
-*/
-    if (!(likely(PyUnicode_CheckExact(__pyx_v_line))||((__pyx_v_line) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_v_line))) __PYX_ERR(0, 77, __pyx_L1_error)
-    __pyx_t_8 = __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(__pyx_v_pattern, ((PyObject*)__pyx_v_line), 0); if (unlikely(__pyx_t_8 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L1_error)
-    __pyx_v_score = __pyx_t_8;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "cython_ext/fuzzy_cython.pyx":78
- *         line = lines[i]
- *         score = similarity_ratio(pattern, line)
- *         if score >= threshold:             # <<<<<<<<<<<<<<
+/* Python wrapper */
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3levenshtein(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_2levenshtein, "\n    Compute the Levenshtein distance between two Unicode strings.\n    Handles all edge cases, including empty strings.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_3levenshtein = {"levenshtein", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_3levenshtein, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_2levenshtein};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_3levenshtein(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_s1 = 0;
+  PyObject *__pyx_v_s2 = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("levenshtein (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_s1,&__pyx_mstate_global->__pyx_n_u_s2,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 141, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "levenshtein", 0) < 0) __PYX_ERR(0, 141, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("levenshtein", 1, 2, 2, i); __PYX_ERR(0, 141, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+    }
+    __pyx_v_s1 = ((PyObject*)values[0]);
+    __pyx_v_s2 = ((PyObject*)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("levenshtein", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 141, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s1), (&PyUnicode_Type), 1, "s1", 1))) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s2), (&PyUnicode_Type), 1, "s2", 1))) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_2levenshtein(__pyx_self, __pyx_v_s1, __pyx_v_s2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_2levenshtein(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("levenshtein", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(__pyx_v_s1, __pyx_v_s2, 1); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.levenshtein", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":148
+ *     return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))
+ * 
+ * cpdef double similarity_ratio(str s1, str s2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.
+*/
+
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5similarity_ratio(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static double __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(PyObject *__pyx_v_s1, PyObject *__pyx_v_s2, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  int __pyx_v_max_len;
+  int __pyx_v_dist;
+  double __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":153
+ *     Handles all edge cases.
+ *     """
+ *     cdef int max_len = max(len(s1), len(s2))             # <<<<<<<<<<<<<<
+ *     if max_len == 0:
+ *         return 1.0
+*/
+  if (unlikely(__pyx_v_s2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 153, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s2); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 153, __pyx_L1_error)
+  if (unlikely(__pyx_v_s1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 153, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_s1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_max_len = __pyx_t_3;
+
+  /* "cython_ext/fuzzy_cython.pyx":154
+ *     """
+ *     cdef int max_len = max(len(s1), len(s2))
+ *     if max_len == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     cdef int dist = levenshtein(s1, s2)
+*/
+  __pyx_t_4 = (__pyx_v_max_len == 0);
+  if (__pyx_t_4) {
+
+    /* "cython_ext/fuzzy_cython.pyx":155
+ *     cdef int max_len = max(len(s1), len(s2))
+ *     if max_len == 0:
+ *         return 1.0             # <<<<<<<<<<<<<<
+ *     cdef int dist = levenshtein(s1, s2)
+ *     return 1.0 - dist / max_len
+*/
+    __pyx_r = 1.0;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":154
+ *     """
+ *     cdef int max_len = max(len(s1), len(s2))
+ *     if max_len == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     cdef int dist = levenshtein(s1, s2)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":156
+ *     if max_len == 0:
+ *         return 1.0
+ *     cdef int dist = levenshtein(s1, s2)             # <<<<<<<<<<<<<<
+ *     return 1.0 - dist / max_len
+ * 
+*/
+  __pyx_t_5 = __pyx_f_10cython_ext_12fuzzy_cython_levenshtein(__pyx_v_s1, __pyx_v_s2, 0); if (unlikely(__pyx_t_5 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_v_dist = __pyx_t_5;
+
+  /* "cython_ext/fuzzy_cython.pyx":157
+ *         return 1.0
+ *     cdef int dist = levenshtein(s1, s2)
+ *     return 1.0 - dist / max_len             # <<<<<<<<<<<<<<
+ * 
+ * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):
+*/
+  if (unlikely(__pyx_v_max_len == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 157, __pyx_L1_error)
+  }
+  __pyx_r = (1.0 - (((double)__pyx_v_dist) / ((double)__pyx_v_max_len)));
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":148
+ *     return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))
+ * 
+ * cpdef double similarity_ratio(str s1, str s2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5similarity_ratio(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_4similarity_ratio, "\n    Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.\n    Handles all edge cases.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_5similarity_ratio = {"similarity_ratio", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_5similarity_ratio, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_4similarity_ratio};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5similarity_ratio(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_s1 = 0;
+  PyObject *__pyx_v_s2 = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("similarity_ratio (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_s1,&__pyx_mstate_global->__pyx_n_u_s2,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 148, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 148, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 148, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "similarity_ratio", 0) < 0) __PYX_ERR(0, 148, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("similarity_ratio", 1, 2, 2, i); __PYX_ERR(0, 148, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 148, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 148, __pyx_L3_error)
+    }
+    __pyx_v_s1 = ((PyObject*)values[0]);
+    __pyx_v_s2 = ((PyObject*)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("similarity_ratio", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 148, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s1), (&PyUnicode_Type), 1, "s1", 1))) __PYX_ERR(0, 148, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_s2), (&PyUnicode_Type), 1, "s2", 1))) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_4similarity_ratio(__pyx_self, __pyx_v_s1, __pyx_v_s2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_4similarity_ratio(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s1, PyObject *__pyx_v_s2) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("similarity_ratio", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(__pyx_v_s1, __pyx_v_s2, 1); if (unlikely(__pyx_t_1 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.similarity_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":159
+ *     return 1.0 - dist / max_len
+ * 
+ * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Fuzzy search for pattern in a list of lines.
+*/
+
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_7fuzzy_search(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_10cython_ext_12fuzzy_cython_fuzzy_search(PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search *__pyx_optional_args) {
+  double __pyx_v_threshold = ((double)0.7);
+  int __pyx_v_context = ((int)0);
+  int __pyx_v_max_results = ((int)0x3E8);
+  int __pyx_v_n_lines;
+  int __pyx_v_results_found;
+  PyObject *__pyx_v_results = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_v_line = NULL;
+  double __pyx_v_score;
+  PyObject *__pyx_v_before = NULL;
+  PyObject *__pyx_v_after = NULL;
+  PyObject *__pyx_7genexpr__pyx_v_j = NULL;
+  PyObject *__pyx_8genexpr1__pyx_v_j = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  double __pyx_t_8;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  long __pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  PyObject *(*__pyx_t_19)(PyObject *);
+  int __pyx_t_20;
+  PyObject *__pyx_t_21 = NULL;
+  int __pyx_t_22;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fuzzy_search", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_threshold = __pyx_optional_args->threshold;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_context = __pyx_optional_args->context;
+        if (__pyx_optional_args->__pyx_n > 2) {
+          __pyx_v_max_results = __pyx_optional_args->max_results;
+        }
+      }
+    }
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":164
+ *     Returns a list of (line_number, line, context_before, context_after) for matches above threshold.
+ *     """
+ *     cdef int n_lines = len(lines)             # <<<<<<<<<<<<<<
+ *     cdef int results_found = 0
+ *     results = []
+*/
+  if (unlikely(__pyx_v_lines == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 164, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_lines); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_v_n_lines = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":165
+ *     """
+ *     cdef int n_lines = len(lines)
+ *     cdef int results_found = 0             # <<<<<<<<<<<<<<
+ *     results = []
+ *     for i in range(n_lines):
+*/
+  __pyx_v_results_found = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":166
+ *     cdef int n_lines = len(lines)
+ *     cdef int results_found = 0
+ *     results = []             # <<<<<<<<<<<<<<
+ *     for i in range(n_lines):
+ *         line = lines[i]
+*/
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_results = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":167
+ *     cdef int results_found = 0
+ *     results = []
+ *     for i in range(n_lines):             # <<<<<<<<<<<<<<
+ *         line = lines[i]
+ *         score = similarity_ratio(pattern, line)
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_INCREF(__pyx_builtin_range);
+  __pyx_t_4 = __pyx_builtin_range; 
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_n_lines); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = 1;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_5};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+    __pyx_t_4 = __pyx_t_2; __Pyx_INCREF(__pyx_t_4);
+    __pyx_t_1 = 0;
+    __pyx_t_7 = NULL;
+  } else {
+    __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 167, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_7)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 167, __pyx_L1_error)
+          #endif
+          if (__pyx_t_1 >= __pyx_temp) break;
+        }
+        __pyx_t_2 = __Pyx_PyList_GetItemRef(__pyx_t_4, __pyx_t_1);
+        ++__pyx_t_1;
+      } else {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 167, __pyx_L1_error)
+          #endif
+          if (__pyx_t_1 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1));
+        #else
+        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1);
+        #endif
+        ++__pyx_t_1;
+      }
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+    } else {
+      __pyx_t_2 = __pyx_t_7(__pyx_t_4);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 167, __pyx_L1_error)
+          PyErr_Clear();
+        }
+        break;
+      }
+    }
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":168
+ *     results = []
+ *     for i in range(n_lines):
+ *         line = lines[i]             # <<<<<<<<<<<<<<
+ *         score = similarity_ratio(pattern, line)
+ *         if score >= threshold:
+*/
+    if (unlikely(__pyx_v_lines == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 168, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_v_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":169
+ *     for i in range(n_lines):
+ *         line = lines[i]
+ *         score = similarity_ratio(pattern, line)             # <<<<<<<<<<<<<<
+ *         if score >= threshold:
+ *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
+*/
+    if (!(likely(PyUnicode_CheckExact(__pyx_v_line))||((__pyx_v_line) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_v_line))) __PYX_ERR(0, 169, __pyx_L1_error)
+    __pyx_t_8 = __pyx_f_10cython_ext_12fuzzy_cython_similarity_ratio(__pyx_v_pattern, ((PyObject*)__pyx_v_line), 0); if (unlikely(__pyx_t_8 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(0, 169, __pyx_L1_error)
+    __pyx_v_score = __pyx_t_8;
+
+    /* "cython_ext/fuzzy_cython.pyx":170
+ *         line = lines[i]
+ *         score = similarity_ratio(pattern, line)
+ *         if score >= threshold:             # <<<<<<<<<<<<<<
+ *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
+ *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
+*/
+    __pyx_t_9 = (__pyx_v_score >= __pyx_v_threshold);
+    if (__pyx_t_9) {
+
+      /* "cython_ext/fuzzy_cython.pyx":171
+ *         score = similarity_ratio(pattern, line)
+ *         if score >= threshold:
+ *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []             # <<<<<<<<<<<<<<
+ *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
+ *             results.append((i+1, line.strip(), before, after, score))
+*/
+      __pyx_t_9 = (__pyx_v_context != 0);
+      if (__pyx_t_9) {
+        { /* enter inner scope */
+          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_10 = NULL;
+          __Pyx_INCREF(__pyx_builtin_range);
+          __pyx_t_11 = __pyx_builtin_range; 
+          __pyx_t_12 = __Pyx_PyLong_From_int(__pyx_v_context); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          __pyx_t_13 = PyNumber_Subtract(__pyx_v_i, __pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+          __pyx_t_14 = 0;
+          __pyx_t_15 = __Pyx_PyLong_From_long(__pyx_t_14); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_GOTREF(__pyx_t_15);
+          __pyx_t_16 = PyObject_RichCompare(__pyx_t_13, __pyx_t_15, Py_GT); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          __pyx_t_17 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_17 < 0))) __PYX_ERR(0, 171, __pyx_L8_error)
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          if (__pyx_t_17) {
+            __Pyx_INCREF(__pyx_t_13);
+            __pyx_t_12 = __pyx_t_13;
+          } else {
+            __pyx_t_16 = __Pyx_PyLong_From_long(__pyx_t_14); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 171, __pyx_L8_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __pyx_t_12 = __pyx_t_16;
+            __pyx_t_16 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_6 = 1;
+          {
+            PyObject *__pyx_callargs[3] = {__pyx_t_10, __pyx_t_12, __pyx_v_i};
+            __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L8_error)
+            __Pyx_GOTREF(__pyx_t_3);
+          }
+          if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+            __pyx_t_11 = __pyx_t_3; __Pyx_INCREF(__pyx_t_11);
+            __pyx_t_18 = 0;
+            __pyx_t_19 = NULL;
+          } else {
+            __pyx_t_18 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 171, __pyx_L8_error)
+            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_19 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 171, __pyx_L8_error)
+          }
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          for (;;) {
+            if (likely(!__pyx_t_19)) {
+              if (likely(PyList_CheckExact(__pyx_t_11))) {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
+                  #if !CYTHON_ASSUME_SAFE_SIZE
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 171, __pyx_L8_error)
+                  #endif
+                  if (__pyx_t_18 >= __pyx_temp) break;
+                }
+                __pyx_t_3 = __Pyx_PyList_GetItemRef(__pyx_t_11, __pyx_t_18);
+                ++__pyx_t_18;
+              } else {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
+                  #if !CYTHON_ASSUME_SAFE_SIZE
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 171, __pyx_L8_error)
+                  #endif
+                  if (__pyx_t_18 >= __pyx_temp) break;
+                }
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_3 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_18));
+                #else
+                __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_18);
+                #endif
+                ++__pyx_t_18;
+              }
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L8_error)
+            } else {
+              __pyx_t_3 = __pyx_t_19(__pyx_t_11);
+              if (unlikely(!__pyx_t_3)) {
+                PyObject* exc_type = PyErr_Occurred();
+                if (exc_type) {
+                  if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 171, __pyx_L8_error)
+                  PyErr_Clear();
+                }
+                break;
+              }
+            }
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_j, __pyx_t_3);
+            __pyx_t_3 = 0;
+            if (unlikely(__pyx_v_lines == Py_None)) {
+              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+              __PYX_ERR(0, 171, __pyx_L8_error)
+            }
+            __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_7genexpr__pyx_v_j); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 171, __pyx_L8_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_12 = __pyx_t_10;
+            __Pyx_INCREF(__pyx_t_12);
+            __pyx_t_6 = 0;
+            {
+              PyObject *__pyx_callargs[2] = {__pyx_t_12, NULL};
+              __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+              __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 171, __pyx_L8_error)
+              __Pyx_GOTREF(__pyx_t_3);
+            }
+            if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 171, __pyx_L8_error)
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j); __pyx_7genexpr__pyx_v_j = 0;
+          goto __pyx_L12_exit_scope;
+          __pyx_L8_error:;
+          __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j); __pyx_7genexpr__pyx_v_j = 0;
+          goto __pyx_L1_error;
+          __pyx_L12_exit_scope:;
+        } /* exit inner scope */
+        __pyx_t_2 = __pyx_t_5;
+        __pyx_t_5 = 0;
+      } else {
+        __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 171, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_2 = __pyx_t_5;
+        __pyx_t_5 = 0;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_before, ((PyObject*)__pyx_t_2));
+      __pyx_t_2 = 0;
+
+      /* "cython_ext/fuzzy_cython.pyx":172
+ *         if score >= threshold:
+ *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
+ *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []             # <<<<<<<<<<<<<<
+ *             results.append((i+1, line.strip(), before, after, score))
+ *             results_found += 1
+*/
+      __pyx_t_9 = (__pyx_v_context != 0);
+      if (__pyx_t_9) {
+        { /* enter inner scope */
+          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_3 = NULL;
+          __Pyx_INCREF(__pyx_builtin_range);
+          __pyx_t_10 = __pyx_builtin_range; 
+          __pyx_t_12 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          __pyx_t_13 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __pyx_t_16 = __Pyx_PyLong_From_int(__pyx_v_context); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __pyx_t_15 = PyNumber_Add(__pyx_t_13, __pyx_t_16); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_15);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          __pyx_t_20 = __pyx_v_n_lines;
+          __pyx_t_13 = __Pyx_PyLong_From_int(__pyx_t_20); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __pyx_t_21 = PyObject_RichCompare(__pyx_t_15, __pyx_t_13, Py_LT); __Pyx_XGOTREF(__pyx_t_21); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_17 = __Pyx_PyObject_IsTrue(__pyx_t_21); if (unlikely((__pyx_t_17 < 0))) __PYX_ERR(0, 172, __pyx_L15_error)
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (__pyx_t_17) {
+            __Pyx_INCREF(__pyx_t_15);
+            __pyx_t_16 = __pyx_t_15;
+          } else {
+            __pyx_t_21 = __Pyx_PyLong_From_int(__pyx_t_20); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 172, __pyx_L15_error)
+            __Pyx_GOTREF(__pyx_t_21);
+            __pyx_t_16 = __pyx_t_21;
+            __pyx_t_21 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          __pyx_t_6 = 1;
+          {
+            PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_t_12, __pyx_t_16};
+            __pyx_t_11 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 172, __pyx_L15_error)
+            __Pyx_GOTREF(__pyx_t_11);
+          }
+          if (likely(PyList_CheckExact(__pyx_t_11)) || PyTuple_CheckExact(__pyx_t_11)) {
+            __pyx_t_10 = __pyx_t_11; __Pyx_INCREF(__pyx_t_10);
+            __pyx_t_18 = 0;
+            __pyx_t_19 = NULL;
+          } else {
+            __pyx_t_18 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 172, __pyx_L15_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_19 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 172, __pyx_L15_error)
+          }
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          for (;;) {
+            if (likely(!__pyx_t_19)) {
+              if (likely(PyList_CheckExact(__pyx_t_10))) {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+                  #if !CYTHON_ASSUME_SAFE_SIZE
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 172, __pyx_L15_error)
+                  #endif
+                  if (__pyx_t_18 >= __pyx_temp) break;
+                }
+                __pyx_t_11 = __Pyx_PyList_GetItemRef(__pyx_t_10, __pyx_t_18);
+                ++__pyx_t_18;
+              } else {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
+                  #if !CYTHON_ASSUME_SAFE_SIZE
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 172, __pyx_L15_error)
+                  #endif
+                  if (__pyx_t_18 >= __pyx_temp) break;
+                }
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_11 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_18));
+                #else
+                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_18);
+                #endif
+                ++__pyx_t_18;
+              }
+              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 172, __pyx_L15_error)
+            } else {
+              __pyx_t_11 = __pyx_t_19(__pyx_t_10);
+              if (unlikely(!__pyx_t_11)) {
+                PyObject* exc_type = PyErr_Occurred();
+                if (exc_type) {
+                  if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 172, __pyx_L15_error)
+                  PyErr_Clear();
+                }
+                break;
+              }
+            }
+            __Pyx_GOTREF(__pyx_t_11);
+            __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_j, __pyx_t_11);
+            __pyx_t_11 = 0;
+            if (unlikely(__pyx_v_lines == Py_None)) {
+              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+              __PYX_ERR(0, 172, __pyx_L15_error)
+            }
+            __pyx_t_12 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_8genexpr1__pyx_v_j); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 172, __pyx_L15_error)
+            __Pyx_GOTREF(__pyx_t_12);
+            __pyx_t_16 = __pyx_t_12;
+            __Pyx_INCREF(__pyx_t_16);
+            __pyx_t_6 = 0;
+            {
+              PyObject *__pyx_callargs[2] = {__pyx_t_16, NULL};
+              __pyx_t_11 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+              __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
+              __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 172, __pyx_L15_error)
+              __Pyx_GOTREF(__pyx_t_11);
+            }
+            if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_11))) __PYX_ERR(0, 172, __pyx_L15_error)
+            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j); __pyx_8genexpr1__pyx_v_j = 0;
+          goto __pyx_L19_exit_scope;
+          __pyx_L15_error:;
+          __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j); __pyx_8genexpr1__pyx_v_j = 0;
+          goto __pyx_L1_error;
+          __pyx_L19_exit_scope:;
+        } /* exit inner scope */
+        __pyx_t_2 = __pyx_t_5;
+        __pyx_t_5 = 0;
+      } else {
+        __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_2 = __pyx_t_5;
+        __pyx_t_5 = 0;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_after, ((PyObject*)__pyx_t_2));
+      __pyx_t_2 = 0;
+
+      /* "cython_ext/fuzzy_cython.pyx":173
+ *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
+ *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
+ *             results.append((i+1, line.strip(), before, after, score))             # <<<<<<<<<<<<<<
+ *             results_found += 1
+ *             if results_found >= max_results:
+*/
+      __pyx_t_2 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_10 = __pyx_v_line;
+      __Pyx_INCREF(__pyx_t_10);
+      __pyx_t_6 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_10, NULL};
+        __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __pyx_t_10 = PyFloat_FromDouble(__pyx_v_score); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 173, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_11 = PyTuple_New(5); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 173, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_GIVEREF(__pyx_t_2);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_2) != (0)) __PYX_ERR(0, 173, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_5);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_5) != (0)) __PYX_ERR(0, 173, __pyx_L1_error);
+      __Pyx_INCREF(__pyx_v_before);
+      __Pyx_GIVEREF(__pyx_v_before);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_v_before) != (0)) __PYX_ERR(0, 173, __pyx_L1_error);
+      __Pyx_INCREF(__pyx_v_after);
+      __Pyx_GIVEREF(__pyx_v_after);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 3, __pyx_v_after) != (0)) __PYX_ERR(0, 173, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_10);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 4, __pyx_t_10) != (0)) __PYX_ERR(0, 173, __pyx_L1_error);
+      __pyx_t_2 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_10 = 0;
+      __pyx_t_22 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_11); if (unlikely(__pyx_t_22 == ((int)-1))) __PYX_ERR(0, 173, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "cython_ext/fuzzy_cython.pyx":174
+ *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
+ *             results.append((i+1, line.strip(), before, after, score))
+ *             results_found += 1             # <<<<<<<<<<<<<<
+ *             if results_found >= max_results:
+ *                 break
+*/
+      __pyx_v_results_found = (__pyx_v_results_found + 1);
+
+      /* "cython_ext/fuzzy_cython.pyx":175
+ *             results.append((i+1, line.strip(), before, after, score))
+ *             results_found += 1
+ *             if results_found >= max_results:             # <<<<<<<<<<<<<<
+ *                 break
+ *     return results
+*/
+      __pyx_t_9 = (__pyx_v_results_found >= __pyx_v_max_results);
+      if (__pyx_t_9) {
+
+        /* "cython_ext/fuzzy_cython.pyx":176
+ *             results_found += 1
+ *             if results_found >= max_results:
+ *                 break             # <<<<<<<<<<<<<<
+ *     return results
+ * # --- Batch scoring ---
+*/
+        goto __pyx_L4_break;
+
+        /* "cython_ext/fuzzy_cython.pyx":175
+ *             results.append((i+1, line.strip(), before, after, score))
+ *             results_found += 1
+ *             if results_found >= max_results:             # <<<<<<<<<<<<<<
+ *                 break
+ *     return results
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":170
+ *         line = lines[i]
+ *         score = similarity_ratio(pattern, line)
+ *         if score >= threshold:             # <<<<<<<<<<<<<<
  *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
  *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
 */
-    __pyx_t_9 = (__pyx_v_score >= __pyx_v_threshold);
-    if (__pyx_t_9) {
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":167
+ *     cdef int results_found = 0
+ *     results = []
+ *     for i in range(n_lines):             # <<<<<<<<<<<<<<
+ *         line = lines[i]
+ *         score = similarity_ratio(pattern, line)
+*/
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  goto __pyx_L21_for_end;
+  __pyx_L4_break:;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  goto __pyx_L21_for_end;
+  __pyx_L21_for_end:;
+
+  /* "cython_ext/fuzzy_cython.pyx":177
+ *             if results_found >= max_results:
+ *                 break
+ *     return results             # <<<<<<<<<<<<<<
+ * # --- Batch scoring ---
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":159
+ *     return 1.0 - dist / max_len
+ * 
+ * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Fuzzy search for pattern in a list of lines.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_results);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_line);
+  __Pyx_XDECREF(__pyx_v_before);
+  __Pyx_XDECREF(__pyx_v_after);
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_7fuzzy_search(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_6fuzzy_search, "\n    Fuzzy search for pattern in a list of lines.\n    Returns a list of (line_number, line, context_before, context_after) for matches above threshold.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_7fuzzy_search = {"fuzzy_search", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_7fuzzy_search, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_6fuzzy_search};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_7fuzzy_search(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_pattern = 0;
+  PyObject *__pyx_v_lines = 0;
+  double __pyx_v_threshold;
+  int __pyx_v_context;
+  int __pyx_v_max_results;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fuzzy_search (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pattern,&__pyx_mstate_global->__pyx_n_u_lines,&__pyx_mstate_global->__pyx_n_u_threshold,&__pyx_mstate_global->__pyx_n_u_context,&__pyx_mstate_global->__pyx_n_u_max_results,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 159, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fuzzy_search", 0) < 0) __PYX_ERR(0, 159, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fuzzy_search", 0, 2, 5, i); __PYX_ERR(0, 159, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 159, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 159, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 159, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_pattern = ((PyObject*)values[0]);
+    __pyx_v_lines = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_threshold = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_threshold == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    } else {
+      __pyx_v_threshold = ((double)0.7);
+    }
+    if (values[3]) {
+      __pyx_v_context = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_context == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    } else {
+      __pyx_v_context = ((int)0);
+    }
+    if (values[4]) {
+      __pyx_v_max_results = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_max_results == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
+    } else {
+      __pyx_v_max_results = ((int)0x3E8);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fuzzy_search", 0, 2, 5, __pyx_nargs); __PYX_ERR(0, 159, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pattern), (&PyUnicode_Type), 1, "pattern", 1))) __PYX_ERR(0, 159, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lines), (&PyList_Type), 1, "lines", 1))) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_6fuzzy_search(__pyx_self, __pyx_v_pattern, __pyx_v_lines, __pyx_v_threshold, __pyx_v_context, __pyx_v_max_results);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_6fuzzy_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_context, int __pyx_v_max_results) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fuzzy_search", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 3;
+  __pyx_t_2.threshold = __pyx_v_threshold;
+  __pyx_t_2.context = __pyx_v_context;
+  __pyx_t_2.max_results = __pyx_v_max_results;
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_fuzzy_search(__pyx_v_pattern, __pyx_v_lines, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":180
+ * # --- Batch scoring ---
+ * 
+ * def encode_lines(list lines):             # <<<<<<<<<<<<<<
+ *     """
+ *     Pack lines into one contiguous code-point buffer.
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_9encode_lines(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_8encode_lines, "\n    Pack lines into one contiguous code-point buffer.\n    Returns (codes, offsets): line i is codes[offsets[i]:offsets[i + 1]].\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_9encode_lines = {"encode_lines", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_9encode_lines, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_8encode_lines};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_9encode_lines(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_lines = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("encode_lines (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lines,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 180, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 180, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "encode_lines", 0) < 0) __PYX_ERR(0, 180, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("encode_lines", 1, 1, 1, i); __PYX_ERR(0, 180, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 180, __pyx_L3_error)
+    }
+    __pyx_v_lines = ((PyObject*)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("encode_lines", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 180, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.encode_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lines), (&PyList_Type), 1, "lines", 1))) __PYX_ERR(0, 180, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_8encode_lines(__pyx_self, __pyx_v_lines);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_8encode_lines(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lines) {
+  Py_ssize_t __pyx_v_n;
+  PyArrayObject *__pyx_v_offsets = 0;
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_v_codes = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_offsets;
+  __Pyx_Buffer __pyx_pybuffer_offsets;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  size_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("encode_lines", 0);
+  __pyx_pybuffer_offsets.pybuffer.buf = NULL;
+  __pyx_pybuffer_offsets.refcount = 0;
+  __pyx_pybuffernd_offsets.data = NULL;
+  __pyx_pybuffernd_offsets.rcbuffer = &__pyx_pybuffer_offsets;
+
+  /* "cython_ext/fuzzy_cython.pyx":185
+ *     Returns (codes, offsets): line i is codes[offsets[i]:offsets[i + 1]].
+ *     """
+ *     cdef Py_ssize_t n = len(lines)             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros(n + 1, dtype=np.int64)
+ *     cdef Py_ssize_t i
+*/
+  if (unlikely(__pyx_v_lines == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 185, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_lines); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":186
+ *     """
+ *     cdef Py_ssize_t n = len(lines)
+ *     cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros(n + 1, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i
+ *     for i in range(n):
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyLong_FromSsize_t((__pyx_v_n + 1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_int64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_8 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_t_4};
+    __pyx_t_6 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 186, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_6, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 186, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_5, __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_mstate_global->__pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 186, __pyx_L1_error)
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_offsets.rcbuffer->pybuffer, (PyObject*)((PyArrayObject *)__pyx_t_2), &__Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_offsets = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_offsets.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 186, __pyx_L1_error)
+    } else {__pyx_pybuffernd_offsets.diminfo[0].strides = __pyx_pybuffernd_offsets.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_offsets.diminfo[0].shape = __pyx_pybuffernd_offsets.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_v_offsets = ((PyArrayObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":188
+ *     cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros(n + 1, dtype=np.int64)
+ *     cdef Py_ssize_t i
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         offsets[i + 1] = offsets[i] + len(<str>lines[i])
+ *     codes = np.frombuffer("".join(lines).encode("utf-32-le"), dtype=np.uint32)
+*/
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_9 = __pyx_t_1;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "cython_ext/fuzzy_cython.pyx":189
+ *     cdef Py_ssize_t i
+ *     for i in range(n):
+ *         offsets[i + 1] = offsets[i] + len(<str>lines[i])             # <<<<<<<<<<<<<<
+ *     codes = np.frombuffer("".join(lines).encode("utf-32-le"), dtype=np.uint32)
+ *     return codes, offsets
+*/
+    __pyx_t_11 = __pyx_v_i;
+    __pyx_t_12 = -1;
+    if (__pyx_t_11 < 0) {
+      __pyx_t_11 += __pyx_pybuffernd_offsets.diminfo[0].shape;
+      if (unlikely(__pyx_t_11 < 0)) __pyx_t_12 = 0;
+    } else if (unlikely(__pyx_t_11 >= __pyx_pybuffernd_offsets.diminfo[0].shape)) __pyx_t_12 = 0;
+    if (unlikely(__pyx_t_12 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_12);
+      __PYX_ERR(0, 189, __pyx_L1_error)
+    }
+    if (unlikely(__pyx_v_lines == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 189, __pyx_L1_error)
+    }
+    __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_lines, __pyx_v_i, Py_ssize_t, 1, PyLong_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (unlikely(__pyx_t_2 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 189, __pyx_L1_error)
+    }
+    __pyx_t_13 = __Pyx_PyUnicode_GET_LENGTH(((PyObject*)__pyx_t_2)); if (unlikely(__pyx_t_13 == ((Py_ssize_t)-1))) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_14 = (__pyx_v_i + 1);
+    __pyx_t_12 = -1;
+    if (__pyx_t_14 < 0) {
+      __pyx_t_14 += __pyx_pybuffernd_offsets.diminfo[0].shape;
+      if (unlikely(__pyx_t_14 < 0)) __pyx_t_12 = 0;
+    } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_offsets.diminfo[0].shape)) __pyx_t_12 = 0;
+    if (unlikely(__pyx_t_12 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_12);
+      __PYX_ERR(0, 189, __pyx_L1_error)
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int64_t *, __pyx_pybuffernd_offsets.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_offsets.diminfo[0].strides) = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int64_t *, __pyx_pybuffernd_offsets.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_offsets.diminfo[0].strides)) + __pyx_t_13);
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":190
+ *     for i in range(n):
+ *         offsets[i + 1] = offsets[i] + len(<str>lines[i])
+ *     codes = np.frombuffer("".join(lines).encode("utf-32-le"), dtype=np.uint32)             # <<<<<<<<<<<<<<
+ *     return codes, offsets
+ * 
+*/
+  __pyx_t_5 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_frombuffer); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = PyUnicode_Join(__pyx_mstate_global->__pyx_kp_u__6, __pyx_v_lines); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = PyUnicode_AsEncodedString(((PyObject*)__pyx_t_6), ((char const *)"utf-32-le"), NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_uint32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_5);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_8 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_4};
+    __pyx_t_6 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_3, __pyx_t_6, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_7, __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_codes = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":191
+ *         offsets[i + 1] = offsets[i] + len(<str>lines[i])
+ *     codes = np.frombuffer("".join(lines).encode("utf-32-le"), dtype=np.uint32)
+ *     return codes, offsets             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_codes);
+  __Pyx_GIVEREF(__pyx_v_codes);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_codes) != (0)) __PYX_ERR(0, 191, __pyx_L1_error);
+  __Pyx_INCREF((PyObject *)__pyx_v_offsets);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_offsets);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_offsets)) != (0)) __PYX_ERR(0, 191, __pyx_L1_error);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":180
+ * # --- Batch scoring ---
+ * 
+ * def encode_lines(list lines):             # <<<<<<<<<<<<<<
+ *     """
+ *     Pack lines into one contiguous code-point buffer.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_offsets.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.encode_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_offsets.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_offsets);
+  __Pyx_XDECREF(__pyx_v_codes);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":193
+ *     return codes, offsets
+ * 
+ * cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int k
+ *     if c < 128:
+*/
+
+static CYTHON_INLINE uint64_t __pyx_f_10cython_ext_12fuzzy_cython__peq(uint32_t __pyx_v_c, uint64_t *__pyx_v_ascii_eq, uint32_t *__pyx_v_other, uint64_t *__pyx_v_other_eq, int __pyx_v_n_other) {
+  int __pyx_v_k;
+  uint64_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "cython_ext/fuzzy_cython.pyx":195
+ * cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:
+ *     cdef int k
+ *     if c < 128:             # <<<<<<<<<<<<<<
+ *         return ascii_eq[c]
+ *     for k in range(n_other):
+*/
+  __pyx_t_1 = (__pyx_v_c < 0x80);
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":196
+ *     cdef int k
+ *     if c < 128:
+ *         return ascii_eq[c]             # <<<<<<<<<<<<<<
+ *     for k in range(n_other):
+ *         if other[k] == c:
+*/
+    __pyx_r = (__pyx_v_ascii_eq[__pyx_v_c]);
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":195
+ * cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:
+ *     cdef int k
+ *     if c < 128:             # <<<<<<<<<<<<<<
+ *         return ascii_eq[c]
+ *     for k in range(n_other):
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":197
+ *     if c < 128:
+ *         return ascii_eq[c]
+ *     for k in range(n_other):             # <<<<<<<<<<<<<<
+ *         if other[k] == c:
+ *             return other_eq[k]
+*/
+  __pyx_t_2 = __pyx_v_n_other;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_k = __pyx_t_4;
+
+    /* "cython_ext/fuzzy_cython.pyx":198
+ *         return ascii_eq[c]
+ *     for k in range(n_other):
+ *         if other[k] == c:             # <<<<<<<<<<<<<<
+ *             return other_eq[k]
+ *     return 0
+*/
+    __pyx_t_1 = ((__pyx_v_other[__pyx_v_k]) == __pyx_v_c);
+    if (__pyx_t_1) {
+
+      /* "cython_ext/fuzzy_cython.pyx":199
+ *     for k in range(n_other):
+ *         if other[k] == c:
+ *             return other_eq[k]             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+*/
+      __pyx_r = (__pyx_v_other_eq[__pyx_v_k]);
+      goto __pyx_L0;
+
+      /* "cython_ext/fuzzy_cython.pyx":198
+ *         return ascii_eq[c]
+ *     for k in range(n_other):
+ *         if other[k] == c:             # <<<<<<<<<<<<<<
+ *             return other_eq[k]
+ *     return 0
+*/
+    }
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":200
+ *         if other[k] == c:
+ *             return other_eq[k]
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef int _myers64_codes(const uint32_t *text, Py_ssize_t n, int m, uint64_t *ascii_eq,
+*/
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":193
+ *     return codes, offsets
+ * 
+ * cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int k
+ *     if c < 128:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":202
+ *     return 0
+ * 
+ * cdef int _myers64_codes(const uint32_t *text, Py_ssize_t n, int m, uint64_t *ascii_eq,             # <<<<<<<<<<<<<<
+ *                         uint32_t *other, uint64_t *other_eq, int n_other, int max_distance) nogil:
+ *     """_myers64() over an encoded line, without touching Python objects."""
+*/
+
+static int __pyx_f_10cython_ext_12fuzzy_cython__myers64_codes(uint32_t const *__pyx_v_text, Py_ssize_t __pyx_v_n, int __pyx_v_m, uint64_t *__pyx_v_ascii_eq, uint32_t *__pyx_v_other, uint64_t *__pyx_v_other_eq, int __pyx_v_n_other, int __pyx_v_max_distance) {
+  uint64_t __pyx_v_mask;
+  uint64_t __pyx_v_top;
+  uint64_t __pyx_v_vp;
+  uint64_t __pyx_v_vn;
+  uint64_t __pyx_v_eq;
+  uint64_t __pyx_v_xv;
+  uint64_t __pyx_v_xh;
+  uint64_t __pyx_v_ph;
+  uint64_t __pyx_v_mh;
+  int __pyx_v_score;
+  Py_ssize_t __pyx_v_j;
+  int __pyx_r;
+  uint64_t __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "cython_ext/fuzzy_cython.pyx":205
+ *                         uint32_t *other, uint64_t *other_eq, int n_other, int max_distance) nogil:
+ *     """_myers64() over an encoded line, without touching Python objects."""
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF             # <<<<<<<<<<<<<<
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh
+*/
+  __pyx_t_2 = (__pyx_v_m < 64);
+  if (__pyx_t_2) {
+    __pyx_t_1 = ((((uint64_t)1) << __pyx_v_m) - 1);
+  } else {
+    __pyx_t_1 = ((uint64_t)0xFFFFFFFFFFFFFFFF);
+  }
+  __pyx_v_mask = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":206
+ *     """_myers64() over an encoded line, without touching Python objects."""
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)             # <<<<<<<<<<<<<<
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh
+ *     cdef int score = m
+*/
+  __pyx_v_top = (((uint64_t)1) << (__pyx_v_m - 1));
+
+  /* "cython_ext/fuzzy_cython.pyx":207
+ *     cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh             # <<<<<<<<<<<<<<
+ *     cdef int score = m
+ *     cdef Py_ssize_t j
+*/
+  __pyx_v_vp = __pyx_v_mask;
+  __pyx_v_vn = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":208
+ *     cdef uint64_t top = <uint64_t>1 << (m - 1)
+ *     cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh
+ *     cdef int score = m             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j
+ *     for j in range(n):
+*/
+  __pyx_v_score = __pyx_v_m;
+
+  /* "cython_ext/fuzzy_cython.pyx":210
+ *     cdef int score = m
+ *     cdef Py_ssize_t j
+ *     for j in range(n):             # <<<<<<<<<<<<<<
+ *         eq = _peq(text[j], ascii_eq, other, other_eq, n_other)
+ *         xv = eq | vn
+*/
+  __pyx_t_3 = __pyx_v_n;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_j = __pyx_t_5;
+
+    /* "cython_ext/fuzzy_cython.pyx":211
+ *     cdef Py_ssize_t j
+ *     for j in range(n):
+ *         eq = _peq(text[j], ascii_eq, other, other_eq, n_other)             # <<<<<<<<<<<<<<
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+*/
+    __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython__peq((__pyx_v_text[__pyx_v_j]), __pyx_v_ascii_eq, __pyx_v_other, __pyx_v_other_eq, __pyx_v_n_other); if (unlikely(__pyx_t_1 == ((uint64_t)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 211, __pyx_L1_error)
+    __pyx_v_eq = __pyx_t_1;
+
+    /* "cython_ext/fuzzy_cython.pyx":212
+ *     for j in range(n):
+ *         eq = _peq(text[j], ascii_eq, other, other_eq, n_other)
+ *         xv = eq | vn             # <<<<<<<<<<<<<<
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)
+*/
+    __pyx_v_xv = (__pyx_v_eq | __pyx_v_vn);
+
+    /* "cython_ext/fuzzy_cython.pyx":213
+ *         eq = _peq(text[j], ascii_eq, other, other_eq, n_other)
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq             # <<<<<<<<<<<<<<
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+*/
+    __pyx_v_xh = ((((__pyx_v_eq & __pyx_v_vp) + __pyx_v_vp) ^ __pyx_v_vp) | __pyx_v_eq);
+
+    /* "cython_ext/fuzzy_cython.pyx":214
+ *         xv = eq | vn
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)             # <<<<<<<<<<<<<<
+ *         mh = vp & xh
+ *         if ph & top:
+*/
+    __pyx_v_ph = (__pyx_v_vn | ((~(__pyx_v_xh | __pyx_v_vp)) & __pyx_v_mask));
+
+    /* "cython_ext/fuzzy_cython.pyx":215
+ *         xh = (((eq & vp) + vp) ^ vp) | eq
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh             # <<<<<<<<<<<<<<
+ *         if ph & top:
+ *             score += 1
+*/
+    __pyx_v_mh = (__pyx_v_vp & __pyx_v_xh);
+
+    /* "cython_ext/fuzzy_cython.pyx":216
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+ *         if ph & top:             # <<<<<<<<<<<<<<
+ *             score += 1
+ *         elif mh & top:
+*/
+    __pyx_t_2 = ((__pyx_v_ph & __pyx_v_top) != 0);
+    if (__pyx_t_2) {
+
+      /* "cython_ext/fuzzy_cython.pyx":217
+ *         mh = vp & xh
+ *         if ph & top:
+ *             score += 1             # <<<<<<<<<<<<<<
+ *         elif mh & top:
+ *             score -= 1
+*/
+      __pyx_v_score = (__pyx_v_score + 1);
+
+      /* "cython_ext/fuzzy_cython.pyx":216
+ *         ph = vn | (~(xh | vp) & mask)
+ *         mh = vp & xh
+ *         if ph & top:             # <<<<<<<<<<<<<<
+ *             score += 1
+ *         elif mh & top:
+*/
+      goto __pyx_L5;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":218
+ *         if ph & top:
+ *             score += 1
+ *         elif mh & top:             # <<<<<<<<<<<<<<
+ *             score -= 1
+ *         if score - (n - j - 1) > max_distance:
+*/
+    __pyx_t_2 = ((__pyx_v_mh & __pyx_v_top) != 0);
+    if (__pyx_t_2) {
+
+      /* "cython_ext/fuzzy_cython.pyx":219
+ *             score += 1
+ *         elif mh & top:
+ *             score -= 1             # <<<<<<<<<<<<<<
+ *         if score - (n - j - 1) > max_distance:
+ *             return max_distance + 1
+*/
+      __pyx_v_score = (__pyx_v_score - 1);
+
+      /* "cython_ext/fuzzy_cython.pyx":218
+ *         if ph & top:
+ *             score += 1
+ *         elif mh & top:             # <<<<<<<<<<<<<<
+ *             score -= 1
+ *         if score - (n - j - 1) > max_distance:
+*/
+    }
+    __pyx_L5:;
+
+    /* "cython_ext/fuzzy_cython.pyx":220
+ *         elif mh & top:
+ *             score -= 1
+ *         if score - (n - j - 1) > max_distance:             # <<<<<<<<<<<<<<
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+*/
+    __pyx_t_2 = ((__pyx_v_score - ((__pyx_v_n - __pyx_v_j) - 1)) > __pyx_v_max_distance);
+    if (__pyx_t_2) {
+
+      /* "cython_ext/fuzzy_cython.pyx":221
+ *             score -= 1
+ *         if score - (n - j - 1) > max_distance:
+ *             return max_distance + 1             # <<<<<<<<<<<<<<
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask
+*/
+      __pyx_r = (__pyx_v_max_distance + 1);
+      goto __pyx_L0;
+
+      /* "cython_ext/fuzzy_cython.pyx":220
+ *         elif mh & top:
+ *             score -= 1
+ *         if score - (n - j - 1) > max_distance:             # <<<<<<<<<<<<<<
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":222
+ *         if score - (n - j - 1) > max_distance:
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask             # <<<<<<<<<<<<<<
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)
+*/
+    __pyx_v_ph = (((__pyx_v_ph << 1) | 1) & __pyx_v_mask);
+
+    /* "cython_ext/fuzzy_cython.pyx":223
+ *             return max_distance + 1
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask             # <<<<<<<<<<<<<<
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv
+*/
+    __pyx_v_mh = ((__pyx_v_mh << 1) & __pyx_v_mask);
+
+    /* "cython_ext/fuzzy_cython.pyx":224
+ *         ph = ((ph << 1) | 1) & mask
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)             # <<<<<<<<<<<<<<
+ *         vn = ph & xv
+ *     return score if score <= max_distance else max_distance + 1
+*/
+    __pyx_v_vp = (__pyx_v_mh | ((~(__pyx_v_xv | __pyx_v_ph)) & __pyx_v_mask));
+
+    /* "cython_ext/fuzzy_cython.pyx":225
+ *         mh = (mh << 1) & mask
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv             # <<<<<<<<<<<<<<
+ *     return score if score <= max_distance else max_distance + 1
+ * 
+*/
+    __pyx_v_vn = (__pyx_v_ph & __pyx_v_xv);
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":226
+ *         vp = mh | (~(xv | ph) & mask)
+ *         vn = ph & xv
+ *     return score if score <= max_distance else max_distance + 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef int _banded_codes(const uint32_t *s1, Py_ssize_t len1, const uint32_t *s2, Py_ssize_t len2,
+*/
+  __pyx_t_2 = (__pyx_v_score <= __pyx_v_max_distance);
+  if (__pyx_t_2) {
+    __pyx_t_6 = __pyx_v_score;
+  } else {
+    __pyx_t_6 = (__pyx_v_max_distance + 1);
+  }
+  __pyx_r = __pyx_t_6;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":202
+ *     return 0
+ * 
+ * cdef int _myers64_codes(const uint32_t *text, Py_ssize_t n, int m, uint64_t *ascii_eq,             # <<<<<<<<<<<<<<
+ *                         uint32_t *other, uint64_t *other_eq, int n_other, int max_distance) nogil:
+ *     """_myers64() over an encoded line, without touching Python objects."""
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._myers64_codes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":228
+ *     return score if score <= max_distance else max_distance + 1
+ * 
+ * cdef int _banded_codes(const uint32_t *s1, Py_ssize_t len1, const uint32_t *s2, Py_ssize_t len2,             # <<<<<<<<<<<<<<
+ *                        int max_distance) nogil:
+ *     """_banded() over encoded strings; returns -1 if memory runs out."""
+*/
+
+static int __pyx_f_10cython_ext_12fuzzy_cython__banded_codes(uint32_t const *__pyx_v_s1, Py_ssize_t __pyx_v_len1, uint32_t const *__pyx_v_s2, Py_ssize_t __pyx_v_len2, int __pyx_v_max_distance) {
+  int __pyx_v_big;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_lo;
+  Py_ssize_t __pyx_v_hi;
+  int __pyx_v_best;
+  int __pyx_v_value;
+  int __pyx_v_result;
+  int *__pyx_v_prev;
+  int *__pyx_v_curr;
+  int *__pyx_v_tmp;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "cython_ext/fuzzy_cython.pyx":231
+ *                        int max_distance) nogil:
+ *     """_banded() over encoded strings; returns -1 if memory runs out."""
+ *     cdef int big = max_distance + 1             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i, j, lo, hi
+ *     cdef int best, value, result
+*/
+  __pyx_v_big = (__pyx_v_max_distance + 1);
+
+  /* "cython_ext/fuzzy_cython.pyx":234
+ *     cdef Py_ssize_t i, j, lo, hi
+ *     cdef int best, value, result
+ *     cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+*/
+  __pyx_v_prev = ((int *)malloc(((__pyx_v_len2 + 1) * (sizeof(int)))));
+
+  /* "cython_ext/fuzzy_cython.pyx":235
+ *     cdef int best, value, result
+ *     cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:
+*/
+  __pyx_v_curr = ((int *)malloc(((__pyx_v_len2 + 1) * (sizeof(int)))));
+
+  /* "cython_ext/fuzzy_cython.pyx":237
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:             # <<<<<<<<<<<<<<
+ *         free(prev)
+ *         free(curr)
+*/
+  __pyx_t_2 = (__pyx_v_prev == NULL);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_curr == NULL);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":238
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:
+ *         free(prev)             # <<<<<<<<<<<<<<
+ *         free(curr)
+ *         return -1
+*/
+    free(__pyx_v_prev);
+
+    /* "cython_ext/fuzzy_cython.pyx":239
+ *     if prev == NULL or curr == NULL:
+ *         free(prev)
+ *         free(curr)             # <<<<<<<<<<<<<<
+ *         return -1
+ *     for j in range(len2 + 1):
+*/
+    free(__pyx_v_curr);
+
+    /* "cython_ext/fuzzy_cython.pyx":240
+ *         free(prev)
+ *         free(curr)
+ *         return -1             # <<<<<<<<<<<<<<
+ *     for j in range(len2 + 1):
+ *         prev[j] = <int>j if j <= max_distance else big
+*/
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":237
+ *     cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+ *     cdef int *tmp
+ *     if prev == NULL or curr == NULL:             # <<<<<<<<<<<<<<
+ *         free(prev)
+ *         free(curr)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":241
+ *         free(curr)
+ *         return -1
+ *     for j in range(len2 + 1):             # <<<<<<<<<<<<<<
+ *         prev[j] = <int>j if j <= max_distance else big
+ *     result = -2
+*/
+  __pyx_t_3 = (__pyx_v_len2 + 1);
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_j = __pyx_t_5;
+
+    /* "cython_ext/fuzzy_cython.pyx":242
+ *         return -1
+ *     for j in range(len2 + 1):
+ *         prev[j] = <int>j if j <= max_distance else big             # <<<<<<<<<<<<<<
+ *     result = -2
+ *     for i in range(1, len1 + 1):
+*/
+    __pyx_t_1 = (__pyx_v_j <= __pyx_v_max_distance);
+    if (__pyx_t_1) {
+      __pyx_t_6 = ((int)__pyx_v_j);
+    } else {
+      __pyx_t_6 = __pyx_v_big;
+    }
+    (__pyx_v_prev[__pyx_v_j]) = __pyx_t_6;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":243
+ *     for j in range(len2 + 1):
+ *         prev[j] = <int>j if j <= max_distance else big
+ *     result = -2             # <<<<<<<<<<<<<<
+ *     for i in range(1, len1 + 1):
+ *         lo = i - max_distance if i > max_distance else 1
+*/
+  __pyx_v_result = -2;
+
+  /* "cython_ext/fuzzy_cython.pyx":244
+ *         prev[j] = <int>j if j <= max_distance else big
+ *     result = -2
+ *     for i in range(1, len1 + 1):             # <<<<<<<<<<<<<<
+ *         lo = i - max_distance if i > max_distance else 1
+ *         hi = i + max_distance if i + max_distance < len2 else len2
+*/
+  __pyx_t_3 = (__pyx_v_len1 + 1);
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 1; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "cython_ext/fuzzy_cython.pyx":245
+ *     result = -2
+ *     for i in range(1, len1 + 1):
+ *         lo = i - max_distance if i > max_distance else 1             # <<<<<<<<<<<<<<
+ *         hi = i + max_distance if i + max_distance < len2 else len2
+ *         curr[0] = <int>i if i <= max_distance else big
+*/
+    __pyx_t_1 = (__pyx_v_i > __pyx_v_max_distance);
+    if (__pyx_t_1) {
+      __pyx_t_7 = (__pyx_v_i - __pyx_v_max_distance);
+    } else {
+      __pyx_t_7 = 1;
+    }
+    __pyx_v_lo = __pyx_t_7;
+
+    /* "cython_ext/fuzzy_cython.pyx":246
+ *     for i in range(1, len1 + 1):
+ *         lo = i - max_distance if i > max_distance else 1
+ *         hi = i + max_distance if i + max_distance < len2 else len2             # <<<<<<<<<<<<<<
+ *         curr[0] = <int>i if i <= max_distance else big
+ *         if lo > 1:
+*/
+    __pyx_t_1 = ((__pyx_v_i + __pyx_v_max_distance) < __pyx_v_len2);
+    if (__pyx_t_1) {
+      __pyx_t_7 = (__pyx_v_i + __pyx_v_max_distance);
+    } else {
+      __pyx_t_7 = __pyx_v_len2;
+    }
+    __pyx_v_hi = __pyx_t_7;
+
+    /* "cython_ext/fuzzy_cython.pyx":247
+ *         lo = i - max_distance if i > max_distance else 1
+ *         hi = i + max_distance if i + max_distance < len2 else len2
+ *         curr[0] = <int>i if i <= max_distance else big             # <<<<<<<<<<<<<<
+ *         if lo > 1:
+ *             curr[lo - 1] = big
+*/
+    __pyx_t_1 = (__pyx_v_i <= __pyx_v_max_distance);
+    if (__pyx_t_1) {
+      __pyx_t_6 = ((int)__pyx_v_i);
+    } else {
+      __pyx_t_6 = __pyx_v_big;
+    }
+    (__pyx_v_curr[0]) = __pyx_t_6;
+
+    /* "cython_ext/fuzzy_cython.pyx":248
+ *         hi = i + max_distance if i + max_distance < len2 else len2
+ *         curr[0] = <int>i if i <= max_distance else big
+ *         if lo > 1:             # <<<<<<<<<<<<<<
+ *             curr[lo - 1] = big
+ *         best = curr[0] if lo == 1 else big
+*/
+    __pyx_t_1 = (__pyx_v_lo > 1);
+    if (__pyx_t_1) {
+
+      /* "cython_ext/fuzzy_cython.pyx":249
+ *         curr[0] = <int>i if i <= max_distance else big
+ *         if lo > 1:
+ *             curr[lo - 1] = big             # <<<<<<<<<<<<<<
+ *         best = curr[0] if lo == 1 else big
+ *         for j in range(lo, hi + 1):
+*/
+      (__pyx_v_curr[(__pyx_v_lo - 1)]) = __pyx_v_big;
+
+      /* "cython_ext/fuzzy_cython.pyx":248
+ *         hi = i + max_distance if i + max_distance < len2 else len2
+ *         curr[0] = <int>i if i <= max_distance else big
+ *         if lo > 1:             # <<<<<<<<<<<<<<
+ *             curr[lo - 1] = big
+ *         best = curr[0] if lo == 1 else big
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":250
+ *         if lo > 1:
+ *             curr[lo - 1] = big
+ *         best = curr[0] if lo == 1 else big             # <<<<<<<<<<<<<<
+ *         for j in range(lo, hi + 1):
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+*/
+    __pyx_t_1 = (__pyx_v_lo == 1);
+    if (__pyx_t_1) {
+      __pyx_t_6 = (__pyx_v_curr[0]);
+    } else {
+      __pyx_t_6 = __pyx_v_big;
+    }
+    __pyx_v_best = __pyx_t_6;
+
+    /* "cython_ext/fuzzy_cython.pyx":251
+ *             curr[lo - 1] = big
+ *         best = curr[0] if lo == 1 else big
+ *         for j in range(lo, hi + 1):             # <<<<<<<<<<<<<<
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+ *             if value > big:
+*/
+    __pyx_t_7 = (__pyx_v_hi + 1);
+    __pyx_t_8 = __pyx_t_7;
+    for (__pyx_t_9 = __pyx_v_lo; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_j = __pyx_t_9;
+
+      /* "cython_ext/fuzzy_cython.pyx":252
+ *         best = curr[0] if lo == 1 else big
+ *         for j in range(lo, hi + 1):
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))             # <<<<<<<<<<<<<<
+ *             if value > big:
+ *                 value = big
+*/
+      __pyx_t_6 = __pyx_f_10cython_ext_12fuzzy_cython_min3(((__pyx_v_curr[(__pyx_v_j - 1)]) + 1), ((__pyx_v_prev[__pyx_v_j]) + 1), ((__pyx_v_prev[(__pyx_v_j - 1)]) + ((__pyx_v_s1[(__pyx_v_i - 1)]) != (__pyx_v_s2[(__pyx_v_j - 1)])))); if (unlikely(__pyx_t_6 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 252, __pyx_L1_error)
+      __pyx_v_value = __pyx_t_6;
+
+      /* "cython_ext/fuzzy_cython.pyx":253
+ *         for j in range(lo, hi + 1):
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+ *             if value > big:             # <<<<<<<<<<<<<<
+ *                 value = big
+ *             curr[j] = value
+*/
+      __pyx_t_1 = (__pyx_v_value > __pyx_v_big);
+      if (__pyx_t_1) {
+
+        /* "cython_ext/fuzzy_cython.pyx":254
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+ *             if value > big:
+ *                 value = big             # <<<<<<<<<<<<<<
+ *             curr[j] = value
+ *             if value < best:
+*/
+        __pyx_v_value = __pyx_v_big;
+
+        /* "cython_ext/fuzzy_cython.pyx":253
+ *         for j in range(lo, hi + 1):
+ *             value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+ *             if value > big:             # <<<<<<<<<<<<<<
+ *                 value = big
+ *             curr[j] = value
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":255
+ *             if value > big:
+ *                 value = big
+ *             curr[j] = value             # <<<<<<<<<<<<<<
+ *             if value < best:
+ *                 best = value
+*/
+      (__pyx_v_curr[__pyx_v_j]) = __pyx_v_value;
+
+      /* "cython_ext/fuzzy_cython.pyx":256
+ *                 value = big
+ *             curr[j] = value
+ *             if value < best:             # <<<<<<<<<<<<<<
+ *                 best = value
+ *         if hi < len2:
+*/
+      __pyx_t_1 = (__pyx_v_value < __pyx_v_best);
+      if (__pyx_t_1) {
+
+        /* "cython_ext/fuzzy_cython.pyx":257
+ *             curr[j] = value
+ *             if value < best:
+ *                 best = value             # <<<<<<<<<<<<<<
+ *         if hi < len2:
+ *             curr[hi + 1] = big
+*/
+        __pyx_v_best = __pyx_v_value;
+
+        /* "cython_ext/fuzzy_cython.pyx":256
+ *                 value = big
+ *             curr[j] = value
+ *             if value < best:             # <<<<<<<<<<<<<<
+ *                 best = value
+ *         if hi < len2:
+*/
+      }
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":258
+ *             if value < best:
+ *                 best = value
+ *         if hi < len2:             # <<<<<<<<<<<<<<
+ *             curr[hi + 1] = big
+ *         if best > max_distance:
+*/
+    __pyx_t_1 = (__pyx_v_hi < __pyx_v_len2);
+    if (__pyx_t_1) {
+
+      /* "cython_ext/fuzzy_cython.pyx":259
+ *                 best = value
+ *         if hi < len2:
+ *             curr[hi + 1] = big             # <<<<<<<<<<<<<<
+ *         if best > max_distance:
+ *             result = big
+*/
+      (__pyx_v_curr[(__pyx_v_hi + 1)]) = __pyx_v_big;
+
+      /* "cython_ext/fuzzy_cython.pyx":258
+ *             if value < best:
+ *                 best = value
+ *         if hi < len2:             # <<<<<<<<<<<<<<
+ *             curr[hi + 1] = big
+ *         if best > max_distance:
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":260
+ *         if hi < len2:
+ *             curr[hi + 1] = big
+ *         if best > max_distance:             # <<<<<<<<<<<<<<
+ *             result = big
+ *             break
+*/
+    __pyx_t_1 = (__pyx_v_best > __pyx_v_max_distance);
+    if (__pyx_t_1) {
+
+      /* "cython_ext/fuzzy_cython.pyx":261
+ *             curr[hi + 1] = big
+ *         if best > max_distance:
+ *             result = big             # <<<<<<<<<<<<<<
+ *             break
+ *         tmp = prev
+*/
+      __pyx_v_result = __pyx_v_big;
+
+      /* "cython_ext/fuzzy_cython.pyx":262
+ *         if best > max_distance:
+ *             result = big
+ *             break             # <<<<<<<<<<<<<<
+ *         tmp = prev
+ *         prev = curr
+*/
+      goto __pyx_L9_break;
+
+      /* "cython_ext/fuzzy_cython.pyx":260
+ *         if hi < len2:
+ *             curr[hi + 1] = big
+ *         if best > max_distance:             # <<<<<<<<<<<<<<
+ *             result = big
+ *             break
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":263
+ *             result = big
+ *             break
+ *         tmp = prev             # <<<<<<<<<<<<<<
+ *         prev = curr
+ *         curr = tmp
+*/
+    __pyx_v_tmp = __pyx_v_prev;
+
+    /* "cython_ext/fuzzy_cython.pyx":264
+ *             break
+ *         tmp = prev
+ *         prev = curr             # <<<<<<<<<<<<<<
+ *         curr = tmp
+ *     if result == -2:
+*/
+    __pyx_v_prev = __pyx_v_curr;
+
+    /* "cython_ext/fuzzy_cython.pyx":265
+ *         tmp = prev
+ *         prev = curr
+ *         curr = tmp             # <<<<<<<<<<<<<<
+ *     if result == -2:
+ *         result = prev[len2] if prev[len2] <= max_distance else big
+*/
+    __pyx_v_curr = __pyx_v_tmp;
+  }
+  __pyx_L9_break:;
+
+  /* "cython_ext/fuzzy_cython.pyx":266
+ *         prev = curr
+ *         curr = tmp
+ *     if result == -2:             # <<<<<<<<<<<<<<
+ *         result = prev[len2] if prev[len2] <= max_distance else big
+ *     free(prev)
+*/
+  __pyx_t_1 = (__pyx_v_result == -2L);
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":267
+ *         curr = tmp
+ *     if result == -2:
+ *         result = prev[len2] if prev[len2] <= max_distance else big             # <<<<<<<<<<<<<<
+ *     free(prev)
+ *     free(curr)
+*/
+    __pyx_t_1 = ((__pyx_v_prev[__pyx_v_len2]) <= __pyx_v_max_distance);
+    if (__pyx_t_1) {
+      __pyx_t_6 = (__pyx_v_prev[__pyx_v_len2]);
+    } else {
+      __pyx_t_6 = __pyx_v_big;
+    }
+    __pyx_v_result = __pyx_t_6;
+
+    /* "cython_ext/fuzzy_cython.pyx":266
+ *         prev = curr
+ *         curr = tmp
+ *     if result == -2:             # <<<<<<<<<<<<<<
+ *         result = prev[len2] if prev[len2] <= max_distance else big
+ *     free(prev)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":268
+ *     if result == -2:
+ *         result = prev[len2] if prev[len2] <= max_distance else big
+ *     free(prev)             # <<<<<<<<<<<<<<
+ *     free(curr)
+ *     return result
+*/
+  free(__pyx_v_prev);
+
+  /* "cython_ext/fuzzy_cython.pyx":269
+ *         result = prev[len2] if prev[len2] <= max_distance else big
+ *     free(prev)
+ *     free(curr)             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+*/
+  free(__pyx_v_curr);
+
+  /* "cython_ext/fuzzy_cython.pyx":270
+ *     free(prev)
+ *     free(curr)
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int _max_distance(double threshold, int length, bint strict) nogil:
+*/
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":228
+ *     return score if score <= max_distance else max_distance + 1
+ * 
+ * cdef int _banded_codes(const uint32_t *s1, Py_ssize_t len1, const uint32_t *s2, Py_ssize_t len2,             # <<<<<<<<<<<<<<
+ *                        int max_distance) nogil:
+ *     """_banded() over encoded strings; returns -1 if memory runs out."""
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._banded_codes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":272
+ *     return result
+ * 
+ * cdef inline int _max_distance(double threshold, int length, bint strict) nogil:             # <<<<<<<<<<<<<<
+ *     """Largest distance passing threshold at this length (see algorithms.fuzzy.max_distance_for)."""
+ *     cdef int d = <int>((1.0 - threshold) * length) + 1
+*/
+
+static CYTHON_INLINE int __pyx_f_10cython_ext_12fuzzy_cython__max_distance(double __pyx_v_threshold, int __pyx_v_length, int __pyx_v_strict) {
+  int __pyx_v_d;
+  double __pyx_v_ratio;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "cython_ext/fuzzy_cython.pyx":274
+ * cdef inline int _max_distance(double threshold, int length, bint strict) nogil:
+ *     """Largest distance passing threshold at this length (see algorithms.fuzzy.max_distance_for)."""
+ *     cdef int d = <int>((1.0 - threshold) * length) + 1             # <<<<<<<<<<<<<<
+ *     cdef double ratio
+ *     if d > length:
+*/
+  __pyx_v_d = (((int)((1.0 - __pyx_v_threshold) * __pyx_v_length)) + 1);
+
+  /* "cython_ext/fuzzy_cython.pyx":276
+ *     cdef int d = <int>((1.0 - threshold) * length) + 1
+ *     cdef double ratio
+ *     if d > length:             # <<<<<<<<<<<<<<
+ *         d = length
+ *     while d >= 0:
+*/
+  __pyx_t_1 = (__pyx_v_d > __pyx_v_length);
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":277
+ *     cdef double ratio
+ *     if d > length:
+ *         d = length             # <<<<<<<<<<<<<<
+ *     while d >= 0:
+ *         ratio = 1.0 - <double>d / length
+*/
+    __pyx_v_d = __pyx_v_length;
+
+    /* "cython_ext/fuzzy_cython.pyx":276
+ *     cdef int d = <int>((1.0 - threshold) * length) + 1
+ *     cdef double ratio
+ *     if d > length:             # <<<<<<<<<<<<<<
+ *         d = length
+ *     while d >= 0:
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":278
+ *     if d > length:
+ *         d = length
+ *     while d >= 0:             # <<<<<<<<<<<<<<
+ *         ratio = 1.0 - <double>d / length
+ *         if ratio > threshold or (not strict and ratio >= threshold):
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_d >= 0);
+    if (!__pyx_t_1) break;
+
+    /* "cython_ext/fuzzy_cython.pyx":279
+ *         d = length
+ *     while d >= 0:
+ *         ratio = 1.0 - <double>d / length             # <<<<<<<<<<<<<<
+ *         if ratio > threshold or (not strict and ratio >= threshold):
+ *             return d
+*/
+    if (unlikely(__pyx_v_length == 0)) {
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      __PYX_ERR(0, 279, __pyx_L1_error)
+    }
+    __pyx_v_ratio = (1.0 - (((double)__pyx_v_d) / ((double)__pyx_v_length)));
+
+    /* "cython_ext/fuzzy_cython.pyx":280
+ *     while d >= 0:
+ *         ratio = 1.0 - <double>d / length
+ *         if ratio > threshold or (not strict and ratio >= threshold):             # <<<<<<<<<<<<<<
+ *             return d
+ *         d -= 1
+*/
+    __pyx_t_2 = (__pyx_v_ratio > __pyx_v_threshold);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = (!__pyx_v_strict);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_ratio >= __pyx_v_threshold);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "cython_ext/fuzzy_cython.pyx":281
+ *         ratio = 1.0 - <double>d / length
+ *         if ratio > threshold or (not strict and ratio >= threshold):
+ *             return d             # <<<<<<<<<<<<<<
+ *         d -= 1
+ *     return -1
+*/
+      __pyx_r = __pyx_v_d;
+      goto __pyx_L0;
+
+      /* "cython_ext/fuzzy_cython.pyx":280
+ *     while d >= 0:
+ *         ratio = 1.0 - <double>d / length
+ *         if ratio > threshold or (not strict and ratio >= threshold):             # <<<<<<<<<<<<<<
+ *             return d
+ *         d -= 1
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":282
+ *         if ratio > threshold or (not strict and ratio >= threshold):
+ *             return d
+ *         d -= 1             # <<<<<<<<<<<<<<
+ *     return -1
+ * 
+*/
+    __pyx_v_d = (__pyx_v_d - 1);
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":283
+ *             return d
+ *         d -= 1
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * cdef double _score_line(const uint32_t *pat, int m, const uint32_t *line, Py_ssize_t n,
+*/
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":272
+ *     return result
+ * 
+ * cdef inline int _max_distance(double threshold, int length, bint strict) nogil:             # <<<<<<<<<<<<<<
+ *     """Largest distance passing threshold at this length (see algorithms.fuzzy.max_distance_for)."""
+ *     cdef int d = <int>((1.0 - threshold) * length) + 1
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._max_distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":285
+ *     return -1
+ * 
+ * cdef double _score_line(const uint32_t *pat, int m, const uint32_t *line, Py_ssize_t n,             # <<<<<<<<<<<<<<
+ *                         uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other,
+ *                         double threshold, bint strict) nogil:
+*/
+
+static double __pyx_f_10cython_ext_12fuzzy_cython__score_line(uint32_t const *__pyx_v_pat, int __pyx_v_m, uint32_t const *__pyx_v_line, Py_ssize_t __pyx_v_n, uint64_t *__pyx_v_ascii_eq, uint32_t *__pyx_v_other, uint64_t *__pyx_v_other_eq, int __pyx_v_n_other, double __pyx_v_threshold, int __pyx_v_strict) {
+  int __pyx_v_length;
+  int __pyx_v_max_distance;
+  int __pyx_v_distance;
+  double __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "cython_ext/fuzzy_cython.pyx":288
+ *                         uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other,
+ *                         double threshold, bint strict) nogil:
+ *     cdef int length = m if m > n else <int>n             # <<<<<<<<<<<<<<
+ *     cdef int max_distance, distance
+ *     if length == 0:
+*/
+  __pyx_t_2 = (__pyx_v_m > __pyx_v_n);
+  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_v_m;
+  } else {
+    __pyx_t_1 = ((int)__pyx_v_n);
+  }
+  __pyx_v_length = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":290
+ *     cdef int length = m if m > n else <int>n
+ *     cdef int max_distance, distance
+ *     if length == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     max_distance = _max_distance(threshold, length, strict)
+*/
+  __pyx_t_2 = (__pyx_v_length == 0);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":291
+ *     cdef int max_distance, distance
+ *     if length == 0:
+ *         return 1.0             # <<<<<<<<<<<<<<
+ *     max_distance = _max_distance(threshold, length, strict)
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+*/
+    __pyx_r = 1.0;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":290
+ *     cdef int length = m if m > n else <int>n
+ *     cdef int max_distance, distance
+ *     if length == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0
+ *     max_distance = _max_distance(threshold, length, strict)
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":292
+ *     if length == 0:
+ *         return 1.0
+ *     max_distance = _max_distance(threshold, length, strict)             # <<<<<<<<<<<<<<
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+ *         return -1.0
+*/
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython__max_distance(__pyx_v_threshold, __pyx_v_length, __pyx_v_strict); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 292, __pyx_L1_error)
+  __pyx_v_max_distance = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":293
+ *         return 1.0
+ *     max_distance = _max_distance(threshold, length, strict)
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:             # <<<<<<<<<<<<<<
+ *         return -1.0
+ *     if m == 0:
+*/
+  __pyx_t_3 = (__pyx_v_max_distance < 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_n - __pyx_v_m) > __pyx_v_max_distance);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_m - __pyx_v_n) > __pyx_v_max_distance);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":294
+ *     max_distance = _max_distance(threshold, length, strict)
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+ *         return -1.0             # <<<<<<<<<<<<<<
+ *     if m == 0:
+ *         distance = <int>n
+*/
+    __pyx_r = -1.0;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":293
+ *         return 1.0
+ *     max_distance = _max_distance(threshold, length, strict)
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:             # <<<<<<<<<<<<<<
+ *         return -1.0
+ *     if m == 0:
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":295
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+ *         return -1.0
+ *     if m == 0:             # <<<<<<<<<<<<<<
+ *         distance = <int>n
+ *     elif m <= 64:
+*/
+  __pyx_t_2 = (__pyx_v_m == 0);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":296
+ *         return -1.0
+ *     if m == 0:
+ *         distance = <int>n             # <<<<<<<<<<<<<<
+ *     elif m <= 64:
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+*/
+    __pyx_v_distance = ((int)__pyx_v_n);
+
+    /* "cython_ext/fuzzy_cython.pyx":295
+ *     if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+ *         return -1.0
+ *     if m == 0:             # <<<<<<<<<<<<<<
+ *         distance = <int>n
+ *     elif m <= 64:
+*/
+    goto __pyx_L8;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":297
+ *     if m == 0:
+ *         distance = <int>n
+ *     elif m <= 64:             # <<<<<<<<<<<<<<
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+ *     elif m <= n:
+*/
+  __pyx_t_2 = (__pyx_v_m <= 64);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":298
+ *         distance = <int>n
+ *     elif m <= 64:
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)             # <<<<<<<<<<<<<<
+ *     elif m <= n:
+ *         distance = _banded_codes(pat, m, line, n, max_distance)
+*/
+    __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython__myers64_codes(__pyx_v_line, __pyx_v_n, __pyx_v_m, __pyx_v_ascii_eq, __pyx_v_other, __pyx_v_other_eq, __pyx_v_n_other, __pyx_v_max_distance); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 298, __pyx_L1_error)
+    __pyx_v_distance = __pyx_t_1;
+
+    /* "cython_ext/fuzzy_cython.pyx":297
+ *     if m == 0:
+ *         distance = <int>n
+ *     elif m <= 64:             # <<<<<<<<<<<<<<
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+ *     elif m <= n:
+*/
+    goto __pyx_L8;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":299
+ *     elif m <= 64:
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+ *     elif m <= n:             # <<<<<<<<<<<<<<
+ *         distance = _banded_codes(pat, m, line, n, max_distance)
+ *     else:
+*/
+  __pyx_t_2 = (__pyx_v_m <= __pyx_v_n);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":300
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+ *     elif m <= n:
+ *         distance = _banded_codes(pat, m, line, n, max_distance)             # <<<<<<<<<<<<<<
+ *     else:
+ *         distance = _banded_codes(line, n, pat, m, max_distance)
+*/
+    __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython__banded_codes(__pyx_v_pat, __pyx_v_m, __pyx_v_line, __pyx_v_n, __pyx_v_max_distance); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 300, __pyx_L1_error)
+    __pyx_v_distance = __pyx_t_1;
+
+    /* "cython_ext/fuzzy_cython.pyx":299
+ *     elif m <= 64:
+ *         distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+ *     elif m <= n:             # <<<<<<<<<<<<<<
+ *         distance = _banded_codes(pat, m, line, n, max_distance)
+ *     else:
+*/
+    goto __pyx_L8;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":302
+ *         distance = _banded_codes(pat, m, line, n, max_distance)
+ *     else:
+ *         distance = _banded_codes(line, n, pat, m, max_distance)             # <<<<<<<<<<<<<<
+ *     if distance < 0 or distance > max_distance:
+ *         return -1.0
+*/
+  /*else*/ {
+    __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython__banded_codes(__pyx_v_line, __pyx_v_n, __pyx_v_pat, __pyx_v_m, __pyx_v_max_distance); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 302, __pyx_L1_error)
+    __pyx_v_distance = __pyx_t_1;
+  }
+  __pyx_L8:;
+
+  /* "cython_ext/fuzzy_cython.pyx":303
+ *     else:
+ *         distance = _banded_codes(line, n, pat, m, max_distance)
+ *     if distance < 0 or distance > max_distance:             # <<<<<<<<<<<<<<
+ *         return -1.0
+ *     return 1.0 - <double>distance / length
+*/
+  __pyx_t_3 = (__pyx_v_distance < 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_distance > __pyx_v_max_distance);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":304
+ *         distance = _banded_codes(line, n, pat, m, max_distance)
+ *     if distance < 0 or distance > max_distance:
+ *         return -1.0             # <<<<<<<<<<<<<<
+ *     return 1.0 - <double>distance / length
+ * 
+*/
+    __pyx_r = -1.0;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":303
+ *     else:
+ *         distance = _banded_codes(line, n, pat, m, max_distance)
+ *     if distance < 0 or distance > max_distance:             # <<<<<<<<<<<<<<
+ *         return -1.0
+ *     return 1.0 - <double>distance / length
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":305
+ *     if distance < 0 or distance > max_distance:
+ *         return -1.0
+ *     return 1.0 - <double>distance / length             # <<<<<<<<<<<<<<
+ * 
+ * def fuzzy_score_block(str pattern, lines, double threshold=0.0, bint strict=False, bint parallel=False):
+*/
+  if (unlikely(__pyx_v_length == 0)) {
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    __PYX_ERR(0, 305, __pyx_L1_error)
+  }
+  __pyx_r = (1.0 - (((double)__pyx_v_distance) / ((double)__pyx_v_length)));
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":285
+ *     return -1
+ * 
+ * cdef double _score_line(const uint32_t *pat, int m, const uint32_t *line, Py_ssize_t n,             # <<<<<<<<<<<<<<
+ *                         uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other,
+ *                         double threshold, bint strict) nogil:
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._score_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":307
+ *     return 1.0 - <double>distance / length
+ * 
+ * def fuzzy_score_block(str pattern, lines, double threshold=0.0, bint strict=False, bint parallel=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Score every line against pattern in one GIL-released loop.
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_11fuzzy_score_block(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_10fuzzy_score_block, "\n    Score every line against pattern in one GIL-released loop.\n    lines is a list of str or an encode_lines() (codes, offsets) pair.\n    Returns a float64 array of similarity_ratio(pattern, line); lines that\n    cannot pass threshold (> if strict, else >=) are pruned early and get -1.0.\n    The default threshold of 0.0 scores every line exactly.\n    parallel=True spreads lines over OpenMP threads (prange) for huge files.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_11fuzzy_score_block = {"fuzzy_score_block", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_11fuzzy_score_block, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_10fuzzy_score_block};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_11fuzzy_score_block(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_pattern = 0;
+  PyObject *__pyx_v_lines = 0;
+  double __pyx_v_threshold;
+  int __pyx_v_strict;
+  int __pyx_v_parallel;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fuzzy_score_block (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pattern,&__pyx_mstate_global->__pyx_n_u_lines,&__pyx_mstate_global->__pyx_n_u_threshold,&__pyx_mstate_global->__pyx_n_u_strict,&__pyx_mstate_global->__pyx_n_u_parallel,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 307, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fuzzy_score_block", 0) < 0) __PYX_ERR(0, 307, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fuzzy_score_block", 0, 2, 5, i); __PYX_ERR(0, 307, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 307, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 307, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 307, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_pattern = ((PyObject*)values[0]);
+    __pyx_v_lines = values[1];
+    if (values[2]) {
+      __pyx_v_threshold = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_threshold == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L3_error)
+    } else {
+      __pyx_v_threshold = ((double)((double)0.0));
+    }
+    if (values[3]) {
+      __pyx_v_strict = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_strict == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L3_error)
+    } else {
+      __pyx_v_strict = ((int)((int)0));
+    }
+    if (values[4]) {
+      __pyx_v_parallel = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_parallel == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L3_error)
+    } else {
+      __pyx_v_parallel = ((int)((int)0));
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fuzzy_score_block", 0, 2, 5, __pyx_nargs); __PYX_ERR(0, 307, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_score_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pattern), (&PyUnicode_Type), 1, "pattern", 1))) __PYX_ERR(0, 307, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_10fuzzy_score_block(__pyx_self, __pyx_v_pattern, __pyx_v_lines, __pyx_v_threshold, __pyx_v_strict, __pyx_v_parallel);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_10fuzzy_score_block(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_strict, int __pyx_v_parallel) {
+  PyObject *__pyx_v_codes = NULL;
+  PyObject *__pyx_v_offsets = NULL;
+  __Pyx_memviewslice __pyx_v_code_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_offset_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_v_n_lines;
+  PyArrayObject *__pyx_v_scores = 0;
+  __Pyx_memviewslice __pyx_v_score_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pat_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_m;
+  uint64_t __pyx_v_ascii_eq[0x80];
+  uint32_t __pyx_v_other[64];
+  uint64_t __pyx_v_other_eq[64];
+  int __pyx_v_n_other;
+  int __pyx_v_k;
+  int __pyx_v_found;
+  Py_ssize_t __pyx_v_i;
+  uint32_t __pyx_v_c;
+  uint32_t const *__pyx_v_base;
+  uint32_t const *__pyx_v_pat;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_scores;
+  __Pyx_Buffer __pyx_pybuffer_scores;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  size_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_11 = NULL;
+  __Pyx_memviewslice __pyx_t_12 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_14;
+  uint32_t const *__pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  uint32_t const *__pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  uint32_t __pyx_t_22;
+  int __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  double __pyx_t_28;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fuzzy_score_block", 0);
+  __pyx_pybuffer_scores.pybuffer.buf = NULL;
+  __pyx_pybuffer_scores.refcount = 0;
+  __pyx_pybuffernd_scores.data = NULL;
+  __pyx_pybuffernd_scores.rcbuffer = &__pyx_pybuffer_scores;
+
+  /* "cython_ext/fuzzy_cython.pyx":316
+ *     parallel=True spreads lines over OpenMP threads (prange) for huge files.
+ *     """
+ *     if isinstance(lines, tuple):             # <<<<<<<<<<<<<<
+ *         codes, offsets = lines
+ *     else:
+*/
+  __pyx_t_1 = PyTuple_Check(__pyx_v_lines); 
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":317
+ *     """
+ *     if isinstance(lines, tuple):
+ *         codes, offsets = lines             # <<<<<<<<<<<<<<
+ *     else:
+ *         codes, offsets = encode_lines(lines)
+*/
+    if ((likely(PyTuple_CheckExact(__pyx_v_lines))) || (PyList_CheckExact(__pyx_v_lines))) {
+      PyObject* sequence = __pyx_v_lines;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 317, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0);
+        __Pyx_INCREF(__pyx_t_2);
+        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1);
+        __Pyx_INCREF(__pyx_t_3);
+      } else {
+        __pyx_t_2 = __Pyx_PyList_GetItemRef(sequence, 0);
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_2);
+        __pyx_t_3 = __Pyx_PyList_GetItemRef(sequence, 1);
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_3);
+      }
+      #else
+      __pyx_t_2 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_4 = PyObject_GetIter(__pyx_v_lines); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_4);
+      index = 0; __pyx_t_2 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_2)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_2);
+      index = 1; __pyx_t_3 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_3);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_4), 2) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
+      __pyx_t_5 = NULL;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      goto __pyx_L5_unpacking_done;
+      __pyx_L4_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_5 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 317, __pyx_L1_error)
+      __pyx_L5_unpacking_done:;
+    }
+    __pyx_v_codes = __pyx_t_2;
+    __pyx_t_2 = 0;
+    __pyx_v_offsets = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":316
+ *     parallel=True spreads lines over OpenMP threads (prange) for huge files.
+ *     """
+ *     if isinstance(lines, tuple):             # <<<<<<<<<<<<<<
+ *         codes, offsets = lines
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":319
+ *         codes, offsets = lines
+ *     else:
+ *         codes, offsets = encode_lines(lines)             # <<<<<<<<<<<<<<
+ *     cdef const uint32_t[::1] code_view = np.ascontiguousarray(codes, dtype=np.uint32)
+ *     cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)
+*/
+  /*else*/ {
+    __pyx_t_2 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_encode_lines); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+      assert(__pyx_t_2);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+      __pyx_t_6 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_lines};
+      __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 319, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
+      PyObject* sequence = __pyx_t_3;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 319, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0);
+        __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1);
+        __Pyx_INCREF(__pyx_t_2);
+      } else {
+        __pyx_t_4 = __Pyx_PyList_GetItemRef(sequence, 0);
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_4);
+        __pyx_t_2 = __Pyx_PyList_GetItemRef(sequence, 1);
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 319, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_2);
+      }
+      #else
+      __pyx_t_4 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 319, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      #endif
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 319, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_5 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_7);
+      index = 0; __pyx_t_4 = __pyx_t_5(__pyx_t_7); if (unlikely(!__pyx_t_4)) goto __pyx_L6_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      index = 1; __pyx_t_2 = __pyx_t_5(__pyx_t_7); if (unlikely(!__pyx_t_2)) goto __pyx_L6_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_2);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_7), 2) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+      __pyx_t_5 = NULL;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L7_unpacking_done;
+      __pyx_L6_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_5 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 319, __pyx_L1_error)
+      __pyx_L7_unpacking_done:;
+    }
+    __pyx_v_codes = __pyx_t_4;
+    __pyx_t_4 = 0;
+    __pyx_v_offsets = __pyx_t_2;
+    __pyx_t_2 = 0;
+  }
+  __pyx_L3:;
+
+  /* "cython_ext/fuzzy_cython.pyx":320
+ *     else:
+ *         codes, offsets = encode_lines(lines)
+ *     cdef const uint32_t[::1] code_view = np.ascontiguousarray(codes, dtype=np.uint32)             # <<<<<<<<<<<<<<
+ *     cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)
+ *     cdef Py_ssize_t n_lines = offset_view.shape[0] - 1
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_ascontiguousarray); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_uint32); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_v_codes};
+    __pyx_t_4 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_8, __pyx_t_4, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 320, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn_uint32_t__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_code_view = __pyx_t_9;
+  __pyx_t_9.memview = NULL;
+  __pyx_t_9.data = NULL;
+
+  /* "cython_ext/fuzzy_cython.pyx":321
+ *         codes, offsets = encode_lines(lines)
+ *     cdef const uint32_t[::1] code_view = np.ascontiguousarray(codes, dtype=np.uint32)
+ *     cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t n_lines = offset_view.shape[0] - 1
+ *     cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)
+*/
+  __pyx_t_7 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_ascontiguousarray); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_int64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_8))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_8);
+    assert(__pyx_t_7);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_8);
+    __Pyx_INCREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_8, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_7, __pyx_v_offsets};
+    __pyx_t_4 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 321, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_4, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 321, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_8, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 321, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int64_t__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_offset_view = __pyx_t_10;
+  __pyx_t_10.memview = NULL;
+  __pyx_t_10.data = NULL;
 
-      /* "cython_ext/fuzzy_cython.pyx":79
- *         score = similarity_ratio(pattern, line)
- *         if score >= threshold:
- *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []             # <<<<<<<<<<<<<<
- *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
- *             results.append((i+1, line.strip(), before, after, score))
+  /* "cython_ext/fuzzy_cython.pyx":322
+ *     cdef const uint32_t[::1] code_view = np.ascontiguousarray(codes, dtype=np.uint32)
+ *     cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)
+ *     cdef Py_ssize_t n_lines = offset_view.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)
+ *     cdef double[::1] score_view = scores
 */
-      __pyx_t_9 = (__pyx_v_context != 0);
-      if (__pyx_t_9) {
-        { /* enter inner scope */
-          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_10 = NULL;
-          __Pyx_INCREF(__pyx_builtin_range);
-          __pyx_t_11 = __pyx_builtin_range; 
-          __pyx_t_12 = __Pyx_PyLong_From_int(__pyx_v_context); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_GOTREF(__pyx_t_12);
-          __pyx_t_13 = PyNumber_Subtract(__pyx_v_i, __pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_GOTREF(__pyx_t_13);
-          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-          __pyx_t_14 = 0;
-          __pyx_t_15 = __Pyx_PyLong_From_long(__pyx_t_14); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_16 = PyObject_RichCompare(__pyx_t_13, __pyx_t_15, Py_GT); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-          __pyx_t_17 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_17 < 0))) __PYX_ERR(0, 79, __pyx_L8_error)
-          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-          if (__pyx_t_17) {
-            __Pyx_INCREF(__pyx_t_13);
-            __pyx_t_12 = __pyx_t_13;
-          } else {
-            __pyx_t_16 = __Pyx_PyLong_From_long(__pyx_t_14); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 79, __pyx_L8_error)
-            __Pyx_GOTREF(__pyx_t_16);
-            __pyx_t_12 = __pyx_t_16;
-            __pyx_t_16 = 0;
-          }
-          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-          __pyx_t_6 = 1;
-          {
-            PyObject *__pyx_callargs[3] = {__pyx_t_10, __pyx_t_12, __pyx_v_i};
-            __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-            __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L8_error)
-            __Pyx_GOTREF(__pyx_t_3);
-          }
-          if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
-            __pyx_t_11 = __pyx_t_3; __Pyx_INCREF(__pyx_t_11);
-            __pyx_t_18 = 0;
-            __pyx_t_19 = NULL;
-          } else {
-            __pyx_t_18 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 79, __pyx_L8_error)
-            __Pyx_GOTREF(__pyx_t_11);
-            __pyx_t_19 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 79, __pyx_L8_error)
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          for (;;) {
-            if (likely(!__pyx_t_19)) {
-              if (likely(PyList_CheckExact(__pyx_t_11))) {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
-                  #if !CYTHON_ASSUME_SAFE_SIZE
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L8_error)
-                  #endif
-                  if (__pyx_t_18 >= __pyx_temp) break;
-                }
-                __pyx_t_3 = __Pyx_PyList_GetItemRef(__pyx_t_11, __pyx_t_18);
-                ++__pyx_t_18;
-              } else {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
-                  #if !CYTHON_ASSUME_SAFE_SIZE
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L8_error)
-                  #endif
-                  if (__pyx_t_18 >= __pyx_temp) break;
-                }
-                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_3 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_18));
-                #else
-                __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_18);
-                #endif
-                ++__pyx_t_18;
+  __pyx_v_n_lines = ((__pyx_v_offset_view.shape[0]) - 1);
+
+  /* "cython_ext/fuzzy_cython.pyx":323
+ *     cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)
+ *     cdef Py_ssize_t n_lines = offset_view.shape[0] - 1
+ *     cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     cdef double[::1] score_view = scores
+ *     cdef const uint32_t[::1] pat_view = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)
+*/
+  __pyx_t_8 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = (__pyx_v_n_lines > 0);
+  if (__pyx_t_1) {
+    __pyx_t_7 = PyLong_FromSsize_t(__pyx_v_n_lines); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_4 = __pyx_t_7;
+    __pyx_t_7 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
+    __pyx_t_4 = __pyx_mstate_global->__pyx_int_0;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
+    assert(__pyx_t_8);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_8, __pyx_t_4};
+    __pyx_t_7 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_11, __pyx_t_7, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_2, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_mstate_global->__pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 323, __pyx_L1_error)
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_scores.rcbuffer->pybuffer, (PyObject*)((PyArrayObject *)__pyx_t_3), &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_scores = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_scores.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 323, __pyx_L1_error)
+    } else {__pyx_pybuffernd_scores.diminfo[0].strides = __pyx_pybuffernd_scores.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_scores.diminfo[0].shape = __pyx_pybuffernd_scores.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_v_scores = ((PyArrayObject *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":324
+ *     cdef Py_ssize_t n_lines = offset_view.shape[0] - 1
+ *     cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)
+ *     cdef double[::1] score_view = scores             # <<<<<<<<<<<<<<
+ *     cdef const uint32_t[::1] pat_view = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)
+ *     cdef int m = len(pattern)
+*/
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_dc_double(((PyObject *)__pyx_v_scores), PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __pyx_v_score_view = __pyx_t_12;
+  __pyx_t_12.memview = NULL;
+  __pyx_t_12.data = NULL;
+
+  /* "cython_ext/fuzzy_cython.pyx":325
+ *     cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)
+ *     cdef double[::1] score_view = scores
+ *     cdef const uint32_t[::1] pat_view = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)             # <<<<<<<<<<<<<<
+ *     cdef int m = len(pattern)
+ *     cdef uint64_t ascii_eq[128]
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_frombuffer); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (unlikely(__pyx_v_pattern == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
+    __PYX_ERR(0, 325, __pyx_L1_error)
+  }
+  __pyx_t_7 = PyUnicode_AsEncodedString(__pyx_v_pattern, ((char const *)"utf-32-le"), NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_uint32); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_11))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_11);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_7};
+    __pyx_t_4 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_8, __pyx_t_4, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_11, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn_uint32_t__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_pat_view = __pyx_t_13;
+  __pyx_t_13.memview = NULL;
+  __pyx_t_13.data = NULL;
+
+  /* "cython_ext/fuzzy_cython.pyx":326
+ *     cdef double[::1] score_view = scores
+ *     cdef const uint32_t[::1] pat_view = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)
+ *     cdef int m = len(pattern)             # <<<<<<<<<<<<<<
+ *     cdef uint64_t ascii_eq[128]
+ *     cdef uint32_t other[64]
+*/
+  if (unlikely(__pyx_v_pattern == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 326, __pyx_L1_error)
+  }
+  __pyx_t_14 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_pattern); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_14;
+
+  /* "cython_ext/fuzzy_cython.pyx":330
+ *     cdef uint32_t other[64]
+ *     cdef uint64_t other_eq[64]
+ *     cdef int n_other = 0             # <<<<<<<<<<<<<<
+ *     cdef int k, found
+ *     cdef Py_ssize_t i
+*/
+  __pyx_v_n_other = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":335
+ *     cdef uint32_t c
+ *     cdef const uint32_t *base
+ *     cdef const uint32_t *pat = &pat_view[0] if m else NULL             # <<<<<<<<<<<<<<
+ * 
+ *     if n_lines <= 0:
+*/
+  __pyx_t_1 = (__pyx_v_m != 0);
+  if (__pyx_t_1) {
+    __pyx_t_16 = 0;
+    __pyx_t_17 = -1;
+    if (__pyx_t_16 < 0) {
+      __pyx_t_16 += __pyx_v_pat_view.shape[0];
+      if (unlikely(__pyx_t_16 < 0)) __pyx_t_17 = 0;
+    } else if (unlikely(__pyx_t_16 >= __pyx_v_pat_view.shape[0])) __pyx_t_17 = 0;
+    if (unlikely(__pyx_t_17 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_17);
+      __PYX_ERR(0, 335, __pyx_L1_error)
+    }
+    __pyx_t_15 = (&(*((uint32_t const  *) ( /* dim=0 */ ((char *) (((uint32_t const  *) __pyx_v_pat_view.data) + __pyx_t_16)) ))));
+  } else {
+    __pyx_t_15 = NULL;
+  }
+  __pyx_v_pat = __pyx_t_15;
+
+  /* "cython_ext/fuzzy_cython.pyx":337
+ *     cdef const uint32_t *pat = &pat_view[0] if m else NULL
+ * 
+ *     if n_lines <= 0:             # <<<<<<<<<<<<<<
+ *         return scores
+ *     base = &code_view[0] if code_view.shape[0] else NULL
+*/
+  __pyx_t_1 = (__pyx_v_n_lines <= 0);
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":338
+ * 
+ *     if n_lines <= 0:
+ *         return scores             # <<<<<<<<<<<<<<
+ *     base = &code_view[0] if code_view.shape[0] else NULL
+ *     for k in range(128):
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF((PyObject *)__pyx_v_scores);
+    __pyx_r = ((PyObject *)__pyx_v_scores);
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":337
+ *     cdef const uint32_t *pat = &pat_view[0] if m else NULL
+ * 
+ *     if n_lines <= 0:             # <<<<<<<<<<<<<<
+ *         return scores
+ *     base = &code_view[0] if code_view.shape[0] else NULL
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":339
+ *     if n_lines <= 0:
+ *         return scores
+ *     base = &code_view[0] if code_view.shape[0] else NULL             # <<<<<<<<<<<<<<
+ *     for k in range(128):
+ *         ascii_eq[k] = 0
+*/
+  __pyx_t_1 = ((__pyx_v_code_view.shape[0]) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_16 = 0;
+    __pyx_t_17 = -1;
+    if (__pyx_t_16 < 0) {
+      __pyx_t_16 += __pyx_v_code_view.shape[0];
+      if (unlikely(__pyx_t_16 < 0)) __pyx_t_17 = 0;
+    } else if (unlikely(__pyx_t_16 >= __pyx_v_code_view.shape[0])) __pyx_t_17 = 0;
+    if (unlikely(__pyx_t_17 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_17);
+      __PYX_ERR(0, 339, __pyx_L1_error)
+    }
+    __pyx_t_18 = (&(*((uint32_t const  *) ( /* dim=0 */ ((char *) (((uint32_t const  *) __pyx_v_code_view.data) + __pyx_t_16)) ))));
+  } else {
+    __pyx_t_18 = NULL;
+  }
+  __pyx_v_base = __pyx_t_18;
+
+  /* "cython_ext/fuzzy_cython.pyx":340
+ *         return scores
+ *     base = &code_view[0] if code_view.shape[0] else NULL
+ *     for k in range(128):             # <<<<<<<<<<<<<<
+ *         ascii_eq[k] = 0
+ *     if m <= 64:
+*/
+  for (__pyx_t_17 = 0; __pyx_t_17 < 0x80; __pyx_t_17+=1) {
+    __pyx_v_k = __pyx_t_17;
+
+    /* "cython_ext/fuzzy_cython.pyx":341
+ *     base = &code_view[0] if code_view.shape[0] else NULL
+ *     for k in range(128):
+ *         ascii_eq[k] = 0             # <<<<<<<<<<<<<<
+ *     if m <= 64:
+ *         for k in range(m):
+*/
+    (__pyx_v_ascii_eq[__pyx_v_k]) = 0;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":342
+ *     for k in range(128):
+ *         ascii_eq[k] = 0
+ *     if m <= 64:             # <<<<<<<<<<<<<<
+ *         for k in range(m):
+ *             c = pat_view[k]
+*/
+  __pyx_t_1 = (__pyx_v_m <= 64);
+  if (__pyx_t_1) {
+
+    /* "cython_ext/fuzzy_cython.pyx":343
+ *         ascii_eq[k] = 0
+ *     if m <= 64:
+ *         for k in range(m):             # <<<<<<<<<<<<<<
+ *             c = pat_view[k]
+ *             if c < 128:
+*/
+    __pyx_t_17 = __pyx_v_m;
+    __pyx_t_19 = __pyx_t_17;
+    for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+      __pyx_v_k = __pyx_t_20;
+
+      /* "cython_ext/fuzzy_cython.pyx":344
+ *     if m <= 64:
+ *         for k in range(m):
+ *             c = pat_view[k]             # <<<<<<<<<<<<<<
+ *             if c < 128:
+ *                 ascii_eq[c] |= <uint64_t>1 << k
+*/
+      __pyx_t_16 = __pyx_v_k;
+      __pyx_t_21 = -1;
+      if (__pyx_t_16 < 0) {
+        __pyx_t_16 += __pyx_v_pat_view.shape[0];
+        if (unlikely(__pyx_t_16 < 0)) __pyx_t_21 = 0;
+      } else if (unlikely(__pyx_t_16 >= __pyx_v_pat_view.shape[0])) __pyx_t_21 = 0;
+      if (unlikely(__pyx_t_21 != -1)) {
+        __Pyx_RaiseBufferIndexError(__pyx_t_21);
+        __PYX_ERR(0, 344, __pyx_L1_error)
+      }
+      __pyx_v_c = (*((uint32_t const  *) ( /* dim=0 */ ((char *) (((uint32_t const  *) __pyx_v_pat_view.data) + __pyx_t_16)) )));
+
+      /* "cython_ext/fuzzy_cython.pyx":345
+ *         for k in range(m):
+ *             c = pat_view[k]
+ *             if c < 128:             # <<<<<<<<<<<<<<
+ *                 ascii_eq[c] |= <uint64_t>1 << k
+ *                 continue
+*/
+      __pyx_t_1 = (__pyx_v_c < 0x80);
+      if (__pyx_t_1) {
+
+        /* "cython_ext/fuzzy_cython.pyx":346
+ *             c = pat_view[k]
+ *             if c < 128:
+ *                 ascii_eq[c] |= <uint64_t>1 << k             # <<<<<<<<<<<<<<
+ *                 continue
+ *             found = -1
+*/
+        __pyx_t_22 = __pyx_v_c;
+        (__pyx_v_ascii_eq[__pyx_t_22]) = ((__pyx_v_ascii_eq[__pyx_t_22]) | (((uint64_t)1) << __pyx_v_k));
+
+        /* "cython_ext/fuzzy_cython.pyx":347
+ *             if c < 128:
+ *                 ascii_eq[c] |= <uint64_t>1 << k
+ *                 continue             # <<<<<<<<<<<<<<
+ *             found = -1
+ *             for i in range(n_other):
+*/
+        goto __pyx_L12_continue;
+
+        /* "cython_ext/fuzzy_cython.pyx":345
+ *         for k in range(m):
+ *             c = pat_view[k]
+ *             if c < 128:             # <<<<<<<<<<<<<<
+ *                 ascii_eq[c] |= <uint64_t>1 << k
+ *                 continue
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":348
+ *                 ascii_eq[c] |= <uint64_t>1 << k
+ *                 continue
+ *             found = -1             # <<<<<<<<<<<<<<
+ *             for i in range(n_other):
+ *                 if other[i] == c:
+*/
+      __pyx_v_found = -1;
+
+      /* "cython_ext/fuzzy_cython.pyx":349
+ *                 continue
+ *             found = -1
+ *             for i in range(n_other):             # <<<<<<<<<<<<<<
+ *                 if other[i] == c:
+ *                     found = <int>i
+*/
+      __pyx_t_21 = __pyx_v_n_other;
+      __pyx_t_23 = __pyx_t_21;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_23; __pyx_t_14+=1) {
+        __pyx_v_i = __pyx_t_14;
+
+        /* "cython_ext/fuzzy_cython.pyx":350
+ *             found = -1
+ *             for i in range(n_other):
+ *                 if other[i] == c:             # <<<<<<<<<<<<<<
+ *                     found = <int>i
+ *             if found < 0:
+*/
+        __pyx_t_1 = ((__pyx_v_other[__pyx_v_i]) == __pyx_v_c);
+        if (__pyx_t_1) {
+
+          /* "cython_ext/fuzzy_cython.pyx":351
+ *             for i in range(n_other):
+ *                 if other[i] == c:
+ *                     found = <int>i             # <<<<<<<<<<<<<<
+ *             if found < 0:
+ *                 found = n_other
+*/
+          __pyx_v_found = ((int)__pyx_v_i);
+
+          /* "cython_ext/fuzzy_cython.pyx":350
+ *             found = -1
+ *             for i in range(n_other):
+ *                 if other[i] == c:             # <<<<<<<<<<<<<<
+ *                     found = <int>i
+ *             if found < 0:
+*/
+        }
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":352
+ *                 if other[i] == c:
+ *                     found = <int>i
+ *             if found < 0:             # <<<<<<<<<<<<<<
+ *                 found = n_other
+ *                 other[found] = c
+*/
+      __pyx_t_1 = (__pyx_v_found < 0);
+      if (__pyx_t_1) {
+
+        /* "cython_ext/fuzzy_cython.pyx":353
+ *                     found = <int>i
+ *             if found < 0:
+ *                 found = n_other             # <<<<<<<<<<<<<<
+ *                 other[found] = c
+ *                 other_eq[found] = 0
+*/
+        __pyx_v_found = __pyx_v_n_other;
+
+        /* "cython_ext/fuzzy_cython.pyx":354
+ *             if found < 0:
+ *                 found = n_other
+ *                 other[found] = c             # <<<<<<<<<<<<<<
+ *                 other_eq[found] = 0
+ *                 n_other += 1
+*/
+        (__pyx_v_other[__pyx_v_found]) = __pyx_v_c;
+
+        /* "cython_ext/fuzzy_cython.pyx":355
+ *                 found = n_other
+ *                 other[found] = c
+ *                 other_eq[found] = 0             # <<<<<<<<<<<<<<
+ *                 n_other += 1
+ *             other_eq[found] |= <uint64_t>1 << k
+*/
+        (__pyx_v_other_eq[__pyx_v_found]) = 0;
+
+        /* "cython_ext/fuzzy_cython.pyx":356
+ *                 other[found] = c
+ *                 other_eq[found] = 0
+ *                 n_other += 1             # <<<<<<<<<<<<<<
+ *             other_eq[found] |= <uint64_t>1 << k
+ * 
+*/
+        __pyx_v_n_other = (__pyx_v_n_other + 1);
+
+        /* "cython_ext/fuzzy_cython.pyx":352
+ *                 if other[i] == c:
+ *                     found = <int>i
+ *             if found < 0:             # <<<<<<<<<<<<<<
+ *                 found = n_other
+ *                 other[found] = c
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":357
+ *                 other_eq[found] = 0
+ *                 n_other += 1
+ *             other_eq[found] |= <uint64_t>1 << k             # <<<<<<<<<<<<<<
+ * 
+ *     if parallel:
+*/
+      __pyx_t_21 = __pyx_v_found;
+      (__pyx_v_other_eq[__pyx_t_21]) = ((__pyx_v_other_eq[__pyx_t_21]) | (((uint64_t)1) << __pyx_v_k));
+      __pyx_L12_continue:;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":342
+ *     for k in range(128):
+ *         ascii_eq[k] = 0
+ *     if m <= 64:             # <<<<<<<<<<<<<<
+ *         for k in range(m):
+ *             c = pat_view[k]
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":359
+ *             other_eq[found] |= <uint64_t>1 << k
+ * 
+ *     if parallel:             # <<<<<<<<<<<<<<
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):
+ *             score_view[i] = _score_line(
+*/
+  if (__pyx_v_parallel) {
+
+    /* "cython_ext/fuzzy_cython.pyx":360
+ * 
+ *     if parallel:
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):             # <<<<<<<<<<<<<<
+ *             score_view[i] = _score_line(
+ *                 pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+*/
+    {
+        PyThreadState *_save;
+        _save = NULL;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_14 = __pyx_v_n_lines;
+          {
+              Py_ssize_t __pyx_parallel_temp0 = ((Py_ssize_t)0xbad0bad0);
+              const char *__pyx_parallel_filename = NULL; int __pyx_parallel_lineno = 0, __pyx_parallel_clineno = 0;
+              PyObject *__pyx_parallel_exc_type = NULL, *__pyx_parallel_exc_value = NULL, *__pyx_parallel_exc_tb = NULL;
+              #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+              PyMutex __pyx_parallel_freethreading_mutex = {0};
+              #endif
+              int __pyx_parallel_why;
+              __pyx_parallel_why = 0;
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_25 = (__pyx_t_14 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_25 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel private(__pyx_t_16, __pyx_t_17, __pyx_t_26, __pyx_t_27, __pyx_t_28) __Pyx_shared_in_cpython_freethreading(__pyx_parallel_freethreading_mutex) private(__pyx_filename, __pyx_lineno, __pyx_clineno) shared(__pyx_parallel_why, __pyx_parallel_exc_type, __pyx_parallel_exc_value, __pyx_parallel_exc_tb)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                      Py_BEGIN_ALLOW_THREADS
+                      #endif /* _OPENMP */
+                      #ifdef _OPENMP
+                      #pragma omp for firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) schedule(dynamic)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_24 = 0; __pyx_t_24 < __pyx_t_25; __pyx_t_24++){
+                          if (__pyx_parallel_why < 2)
+                          {
+                              __pyx_v_i = (Py_ssize_t)(0 + 1 * __pyx_t_24);
+
+                              /* "cython_ext/fuzzy_cython.pyx":362
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):
+ *             score_view[i] = _score_line(
+ *                 pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],             # <<<<<<<<<<<<<<
+ *                 ascii_eq, other, other_eq, n_other, threshold, strict,
+ *             )
+*/
+                              __pyx_t_16 = __pyx_v_i;
+                              __pyx_t_17 = -1;
+                              if (__pyx_t_16 < 0) {
+                                __pyx_t_16 += __pyx_v_offset_view.shape[0];
+                                if (unlikely(__pyx_t_16 < 0)) __pyx_t_17 = 0;
+                              } else if (unlikely(__pyx_t_16 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+                              if (unlikely(__pyx_t_17 != -1)) {
+                                __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+                                __PYX_ERR(0, 362, __pyx_L25_error)
+                              }
+                              __pyx_t_26 = (__pyx_v_i + 1);
+                              __pyx_t_17 = -1;
+                              if (__pyx_t_26 < 0) {
+                                __pyx_t_26 += __pyx_v_offset_view.shape[0];
+                                if (unlikely(__pyx_t_26 < 0)) __pyx_t_17 = 0;
+                              } else if (unlikely(__pyx_t_26 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+                              if (unlikely(__pyx_t_17 != -1)) {
+                                __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+                                __PYX_ERR(0, 362, __pyx_L25_error)
+                              }
+                              __pyx_t_27 = __pyx_v_i;
+                              __pyx_t_17 = -1;
+                              if (__pyx_t_27 < 0) {
+                                __pyx_t_27 += __pyx_v_offset_view.shape[0];
+                                if (unlikely(__pyx_t_27 < 0)) __pyx_t_17 = 0;
+                              } else if (unlikely(__pyx_t_27 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+                              if (unlikely(__pyx_t_17 != -1)) {
+                                __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+                                __PYX_ERR(0, 362, __pyx_L25_error)
+                              }
+
+                              /* "cython_ext/fuzzy_cython.pyx":361
+ *     if parallel:
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):
+ *             score_view[i] = _score_line(             # <<<<<<<<<<<<<<
+ *                 pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+ *                 ascii_eq, other, other_eq, n_other, threshold, strict,
+*/
+                              __pyx_t_28 = __pyx_f_10cython_ext_12fuzzy_cython__score_line(__pyx_v_pat, __pyx_v_m, (__pyx_v_base + (*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_16)) )))), ((*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_26)) ))) - (*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_27)) )))), __pyx_v_ascii_eq, __pyx_v_other, __pyx_v_other_eq, __pyx_v_n_other, __pyx_v_threshold, __pyx_v_strict); if (unlikely(__pyx_t_28 == ((double)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 361, __pyx_L25_error)
+                              __pyx_t_27 = __pyx_v_i;
+                              __pyx_t_17 = -1;
+                              if (__pyx_t_27 < 0) {
+                                __pyx_t_27 += __pyx_v_score_view.shape[0];
+                                if (unlikely(__pyx_t_27 < 0)) __pyx_t_17 = 0;
+                              } else if (unlikely(__pyx_t_27 >= __pyx_v_score_view.shape[0])) __pyx_t_17 = 0;
+                              if (unlikely(__pyx_t_17 != -1)) {
+                                __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+                                __PYX_ERR(0, 361, __pyx_L25_error)
+                              }
+                              *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_score_view.data) + __pyx_t_27)) )) = __pyx_t_28;
+                              goto __pyx_L28;
+                              __pyx_L25_error:;
+                              {
+                                  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                                  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+                                  PyMutex_Lock(&__pyx_parallel_freethreading_mutex);
+                                  #endif
+                                  #ifdef _OPENMP
+                                  #pragma omp flush(__pyx_parallel_exc_type)
+                                  #endif /* _OPENMP */
+                                  if (!__pyx_parallel_exc_type) {
+                                    __Pyx_ErrFetchWithState(&__pyx_parallel_exc_type, &__pyx_parallel_exc_value, &__pyx_parallel_exc_tb);
+                                    __pyx_parallel_filename = __pyx_filename; __pyx_parallel_lineno = __pyx_lineno; __pyx_parallel_clineno = __pyx_clineno;
+                                    __Pyx_GOTREF(__pyx_parallel_exc_type);
+                                  }
+                                  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+                                  PyMutex_Unlock(&__pyx_parallel_freethreading_mutex);
+                                  #endif
+                                  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                              }
+                              __pyx_parallel_why = 4;
+                              goto __pyx_L27;
+                              __pyx_L27:;
+                              #ifdef _OPENMP
+                              #pragma omp critical(__pyx_parallel_lastprivates0)
+                              #endif /* _OPENMP */
+                              {
+                                  __pyx_parallel_temp0 = __pyx_v_i;
+                              }
+                              __pyx_L28:;
+                              #ifdef _OPENMP
+                              #pragma omp flush(__pyx_parallel_why)
+                              #endif /* _OPENMP */
+                          }
+                      }
+                      #ifdef _OPENMP
+                      Py_END_ALLOW_THREADS
+                      #else
+{
+PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                      #endif /* _OPENMP */
+                      /* Clean up any temporaries */
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                      #ifndef _OPENMP
+}
+#endif /* _OPENMP */
+                  }
               }
-              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L8_error)
-            } else {
-              __pyx_t_3 = __pyx_t_19(__pyx_t_11);
-              if (unlikely(!__pyx_t_3)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 79, __pyx_L8_error)
-                  PyErr_Clear();
+              if (__pyx_parallel_exc_type) {
+                /* This may have been overridden by a continue, break or return in another thread. Prefer the error. */
+                __pyx_parallel_why = 4;
+              }
+              if (__pyx_parallel_why) {
+                __pyx_v_i = __pyx_parallel_temp0;
+                switch (__pyx_parallel_why) {
+                      case 4:
+                  {
+                      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+                      PyMutex_Lock(&__pyx_parallel_freethreading_mutex);
+                      #endif
+                      __Pyx_GIVEREF(__pyx_parallel_exc_type);
+                      __Pyx_ErrRestoreWithState(__pyx_parallel_exc_type, __pyx_parallel_exc_value, __pyx_parallel_exc_tb);
+                      __pyx_filename = __pyx_parallel_filename; __pyx_lineno = __pyx_parallel_lineno; __pyx_clineno = __pyx_parallel_clineno;
+                      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+                      PyMutex_Unlock(&__pyx_parallel_freethreading_mutex);
+                      #endif
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                  }
+                  goto __pyx_L21_error;
                 }
-                break;
               }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+        }
+
+        /* "cython_ext/fuzzy_cython.pyx":360
+ * 
+ *     if parallel:
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):             # <<<<<<<<<<<<<<
+ *             score_view[i] = _score_line(
+ *                 pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            goto __pyx_L22;
+          }
+          __pyx_L21_error: {
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            goto __pyx_L1_error;
+          }
+          __pyx_L22:;
+        }
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":359
+ *             other_eq[found] |= <uint64_t>1 << k
+ * 
+ *     if parallel:             # <<<<<<<<<<<<<<
+ *         for i in prange(n_lines, nogil=True, schedule="dynamic"):
+ *             score_view[i] = _score_line(
+*/
+    goto __pyx_L19;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":366
+ *             )
+ *     else:
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(n_lines):
+ *                 score_view[i] = _score_line(
+*/
+  /*else*/ {
+    {
+        PyThreadState *_save;
+        _save = NULL;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+
+          /* "cython_ext/fuzzy_cython.pyx":367
+ *     else:
+ *         with nogil:
+ *             for i in range(n_lines):             # <<<<<<<<<<<<<<
+ *                 score_view[i] = _score_line(
+ *                     pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+*/
+          __pyx_t_25 = __pyx_v_n_lines;
+          __pyx_t_24 = __pyx_t_25;
+          for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_24; __pyx_t_14+=1) {
+            __pyx_v_i = __pyx_t_14;
+
+            /* "cython_ext/fuzzy_cython.pyx":369
+ *             for i in range(n_lines):
+ *                 score_view[i] = _score_line(
+ *                     pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],             # <<<<<<<<<<<<<<
+ *                     ascii_eq, other, other_eq, n_other, threshold, strict,
+ *                 )
+*/
+            __pyx_t_27 = __pyx_v_i;
+            __pyx_t_17 = -1;
+            if (__pyx_t_27 < 0) {
+              __pyx_t_27 += __pyx_v_offset_view.shape[0];
+              if (unlikely(__pyx_t_27 < 0)) __pyx_t_17 = 0;
+            } else if (unlikely(__pyx_t_27 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+            if (unlikely(__pyx_t_17 != -1)) {
+              __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+              __PYX_ERR(0, 369, __pyx_L30_error)
             }
-            __Pyx_GOTREF(__pyx_t_3);
-            __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_j, __pyx_t_3);
-            __pyx_t_3 = 0;
-            if (unlikely(__pyx_v_lines == Py_None)) {
-              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-              __PYX_ERR(0, 79, __pyx_L8_error)
+            __pyx_t_26 = (__pyx_v_i + 1);
+            __pyx_t_17 = -1;
+            if (__pyx_t_26 < 0) {
+              __pyx_t_26 += __pyx_v_offset_view.shape[0];
+              if (unlikely(__pyx_t_26 < 0)) __pyx_t_17 = 0;
+            } else if (unlikely(__pyx_t_26 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+            if (unlikely(__pyx_t_17 != -1)) {
+              __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+              __PYX_ERR(0, 369, __pyx_L30_error)
             }
-            __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_7genexpr__pyx_v_j); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 79, __pyx_L8_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_12 = __pyx_t_10;
-            __Pyx_INCREF(__pyx_t_12);
-            __pyx_t_6 = 0;
-            {
-              PyObject *__pyx_callargs[2] = {__pyx_t_12, NULL};
-              __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-              __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L8_error)
-              __Pyx_GOTREF(__pyx_t_3);
+            __pyx_t_16 = __pyx_v_i;
+            __pyx_t_17 = -1;
+            if (__pyx_t_16 < 0) {
+              __pyx_t_16 += __pyx_v_offset_view.shape[0];
+              if (unlikely(__pyx_t_16 < 0)) __pyx_t_17 = 0;
+            } else if (unlikely(__pyx_t_16 >= __pyx_v_offset_view.shape[0])) __pyx_t_17 = 0;
+            if (unlikely(__pyx_t_17 != -1)) {
+              __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+              __PYX_ERR(0, 369, __pyx_L30_error)
             }
-            if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 79, __pyx_L8_error)
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "cython_ext/fuzzy_cython.pyx":368
+ *         with nogil:
+ *             for i in range(n_lines):
+ *                 score_view[i] = _score_line(             # <<<<<<<<<<<<<<
+ *                     pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+ *                     ascii_eq, other, other_eq, n_other, threshold, strict,
+*/
+            __pyx_t_28 = __pyx_f_10cython_ext_12fuzzy_cython__score_line(__pyx_v_pat, __pyx_v_m, (__pyx_v_base + (*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_27)) )))), ((*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_26)) ))) - (*((__pyx_t_5numpy_int64_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int64_t const  *) __pyx_v_offset_view.data) + __pyx_t_16)) )))), __pyx_v_ascii_eq, __pyx_v_other, __pyx_v_other_eq, __pyx_v_n_other, __pyx_v_threshold, __pyx_v_strict); if (unlikely(__pyx_t_28 == ((double)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 368, __pyx_L30_error)
+            __pyx_t_16 = __pyx_v_i;
+            __pyx_t_17 = -1;
+            if (__pyx_t_16 < 0) {
+              __pyx_t_16 += __pyx_v_score_view.shape[0];
+              if (unlikely(__pyx_t_16 < 0)) __pyx_t_17 = 0;
+            } else if (unlikely(__pyx_t_16 >= __pyx_v_score_view.shape[0])) __pyx_t_17 = 0;
+            if (unlikely(__pyx_t_17 != -1)) {
+              __Pyx_RaiseBufferIndexErrorNogil(__pyx_t_17);
+              __PYX_ERR(0, 368, __pyx_L30_error)
+            }
+            *((double *) ( /* dim=0 */ ((char *) (((double *) __pyx_v_score_view.data) + __pyx_t_16)) )) = __pyx_t_28;
           }
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j); __pyx_7genexpr__pyx_v_j = 0;
-          goto __pyx_L12_exit_scope;
-          __pyx_L8_error:;
-          __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j); __pyx_7genexpr__pyx_v_j = 0;
-          goto __pyx_L1_error;
-          __pyx_L12_exit_scope:;
-        } /* exit inner scope */
-        __pyx_t_2 = __pyx_t_5;
-        __pyx_t_5 = 0;
-      } else {
-        __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_2 = __pyx_t_5;
-        __pyx_t_5 = 0;
+        }
+
+        /* "cython_ext/fuzzy_cython.pyx":366
+ *             )
+ *     else:
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(n_lines):
+ *                 score_view[i] = _score_line(
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            goto __pyx_L31;
+          }
+          __pyx_L30_error: {
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            goto __pyx_L1_error;
+          }
+          __pyx_L31:;
+        }
+    }
+  }
+  __pyx_L19:;
+
+  /* "cython_ext/fuzzy_cython.pyx":372
+ *                     ascii_eq, other, other_eq, n_other, threshold, strict,
+ *                 )
+ *     return scores             # <<<<<<<<<<<<<<
+ * 
+ * # --- Best-window (semi-global) matching ---
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_scores);
+  __pyx_r = ((PyObject *)__pyx_v_scores);
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":307
+ *     return 1.0 - <double>distance / length
+ * 
+ * def fuzzy_score_block(str pattern, lines, double threshold=0.0, bint strict=False, bint parallel=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Score every line against pattern in one GIL-released loop.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
+  __Pyx_XDECREF(__pyx_t_11);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_scores.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_score_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_scores.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF(__pyx_v_codes);
+  __Pyx_XDECREF(__pyx_v_offsets);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_code_view, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_offset_view, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_scores);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_score_view, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_pat_view, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":376
+ * # --- Best-window (semi-global) matching ---
+ * 
+ * cdef int _window_end(str pattern, str text, int max_distance, bint first, int *end_out):             # <<<<<<<<<<<<<<
+ *     """
+ *     Smallest distance (<= max_distance) between pattern and any substring of
+*/
+
+static int __pyx_f_10cython_ext_12fuzzy_cython__window_end(PyObject *__pyx_v_pattern, PyObject *__pyx_v_text, int __pyx_v_max_distance, int __pyx_v_first, int *__pyx_v_end_out) {
+  int __pyx_v_m;
+  int __pyx_v_n;
+  int __pyx_v_best;
+  int __pyx_v_best_end;
+  int __pyx_v_score;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_diag;
+  int __pyx_v_above;
+  int __pyx_v_value;
+  Py_UCS4 __pyx_v_ch;
+  uint64_t __pyx_v_ascii_eq[0x80];
+  PyObject *__pyx_v_other_eq = 0;
+  uint64_t __pyx_v_mask;
+  uint64_t __pyx_v_top;
+  uint64_t __pyx_v_vp;
+  uint64_t __pyx_v_vn;
+  uint64_t __pyx_v_eq;
+  uint64_t __pyx_v_xv;
+  uint64_t __pyx_v_xh;
+  uint64_t __pyx_v_ph;
+  uint64_t __pyx_v_mh;
+  uint64_t __pyx_v_bit;
+  int *__pyx_v_col;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  uint64_t __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  Py_ssize_t __pyx_t_7;
+  void *__pyx_t_8;
+  int __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_UCS4 __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_t_14;
+  long __pyx_t_15;
+  long __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  long __pyx_t_19;
+  long __pyx_t_20;
+  int __pyx_t_21;
+  char const *__pyx_t_22;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *__pyx_t_26 = NULL;
+  PyObject *__pyx_t_27 = NULL;
+  PyObject *__pyx_t_28 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_window_end", 0);
+
+  /* "cython_ext/fuzzy_cython.pyx":383
+ *     Returns -1 if no substring is within max_distance.
+ *     """
+ *     cdef int m = len(pattern)             # <<<<<<<<<<<<<<
+ *     cdef int n = len(text)
+ *     cdef int best = max_distance + 1
+*/
+  if (unlikely(__pyx_v_pattern == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 383, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_pattern); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 383, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":384
+ *     """
+ *     cdef int m = len(pattern)
+ *     cdef int n = len(text)             # <<<<<<<<<<<<<<
+ *     cdef int best = max_distance + 1
+ *     cdef int best_end = -1
+*/
+  if (unlikely(__pyx_v_text == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 384, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_text); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 384, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+
+  /* "cython_ext/fuzzy_cython.pyx":385
+ *     cdef int m = len(pattern)
+ *     cdef int n = len(text)
+ *     cdef int best = max_distance + 1             # <<<<<<<<<<<<<<
+ *     cdef int best_end = -1
+ *     cdef int score = m
+*/
+  __pyx_v_best = (__pyx_v_max_distance + 1);
+
+  /* "cython_ext/fuzzy_cython.pyx":386
+ *     cdef int n = len(text)
+ *     cdef int best = max_distance + 1
+ *     cdef int best_end = -1             # <<<<<<<<<<<<<<
+ *     cdef int score = m
+ *     cdef int i, j, diag, above, value
+*/
+  __pyx_v_best_end = -1;
+
+  /* "cython_ext/fuzzy_cython.pyx":387
+ *     cdef int best = max_distance + 1
+ *     cdef int best_end = -1
+ *     cdef int score = m             # <<<<<<<<<<<<<<
+ *     cdef int i, j, diag, above, value
+ *     cdef Py_UCS4 ch
+*/
+  __pyx_v_score = __pyx_v_m;
+
+  /* "cython_ext/fuzzy_cython.pyx":395
+ *     cdef int *col
+ * 
+ *     if m <= 64:             # <<<<<<<<<<<<<<
+ *         other_eq = {}
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+*/
+  __pyx_t_2 = (__pyx_v_m <= 64);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":396
+ * 
+ *     if m <= 64:
+ *         other_eq = {}             # <<<<<<<<<<<<<<
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *         top = <uint64_t>1 << (m - 1)
+*/
+    __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 396, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_v_other_eq = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":397
+ *     if m <= 64:
+ *         other_eq = {}
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF             # <<<<<<<<<<<<<<
+ *         top = <uint64_t>1 << (m - 1)
+ *         vp = mask
+*/
+    __pyx_t_2 = (__pyx_v_m < 64);
+    if (__pyx_t_2) {
+      __pyx_t_4 = ((((uint64_t)1) << __pyx_v_m) - 1);
+    } else {
+      __pyx_t_4 = ((uint64_t)0xFFFFFFFFFFFFFFFF);
+    }
+    __pyx_v_mask = __pyx_t_4;
+
+    /* "cython_ext/fuzzy_cython.pyx":398
+ *         other_eq = {}
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *         top = <uint64_t>1 << (m - 1)             # <<<<<<<<<<<<<<
+ *         vp = mask
+ *         vn = 0
+*/
+    __pyx_v_top = (((uint64_t)1) << (__pyx_v_m - 1));
+
+    /* "cython_ext/fuzzy_cython.pyx":399
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+ *         top = <uint64_t>1 << (m - 1)
+ *         vp = mask             # <<<<<<<<<<<<<<
+ *         vn = 0
+ *         bit = 1
+*/
+    __pyx_v_vp = __pyx_v_mask;
+
+    /* "cython_ext/fuzzy_cython.pyx":400
+ *         top = <uint64_t>1 << (m - 1)
+ *         vp = mask
+ *         vn = 0             # <<<<<<<<<<<<<<
+ *         bit = 1
+ *         for i in range(128):
+*/
+    __pyx_v_vn = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":401
+ *         vp = mask
+ *         vn = 0
+ *         bit = 1             # <<<<<<<<<<<<<<
+ *         for i in range(128):
+ *             ascii_eq[i] = 0
+*/
+    __pyx_v_bit = 1;
+
+    /* "cython_ext/fuzzy_cython.pyx":402
+ *         vn = 0
+ *         bit = 1
+ *         for i in range(128):             # <<<<<<<<<<<<<<
+ *             ascii_eq[i] = 0
+ *         for ch in pattern:
+*/
+    for (__pyx_t_5 = 0; __pyx_t_5 < 0x80; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "cython_ext/fuzzy_cython.pyx":403
+ *         bit = 1
+ *         for i in range(128):
+ *             ascii_eq[i] = 0             # <<<<<<<<<<<<<<
+ *         for ch in pattern:
+ *             if ch < 128:
+*/
+      (__pyx_v_ascii_eq[__pyx_v_i]) = 0;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":404
+ *         for i in range(128):
+ *             ascii_eq[i] = 0
+ *         for ch in pattern:             # <<<<<<<<<<<<<<
+ *             if ch < 128:
+ *                 ascii_eq[ch] |= bit
+*/
+    if (unlikely(__pyx_v_pattern == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
+      __PYX_ERR(0, 404, __pyx_L1_error)
+    }
+    __Pyx_INCREF(__pyx_v_pattern);
+    __pyx_t_6 = __pyx_v_pattern;
+    __pyx_t_9 = __Pyx_init_unicode_iteration(__pyx_t_6, (&__pyx_t_7), (&__pyx_t_8), (&__pyx_t_5)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 404, __pyx_L1_error)
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_7; __pyx_t_10++) {
+      __pyx_t_1 = __pyx_t_10;
+      __pyx_v_ch = __Pyx_PyUnicode_READ(__pyx_t_5, __pyx_t_8, __pyx_t_1);
+
+      /* "cython_ext/fuzzy_cython.pyx":405
+ *             ascii_eq[i] = 0
+ *         for ch in pattern:
+ *             if ch < 128:             # <<<<<<<<<<<<<<
+ *                 ascii_eq[ch] |= bit
+ *             else:
+*/
+      __pyx_t_2 = (__pyx_v_ch < 0x80);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":406
+ *         for ch in pattern:
+ *             if ch < 128:
+ *                 ascii_eq[ch] |= bit             # <<<<<<<<<<<<<<
+ *             else:
+ *                 other_eq[ch] = other_eq.get(ch, 0) | bit
+*/
+        __pyx_t_11 = __pyx_v_ch;
+        (__pyx_v_ascii_eq[__pyx_t_11]) = ((__pyx_v_ascii_eq[__pyx_t_11]) | __pyx_v_bit);
+
+        /* "cython_ext/fuzzy_cython.pyx":405
+ *             ascii_eq[i] = 0
+ *         for ch in pattern:
+ *             if ch < 128:             # <<<<<<<<<<<<<<
+ *                 ascii_eq[ch] |= bit
+ *             else:
+*/
+        goto __pyx_L8;
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":408
+ *                 ascii_eq[ch] |= bit
+ *             else:
+ *                 other_eq[ch] = other_eq.get(ch, 0) | bit             # <<<<<<<<<<<<<<
+ *             bit <<= 1
+ *         j = 0
+*/
+      /*else*/ {
+        __pyx_t_3 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_12 = __Pyx_PyDict_GetItemDefault(__pyx_v_other_eq, __pyx_t_3, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_3 = __Pyx_PyLong_From_uint64_t(__pyx_v_bit); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_13 = PyNumber_Or(__pyx_t_12, __pyx_t_3); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_3 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        if (unlikely((PyDict_SetItem(__pyx_v_other_eq, __pyx_t_3, __pyx_t_13) < 0))) __PYX_ERR(0, 408, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      }
+      __pyx_L8:;
+
+      /* "cython_ext/fuzzy_cython.pyx":409
+ *             else:
+ *                 other_eq[ch] = other_eq.get(ch, 0) | bit
+ *             bit <<= 1             # <<<<<<<<<<<<<<
+ *         j = 0
+ *         for ch in text:
+*/
+      __pyx_v_bit = (__pyx_v_bit << 1);
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":410
+ *                 other_eq[ch] = other_eq.get(ch, 0) | bit
+ *             bit <<= 1
+ *         j = 0             # <<<<<<<<<<<<<<
+ *         for ch in text:
+ *             if ch < 128:
+*/
+    __pyx_v_j = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":411
+ *             bit <<= 1
+ *         j = 0
+ *         for ch in text:             # <<<<<<<<<<<<<<
+ *             if ch < 128:
+ *                 eq = ascii_eq[ch]
+*/
+    if (unlikely(__pyx_v_text == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' is not iterable");
+      __PYX_ERR(0, 411, __pyx_L1_error)
+    }
+    __Pyx_INCREF(__pyx_v_text);
+    __pyx_t_6 = __pyx_v_text;
+    __pyx_t_9 = __Pyx_init_unicode_iteration(__pyx_t_6, (&__pyx_t_1), (&__pyx_t_8), (&__pyx_t_5)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 411, __pyx_L1_error)
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_1; __pyx_t_10++) {
+      __pyx_t_7 = __pyx_t_10;
+      __pyx_v_ch = __Pyx_PyUnicode_READ(__pyx_t_5, __pyx_t_8, __pyx_t_7);
+
+      /* "cython_ext/fuzzy_cython.pyx":412
+ *         j = 0
+ *         for ch in text:
+ *             if ch < 128:             # <<<<<<<<<<<<<<
+ *                 eq = ascii_eq[ch]
+ *             elif other_eq:
+*/
+      __pyx_t_2 = (__pyx_v_ch < 0x80);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":413
+ *         for ch in text:
+ *             if ch < 128:
+ *                 eq = ascii_eq[ch]             # <<<<<<<<<<<<<<
+ *             elif other_eq:
+ *                 eq = other_eq.get(ch, 0)
+*/
+        __pyx_v_eq = (__pyx_v_ascii_eq[__pyx_v_ch]);
+
+        /* "cython_ext/fuzzy_cython.pyx":412
+ *         j = 0
+ *         for ch in text:
+ *             if ch < 128:             # <<<<<<<<<<<<<<
+ *                 eq = ascii_eq[ch]
+ *             elif other_eq:
+*/
+        goto __pyx_L11;
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":414
+ *             if ch < 128:
+ *                 eq = ascii_eq[ch]
+ *             elif other_eq:             # <<<<<<<<<<<<<<
+ *                 eq = other_eq.get(ch, 0)
+ *             else:
+*/
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_other_eq); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 414, __pyx_L1_error)
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":415
+ *                 eq = ascii_eq[ch]
+ *             elif other_eq:
+ *                 eq = other_eq.get(ch, 0)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 eq = 0
+*/
+        __pyx_t_13 = __Pyx_PyUnicode_FromOrdinal(__pyx_v_ch); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 415, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_3 = __Pyx_PyDict_GetItemDefault(__pyx_v_other_eq, __pyx_t_13, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 415, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_4 = __Pyx_PyLong_As_uint64_t(__pyx_t_3); if (unlikely((__pyx_t_4 == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 415, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_v_eq = __pyx_t_4;
+
+        /* "cython_ext/fuzzy_cython.pyx":414
+ *             if ch < 128:
+ *                 eq = ascii_eq[ch]
+ *             elif other_eq:             # <<<<<<<<<<<<<<
+ *                 eq = other_eq.get(ch, 0)
+ *             else:
+*/
+        goto __pyx_L11;
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":417
+ *                 eq = other_eq.get(ch, 0)
+ *             else:
+ *                 eq = 0             # <<<<<<<<<<<<<<
+ *             xv = eq | vn
+ *             xh = (((eq & vp) + vp) ^ vp) | eq
+*/
+      /*else*/ {
+        __pyx_v_eq = 0;
+      }
+      __pyx_L11:;
+
+      /* "cython_ext/fuzzy_cython.pyx":418
+ *             else:
+ *                 eq = 0
+ *             xv = eq | vn             # <<<<<<<<<<<<<<
+ *             xh = (((eq & vp) + vp) ^ vp) | eq
+ *             ph = vn | (~(xh | vp) & mask)
+*/
+      __pyx_v_xv = (__pyx_v_eq | __pyx_v_vn);
+
+      /* "cython_ext/fuzzy_cython.pyx":419
+ *                 eq = 0
+ *             xv = eq | vn
+ *             xh = (((eq & vp) + vp) ^ vp) | eq             # <<<<<<<<<<<<<<
+ *             ph = vn | (~(xh | vp) & mask)
+ *             mh = vp & xh
+*/
+      __pyx_v_xh = ((((__pyx_v_eq & __pyx_v_vp) + __pyx_v_vp) ^ __pyx_v_vp) | __pyx_v_eq);
+
+      /* "cython_ext/fuzzy_cython.pyx":420
+ *             xv = eq | vn
+ *             xh = (((eq & vp) + vp) ^ vp) | eq
+ *             ph = vn | (~(xh | vp) & mask)             # <<<<<<<<<<<<<<
+ *             mh = vp & xh
+ *             if ph & top:
+*/
+      __pyx_v_ph = (__pyx_v_vn | ((~(__pyx_v_xh | __pyx_v_vp)) & __pyx_v_mask));
+
+      /* "cython_ext/fuzzy_cython.pyx":421
+ *             xh = (((eq & vp) + vp) ^ vp) | eq
+ *             ph = vn | (~(xh | vp) & mask)
+ *             mh = vp & xh             # <<<<<<<<<<<<<<
+ *             if ph & top:
+ *                 score += 1
+*/
+      __pyx_v_mh = (__pyx_v_vp & __pyx_v_xh);
+
+      /* "cython_ext/fuzzy_cython.pyx":422
+ *             ph = vn | (~(xh | vp) & mask)
+ *             mh = vp & xh
+ *             if ph & top:             # <<<<<<<<<<<<<<
+ *                 score += 1
+ *             elif mh & top:
+*/
+      __pyx_t_2 = ((__pyx_v_ph & __pyx_v_top) != 0);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":423
+ *             mh = vp & xh
+ *             if ph & top:
+ *                 score += 1             # <<<<<<<<<<<<<<
+ *             elif mh & top:
+ *                 score -= 1
+*/
+        __pyx_v_score = (__pyx_v_score + 1);
+
+        /* "cython_ext/fuzzy_cython.pyx":422
+ *             ph = vn | (~(xh | vp) & mask)
+ *             mh = vp & xh
+ *             if ph & top:             # <<<<<<<<<<<<<<
+ *                 score += 1
+ *             elif mh & top:
+*/
+        goto __pyx_L12;
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":424
+ *             if ph & top:
+ *                 score += 1
+ *             elif mh & top:             # <<<<<<<<<<<<<<
+ *                 score -= 1
+ *             j += 1
+*/
+      __pyx_t_2 = ((__pyx_v_mh & __pyx_v_top) != 0);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":425
+ *                 score += 1
+ *             elif mh & top:
+ *                 score -= 1             # <<<<<<<<<<<<<<
+ *             j += 1
+ *             if score < best:
+*/
+        __pyx_v_score = (__pyx_v_score - 1);
+
+        /* "cython_ext/fuzzy_cython.pyx":424
+ *             if ph & top:
+ *                 score += 1
+ *             elif mh & top:             # <<<<<<<<<<<<<<
+ *                 score -= 1
+ *             j += 1
+*/
       }
-      __Pyx_XDECREF_SET(__pyx_v_before, ((PyObject*)__pyx_t_2));
-      __pyx_t_2 = 0;
+      __pyx_L12:;
 
-      /* "cython_ext/fuzzy_cython.pyx":80
- *         if score >= threshold:
- *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
- *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []             # <<<<<<<<<<<<<<
- *             results.append((i+1, line.strip(), before, after, score))
- *             results_found += 1
+      /* "cython_ext/fuzzy_cython.pyx":426
+ *             elif mh & top:
+ *                 score -= 1
+ *             j += 1             # <<<<<<<<<<<<<<
+ *             if score < best:
+ *                 best = score
 */
-      __pyx_t_9 = (__pyx_v_context != 0);
-      if (__pyx_t_9) {
-        { /* enter inner scope */
-          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_3 = NULL;
-          __Pyx_INCREF(__pyx_builtin_range);
-          __pyx_t_10 = __pyx_builtin_range; 
-          __pyx_t_12 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_12);
-          __pyx_t_13 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_13);
-          __pyx_t_16 = __Pyx_PyLong_From_int(__pyx_v_context); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_16);
-          __pyx_t_15 = PyNumber_Add(__pyx_t_13, __pyx_t_16); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-          __pyx_t_20 = __pyx_v_n_lines;
-          __pyx_t_13 = __Pyx_PyLong_From_int(__pyx_t_20); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_GOTREF(__pyx_t_13);
-          __pyx_t_21 = PyObject_RichCompare(__pyx_t_15, __pyx_t_13, Py_LT); __Pyx_XGOTREF(__pyx_t_21); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-          __pyx_t_17 = __Pyx_PyObject_IsTrue(__pyx_t_21); if (unlikely((__pyx_t_17 < 0))) __PYX_ERR(0, 80, __pyx_L15_error)
-          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-          if (__pyx_t_17) {
-            __Pyx_INCREF(__pyx_t_15);
-            __pyx_t_16 = __pyx_t_15;
+      __pyx_v_j = (__pyx_v_j + 1);
+
+      /* "cython_ext/fuzzy_cython.pyx":427
+ *                 score -= 1
+ *             j += 1
+ *             if score < best:             # <<<<<<<<<<<<<<
+ *                 best = score
+ *                 best_end = j
+*/
+      __pyx_t_2 = (__pyx_v_score < __pyx_v_best);
+      if (__pyx_t_2) {
+
+        /* "cython_ext/fuzzy_cython.pyx":428
+ *             j += 1
+ *             if score < best:
+ *                 best = score             # <<<<<<<<<<<<<<
+ *                 best_end = j
+ *                 if first or score == 0:
+*/
+        __pyx_v_best = __pyx_v_score;
+
+        /* "cython_ext/fuzzy_cython.pyx":429
+ *             if score < best:
+ *                 best = score
+ *                 best_end = j             # <<<<<<<<<<<<<<
+ *                 if first or score == 0:
+ *                     break
+*/
+        __pyx_v_best_end = __pyx_v_j;
+
+        /* "cython_ext/fuzzy_cython.pyx":430
+ *                 best = score
+ *                 best_end = j
+ *                 if first or score == 0:             # <<<<<<<<<<<<<<
+ *                     break
+ *             # Row 0 stays 0: a match may start at any column
+*/
+        if (!__pyx_v_first) {
+        } else {
+          __pyx_t_2 = __pyx_v_first;
+          goto __pyx_L15_bool_binop_done;
+        }
+        __pyx_t_14 = (__pyx_v_score == 0);
+        __pyx_t_2 = __pyx_t_14;
+        __pyx_L15_bool_binop_done:;
+        if (__pyx_t_2) {
+
+          /* "cython_ext/fuzzy_cython.pyx":431
+ *                 best_end = j
+ *                 if first or score == 0:
+ *                     break             # <<<<<<<<<<<<<<
+ *             # Row 0 stays 0: a match may start at any column
+ *             ph = (ph << 1) & mask
+*/
+          goto __pyx_L10_break;
+
+          /* "cython_ext/fuzzy_cython.pyx":430
+ *                 best = score
+ *                 best_end = j
+ *                 if first or score == 0:             # <<<<<<<<<<<<<<
+ *                     break
+ *             # Row 0 stays 0: a match may start at any column
+*/
+        }
+
+        /* "cython_ext/fuzzy_cython.pyx":427
+ *                 score -= 1
+ *             j += 1
+ *             if score < best:             # <<<<<<<<<<<<<<
+ *                 best = score
+ *                 best_end = j
+*/
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":433
+ *                     break
+ *             # Row 0 stays 0: a match may start at any column
+ *             ph = (ph << 1) & mask             # <<<<<<<<<<<<<<
+ *             mh = (mh << 1) & mask
+ *             vp = mh | (~(xv | ph) & mask)
+*/
+      __pyx_v_ph = ((__pyx_v_ph << 1) & __pyx_v_mask);
+
+      /* "cython_ext/fuzzy_cython.pyx":434
+ *             # Row 0 stays 0: a match may start at any column
+ *             ph = (ph << 1) & mask
+ *             mh = (mh << 1) & mask             # <<<<<<<<<<<<<<
+ *             vp = mh | (~(xv | ph) & mask)
+ *             vn = ph & xv
+*/
+      __pyx_v_mh = ((__pyx_v_mh << 1) & __pyx_v_mask);
+
+      /* "cython_ext/fuzzy_cython.pyx":435
+ *             ph = (ph << 1) & mask
+ *             mh = (mh << 1) & mask
+ *             vp = mh | (~(xv | ph) & mask)             # <<<<<<<<<<<<<<
+ *             vn = ph & xv
+ *     else:
+*/
+      __pyx_v_vp = (__pyx_v_mh | ((~(__pyx_v_xv | __pyx_v_ph)) & __pyx_v_mask));
+
+      /* "cython_ext/fuzzy_cython.pyx":436
+ *             mh = (mh << 1) & mask
+ *             vp = mh | (~(xv | ph) & mask)
+ *             vn = ph & xv             # <<<<<<<<<<<<<<
+ *     else:
+ *         # Column-wise DP over the pattern for patterns wider than a machine word
+*/
+      __pyx_v_vn = (__pyx_v_ph & __pyx_v_xv);
+    }
+    __pyx_L10_break:;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "cython_ext/fuzzy_cython.pyx":395
+ *     cdef int *col
+ * 
+ *     if m <= 64:             # <<<<<<<<<<<<<<
+ *         other_eq = {}
+ *         mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+*/
+    goto __pyx_L3;
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":439
+ *     else:
+ *         # Column-wise DP over the pattern for patterns wider than a machine word
+ *         col = <int *>malloc((m + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if col == NULL:
+ *             raise MemoryError()
+*/
+  /*else*/ {
+    __pyx_v_col = ((int *)malloc(((__pyx_v_m + 1) * (sizeof(int)))));
+
+    /* "cython_ext/fuzzy_cython.pyx":440
+ *         # Column-wise DP over the pattern for patterns wider than a machine word
+ *         col = <int *>malloc((m + 1) * sizeof(int))
+ *         if col == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+*/
+    __pyx_t_2 = (__pyx_v_col == NULL);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "cython_ext/fuzzy_cython.pyx":441
+ *         col = <int *>malloc((m + 1) * sizeof(int))
+ *         if col == NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         try:
+ *             for i in range(m + 1):
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 441, __pyx_L1_error)
+
+      /* "cython_ext/fuzzy_cython.pyx":440
+ *         # Column-wise DP over the pattern for patterns wider than a machine word
+ *         col = <int *>malloc((m + 1) * sizeof(int))
+ *         if col == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+*/
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":442
+ *         if col == NULL:
+ *             raise MemoryError()
+ *         try:             # <<<<<<<<<<<<<<
+ *             for i in range(m + 1):
+ *                 col[i] = i
+*/
+    /*try:*/ {
+
+      /* "cython_ext/fuzzy_cython.pyx":443
+ *             raise MemoryError()
+ *         try:
+ *             for i in range(m + 1):             # <<<<<<<<<<<<<<
+ *                 col[i] = i
+ *             for j in range(n):
+*/
+      __pyx_t_15 = (__pyx_v_m + 1);
+      __pyx_t_16 = __pyx_t_15;
+      for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_16; __pyx_t_5+=1) {
+        __pyx_v_i = __pyx_t_5;
+
+        /* "cython_ext/fuzzy_cython.pyx":444
+ *         try:
+ *             for i in range(m + 1):
+ *                 col[i] = i             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 ch = text[j]
+*/
+        (__pyx_v_col[__pyx_v_i]) = __pyx_v_i;
+      }
+
+      /* "cython_ext/fuzzy_cython.pyx":445
+ *             for i in range(m + 1):
+ *                 col[i] = i
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 ch = text[j]
+ *                 diag = 0
+*/
+      __pyx_t_5 = __pyx_v_n;
+      __pyx_t_9 = __pyx_t_5;
+      for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_9; __pyx_t_17+=1) {
+        __pyx_v_j = __pyx_t_17;
+
+        /* "cython_ext/fuzzy_cython.pyx":446
+ *                 col[i] = i
+ *             for j in range(n):
+ *                 ch = text[j]             # <<<<<<<<<<<<<<
+ *                 diag = 0
+ *                 col[0] = 0
+*/
+        __pyx_t_11 = __Pyx_GetItemInt_Unicode(__pyx_v_text, __pyx_v_j, int, 1, __Pyx_PyLong_From_int, 0, 1, 1); if (unlikely(__pyx_t_11 == (Py_UCS4)-1)) __PYX_ERR(0, 446, __pyx_L19_error)
+        __pyx_v_ch = __pyx_t_11;
+
+        /* "cython_ext/fuzzy_cython.pyx":447
+ *             for j in range(n):
+ *                 ch = text[j]
+ *                 diag = 0             # <<<<<<<<<<<<<<
+ *                 col[0] = 0
+ *                 for i in range(1, m + 1):
+*/
+        __pyx_v_diag = 0;
+
+        /* "cython_ext/fuzzy_cython.pyx":448
+ *                 ch = text[j]
+ *                 diag = 0
+ *                 col[0] = 0             # <<<<<<<<<<<<<<
+ *                 for i in range(1, m + 1):
+ *                     above = col[i]
+*/
+        (__pyx_v_col[0]) = 0;
+
+        /* "cython_ext/fuzzy_cython.pyx":449
+ *                 diag = 0
+ *                 col[0] = 0
+ *                 for i in range(1, m + 1):             # <<<<<<<<<<<<<<
+ *                     above = col[i]
+ *                     value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))
+*/
+        __pyx_t_15 = (__pyx_v_m + 1);
+        __pyx_t_16 = __pyx_t_15;
+        for (__pyx_t_18 = 1; __pyx_t_18 < __pyx_t_16; __pyx_t_18+=1) {
+          __pyx_v_i = __pyx_t_18;
+
+          /* "cython_ext/fuzzy_cython.pyx":450
+ *                 col[0] = 0
+ *                 for i in range(1, m + 1):
+ *                     above = col[i]             # <<<<<<<<<<<<<<
+ *                     value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))
+ *                     diag = above
+*/
+          __pyx_v_above = (__pyx_v_col[__pyx_v_i]);
+
+          /* "cython_ext/fuzzy_cython.pyx":451
+ *                 for i in range(1, m + 1):
+ *                     above = col[i]
+ *                     value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))             # <<<<<<<<<<<<<<
+ *                     diag = above
+ *                     col[i] = value
+*/
+          __pyx_t_20 = (__pyx_v_i - 1);
+          __pyx_t_11 = __Pyx_GetItemInt_Unicode(__pyx_v_pattern, __pyx_t_20, long, 1, __Pyx_PyLong_From_long, 0, 1, 1); if (unlikely(__pyx_t_11 == (Py_UCS4)-1)) __PYX_ERR(0, 451, __pyx_L19_error)
+          __pyx_t_2 = (__pyx_t_11 == __pyx_v_ch);
+          if (__pyx_t_2) {
+            __pyx_t_19 = 0;
           } else {
-            __pyx_t_21 = __Pyx_PyLong_From_int(__pyx_t_20); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 80, __pyx_L15_error)
-            __Pyx_GOTREF(__pyx_t_21);
-            __pyx_t_16 = __pyx_t_21;
-            __pyx_t_21 = 0;
-          }
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-          __pyx_t_6 = 1;
-          {
-            PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_t_12, __pyx_t_16};
-            __pyx_t_11 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-            __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-            if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 80, __pyx_L15_error)
-            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_19 = 1;
           }
-          if (likely(PyList_CheckExact(__pyx_t_11)) || PyTuple_CheckExact(__pyx_t_11)) {
-            __pyx_t_10 = __pyx_t_11; __Pyx_INCREF(__pyx_t_10);
-            __pyx_t_18 = 0;
-            __pyx_t_19 = NULL;
+          __pyx_t_21 = __pyx_f_10cython_ext_12fuzzy_cython_min3(((__pyx_v_col[(__pyx_v_i - 1)]) + 1), (__pyx_v_above + 1), (__pyx_v_diag + __pyx_t_19)); if (unlikely(__pyx_t_21 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 451, __pyx_L19_error)
+          __pyx_v_value = __pyx_t_21;
+
+          /* "cython_ext/fuzzy_cython.pyx":452
+ *                     above = col[i]
+ *                     value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))
+ *                     diag = above             # <<<<<<<<<<<<<<
+ *                     col[i] = value
+ *                 if col[m] < best:
+*/
+          __pyx_v_diag = __pyx_v_above;
+
+          /* "cython_ext/fuzzy_cython.pyx":453
+ *                     value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))
+ *                     diag = above
+ *                     col[i] = value             # <<<<<<<<<<<<<<
+ *                 if col[m] < best:
+ *                     best = col[m]
+*/
+          (__pyx_v_col[__pyx_v_i]) = __pyx_v_value;
+        }
+
+        /* "cython_ext/fuzzy_cython.pyx":454
+ *                     diag = above
+ *                     col[i] = value
+ *                 if col[m] < best:             # <<<<<<<<<<<<<<
+ *                     best = col[m]
+ *                     best_end = j + 1
+*/
+        __pyx_t_2 = ((__pyx_v_col[__pyx_v_m]) < __pyx_v_best);
+        if (__pyx_t_2) {
+
+          /* "cython_ext/fuzzy_cython.pyx":455
+ *                     col[i] = value
+ *                 if col[m] < best:
+ *                     best = col[m]             # <<<<<<<<<<<<<<
+ *                     best_end = j + 1
+ *                     if first or best == 0:
+*/
+          __pyx_v_best = (__pyx_v_col[__pyx_v_m]);
+
+          /* "cython_ext/fuzzy_cython.pyx":456
+ *                 if col[m] < best:
+ *                     best = col[m]
+ *                     best_end = j + 1             # <<<<<<<<<<<<<<
+ *                     if first or best == 0:
+ *                         break
+*/
+          __pyx_v_best_end = (__pyx_v_j + 1);
+
+          /* "cython_ext/fuzzy_cython.pyx":457
+ *                     best = col[m]
+ *                     best_end = j + 1
+ *                     if first or best == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *         finally:
+*/
+          if (!__pyx_v_first) {
           } else {
-            __pyx_t_18 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 80, __pyx_L15_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_19 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 80, __pyx_L15_error)
+            __pyx_t_2 = __pyx_v_first;
+            goto __pyx_L29_bool_binop_done;
           }
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          for (;;) {
-            if (likely(!__pyx_t_19)) {
-              if (likely(PyList_CheckExact(__pyx_t_10))) {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
-                  #if !CYTHON_ASSUME_SAFE_SIZE
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 80, __pyx_L15_error)
-                  #endif
-                  if (__pyx_t_18 >= __pyx_temp) break;
-                }
-                __pyx_t_11 = __Pyx_PyList_GetItemRef(__pyx_t_10, __pyx_t_18);
-                ++__pyx_t_18;
-              } else {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
-                  #if !CYTHON_ASSUME_SAFE_SIZE
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 80, __pyx_L15_error)
-                  #endif
-                  if (__pyx_t_18 >= __pyx_temp) break;
-                }
-                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_11 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_18));
-                #else
-                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_18);
-                #endif
-                ++__pyx_t_18;
-              }
-              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 80, __pyx_L15_error)
-            } else {
-              __pyx_t_11 = __pyx_t_19(__pyx_t_10);
-              if (unlikely(!__pyx_t_11)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 80, __pyx_L15_error)
-                  PyErr_Clear();
-                }
-                break;
-              }
-            }
-            __Pyx_GOTREF(__pyx_t_11);
-            __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_j, __pyx_t_11);
-            __pyx_t_11 = 0;
-            if (unlikely(__pyx_v_lines == Py_None)) {
-              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-              __PYX_ERR(0, 80, __pyx_L15_error)
-            }
-            __pyx_t_12 = __Pyx_PyObject_GetItem(__pyx_v_lines, __pyx_8genexpr1__pyx_v_j); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 80, __pyx_L15_error)
-            __Pyx_GOTREF(__pyx_t_12);
-            __pyx_t_16 = __pyx_t_12;
-            __Pyx_INCREF(__pyx_t_16);
-            __pyx_t_6 = 0;
-            {
-              PyObject *__pyx_callargs[2] = {__pyx_t_16, NULL};
-              __pyx_t_11 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-              __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
-              __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 80, __pyx_L15_error)
-              __Pyx_GOTREF(__pyx_t_11);
-            }
-            if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_11))) __PYX_ERR(0, 80, __pyx_L15_error)
-            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __pyx_t_14 = (__pyx_v_best == 0);
+          __pyx_t_2 = __pyx_t_14;
+          __pyx_L29_bool_binop_done:;
+          if (__pyx_t_2) {
+
+            /* "cython_ext/fuzzy_cython.pyx":458
+ *                     best_end = j + 1
+ *                     if first or best == 0:
+ *                         break             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(col)
+*/
+            goto __pyx_L24_break;
+
+            /* "cython_ext/fuzzy_cython.pyx":457
+ *                     best = col[m]
+ *                     best_end = j + 1
+ *                     if first or best == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *         finally:
+*/
           }
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j); __pyx_8genexpr1__pyx_v_j = 0;
-          goto __pyx_L19_exit_scope;
-          __pyx_L15_error:;
-          __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j); __pyx_8genexpr1__pyx_v_j = 0;
-          goto __pyx_L1_error;
-          __pyx_L19_exit_scope:;
-        } /* exit inner scope */
-        __pyx_t_2 = __pyx_t_5;
-        __pyx_t_5 = 0;
-      } else {
-        __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_2 = __pyx_t_5;
-        __pyx_t_5 = 0;
+
+          /* "cython_ext/fuzzy_cython.pyx":454
+ *                     diag = above
+ *                     col[i] = value
+ *                 if col[m] < best:             # <<<<<<<<<<<<<<
+ *                     best = col[m]
+ *                     best_end = j + 1
+*/
+        }
       }
-      __Pyx_XDECREF_SET(__pyx_v_after, ((PyObject*)__pyx_t_2));
-      __pyx_t_2 = 0;
+      __pyx_L24_break:;
+    }
+
+    /* "cython_ext/fuzzy_cython.pyx":460
+ *                         break
+ *         finally:
+ *             free(col)             # <<<<<<<<<<<<<<
+ *     if best_end < 0:
+ *         return -1
+*/
+    /*finally:*/ {
+      /*normal exit:*/{
+        free(__pyx_v_col);
+        goto __pyx_L20;
+      }
+      __pyx_L19_error:;
+      /*exception exit:*/{
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0; __pyx_t_26 = 0; __pyx_t_27 = 0; __pyx_t_28 = 0;
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+         __Pyx_ExceptionSwap(&__pyx_t_26, &__pyx_t_27, &__pyx_t_28);
+        if ( unlikely(__Pyx_GetException(&__pyx_t_23, &__pyx_t_24, &__pyx_t_25) < 0)) __Pyx_ErrFetch(&__pyx_t_23, &__pyx_t_24, &__pyx_t_25);
+        __Pyx_XGOTREF(__pyx_t_23);
+        __Pyx_XGOTREF(__pyx_t_24);
+        __Pyx_XGOTREF(__pyx_t_25);
+        __Pyx_XGOTREF(__pyx_t_26);
+        __Pyx_XGOTREF(__pyx_t_27);
+        __Pyx_XGOTREF(__pyx_t_28);
+        __pyx_t_5 = __pyx_lineno; __pyx_t_9 = __pyx_clineno; __pyx_t_22 = __pyx_filename;
+        {
+          free(__pyx_v_col);
+        }
+        __Pyx_XGIVEREF(__pyx_t_26);
+        __Pyx_XGIVEREF(__pyx_t_27);
+        __Pyx_XGIVEREF(__pyx_t_28);
+        __Pyx_ExceptionReset(__pyx_t_26, __pyx_t_27, __pyx_t_28);
+        __Pyx_XGIVEREF(__pyx_t_23);
+        __Pyx_XGIVEREF(__pyx_t_24);
+        __Pyx_XGIVEREF(__pyx_t_25);
+        __Pyx_ErrRestore(__pyx_t_23, __pyx_t_24, __pyx_t_25);
+        __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0; __pyx_t_26 = 0; __pyx_t_27 = 0; __pyx_t_28 = 0;
+        __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_9; __pyx_filename = __pyx_t_22;
+        goto __pyx_L1_error;
+      }
+      __pyx_L20:;
+    }
+  }
+  __pyx_L3:;
+
+  /* "cython_ext/fuzzy_cython.pyx":461
+ *         finally:
+ *             free(col)
+ *     if best_end < 0:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     end_out[0] = best_end
+*/
+  __pyx_t_2 = (__pyx_v_best_end < 0);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":462
+ *             free(col)
+ *     if best_end < 0:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     end_out[0] = best_end
+ *     return best
+*/
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":461
+ *         finally:
+ *             free(col)
+ *     if best_end < 0:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     end_out[0] = best_end
+*/
+  }
+
+  /* "cython_ext/fuzzy_cython.pyx":463
+ *     if best_end < 0:
+ *         return -1
+ *     end_out[0] = best_end             # <<<<<<<<<<<<<<
+ *     return best
+ * 
+*/
+  (__pyx_v_end_out[0]) = __pyx_v_best_end;
+
+  /* "cython_ext/fuzzy_cython.pyx":464
+ *         return -1
+ *     end_out[0] = best_end
+ *     return best             # <<<<<<<<<<<<<<
+ * 
+ * cpdef object best_window(str pattern, str text, int max_distance):
+*/
+  __pyx_r = __pyx_v_best;
+  goto __pyx_L0;
+
+  /* "cython_ext/fuzzy_cython.pyx":376
+ * # --- Best-window (semi-global) matching ---
+ * 
+ * cdef int _window_end(str pattern, str text, int max_distance, bint first, int *end_out):             # <<<<<<<<<<<<<<
+ *     """
+ *     Smallest distance (<= max_distance) between pattern and any substring of
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython._window_end", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_other_eq);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_ext/fuzzy_cython.pyx":466
+ *     return best
+ * 
+ * cpdef object best_window(str pattern, str text, int max_distance):             # <<<<<<<<<<<<<<
+ *     """
+ *     Best approximate occurrence of pattern inside text (semi-global alignment).
+*/
+
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_13best_window(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_10cython_ext_12fuzzy_cython_best_window(PyObject *__pyx_v_pattern, PyObject *__pyx_v_text, int __pyx_v_max_distance, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  int __pyx_v_m;
+  int __pyx_v_end;
+  int __pyx_v_back;
+  int __pyx_v_distance;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("best_window", 0);
 
-      /* "cython_ext/fuzzy_cython.pyx":81
- *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
- *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
- *             results.append((i+1, line.strip(), before, after, score))             # <<<<<<<<<<<<<<
- *             results_found += 1
- *             if results_found >= max_results:
+  /* "cython_ext/fuzzy_cython.pyx":472
+ *     max_distance edits, or None.
+ *     """
+ *     cdef int m = len(pattern)             # <<<<<<<<<<<<<<
+ *     cdef int end = 0, back = 0, distance
+ *     if m == 0 or m - max_distance > len(text):
 */
-      __pyx_t_2 = __Pyx_PyLong_AddObjC(__pyx_v_i, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_10 = __pyx_v_line;
-      __Pyx_INCREF(__pyx_t_10);
-      __pyx_t_6 = 0;
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_10, NULL};
-        __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-      }
-      __pyx_t_10 = PyFloat_FromDouble(__pyx_v_score); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 81, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_10);
-      __pyx_t_11 = PyTuple_New(5); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 81, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      __Pyx_GIVEREF(__pyx_t_2);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_2) != (0)) __PYX_ERR(0, 81, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_5);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_5) != (0)) __PYX_ERR(0, 81, __pyx_L1_error);
-      __Pyx_INCREF(__pyx_v_before);
-      __Pyx_GIVEREF(__pyx_v_before);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_v_before) != (0)) __PYX_ERR(0, 81, __pyx_L1_error);
-      __Pyx_INCREF(__pyx_v_after);
-      __Pyx_GIVEREF(__pyx_v_after);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 3, __pyx_v_after) != (0)) __PYX_ERR(0, 81, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_10);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 4, __pyx_t_10) != (0)) __PYX_ERR(0, 81, __pyx_L1_error);
-      __pyx_t_2 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_10 = 0;
-      __pyx_t_22 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_11); if (unlikely(__pyx_t_22 == ((int)-1))) __PYX_ERR(0, 81, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (unlikely(__pyx_v_pattern == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 472, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_pattern); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 472, __pyx_L1_error)
+  __pyx_v_m = __pyx_t_1;
 
-      /* "cython_ext/fuzzy_cython.pyx":82
- *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
- *             results.append((i+1, line.strip(), before, after, score))
- *             results_found += 1             # <<<<<<<<<<<<<<
- *             if results_found >= max_results:
- *                 break
+  /* "cython_ext/fuzzy_cython.pyx":473
+ *     """
+ *     cdef int m = len(pattern)
+ *     cdef int end = 0, back = 0, distance             # <<<<<<<<<<<<<<
+ *     if m == 0 or m - max_distance > len(text):
+ *         return None
 */
-      __pyx_v_results_found = (__pyx_v_results_found + 1);
+  __pyx_v_end = 0;
+  __pyx_v_back = 0;
 
-      /* "cython_ext/fuzzy_cython.pyx":83
- *             results.append((i+1, line.strip(), before, after, score))
- *             results_found += 1
- *             if results_found >= max_results:             # <<<<<<<<<<<<<<
- *                 break
- *     return results
+  /* "cython_ext/fuzzy_cython.pyx":474
+ *     cdef int m = len(pattern)
+ *     cdef int end = 0, back = 0, distance
+ *     if m == 0 or m - max_distance > len(text):             # <<<<<<<<<<<<<<
+ *         return None
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
 */
-      __pyx_t_9 = (__pyx_v_results_found >= __pyx_v_max_results);
-      if (__pyx_t_9) {
+  __pyx_t_3 = (__pyx_v_m == 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  if (unlikely(__pyx_v_text == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 474, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyUnicode_GET_LENGTH(__pyx_v_text); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 474, __pyx_L1_error)
+  __pyx_t_3 = ((__pyx_v_m - __pyx_v_max_distance) > __pyx_t_1);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
 
-        /* "cython_ext/fuzzy_cython.pyx":84
- *             results_found += 1
- *             if results_found >= max_results:
- *                 break             # <<<<<<<<<<<<<<
- *     return results
+    /* "cython_ext/fuzzy_cython.pyx":475
+ *     cdef int end = 0, back = 0, distance
+ *     if m == 0 or m - max_distance > len(text):
+ *         return None             # <<<<<<<<<<<<<<
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
+ *     if distance < 0:
 */
-        goto __pyx_L4_break;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-        /* "cython_ext/fuzzy_cython.pyx":83
- *             results.append((i+1, line.strip(), before, after, score))
- *             results_found += 1
- *             if results_found >= max_results:             # <<<<<<<<<<<<<<
- *                 break
- *     return results
+    /* "cython_ext/fuzzy_cython.pyx":474
+ *     cdef int m = len(pattern)
+ *     cdef int end = 0, back = 0, distance
+ *     if m == 0 or m - max_distance > len(text):             # <<<<<<<<<<<<<<
+ *         return None
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
 */
-      }
+  }
 
-      /* "cython_ext/fuzzy_cython.pyx":78
- *         line = lines[i]
- *         score = similarity_ratio(pattern, line)
- *         if score >= threshold:             # <<<<<<<<<<<<<<
- *             before = [lines[j].strip() for j in range(max(0, i-context), i)] if context else []
- *             after = [lines[j].strip() for j in range(i+1, min(n_lines, i+1+context))] if context else []
+  /* "cython_ext/fuzzy_cython.pyx":476
+ *     if m == 0 or m - max_distance > len(text):
+ *         return None
+ *     distance = _window_end(pattern, text, max_distance, False, &end)             # <<<<<<<<<<<<<<
+ *     if distance < 0:
+ *         return None
 */
-    }
+  __pyx_t_4 = __pyx_f_10cython_ext_12fuzzy_cython__window_end(__pyx_v_pattern, __pyx_v_text, __pyx_v_max_distance, 0, (&__pyx_v_end)); if (unlikely(__pyx_t_4 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 476, __pyx_L1_error)
+  __pyx_v_distance = __pyx_t_4;
 
-    /* "cython_ext/fuzzy_cython.pyx":75
- *     cdef int results_found = 0
- *     results = []
- *     for i in range(n_lines):             # <<<<<<<<<<<<<<
- *         line = lines[i]
- *         score = similarity_ratio(pattern, line)
+  /* "cython_ext/fuzzy_cython.pyx":477
+ *         return None
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
+ *     if distance < 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     # Align the reversed pattern backwards from end to find where the window starts
+*/
+  __pyx_t_2 = (__pyx_v_distance < 0);
+  if (__pyx_t_2) {
+
+    /* "cython_ext/fuzzy_cython.pyx":478
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
+ *     if distance < 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     # Align the reversed pattern backwards from end to find where the window starts
+ *     _window_end(pattern[::-1], text[end - 1::-1], distance, True, &back)
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "cython_ext/fuzzy_cython.pyx":477
+ *         return None
+ *     distance = _window_end(pattern, text, max_distance, False, &end)
+ *     if distance < 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     # Align the reversed pattern backwards from end to find where the window starts
 */
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  goto __pyx_L21_for_end;
-  __pyx_L4_break:;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  goto __pyx_L21_for_end;
-  __pyx_L21_for_end:;
 
-  /* "cython_ext/fuzzy_cython.pyx":85
- *             if results_found >= max_results:
- *                 break
- *     return results             # <<<<<<<<<<<<<<
+  /* "cython_ext/fuzzy_cython.pyx":480
+ *         return None
+ *     # Align the reversed pattern backwards from end to find where the window starts
+ *     _window_end(pattern[::-1], text[end - 1::-1], distance, True, &back)             # <<<<<<<<<<<<<<
+ *     return distance, end - back, end
+*/
+  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_v_pattern, __pyx_mstate_global->__pyx_slice[1]); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyLong_From_long((__pyx_v_end - 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PySlice_New(__pyx_t_6, Py_None, __pyx_mstate_global->__pyx_int_neg_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_text, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_4 = __pyx_f_10cython_ext_12fuzzy_cython__window_end(((PyObject*)__pyx_t_5), ((PyObject*)__pyx_t_6), __pyx_v_distance, 1, (&__pyx_v_back)); if (unlikely(__pyx_t_4 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":481
+ *     # Align the reversed pattern backwards from end to find where the window starts
+ *     _window_end(pattern[::-1], text[end - 1::-1], distance, True, &back)
+ *     return distance, end - back, end             # <<<<<<<<<<<<<<
 */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_results);
-  __pyx_r = __pyx_v_results;
+  __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_distance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_end - __pyx_v_back)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = __Pyx_PyLong_From_int(__pyx_v_end); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6) != (0)) __PYX_ERR(0, 481, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_5) != (0)) __PYX_ERR(0, 481, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7) != (0)) __PYX_ERR(0, 481, __pyx_L1_error);
+  __pyx_t_6 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "cython_ext/fuzzy_cython.pyx":67
- *     return 1.0 - dist / max_len
+  /* "cython_ext/fuzzy_cython.pyx":466
+ *     return best
  * 
- * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
+ * cpdef object best_window(str pattern, str text, int max_distance):             # <<<<<<<<<<<<<<
  *     """
- *     Fuzzy search for pattern in a list of lines.
+ *     Best approximate occurrence of pattern inside text (semi-global alignment).
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_21);
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.best_window", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_results);
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v_before);
-  __Pyx_XDECREF(__pyx_v_after);
-  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_j);
-  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_j);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5fuzzy_search(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_13best_window(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_4fuzzy_search, "\n    Fuzzy search for pattern in a list of lines.\n    Returns a list of (line_number, line, context_before, context_after) for matches above threshold.\n    ");
-static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_5fuzzy_search = {"fuzzy_search", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_5fuzzy_search, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_4fuzzy_search};
-static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_5fuzzy_search(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_10cython_ext_12fuzzy_cython_12best_window, "\n    Best approximate occurrence of pattern inside text (semi-global alignment).\n    Returns (distance, start, end) for the leftmost, shortest window within\n    max_distance edits, or None.\n    ");
+static PyMethodDef __pyx_mdef_10cython_ext_12fuzzy_cython_13best_window = {"best_window", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_12fuzzy_cython_13best_window, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_12fuzzy_cython_12best_window};
+static PyObject *__pyx_pw_10cython_ext_12fuzzy_cython_13best_window(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -20663,21 +26337,19 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
   PyObject *__pyx_v_pattern = 0;
-  PyObject *__pyx_v_lines = 0;
-  double __pyx_v_threshold;
-  int __pyx_v_context;
-  int __pyx_v_max_results;
+  PyObject *__pyx_v_text = 0;
+  int __pyx_v_max_distance;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[5] = {0,0,0,0,0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("fuzzy_search (wrapper)", 0);
+  __Pyx_RefNannySetupContext("best_window (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -20687,96 +26359,61 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pattern,&__pyx_mstate_global->__pyx_n_u_lines,&__pyx_mstate_global->__pyx_n_u_threshold,&__pyx_mstate_global->__pyx_n_u_context,&__pyx_mstate_global->__pyx_n_u_max_results,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pattern,&__pyx_mstate_global->__pyx_n_u_text,&__pyx_mstate_global->__pyx_n_u_max_distance,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 67, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 466, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  5:
-        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 67, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 67, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 67, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 466, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 67, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 466, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 67, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 466, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fuzzy_search", 0) < 0) __PYX_ERR(0, 67, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fuzzy_search", 0, 2, 5, i); __PYX_ERR(0, 67, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "best_window", 0) < 0) __PYX_ERR(0, 466, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("best_window", 1, 3, 3, i); __PYX_ERR(0, 466, __pyx_L3_error) }
       }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      switch (__pyx_nargs) {
-        case  5:
-        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 67, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 67, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 67, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 67, __pyx_L3_error)
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 67, __pyx_L3_error)
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 466, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 466, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 466, __pyx_L3_error)
     }
     __pyx_v_pattern = ((PyObject*)values[0]);
-    __pyx_v_lines = ((PyObject*)values[1]);
-    if (values[2]) {
-      __pyx_v_threshold = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_threshold == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
-    } else {
-      __pyx_v_threshold = ((double)0.7);
-    }
-    if (values[3]) {
-      __pyx_v_context = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_context == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
-    } else {
-      __pyx_v_context = ((int)0);
-    }
-    if (values[4]) {
-      __pyx_v_max_results = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_max_results == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
-    } else {
-      __pyx_v_max_results = ((int)0x3E8);
-    }
+    __pyx_v_text = ((PyObject*)values[1]);
+    __pyx_v_max_distance = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_max_distance == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 466, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fuzzy_search", 0, 2, 5, __pyx_nargs); __PYX_ERR(0, 67, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("best_window", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 466, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.best_window", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pattern), (&PyUnicode_Type), 1, "pattern", 1))) __PYX_ERR(0, 67, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lines), (&PyList_Type), 1, "lines", 1))) __PYX_ERR(0, 67, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_4fuzzy_search(__pyx_self, __pyx_v_pattern, __pyx_v_lines, __pyx_v_threshold, __pyx_v_context, __pyx_v_max_results);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pattern), (&PyUnicode_Type), 1, "pattern", 1))) __PYX_ERR(0, 466, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_text), (&PyUnicode_Type), 1, "text", 1))) __PYX_ERR(0, 466, __pyx_L1_error)
+  __pyx_r = __pyx_pf_10cython_ext_12fuzzy_cython_12best_window(__pyx_self, __pyx_v_pattern, __pyx_v_text, __pyx_v_max_distance);
 
   /* function exit code */
   goto __pyx_L0;
@@ -20795,21 +26432,16 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_4fuzzy_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_lines, double __pyx_v_threshold, int __pyx_v_context, int __pyx_v_max_results) {
+static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_12best_window(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pattern, PyObject *__pyx_v_text, int __pyx_v_max_distance) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_10cython_ext_12fuzzy_cython_fuzzy_search __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fuzzy_search", 0);
+  __Pyx_RefNannySetupContext("best_window", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 3;
-  __pyx_t_2.threshold = __pyx_v_threshold;
-  __pyx_t_2.context = __pyx_v_context;
-  __pyx_t_2.max_results = __pyx_v_max_results;
-  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_fuzzy_search(__pyx_v_pattern, __pyx_v_lines, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10cython_ext_12fuzzy_cython_best_window(__pyx_v_pattern, __pyx_v_text, __pyx_v_max_distance, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -20818,7 +26450,7 @@ static PyObject *__pyx_pf_10cython_ext_12fuzzy_cython_4fuzzy_search(CYTHON_UNUSE
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cython_ext.fuzzy_cython.fuzzy_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_ext.fuzzy_cython.best_window", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -21920,7 +27552,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #endif
   __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 272, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_mstate->__pyx_ptype_5numpy_dtype = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "dtype",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
@@ -21930,7 +27562,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArray_Descr),
   #endif
-  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 272, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 229, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_flatiter = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "flatiter",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayIterObject),
@@ -21939,7 +27571,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayIterObject),
   #endif
-  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 317, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 274, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_broadcast = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "broadcast",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayMultiIterObject),
@@ -21948,7 +27580,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayMultiIterObject),
   #endif
-  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 321, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 278, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_ndarray = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "ndarray",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayObject),
@@ -21957,7 +27589,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyArrayObject),
   #endif
-  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 360, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 317, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_generic = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "generic",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -21966,7 +27598,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_generic) __PYX_ERR(2, 873, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_generic) __PYX_ERR(2, 826, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_number = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "number",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -21975,7 +27607,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_number) __PYX_ERR(2, 875, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_number) __PYX_ERR(2, 828, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_integer = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "integer",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -21984,7 +27616,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_integer) __PYX_ERR(2, 877, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_integer) __PYX_ERR(2, 830, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "signedinteger",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -21993,7 +27625,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 879, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 832, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "unsignedinteger",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22002,7 +27634,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 881, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 834, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_inexact = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "inexact",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22011,7 +27643,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 883, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 836, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_floating = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "floating",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22020,7 +27652,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_floating) __PYX_ERR(2, 885, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_floating) __PYX_ERR(2, 838, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "complexfloating",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22029,7 +27661,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 887, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 840, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_flexible = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "flexible",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22038,7 +27670,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 889, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 842, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_character = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "character",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
@@ -22047,7 +27679,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_character) __PYX_ERR(2, 891, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_character) __PYX_ERR(2, 844, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_5numpy_ufunc = __Pyx_ImportType_3_1_1(__pyx_t_1, "numpy", "ufunc",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyUFuncObject),
@@ -22056,7 +27688,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_1_1(PyUFuncObject),
   #endif
-  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 955, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Ignore_3_1_1); if (!__pyx_mstate->__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 908, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -22267,6 +27899,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_fuzzy_cython(PyObject *__pyx_pyini
   size_t __pyx_t_7;
   static PyThread_type_lock __pyx_t_8[8];
   int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -22907,59 +28540,120 @@ __Pyx_RefNannySetupContext("PyInit_fuzzy_cython", 0);
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
  * cimport numpy as np
- * 
+ * from libc.stdint cimport uint32_t, uint64_t
 */
   __pyx_t_5 = __Pyx_ImportDottedModule(__pyx_mstate_global->__pyx_n_u_numpy, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_5) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_ext/fuzzy_cython.pyx":19
- *             return c
+  /* "cython_ext/fuzzy_cython.pyx":120
+ *         free(curr)
+ * 
+ * cpdef int bounded_levenshtein(str s1, str s2, int max_distance):             # <<<<<<<<<<<<<<
+ *     """
+ *     Levenshtein distance between s1 and s2, or max_distance + 1 as soon as it
+*/
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_1bounded_levenshtein, 0, __pyx_mstate_global->__pyx_n_u_bounded_levenshtein, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 120, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_bounded_levenshtein, __pyx_t_5) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":141
+ *     return _banded(s1, s2, max_distance)
  * 
  * cpdef int levenshtein(str s1, str s2):             # <<<<<<<<<<<<<<
  *     """
  *     Compute the Levenshtein distance between two Unicode strings.
 */
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_1levenshtein, 0, __pyx_mstate_global->__pyx_n_u_levenshtein, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_3levenshtein, 0, __pyx_mstate_global->__pyx_n_u_levenshtein, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 141, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_levenshtein, __pyx_t_5) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_levenshtein, __pyx_t_5) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_ext/fuzzy_cython.pyx":56
- *     return prev_row_mv[len2]
+  /* "cython_ext/fuzzy_cython.pyx":148
+ *     return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))
  * 
  * cpdef double similarity_ratio(str s1, str s2):             # <<<<<<<<<<<<<<
  *     """
  *     Return a similarity ratio between 0.0 and 1.0 based on Levenshtein distance.
 */
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_3similarity_ratio, 0, __pyx_mstate_global->__pyx_n_u_similarity_ratio, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_5similarity_ratio, 0, __pyx_mstate_global->__pyx_n_u_similarity_ratio, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_similarity_ratio, __pyx_t_5) < 0) __PYX_ERR(0, 56, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_similarity_ratio, __pyx_t_5) < 0) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_ext/fuzzy_cython.pyx":67
+  /* "cython_ext/fuzzy_cython.pyx":159
  *     return 1.0 - dist / max_len
  * 
  * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
  *     """
  *     Fuzzy search for pattern in a list of lines.
 */
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_5fuzzy_search, 0, __pyx_mstate_global->__pyx_n_u_fuzzy_search, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_7fuzzy_search, 0, __pyx_mstate_global->__pyx_n_u_fuzzy_search, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_mstate_global->__pyx_tuple[2]);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fuzzy_search, __pyx_t_5) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fuzzy_search, __pyx_t_5) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":180
+ * # --- Batch scoring ---
+ * 
+ * def encode_lines(list lines):             # <<<<<<<<<<<<<<
+ *     """
+ *     Pack lines into one contiguous code-point buffer.
+*/
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_9encode_lines, 0, __pyx_mstate_global->__pyx_n_u_encode_lines, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_encode_lines, __pyx_t_5) < 0) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":307
+ *     return 1.0 - <double>distance / length
+ * 
+ * def fuzzy_score_block(str pattern, lines, double threshold=0.0, bint strict=False, bint parallel=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Score every line against pattern in one GIL-released loop.
+*/
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyBool_FromLong(((int)0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyBool_FromLong(((int)0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_10 = PyTuple_Pack(3, __pyx_t_5, __pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_11fuzzy_score_block, 0, __pyx_mstate_global->__pyx_n_u_fuzzy_score_block, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_6, __pyx_t_10);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fuzzy_score_block, __pyx_t_6) < 0) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "cython_ext/fuzzy_cython.pyx":466
+ *     return best
+ * 
+ * cpdef object best_window(str pattern, str text, int max_distance):             # <<<<<<<<<<<<<<
+ *     """
+ *     Best approximate occurrence of pattern inside text (semi-global alignment).
+*/
+  __pyx_t_6 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_12fuzzy_cython_13best_window, 0, __pyx_mstate_global->__pyx_n_u_best_window, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_fuzzy_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_best_window, __pyx_t_6) < 0) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
   /* "cython_ext/fuzzy_cython.pyx":1
  * # cython: language_level=3             # <<<<<<<<<<<<<<
  * 
  * import numpy as np
 */
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_5) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_6) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -22968,6 +28662,7 @@ __Pyx_RefNannySetupContext("PyInit_fuzzy_cython", 0);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_10);
   if (__pyx_m) {
     if (__pyx_mstate->__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init cython_ext.fuzzy_cython", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -23058,18 +28753,24 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__4 */
   {__pyx_k__5, sizeof(__pyx_k__5), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__5 */
   {__pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__6 */
+  {__pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__7 */
   {__pyx_k_abc, sizeof(__pyx_k_abc), 0, 1, 1}, /* PyObject cname: __pyx_n_u_abc */
   {__pyx_k_add_note, sizeof(__pyx_k_add_note), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_add_note */
   {__pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 1, 1}, /* PyObject cname: __pyx_n_u_allocate_buffer */
   {__pyx_k_and, sizeof(__pyx_k_and), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_and */
-  {__pyx_k_arange, sizeof(__pyx_k_arange), 0, 1, 1}, /* PyObject cname: __pyx_n_u_arange */
+  {__pyx_k_ascii_eq, sizeof(__pyx_k_ascii_eq), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ascii_eq */
+  {__pyx_k_ascontiguousarray, sizeof(__pyx_k_ascontiguousarray), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ascontiguousarray */
   {__pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_asyncio_coroutines */
   {__pyx_k_at_0x, sizeof(__pyx_k_at_0x), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_at_0x */
   {__pyx_k_base, sizeof(__pyx_k_base), 0, 1, 1}, /* PyObject cname: __pyx_n_u_base */
+  {__pyx_k_best_window, sizeof(__pyx_k_best_window), 0, 1, 1}, /* PyObject cname: __pyx_n_u_best_window */
+  {__pyx_k_bounded_levenshtein, sizeof(__pyx_k_bounded_levenshtein), 0, 1, 1}, /* PyObject cname: __pyx_n_u_bounded_levenshtein */
   {__pyx_k_c, sizeof(__pyx_k_c), 0, 1, 1}, /* PyObject cname: __pyx_n_u_c */
   {__pyx_k_class, sizeof(__pyx_k_class), 0, 1, 1}, /* PyObject cname: __pyx_n_u_class */
   {__pyx_k_class_getitem, sizeof(__pyx_k_class_getitem), 0, 1, 1}, /* PyObject cname: __pyx_n_u_class_getitem */
   {__pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_cline_in_traceback */
+  {__pyx_k_code_view, sizeof(__pyx_k_code_view), 0, 1, 1}, /* PyObject cname: __pyx_n_u_code_view */
+  {__pyx_k_codes, sizeof(__pyx_k_codes), 0, 1, 1}, /* PyObject cname: __pyx_n_u_codes */
   {__pyx_k_collections_abc, sizeof(__pyx_k_collections_abc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_collections_abc */
   {__pyx_k_context, sizeof(__pyx_k_context), 0, 1, 1}, /* PyObject cname: __pyx_n_u_context */
   {__pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_contiguous_and_direct */
@@ -23081,35 +28782,49 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_disable */
   {__pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 1, 1}, /* PyObject cname: __pyx_n_u_dtype */
   {__pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 1, 1}, /* PyObject cname: __pyx_n_u_dtype_is_object */
+  {__pyx_k_empty, sizeof(__pyx_k_empty), 0, 1, 1}, /* PyObject cname: __pyx_n_u_empty */
   {__pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_enable */
   {__pyx_k_encode, sizeof(__pyx_k_encode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encode */
+  {__pyx_k_encode_lines, sizeof(__pyx_k_encode_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encode_lines */
   {__pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_enumerate */
   {__pyx_k_error, sizeof(__pyx_k_error), 0, 1, 1}, /* PyObject cname: __pyx_n_u_error */
   {__pyx_k_flags, sizeof(__pyx_k_flags), 0, 1, 1}, /* PyObject cname: __pyx_n_u_flags */
+  {__pyx_k_float64, sizeof(__pyx_k_float64), 0, 1, 1}, /* PyObject cname: __pyx_n_u_float64 */
   {__pyx_k_format, sizeof(__pyx_k_format), 0, 1, 1}, /* PyObject cname: __pyx_n_u_format */
   {__pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fortran */
+  {__pyx_k_found, sizeof(__pyx_k_found), 0, 1, 1}, /* PyObject cname: __pyx_n_u_found */
+  {__pyx_k_frombuffer, sizeof(__pyx_k_frombuffer), 0, 1, 1}, /* PyObject cname: __pyx_n_u_frombuffer */
   {__pyx_k_func, sizeof(__pyx_k_func), 0, 1, 1}, /* PyObject cname: __pyx_n_u_func */
+  {__pyx_k_fuzzy_score_block, sizeof(__pyx_k_fuzzy_score_block), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fuzzy_score_block */
   {__pyx_k_fuzzy_search, sizeof(__pyx_k_fuzzy_search), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fuzzy_search */
   {__pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_gc */
+  {__pyx_k_get, sizeof(__pyx_k_get), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get */
   {__pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_getstate */
   {__pyx_k_got, sizeof(__pyx_k_got), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_got */
   {__pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_got_differing_extents_in_dimensi */
+  {__pyx_k_i, sizeof(__pyx_k_i), 0, 1, 1}, /* PyObject cname: __pyx_n_u_i */
   {__pyx_k_id, sizeof(__pyx_k_id), 0, 1, 1}, /* PyObject cname: __pyx_n_u_id */
   {__pyx_k_import, sizeof(__pyx_k_import), 0, 1, 1}, /* PyObject cname: __pyx_n_u_import */
   {__pyx_k_index, sizeof(__pyx_k_index), 0, 1, 1}, /* PyObject cname: __pyx_n_u_index */
   {__pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 1, 1}, /* PyObject cname: __pyx_n_u_initializing */
-  {__pyx_k_int32, sizeof(__pyx_k_int32), 0, 1, 1}, /* PyObject cname: __pyx_n_u_int32 */
+  {__pyx_k_int64, sizeof(__pyx_k_int64), 0, 1, 1}, /* PyObject cname: __pyx_n_u_int64 */
   {__pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 1, 1}, /* PyObject cname: __pyx_n_u_is_coroutine */
   {__pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_isenabled */
   {__pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 1, 1}, /* PyObject cname: __pyx_n_u_itemsize */
   {__pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_itemsize_0_for_cython_array */
+  {__pyx_k_k, sizeof(__pyx_k_k), 0, 1, 1}, /* PyObject cname: __pyx_n_u_k */
   {__pyx_k_levenshtein, sizeof(__pyx_k_levenshtein), 0, 1, 1}, /* PyObject cname: __pyx_n_u_levenshtein */
   {__pyx_k_lines, sizeof(__pyx_k_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lines */
+  {__pyx_k_m, sizeof(__pyx_k_m), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m */
   {__pyx_k_main, sizeof(__pyx_k_main), 0, 1, 1}, /* PyObject cname: __pyx_n_u_main */
+  {__pyx_k_max_distance, sizeof(__pyx_k_max_distance), 0, 1, 1}, /* PyObject cname: __pyx_n_u_max_distance */
   {__pyx_k_max_results, sizeof(__pyx_k_max_results), 0, 1, 1}, /* PyObject cname: __pyx_n_u_max_results */
   {__pyx_k_memview, sizeof(__pyx_k_memview), 0, 1, 1}, /* PyObject cname: __pyx_n_u_memview */
   {__pyx_k_mode, sizeof(__pyx_k_mode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_mode */
   {__pyx_k_module, sizeof(__pyx_k_module), 0, 1, 1}, /* PyObject cname: __pyx_n_u_module */
+  {__pyx_k_n, sizeof(__pyx_k_n), 0, 1, 1}, /* PyObject cname: __pyx_n_u_n */
+  {__pyx_k_n_lines, sizeof(__pyx_k_n_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_n_lines */
+  {__pyx_k_n_other, sizeof(__pyx_k_n_other), 0, 1, 1}, /* PyObject cname: __pyx_n_u_n_other */
   {__pyx_k_name, sizeof(__pyx_k_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_name */
   {__pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_name_2 */
   {__pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ndim */
@@ -23121,7 +28836,14 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_numpy__core_umath_failed_to_impo, sizeof(__pyx_k_numpy__core_umath_failed_to_impo), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_numpy__core_umath_failed_to_impo */
   {__pyx_k_obj, sizeof(__pyx_k_obj), 0, 1, 1}, /* PyObject cname: __pyx_n_u_obj */
   {__pyx_k_object, sizeof(__pyx_k_object), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_object */
+  {__pyx_k_offset_view, sizeof(__pyx_k_offset_view), 0, 1, 1}, /* PyObject cname: __pyx_n_u_offset_view */
+  {__pyx_k_offsets, sizeof(__pyx_k_offsets), 0, 1, 1}, /* PyObject cname: __pyx_n_u_offsets */
+  {__pyx_k_other, sizeof(__pyx_k_other), 0, 1, 1}, /* PyObject cname: __pyx_n_u_other */
+  {__pyx_k_other_eq, sizeof(__pyx_k_other_eq), 0, 1, 1}, /* PyObject cname: __pyx_n_u_other_eq */
   {__pyx_k_pack, sizeof(__pyx_k_pack), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pack */
+  {__pyx_k_parallel, sizeof(__pyx_k_parallel), 0, 1, 1}, /* PyObject cname: __pyx_n_u_parallel */
+  {__pyx_k_pat, sizeof(__pyx_k_pat), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pat */
+  {__pyx_k_pat_view, sizeof(__pyx_k_pat_view), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pat_view */
   {__pyx_k_pattern, sizeof(__pyx_k_pattern), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pattern */
   {__pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pickle */
   {__pyx_k_pop, sizeof(__pyx_k_pop), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pop */
@@ -23138,6 +28860,8 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_register, sizeof(__pyx_k_register), 0, 1, 1}, /* PyObject cname: __pyx_n_u_register */
   {__pyx_k_s1, sizeof(__pyx_k_s1), 0, 1, 1}, /* PyObject cname: __pyx_n_u_s1 */
   {__pyx_k_s2, sizeof(__pyx_k_s2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_s2 */
+  {__pyx_k_score_view, sizeof(__pyx_k_score_view), 0, 1, 1}, /* PyObject cname: __pyx_n_u_score_view */
+  {__pyx_k_scores, sizeof(__pyx_k_scores), 0, 1, 1}, /* PyObject cname: __pyx_n_u_scores */
   {__pyx_k_set_name, sizeof(__pyx_k_set_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_set_name */
   {__pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_setstate */
   {__pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_setstate_cython */
@@ -23148,13 +28872,16 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_start, sizeof(__pyx_k_start), 0, 1, 1}, /* PyObject cname: __pyx_n_u_start */
   {__pyx_k_step, sizeof(__pyx_k_step), 0, 1, 1}, /* PyObject cname: __pyx_n_u_step */
   {__pyx_k_stop, sizeof(__pyx_k_stop), 0, 1, 1}, /* PyObject cname: __pyx_n_u_stop */
+  {__pyx_k_strict, sizeof(__pyx_k_strict), 0, 1, 1}, /* PyObject cname: __pyx_n_u_strict */
   {__pyx_k_strided_and_direct, sizeof(__pyx_k_strided_and_direct), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_direct */
   {__pyx_k_strided_and_direct_or_indirect, sizeof(__pyx_k_strided_and_direct_or_indirect), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_direct_or_indirect */
   {__pyx_k_strided_and_indirect, sizeof(__pyx_k_strided_and_indirect), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_indirect */
   {__pyx_k_strip, sizeof(__pyx_k_strip), 0, 1, 1}, /* PyObject cname: __pyx_n_u_strip */
   {__pyx_k_struct, sizeof(__pyx_k_struct), 0, 1, 1}, /* PyObject cname: __pyx_n_u_struct */
   {__pyx_k_test, sizeof(__pyx_k_test), 0, 1, 1}, /* PyObject cname: __pyx_n_u_test */
+  {__pyx_k_text, sizeof(__pyx_k_text), 0, 1, 1}, /* PyObject cname: __pyx_n_u_text */
   {__pyx_k_threshold, sizeof(__pyx_k_threshold), 0, 1, 1}, /* PyObject cname: __pyx_n_u_threshold */
+  {__pyx_k_uint32, sizeof(__pyx_k_uint32), 0, 1, 1}, /* PyObject cname: __pyx_n_u_uint32 */
   {__pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_unable_to_allocate_array_data */
   {__pyx_k_unable_to_allocate_shape_and_str, sizeof(__pyx_k_unable_to_allocate_shape_and_str), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_unable_to_allocate_shape_and_str */
   {__pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 1, 1}, /* PyObject cname: __pyx_n_u_unpack */
@@ -23170,17 +28897,17 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry const *t, PyObject **target, c
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_range); if (!__pyx_builtin_range) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_range); if (!__pyx_builtin_range) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 89, __pyx_L1_error)
   __pyx_builtin___import__ = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_import); if (!__pyx_builtin___import__) __PYX_ERR(1, 101, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 139, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 154, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 157, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
   __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(1, 373, __pyx_L1_error)
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_Ellipsis); if (!__pyx_builtin_Ellipsis) __PYX_ERR(1, 408, __pyx_L1_error)
   __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_id); if (!__pyx_builtin_id) __PYX_ERR(1, 618, __pyx_L1_error)
   __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(1, 914, __pyx_L1_error)
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1051, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1011, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -23228,14 +28955,24 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
 
-  /* "cython_ext/fuzzy_cython.pyx":67
+  /* "cython_ext/fuzzy_cython.pyx":480
+ *         return None
+ *     # Align the reversed pattern backwards from end to find where the window starts
+ *     _window_end(pattern[::-1], text[end - 1::-1], distance, True, &back)             # <<<<<<<<<<<<<<
+ *     return distance, end - back, end
+*/
+  __pyx_mstate_global->__pyx_slice[1] = PySlice_New(Py_None, Py_None, __pyx_mstate_global->__pyx_int_neg_1); if (unlikely(!__pyx_mstate_global->__pyx_slice[1])) __PYX_ERR(0, 480, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_slice[1]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_slice[1]);
+
+  /* "cython_ext/fuzzy_cython.pyx":159
  *     return 1.0 - dist / max_len
  * 
  * cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int context=0, int max_results=1000):             # <<<<<<<<<<<<<<
  *     """
  *     Fuzzy search for pattern in a list of lines.
 */
-  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(3, __pyx_mstate_global->__pyx_float_0_7, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_1000); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(3, __pyx_mstate_global->__pyx_float_0_7, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_1000); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
   __Pyx_RefNannyFinishContext();
@@ -23248,6 +28985,8 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
+  __pyx_mstate->__pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_get.method_name = &__pyx_mstate->__pyx_n_u_get;
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
   if (__Pyx_InitStrings(__pyx_string_tab, __pyx_mstate->__pyx_string_tab, __pyx_string_tab_encodings) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
@@ -23269,10 +29008,10 @@ static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
             unsigned int argcount : 3;
             unsigned int num_posonly_args : 1;
             unsigned int num_kwonly_args : 1;
-            unsigned int nlocals : 3;
+            unsigned int nlocals : 5;
             unsigned int flags : 10;
-            unsigned int first_line : 7;
-            unsigned int line_table_length : 13;
+            unsigned int first_line : 9;
+            unsigned int line_table_length : 14;
         } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -23289,19 +29028,39 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 19, 267};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 120, 136};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_s1, __pyx_mstate->__pyx_n_u_s2, __pyx_mstate->__pyx_n_u_max_distance};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_bounded_levenshtein, __pyx_k_Q_s_4r_AQ_E_Q_3aq_3aq_uBe2Q_Ba, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 141, 31};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_s1, __pyx_mstate->__pyx_n_u_s2};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_levenshtein, __pyx_k_Q_Cq_Cq_uCq_q_uCq_q_s_Q_q_42WAU, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_levenshtein, __pyx_k_Q_at83auCq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 56, 60};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 148, 60};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_s1, __pyx_mstate->__pyx_n_u_s2};
-    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_similarity_ratio, __pyx_k_Q_3auCq_xs_q_Kq_A_4r_b, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_similarity_ratio, __pyx_k_Q_3auCq_xs_q_Kq_A_4r_b, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 67, 207};
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 159, 207};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pattern, __pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_threshold, __pyx_mstate->__pyx_n_u_context, __pyx_mstate->__pyx_n_u_max_results};
-    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_fuzzy_search, __pyx_k_BBSSffg_s_1_Q_a_U_1_uAQ_6_A_Qe1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_fuzzy_search, __pyx_k_BBSSffg_s_1_Q_a_U_1_uAQ_6_A_Qe1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 180, 112};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_offsets, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_codes};
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_encode_lines, __pyx_k_1A_2_F_2Rs_U_1_q_E_Bc_uAQ_Bk_E, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 307, 539};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pattern, __pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_threshold, __pyx_mstate->__pyx_n_u_strict, __pyx_mstate->__pyx_n_u_parallel, __pyx_mstate->__pyx_n_u_codes, __pyx_mstate->__pyx_n_u_offsets, __pyx_mstate->__pyx_n_u_code_view, __pyx_mstate->__pyx_n_u_offset_view, __pyx_mstate->__pyx_n_u_n_lines, __pyx_mstate->__pyx_n_u_scores, __pyx_mstate->__pyx_n_u_score_view, __pyx_mstate->__pyx_n_u_pat_view, __pyx_mstate->__pyx_n_u_m, __pyx_mstate->__pyx_n_u_ascii_eq, __pyx_mstate->__pyx_n_u_other, __pyx_mstate->__pyx_n_u_other_eq, __pyx_mstate->__pyx_n_u_n_other, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_found, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_c, __pyx_mstate->__pyx_n_u_base, __pyx_mstate->__pyx_n_u_pat};
+    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_fuzzy_score_block, __pyx_k_SST_z_z_z_Qa_QgV2Q_R_A_6QSST_k, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 466, 127};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pattern, __pyx_mstate->__pyx_n_u_text, __pyx_mstate->__pyx_n_u_max_distance};
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_fuzzy_cython_pyx, __pyx_mstate->__pyx_n_u_best_window, __pyx_k_AQ_Q_r_Bc_2_Cq_q_9F_q_y_q_q_t4t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -26051,90 +31810,346 @@ static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObje
                         return -1;
                     PyErr_Clear();
                 }
-            }
-            return sm->sq_ass_item(o, i, v);
+            }
+            return sm->sq_ass_item(o, i, v);
+        }
+    }
+#else
+    if (is_list || !PyMapping_Check(o))
+    {
+        return PySequence_SetItem(o, i, v);
+    }
+#endif
+    return __Pyx_SetItemInt_Generic(o, PyLong_FromSsize_t(i), v);
+}
+
+/* RaiseUnboundLocalError */
+static void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* DivInt[long] */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b, int b_is_constant) {
+    long q = a / b;
+    long r = a - q*b;
+    long adapt_python = (b_is_constant ?
+        ((r != 0) & ((r < 0) ^ (b < 0))) :
+        ((r != 0) & ((r ^ b) < 0))
+    );
+    return q - adapt_python;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u__2);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
+    }
+    return value;
+}
+
+/* HasAttr */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+#endif
+
+/* unicode_iter */
+static CYTHON_INLINE int __Pyx_init_unicode_iteration(
+    PyObject* ustring, Py_ssize_t *length, void** data, int *kind) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    *kind   = 0;
+    *length = PyUnicode_GetLength(ustring);
+    *data   = (void*)ustring;
+#else
+    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return -1;
+    *kind   = PyUnicode_KIND(ustring);
+    *length = PyUnicode_GET_LENGTH(ustring);
+    *data   = PyUnicode_DATA(ustring);
+#endif
+    return 0;
+}
+
+/* PyObjectCall2Args */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args[3] = {NULL, arg1, arg2};
+    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    int was_initialized =  __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return __Pyx_CallCFunction(cfunc, self, arg);
+        } else if (flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, &arg, 1);
+        } else if (flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, &arg, 1, NULL);
+        }
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod1(&tmp_cfunc, self, arg);
+    }
+#endif
+    PyObject* result = __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *args = PyTuple_New(1);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+    } else
+#endif
+    {
+        result = __Pyx_PyObject_Call2Args(cfunc->method, self, arg);
+    }
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyBytes_CheckExact(key) || PyUnicode_CheckExact(key) || PyLong_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* GetItemIntUnicode */
+static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
+                                                           int wraparound, int boundscheck) {
+    Py_ssize_t length;
+    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return (Py_UCS4)-1;
+    if (wraparound | boundscheck) {
+        length = __Pyx_PyUnicode_GET_LENGTH(ustring);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(length < 0)) return (Py_UCS4)-1;
+        #endif
+        if (wraparound & unlikely(i < 0)) i += length;
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
+            return __Pyx_PyUnicode_READ_CHAR(ustring, i);
+        } else {
+            PyErr_SetString(PyExc_IndexError, "string index out of range");
+            return (Py_UCS4)-1;
+        }
+    } else {
+        return __Pyx_PyUnicode_READ_CHAR(ustring, i);
+    }
+}
+
+/* PyLongBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    long a, x;
+#ifdef HAVE_LONG_LONG
+    const PY_LONG_LONG llb = intval;
+    PY_LONG_LONG lla, llx;
+#endif
+    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+        return __Pyx_NewRef(op2);
+    }
+    if (likely(__Pyx_PyLong_IsCompact(op1))) {
+        a = __Pyx_PyLong_CompactValue(op1);
+    } else {
+        const digit* digits = __Pyx_PyLong_Digits(op1);
+        const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
+        switch (size) {
+            case -2:
+                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                    lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            case 2:
+                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            case -3:
+                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                    lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            case 3:
+                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            case -4:
+                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                    a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                    lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            case 4:
+                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                    a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    break;
+                #ifdef HAVE_LONG_LONG
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    goto long_long;
+                #endif
+                }
+                CYTHON_FALLTHROUGH;
+            default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
         }
     }
-#else
-    if (is_list || !PyMapping_Check(o))
-    {
-        return PySequence_SetItem(o, i, v);
-    }
+            x = a + b;
+        return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+    long_long:
+            llx = lla + llb;
+        return PyLong_FromLongLong(llx);
 #endif
-    return __Pyx_SetItemInt_Generic(o, PyLong_FromSsize_t(i), v);
-}
-
-/* RaiseUnboundLocalError */
-static void __Pyx_RaiseUnboundLocalError(const char *varname) {
-    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
-}
-
-/* DivInt[long] */
-static CYTHON_INLINE long __Pyx_div_long(long a, long b, int b_is_constant) {
-    long q = a / b;
-    long r = a - q*b;
-    long adapt_python = (b_is_constant ?
-        ((r != 0) & ((r < 0) ^ (b < 0))) :
-        ((r != 0) & ((r ^ b) < 0))
-    );
-    return q - adapt_python;
+    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+    
+    
 }
-
-/* ImportFrom */
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        const char* module_name_str = 0;
-        PyObject* module_name = 0;
-        PyObject* module_dot = 0;
-        PyObject* full_name = 0;
-        PyErr_Clear();
-        module_name_str = PyModule_GetName(module);
-        if (unlikely(!module_name_str)) { goto modbad; }
-        module_name = PyUnicode_FromString(module_name_str);
-        if (unlikely(!module_name)) { goto modbad; }
-        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u__2);
-        if (unlikely(!module_dot)) { goto modbad; }
-        full_name = PyUnicode_Concat(module_dot, name);
-        if (unlikely(!full_name)) { goto modbad; }
-        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
-                CYTHON_COMPILING_IN_GRAAL
-        {
-            PyObject *modules = PyImport_GetModuleDict();
-            if (unlikely(!modules))
-                goto modbad;
-            value = PyObject_GetItem(modules, full_name);
-        }
-        #else
-        value = PyImport_GetModule(full_name);
-        #endif
-      modbad:
-        Py_XDECREF(full_name);
-        Py_XDECREF(module_dot);
-        Py_XDECREF(module_name);
-    }
-    if (unlikely(!value)) {
-        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
-    }
-    return value;
+#endif
+static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
+        double result;
+        
+        result = ((double)a) + (double)b;
+        return PyFloat_FromDouble(result);
 }
-
-/* HasAttr */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
-    PyObject *r;
-    if (unlikely(!PyUnicode_Check(n))) {
-        PyErr_SetString(PyExc_TypeError,
-                        "hasattr(): attribute name must be string");
-        return -1;
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
     }
-    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
-    if (!r) {
-        return (unlikely(PyErr_Occurred())) ? -1 : 0;
-    } else {
-        Py_DECREF(r);
-        return 1;
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
     }
+    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
 }
 #endif
 
@@ -26744,156 +32759,46 @@ fail:;
      "Out of bounds on buffer access (axis %d)", axis);
 }
 
-/* GetItemIntUnicode */
-  static CYTHON_INLINE Py_UCS4 __Pyx_GetItemInt_Unicode_Fast(PyObject* ustring, Py_ssize_t i,
-                                                           int wraparound, int boundscheck) {
-    Py_ssize_t length;
-    if (unlikely(__Pyx_PyUnicode_READY(ustring) < 0)) return (Py_UCS4)-1;
-    if (wraparound | boundscheck) {
-        length = __Pyx_PyUnicode_GET_LENGTH(ustring);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely(length < 0)) return (Py_UCS4)-1;
-        #endif
-        if (wraparound & unlikely(i < 0)) i += length;
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
-            return __Pyx_PyUnicode_READ_CHAR(ustring, i);
-        } else {
-            PyErr_SetString(PyExc_IndexError, "string index out of range");
-            return (Py_UCS4)-1;
-        }
-    } else {
-        return __Pyx_PyUnicode_READ_CHAR(ustring, i);
-    }
+/* ErrOccurredWithGIL */
+  static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
+  int err;
+  PyGILState_STATE _save = PyGILState_Ensure();
+  err = !!PyErr_Occurred();
+  PyGILState_Release(_save);
+  return err;
 }
 
-/* PyLongBinop */
-  #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#if CYTHON_USE_PYLONG_INTERNALS
-static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    long a, x;
-#ifdef HAVE_LONG_LONG
-    const PY_LONG_LONG llb = intval;
-    PY_LONG_LONG lla, llx;
-#endif
-    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
-        return __Pyx_NewRef(op2);
-    }
-    if (likely(__Pyx_PyLong_IsCompact(op1))) {
-        a = __Pyx_PyLong_CompactValue(op1);
-    } else {
-        const digit* digits = __Pyx_PyLong_Digits(op1);
-        const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
-        switch (size) {
-            case -2:
-                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                    a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 2:
-                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                    a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case -3:
-                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                    a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 3:
-                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                    a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case -4:
-                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                    a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 4:
-                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                    a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
-        }
-    }
-            x = a + b;
-        return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-    long_long:
-            llx = lla + llb;
-        return PyLong_FromLongLong(llx);
-#endif
-    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
-    
-    
-}
-#endif
-static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
-        double result;
-        
-        result = ((double)a) + (double)b;
-        return PyFloat_FromDouble(result);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
+/* IterFinish */
+  static CYTHON_INLINE int __Pyx_IterFinish(void) {
+    PyObject* exc_type;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    exc_type = __Pyx_PyErr_CurrentExceptionType();
+    if (unlikely(exc_type)) {
+        if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))
+            return -1;
+        __Pyx_PyErr_Clear();
+        return 0;
     }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
+    return 0;
+}
+
+/* UnpackItemEndCheck */
+  static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
     }
-    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+    return __Pyx_IterFinish();
+}
+
+/* BufferIndexErrorNogil */
+  static void __Pyx_RaiseBufferIndexErrorNogil(int axis) {
+    PyGILState_STATE gilstate = PyGILState_Ensure();
+    __Pyx_RaiseBufferIndexError(axis);
+    PyGILState_Release(gilstate);
 }
-#endif
 
 /* CallTypeTraverse */
   #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
@@ -29513,18 +35418,64 @@ no_fail:
 }
 
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_nn___pyx_t_5numpy_int32_t(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn_uint32_t__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_nn_uint32_t__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int64_t__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
-    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
-                                                 PyBUF_RECORDS_RO | writable_flag, 1,
-                                                 &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, stack,
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_double, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -30459,32 +36410,286 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* CIntFromPy */
+  static CYTHON_INLINE uint64_t __Pyx_PyLong_As_uint64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint64_t neg_one = (uint64_t) -1, const_zero = (uint64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        uint64_t val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (uint64_t) -1;
+        val = __Pyx_PyLong_As_uint64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(uint64_t, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(uint64_t) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) >= 2 * PyLong_SHIFT)) {
+                            return (uint64_t) (((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(uint64_t) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) >= 3 * PyLong_SHIFT)) {
+                            return (uint64_t) (((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(uint64_t) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) >= 4 * PyLong_SHIFT)) {
+                            return (uint64_t) (((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (uint64_t) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(uint64_t) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(uint64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(uint64_t) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(uint64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(uint64_t, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(uint64_t) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT)) {
+                            return (uint64_t) (((uint64_t)-1)*(((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(uint64_t) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT)) {
+                            return (uint64_t) ((((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT)) {
+                            return (uint64_t) (((uint64_t)-1)*(((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(uint64_t) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT)) {
+                            return (uint64_t) ((((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 4 * PyLong_SHIFT)) {
+                            return (uint64_t) (((uint64_t)-1)*(((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(uint64_t) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(uint64_t) - 1 > 4 * PyLong_SHIFT)) {
+                            return (uint64_t) ((((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(uint64_t) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(uint64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(uint64_t) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(uint64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+        }
+    }
+    {
+        uint64_t val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (uint64_t) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (uint64_t) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (uint64_t) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (uint64_t) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(uint64_t) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((uint64_t) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(uint64_t) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((uint64_t) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((uint64_t) 1) << (sizeof(uint64_t) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (uint64_t) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to uint64_t");
+    return (uint64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to uint64_t");
+    return (uint64_t) -1;
+}
+
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+  static CYTHON_INLINE PyObject* __Pyx_PyLong_From_uint64_t(uint64_t value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
+    const uint64_t neg_one = (uint64_t) -1, const_zero = (uint64_t) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
+        if (sizeof(uint64_t) < sizeof(long)) {
             return PyLong_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
+        } else if (sizeof(uint64_t) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
 #if defined(HAVE_LONG_LONG) && !CYTHON_COMPILING_IN_PYPY
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+        } else if (sizeof(uint64_t) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
         }
     } else {
-        if (sizeof(long) <= sizeof(long)) {
+        if (sizeof(uint64_t) <= sizeof(long)) {
             return PyLong_FromLong((long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+        } else if (sizeof(uint64_t) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
 #endif
         }
@@ -30499,7 +36704,7 @@ raise_neg_overflow:
         }
 #elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
         int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
+        return _PyLong_FromByteArray(bytes, sizeof(uint64_t),
                                      little, !is_unsigned);
 #else
         int one = 1; int little = (int)*(unsigned char *)&one;
@@ -30507,7 +36712,7 @@ raise_neg_overflow:
         PyObject *py_bytes = NULL, *order_str = NULL;
         from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
         if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(uint64_t));
         if (!py_bytes) goto limited_bad;
         order_str = PyUnicode_FromString(little ? "little" : "big");
         if (!order_str) goto limited_bad;
@@ -30531,31 +36736,31 @@ raise_neg_overflow:
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyLong_From_npy_int32(npy_int32 value) {
+  static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const npy_int32 neg_one = (npy_int32) -1, const_zero = (npy_int32) 0;
+    const long neg_one = (long) -1, const_zero = (long) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
-        if (sizeof(npy_int32) < sizeof(long)) {
+        if (sizeof(long) < sizeof(long)) {
             return PyLong_FromLong((long) value);
-        } else if (sizeof(npy_int32) <= sizeof(unsigned long)) {
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
 #if defined(HAVE_LONG_LONG) && !CYTHON_COMPILING_IN_PYPY
-        } else if (sizeof(npy_int32) <= sizeof(unsigned PY_LONG_LONG)) {
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
         }
     } else {
-        if (sizeof(npy_int32) <= sizeof(long)) {
+        if (sizeof(long) <= sizeof(long)) {
             return PyLong_FromLong((long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(npy_int32) <= sizeof(PY_LONG_LONG)) {
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
 #endif
         }
@@ -30570,7 +36775,7 @@ raise_neg_overflow:
         }
 #elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
         int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(npy_int32),
+        return _PyLong_FromByteArray(bytes, sizeof(long),
                                      little, !is_unsigned);
 #else
         int one = 1; int little = (int)*(unsigned char *)&one;
@@ -30578,7 +36783,7 @@ raise_neg_overflow:
         PyObject *py_bytes = NULL, *order_str = NULL;
         from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
         if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(npy_int32));
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
         if (!py_bytes) goto limited_bad;
         order_str = PyUnicode_FromString(little ? "little" : "big");
         if (!order_str) goto limited_bad;
@@ -31213,7 +37418,7 @@ __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
         result = name;
         name = NULL;
     } else {
-        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__6);
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__7);
     }
     goto done;
 }
@@ -2,8 +2,11 @@
 
 import numpy as np
 cimport numpy as np
+from libc.stdint cimport uint32_t, uint64_t
+from cython.parallel cimport prange
+from libc.stdlib cimport malloc, free
 
-cdef inline int min3(int a, int b, int c):
+cdef inline int min3(int a, int b, int c) nogil:
     """Return the minimum of three integers."""
     if a < b:
         if a < c:
@@ -16,42 +19,131 @@ cdef inline int min3(int a, int b, int c):
         else:
             return c
 
-cpdef int levenshtein(str s1, str s2):
+cdef int _myers64(str pattern, str text, int max_distance):
     """
-    Compute the Levenshtein distance between two Unicode strings.
-    Handles all edge cases, including empty strings.
+    Bit-parallel global edit distance (Hyyrö's variant of Myers' algorithm)
+    for patterns of at most 64 characters, one machine word per column.
+    Returns max_distance + 1 once the distance cannot stay within max_distance.
+    """
+    cdef int m = len(pattern)
+    cdef int n = len(text)
+    cdef uint64_t ascii_eq[128]
+    cdef dict other_eq = {}
+    cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+    cdef uint64_t top = <uint64_t>1 << (m - 1)
+    cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh, bit = 1
+    cdef int score = m
+    cdef int remaining = n
+    cdef Py_UCS4 ch
+    cdef int i
+
+    for i in range(128):
+        ascii_eq[i] = 0
+    for ch in pattern:
+        if ch < 128:
+            ascii_eq[ch] |= bit
+        else:
+            other_eq[ch] = other_eq.get(ch, 0) | bit
+        bit <<= 1
+
+    for ch in text:
+        if ch < 128:
+            eq = ascii_eq[ch]
+        elif other_eq:
+            eq = other_eq.get(ch, 0)
+        else:
+            eq = 0
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & mask)
+        mh = vp & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        remaining -= 1
+        # Each remaining character lowers the last row by at most one
+        if score - remaining > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (~(xv | ph) & mask)
+        vn = ph & xv
+    return score if score <= max_distance else max_distance + 1
+
+cdef int _banded(str s1, str s2, int max_distance):
+    """
+    Levenshtein DP restricted to the diagonal band |i - j| <= max_distance,
+    stopping as soon as a whole row exceeds max_distance. len(s1) <= len(s2).
     """
     cdef int len1 = len(s1)
     cdef int len2 = len(s2)
-    cdef int i, j
+    cdef int big = max_distance + 1
+    cdef int i, j, lo, hi, cost, best, value
+    cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))
+    cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+    cdef int *tmp
+    if prev == NULL or curr == NULL:
+        free(prev)
+        free(curr)
+        raise MemoryError()
+    try:
+        for j in range(len2 + 1):
+            prev[j] = j if j <= max_distance else big
+        for i in range(1, len1 + 1):
+            lo = i - max_distance if i > max_distance else 1
+            hi = i + max_distance if i + max_distance < len2 else len2
+            curr[0] = i if i <= max_distance else big
+            if lo > 1:
+                curr[lo - 1] = big
+            best = curr[0] if lo == 1 else big
+            for j in range(lo, hi + 1):
+                cost = 0 if s1[i - 1] == s2[j - 1] else 1
+                value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
+                if value > big:
+                    value = big
+                curr[j] = value
+                if value < best:
+                    best = value
+            if hi < len2:
+                curr[hi + 1] = big
+            if best > max_distance:
+                return big
+            tmp = prev
+            prev = curr
+            curr = tmp
+        return prev[len2] if prev[len2] <= max_distance else big
+    finally:
+        free(prev)
+        free(curr)
 
-    # Edge cases
+cpdef int bounded_levenshtein(str s1, str s2, int max_distance):
+    """
+    Levenshtein distance between s1 and s2, or max_distance + 1 as soon as it
+    is known to exceed max_distance. Uses the bit-parallel kernel when the
+    shorter string fits a machine word, else a banded DP.
+    """
+    cdef int len1, len2
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    len1 = len(s1)
+    len2 = len(s2)
+    if len2 - len1 > max_distance:
+        return max_distance + 1
     if len1 == 0:
         return len2
-    if len2 == 0:
-        return len1
     if s1 == s2:
         return 0
+    if len1 <= 64:
+        return _myers64(s1, s2, max_distance)
+    return _banded(s1, s2, max_distance)
 
-    # Allocate two rows for dynamic programming using NumPy arrays
-    cdef np.ndarray[np.int32_t, ndim=1] prev_row = np.arange(len2 + 1, dtype=np.int32)
-    cdef np.ndarray[np.int32_t, ndim=1] curr_row = np.zeros(len2 + 1, dtype=np.int32)
-    cdef np.int32_t[:] prev_row_mv = prev_row
-    cdef np.int32_t[:] curr_row_mv = curr_row
-
-    for i in range(1, len1 + 1):
-        curr_row_mv[0] = i
-        for j in range(1, len2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            curr_row_mv[j] = min3(
-                curr_row_mv[j - 1] + 1,      # insertion
-                prev_row_mv[j] + 1,          # deletion
-                prev_row_mv[j - 1] + cost    # substitution
-            )
-        # Swap rows for next iteration
-        prev_row_mv, curr_row_mv = curr_row_mv, prev_row_mv
-
-    return prev_row_mv[len2]
+cpdef int levenshtein(str s1, str s2):
+    """
+    Compute the Levenshtein distance between two Unicode strings.
+    Handles all edge cases, including empty strings.
+    """
+    return bounded_levenshtein(s1, s2, max(len(s1), len(s2)))
 
 cpdef double similarity_ratio(str s1, str s2):
     """
@@ -82,4 +174,308 @@ cpdef list fuzzy_search(str pattern, list lines, double threshold=0.7, int conte
             results_found += 1
             if results_found >= max_results:
                 break
-    return results
\ No newline at end of file
+    return results
+# --- Batch scoring ---
+
+def encode_lines(list lines):
+    """
+    Pack lines into one contiguous code-point buffer.
+    Returns (codes, offsets): line i is codes[offsets[i]:offsets[i + 1]].
+    """
+    cdef Py_ssize_t n = len(lines)
+    cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros(n + 1, dtype=np.int64)
+    cdef Py_ssize_t i
+    for i in range(n):
+        offsets[i + 1] = offsets[i] + len(<str>lines[i])
+    codes = np.frombuffer("".join(lines).encode("utf-32-le"), dtype=np.uint32)
+    return codes, offsets
+
+cdef inline uint64_t _peq(uint32_t c, uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other) nogil:
+    cdef int k
+    if c < 128:
+        return ascii_eq[c]
+    for k in range(n_other):
+        if other[k] == c:
+            return other_eq[k]
+    return 0
+
+cdef int _myers64_codes(const uint32_t *text, Py_ssize_t n, int m, uint64_t *ascii_eq,
+                        uint32_t *other, uint64_t *other_eq, int n_other, int max_distance) nogil:
+    """_myers64() over an encoded line, without touching Python objects."""
+    cdef uint64_t mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+    cdef uint64_t top = <uint64_t>1 << (m - 1)
+    cdef uint64_t vp = mask, vn = 0, eq, xv, xh, ph, mh
+    cdef int score = m
+    cdef Py_ssize_t j
+    for j in range(n):
+        eq = _peq(text[j], ascii_eq, other, other_eq, n_other)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & mask)
+        mh = vp & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        if score - (n - j - 1) > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (~(xv | ph) & mask)
+        vn = ph & xv
+    return score if score <= max_distance else max_distance + 1
+
+cdef int _banded_codes(const uint32_t *s1, Py_ssize_t len1, const uint32_t *s2, Py_ssize_t len2,
+                       int max_distance) nogil:
+    """_banded() over encoded strings; returns -1 if memory runs out."""
+    cdef int big = max_distance + 1
+    cdef Py_ssize_t i, j, lo, hi
+    cdef int best, value, result
+    cdef int *prev = <int *>malloc((len2 + 1) * sizeof(int))
+    cdef int *curr = <int *>malloc((len2 + 1) * sizeof(int))
+    cdef int *tmp
+    if prev == NULL or curr == NULL:
+        free(prev)
+        free(curr)
+        return -1
+    for j in range(len2 + 1):
+        prev[j] = <int>j if j <= max_distance else big
+    result = -2
+    for i in range(1, len1 + 1):
+        lo = i - max_distance if i > max_distance else 1
+        hi = i + max_distance if i + max_distance < len2 else len2
+        curr[0] = <int>i if i <= max_distance else big
+        if lo > 1:
+            curr[lo - 1] = big
+        best = curr[0] if lo == 1 else big
+        for j in range(lo, hi + 1):
+            value = min3(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + (s1[i - 1] != s2[j - 1]))
+            if value > big:
+                value = big
+            curr[j] = value
+            if value < best:
+                best = value
+        if hi < len2:
+            curr[hi + 1] = big
+        if best > max_distance:
+            result = big
+            break
+        tmp = prev
+        prev = curr
+        curr = tmp
+    if result == -2:
+        result = prev[len2] if prev[len2] <= max_distance else big
+    free(prev)
+    free(curr)
+    return result
+
+cdef inline int _max_distance(double threshold, int length, bint strict) nogil:
+    """Largest distance passing threshold at this length (see algorithms.fuzzy.max_distance_for)."""
+    cdef int d = <int>((1.0 - threshold) * length) + 1
+    cdef double ratio
+    if d > length:
+        d = length
+    while d >= 0:
+        ratio = 1.0 - <double>d / length
+        if ratio > threshold or (not strict and ratio >= threshold):
+            return d
+        d -= 1
+    return -1
+
+cdef double _score_line(const uint32_t *pat, int m, const uint32_t *line, Py_ssize_t n,
+                        uint64_t *ascii_eq, uint32_t *other, uint64_t *other_eq, int n_other,
+                        double threshold, bint strict) nogil:
+    cdef int length = m if m > n else <int>n
+    cdef int max_distance, distance
+    if length == 0:
+        return 1.0
+    max_distance = _max_distance(threshold, length, strict)
+    if max_distance < 0 or n - m > max_distance or m - n > max_distance:
+        return -1.0
+    if m == 0:
+        distance = <int>n
+    elif m <= 64:
+        distance = _myers64_codes(line, n, m, ascii_eq, other, other_eq, n_other, max_distance)
+    elif m <= n:
+        distance = _banded_codes(pat, m, line, n, max_distance)
+    else:
+        distance = _banded_codes(line, n, pat, m, max_distance)
+    if distance < 0 or distance > max_distance:
+        return -1.0
+    return 1.0 - <double>distance / length
+
+def fuzzy_score_block(str pattern, lines, double threshold=0.0, bint strict=False, bint parallel=False):
+    """
+    Score every line against pattern in one GIL-released loop.
+    lines is a list of str or an encode_lines() (codes, offsets) pair.
+    Returns a float64 array of similarity_ratio(pattern, line); lines that
+    cannot pass threshold (> if strict, else >=) are pruned early and get -1.0.
+    The default threshold of 0.0 scores every line exactly.
+    parallel=True spreads lines over OpenMP threads (prange) for huge files.
+    """
+    if isinstance(lines, tuple):
+        codes, offsets = lines
+    else:
+        codes, offsets = encode_lines(lines)
+    cdef const uint32_t[::1] code_view = np.ascontiguousarray(codes, dtype=np.uint32)
+    cdef const np.int64_t[::1] offset_view = np.ascontiguousarray(offsets, dtype=np.int64)
+    cdef Py_ssize_t n_lines = offset_view.shape[0] - 1
+    cdef np.ndarray[np.float64_t, ndim=1] scores = np.empty(n_lines if n_lines > 0 else 0, dtype=np.float64)
+    cdef double[::1] score_view = scores
+    cdef const uint32_t[::1] pat_view = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)
+    cdef int m = len(pattern)
+    cdef uint64_t ascii_eq[128]
+    cdef uint32_t other[64]
+    cdef uint64_t other_eq[64]
+    cdef int n_other = 0
+    cdef int k, found
+    cdef Py_ssize_t i
+    cdef uint32_t c
+    cdef const uint32_t *base
+    cdef const uint32_t *pat = &pat_view[0] if m else NULL
+
+    if n_lines <= 0:
+        return scores
+    base = &code_view[0] if code_view.shape[0] else NULL
+    for k in range(128):
+        ascii_eq[k] = 0
+    if m <= 64:
+        for k in range(m):
+            c = pat_view[k]
+            if c < 128:
+                ascii_eq[c] |= <uint64_t>1 << k
+                continue
+            found = -1
+            for i in range(n_other):
+                if other[i] == c:
+                    found = <int>i
+            if found < 0:
+                found = n_other
+                other[found] = c
+                other_eq[found] = 0
+                n_other += 1
+            other_eq[found] |= <uint64_t>1 << k
+
+    if parallel:
+        for i in prange(n_lines, nogil=True, schedule="dynamic"):
+            score_view[i] = _score_line(
+                pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+                ascii_eq, other, other_eq, n_other, threshold, strict,
+            )
+    else:
+        with nogil:
+            for i in range(n_lines):
+                score_view[i] = _score_line(
+                    pat, m, base + offset_view[i], offset_view[i + 1] - offset_view[i],
+                    ascii_eq, other, other_eq, n_other, threshold, strict,
+                )
+    return scores
+
+# --- Best-window (semi-global) matching ---
+
+cdef int _window_end(str pattern, str text, int max_distance, bint first, int *end_out):
+    """
+    Smallest distance (<= max_distance) between pattern and any substring of
+    text, with the first end offset reaching it written to end_out (with
+    first=True, the first end offset within max_distance at all).
+    Returns -1 if no substring is within max_distance.
+    """
+    cdef int m = len(pattern)
+    cdef int n = len(text)
+    cdef int best = max_distance + 1
+    cdef int best_end = -1
+    cdef int score = m
+    cdef int i, j, diag, above, value
+    cdef Py_UCS4 ch
+    cdef uint64_t ascii_eq[128]
+    cdef dict other_eq
+    cdef uint64_t mask, top, vp, vn, eq, xv, xh, ph, mh, bit
+    cdef int *col
+
+    if m <= 64:
+        other_eq = {}
+        mask = (<uint64_t>1 << m) - 1 if m < 64 else <uint64_t>0xFFFFFFFFFFFFFFFF
+        top = <uint64_t>1 << (m - 1)
+        vp = mask
+        vn = 0
+        bit = 1
+        for i in range(128):
+            ascii_eq[i] = 0
+        for ch in pattern:
+            if ch < 128:
+                ascii_eq[ch] |= bit
+            else:
+                other_eq[ch] = other_eq.get(ch, 0) | bit
+            bit <<= 1
+        j = 0
+        for ch in text:
+            if ch < 128:
+                eq = ascii_eq[ch]
+            elif other_eq:
+                eq = other_eq.get(ch, 0)
+            else:
+                eq = 0
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            ph = vn | (~(xh | vp) & mask)
+            mh = vp & xh
+            if ph & top:
+                score += 1
+            elif mh & top:
+                score -= 1
+            j += 1
+            if score < best:
+                best = score
+                best_end = j
+                if first or score == 0:
+                    break
+            # Row 0 stays 0: a match may start at any column
+            ph = (ph << 1) & mask
+            mh = (mh << 1) & mask
+            vp = mh | (~(xv | ph) & mask)
+            vn = ph & xv
+    else:
+        # Column-wise DP over the pattern for patterns wider than a machine word
+        col = <int *>malloc((m + 1) * sizeof(int))
+        if col == NULL:
+            raise MemoryError()
+        try:
+            for i in range(m + 1):
+                col[i] = i
+            for j in range(n):
+                ch = text[j]
+                diag = 0
+                col[0] = 0
+                for i in range(1, m + 1):
+                    above = col[i]
+                    value = min3(col[i - 1] + 1, above + 1, diag + (0 if pattern[i - 1] == ch else 1))
+                    diag = above
+                    col[i] = value
+                if col[m] < best:
+                    best = col[m]
+                    best_end = j + 1
+                    if first or best == 0:
+                        break
+        finally:
+            free(col)
+    if best_end < 0:
+        return -1
+    end_out[0] = best_end
+    return best
+
+cpdef object best_window(str pattern, str text, int max_distance):
+    """
+    Best approximate occurrence of pattern inside text (semi-global alignment).
+    Returns (distance, start, end) for the leftmost, shortest window within
+    max_distance edits, or None.
+    """
+    cdef int m = len(pattern)
+    cdef int end = 0, back = 0, distance
+    if m == 0 or m - max_distance > len(text):
+        return None
+    distance = _window_end(pattern, text, max_distance, False, &end)
+    if distance < 0:
+        return None
+    # Align the reversed pattern backwards from end to find where the window starts
+    _window_end(pattern[::-1], text[end - 1::-1], distance, True, &back)
+    return distance, end - back, end
@@ -2217,7 +2217,9 @@ static const char __pyx_k_n[] = "n";
 static const char __pyx_k__2[] = "//";
 static const char __pyx_k__3[] = "\"";
 static const char __pyx_k__4[] = "'";
-static const char __pyx_k__5[] = "?";
+static const char __pyx_k__5[] = "\\";
+static const char __pyx_k__6[] = "\\\\";
+static const char __pyx_k__7[] = "?";
 static const char __pyx_k_re[] = "re";
 static const char __pyx_k_all[] = "all";
 static const char __pyx_k_pat[] = "pat";
@@ -2243,11 +2245,13 @@ static const char __pyx_k_string[] = "string";
 static const char __pyx_k_comment[] = "comment";
 static const char __pyx_k_compile[] = "compile";
 static const char __pyx_k_pattern[] = "pattern";
+static const char __pyx_k_replace[] = "replace";
 static const char __pyx_k_4_avT_1A[] = "\200\001\330\004\013\2104\210\230a\230v\240T\250\024\250^\2701\270A";
 static const char __pyx_k_endswith[] = "endswith";
 static const char __pyx_k_new_line[] = "new_line";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_stripped[] = "stripped";
+static const char __pyx_k_template[] = "template";
 static const char __pyx_k_remaining[] = "remaining";
 static const char __pyx_k_IGNORECASE[] = "IGNORECASE";
 static const char __pyx_k_startswith[] = "startswith";
@@ -2272,7 +2276,7 @@ static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_cython_ext_replace_cython[] = "cython_ext.replace_cython";
 static const char __pyx_k_cython_ext_replace_cython_pyx[] = "cython_ext/replace_cython.pyx";
-static const char __pyx_k_Bo_a_q_b_b_2Rwaz_b_7_Q_Q_D_q_a[] = "\200\001\360\010\000\005\006\330\004\005\330\004\005\330\004\005\330\004\005\330\004\005\360\020\000\005\r\210B\210o\320\035.\250a\330\004\007\200q\330\010\016\210b\220\010\230\001\230\031\240!\330\t\n\330\010\016\210b\220\010\230\001\230\032\2402\240R\240w\250a\250z\270\021\340\010\016\210b\220\010\230\001\230\022\2307\240!\240:\250Q\340\004\025\220Q\330\004\030\230\001\340\004\010\210\010\220\001\340\010\013\210=\230\004\230D\240\017\250q\260\006\260a\330\014\032\230'\240\021\240!\330\014\r\340\010\013\320\013\034\230D\320 2\260#\260Q\330\014\032\230'\240\021\240!\330\014\r\360\006\000\t\025\320\024%\240R\320'<\320<R\320RS\340\010\013\2106\220\023\220A\330\014\017\210q\330\020\032\230$\230c\240\025\240a\240}\260F\270&\300\001\340\020\032\230$\230c\240\025\240a\240}\260A\340\014\017\210q\330\020\032\230$\230c\240\025\240a\240}\260F\270&\300\001\340\020\032\230$\230c\240\025\240a\240}\260A\340\010\026\220g\230Q\230a\330\010\035\230Q\340\010\013\320\013\034\230D\320 2\260#\260Q\340\014\032\230'\240\021\240%\240q\250\003\2501\250A\330\014\r\340\004\013\2101";
+static const char __pyx_k_Bo_a_q_b_b_2Rwaz_b_7_Q_k_HAV1_Q[] = "\200\001\360\010\000\005\006\330\004\005\330\004\005\330\004\005\330\004\005\330\004\005\360\022\000\005\r\210B\210o\320\035.\250a\330\004\007\200q\330\010\016\210b\220\010\230\001\230\031\240!\330\t\n\330\010\016\210b\220\010\230\001\230\032\2402\240R\240w\250a\250z\270\021\340\010\016\210b\220\010\230\001\230\022\2307\240!\240:\250Q\340\004\017\210\230k\250\033\260H\270A\270V\3001\340\004\025\220Q\330\004\030\230\001\340\004\010\210\010\220\001\340\010\013\210=\230\004\230D\240\017\250q\260\006\260a\330\014\032\230'\240\021\240!\330\014\r\340\010\013\320\013\034\230D\320 2\260#\260Q\330\014\032\230'\240\021\240!\330\014\r\360\006\000\t\025\320\024%\240R\320'<\320<R\320RS\340\010\013\2106\220\023\220A\330\014\017\210q\330\020\032\230$\230c\240\025\240a\240z\260\026\260v\270Q\340\020\032\230$\230c\240\025\240a\240z\260\021\340\014\017\210q\330\020\032\230$\230c\240\025\240a\240z\260\026\260v\270Q\340\020\032\230$\230c\240\025\240a\240z\260\021\340\010\026\220g\230Q\230a\330\010\035\230Q\340\010\013\320\013\034\230D\320 2\260#\260Q\340\014\032\230'\240\021\240%\240q\250\003\2501\250A\330\014\r\340\004\013\2101";
 /* #### Code section: decls ### */
 static PyObject *__pyx_pf_10cython_ext_14replace_cython_is_comment_line(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line); /* proto */
 static PyObject *__pyx_pf_10cython_ext_14replace_cython_2is_string_line(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line); /* proto */
@@ -2318,9 +2322,9 @@ typedef struct {
   PyTypeObject *__pyx_CoroutineType;
   #endif
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
-  PyObject *__pyx_tuple[1];
+  PyObject *__pyx_tuple[2];
   PyObject *__pyx_codeobj_tab[5];
-  PyObject *__pyx_string_tab[56];
+  PyObject *__pyx_string_tab[60];
   PyObject *__pyx_int_0;
 /* #### Code section: module_state_contents ### */
 /* CachedMethodType.module_state_decls */
@@ -2362,56 +2366,60 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u__3 __pyx_string_tab[3]
 #define __pyx_kp_u__4 __pyx_string_tab[4]
 #define __pyx_kp_u__5 __pyx_string_tab[5]
-#define __pyx_n_u_all __pyx_string_tab[6]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[7]
-#define __pyx_kp_u_b_s_b __pyx_string_tab[8]
-#define __pyx_n_u_batch_replace __pyx_string_tab[9]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[10]
-#define __pyx_n_u_code __pyx_string_tab[11]
-#define __pyx_n_u_comment __pyx_string_tab[12]
-#define __pyx_n_u_compile __pyx_string_tab[13]
-#define __pyx_n_u_count __pyx_string_tab[14]
-#define __pyx_n_u_cython_ext_replace_cython __pyx_string_tab[15]
-#define __pyx_kp_u_cython_ext_replace_cython_pyx __pyx_string_tab[16]
-#define __pyx_n_u_endswith __pyx_string_tab[17]
-#define __pyx_n_u_escape __pyx_string_tab[18]
-#define __pyx_n_u_flags __pyx_string_tab[19]
-#define __pyx_n_u_func __pyx_string_tab[20]
-#define __pyx_n_u_ignore_case __pyx_string_tab[21]
-#define __pyx_n_u_initializing __pyx_string_tab[22]
-#define __pyx_n_u_is_code_line __pyx_string_tab[23]
-#define __pyx_n_u_is_comment_line __pyx_string_tab[24]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[25]
-#define __pyx_n_u_is_string_line __pyx_string_tab[26]
-#define __pyx_n_u_is_syntax_match __pyx_string_tab[27]
-#define __pyx_n_u_line __pyx_string_tab[28]
-#define __pyx_n_u_lines __pyx_string_tab[29]
-#define __pyx_n_u_main __pyx_string_tab[30]
-#define __pyx_n_u_max_replacements __pyx_string_tab[31]
-#define __pyx_n_u_module __pyx_string_tab[32]
-#define __pyx_n_u_n __pyx_string_tab[33]
-#define __pyx_n_u_name __pyx_string_tab[34]
-#define __pyx_n_u_new_line __pyx_string_tab[35]
-#define __pyx_n_u_pat __pyx_string_tab[36]
-#define __pyx_n_u_pattern __pyx_string_tab[37]
-#define __pyx_n_u_pop __pyx_string_tab[38]
-#define __pyx_n_u_qualname __pyx_string_tab[39]
-#define __pyx_n_u_re __pyx_string_tab[40]
-#define __pyx_n_u_regex __pyx_string_tab[41]
-#define __pyx_n_u_remaining __pyx_string_tab[42]
-#define __pyx_n_u_replaced_lines __pyx_string_tab[43]
-#define __pyx_n_u_replacement __pyx_string_tab[44]
-#define __pyx_n_u_replacements_done __pyx_string_tab[45]
-#define __pyx_n_u_spec __pyx_string_tab[46]
-#define __pyx_n_u_startswith __pyx_string_tab[47]
-#define __pyx_n_u_string __pyx_string_tab[48]
-#define __pyx_n_u_strip __pyx_string_tab[49]
-#define __pyx_n_u_stripped __pyx_string_tab[50]
-#define __pyx_n_u_subn __pyx_string_tab[51]
-#define __pyx_n_u_syntax_aware __pyx_string_tab[52]
-#define __pyx_n_u_syntax_mode __pyx_string_tab[53]
-#define __pyx_n_u_test __pyx_string_tab[54]
-#define __pyx_n_u_word __pyx_string_tab[55]
+#define __pyx_kp_u__6 __pyx_string_tab[6]
+#define __pyx_kp_u__7 __pyx_string_tab[7]
+#define __pyx_n_u_all __pyx_string_tab[8]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[9]
+#define __pyx_kp_u_b_s_b __pyx_string_tab[10]
+#define __pyx_n_u_batch_replace __pyx_string_tab[11]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[12]
+#define __pyx_n_u_code __pyx_string_tab[13]
+#define __pyx_n_u_comment __pyx_string_tab[14]
+#define __pyx_n_u_compile __pyx_string_tab[15]
+#define __pyx_n_u_count __pyx_string_tab[16]
+#define __pyx_n_u_cython_ext_replace_cython __pyx_string_tab[17]
+#define __pyx_kp_u_cython_ext_replace_cython_pyx __pyx_string_tab[18]
+#define __pyx_n_u_endswith __pyx_string_tab[19]
+#define __pyx_n_u_escape __pyx_string_tab[20]
+#define __pyx_n_u_flags __pyx_string_tab[21]
+#define __pyx_n_u_func __pyx_string_tab[22]
+#define __pyx_n_u_ignore_case __pyx_string_tab[23]
+#define __pyx_n_u_initializing __pyx_string_tab[24]
+#define __pyx_n_u_is_code_line __pyx_string_tab[25]
+#define __pyx_n_u_is_comment_line __pyx_string_tab[26]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[27]
+#define __pyx_n_u_is_string_line __pyx_string_tab[28]
+#define __pyx_n_u_is_syntax_match __pyx_string_tab[29]
+#define __pyx_n_u_line __pyx_string_tab[30]
+#define __pyx_n_u_lines __pyx_string_tab[31]
+#define __pyx_n_u_main __pyx_string_tab[32]
+#define __pyx_n_u_max_replacements __pyx_string_tab[33]
+#define __pyx_n_u_module __pyx_string_tab[34]
+#define __pyx_n_u_n __pyx_string_tab[35]
+#define __pyx_n_u_name __pyx_string_tab[36]
+#define __pyx_n_u_new_line __pyx_string_tab[37]
+#define __pyx_n_u_pat __pyx_string_tab[38]
+#define __pyx_n_u_pattern __pyx_string_tab[39]
+#define __pyx_n_u_pop __pyx_string_tab[40]
+#define __pyx_n_u_qualname __pyx_string_tab[41]
+#define __pyx_n_u_re __pyx_string_tab[42]
+#define __pyx_n_u_regex __pyx_string_tab[43]
+#define __pyx_n_u_remaining __pyx_string_tab[44]
+#define __pyx_n_u_replace __pyx_string_tab[45]
+#define __pyx_n_u_replaced_lines __pyx_string_tab[46]
+#define __pyx_n_u_replacement __pyx_string_tab[47]
+#define __pyx_n_u_replacements_done __pyx_string_tab[48]
+#define __pyx_n_u_spec __pyx_string_tab[49]
+#define __pyx_n_u_startswith __pyx_string_tab[50]
+#define __pyx_n_u_string __pyx_string_tab[51]
+#define __pyx_n_u_strip __pyx_string_tab[52]
+#define __pyx_n_u_stripped __pyx_string_tab[53]
+#define __pyx_n_u_subn __pyx_string_tab[54]
+#define __pyx_n_u_syntax_aware __pyx_string_tab[55]
+#define __pyx_n_u_syntax_mode __pyx_string_tab[56]
+#define __pyx_n_u_template __pyx_string_tab[57]
+#define __pyx_n_u_test __pyx_string_tab[58]
+#define __pyx_n_u_word __pyx_string_tab[59]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2432,9 +2440,9 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __Pyx_State_RemoveModule(NULL);
   #endif
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
   for (int i=0; i<5; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<56; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<60; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   Py_CLEAR(clear_module_state->__pyx_int_0);
   return 0;
 }
@@ -2456,9 +2464,9 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   #ifdef __Pyx_FusedFunction_USED
   Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
   #endif
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
   for (int i=0; i<5; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<56; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<60; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_0);
   return 0;
 }
@@ -3431,7 +3439,7 @@ PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_10cython_ext_14replace_cython_8batch_replace, "\n    Batch replace occurrences of pattern in lines.\n    Supports plain, word, and regex replacement.\n    Optionally restricts replacement to certain syntax contexts.\n    Returns a list of replaced lines.\n    ");
+PyDoc_STRVAR(__pyx_doc_10cython_ext_14replace_cython_8batch_replace, "\n    Batch replace occurrences of pattern in lines.\n    Supports plain, word, and regex replacement. replacement is inserted\n    as is, unless regex is set: then it is an re replacement string.\n    Optionally restricts replacement to certain syntax contexts.\n    Returns a list of replaced lines.\n    ");
 static PyMethodDef __pyx_mdef_10cython_ext_14replace_cython_9batch_replace = {"batch_replace", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10cython_ext_14replace_cython_9batch_replace, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10cython_ext_14replace_cython_8batch_replace};
 static PyObject *__pyx_pw_10cython_ext_14replace_cython_9batch_replace(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
@@ -3643,6 +3651,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lines, PyObject *__pyx_v_pattern, PyObject *__pyx_v_replacement, PyObject *__pyx_v_regex, PyObject *__pyx_v_ignore_case, PyObject *__pyx_v_word, PyObject *__pyx_v_max_replacements, PyObject *__pyx_v_syntax_aware, PyObject *__pyx_v_syntax_mode) {
   PyObject *__pyx_v_flags = NULL;
   PyObject *__pyx_v_pat = NULL;
+  PyObject *__pyx_v_template = NULL;
   PyObject *__pyx_v_replaced_lines = NULL;
   PyObject *__pyx_v_replacements_done = NULL;
   PyObject *__pyx_v_line = NULL;
@@ -3672,18 +3681,18 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("batch_replace", 0);
 
-  /* "cython_ext/replace_cython.pyx":48
+  /* "cython_ext/replace_cython.pyx":49
  *     Returns a list of replaced lines.
  *     """
  *     flags = re.IGNORECASE if ignore_case else 0             # <<<<<<<<<<<<<<
  *     if regex:
  *         pat = re.compile(pattern, flags)
 */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_ignore_case); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_ignore_case); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 49, __pyx_L1_error)
   if (__pyx_t_2) {
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_IGNORECASE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_IGNORECASE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_1 = __pyx_t_4;
@@ -3695,17 +3704,17 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   __pyx_v_flags = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "cython_ext/replace_cython.pyx":49
+  /* "cython_ext/replace_cython.pyx":50
  *     """
  *     flags = re.IGNORECASE if ignore_case else 0
  *     if regex:             # <<<<<<<<<<<<<<
  *         pat = re.compile(pattern, flags)
  *     elif word:
 */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_regex); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 49, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_regex); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 50, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "cython_ext/replace_cython.pyx":50
+    /* "cython_ext/replace_cython.pyx":51
  *     flags = re.IGNORECASE if ignore_case else 0
  *     if regex:
  *         pat = re.compile(pattern, flags)             # <<<<<<<<<<<<<<
@@ -3713,9 +3722,9 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
  *         pat = re.compile(r"\b%s\b" % re.escape(pattern), flags)
 */
     __pyx_t_4 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 50, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 50, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_6 = 1;
@@ -3735,13 +3744,13 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
       __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     }
     __pyx_v_pat = __pyx_t_1;
     __pyx_t_1 = 0;
 
-    /* "cython_ext/replace_cython.pyx":49
+    /* "cython_ext/replace_cython.pyx":50
  *     """
  *     flags = re.IGNORECASE if ignore_case else 0
  *     if regex:             # <<<<<<<<<<<<<<
@@ -3751,17 +3760,17 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
     goto __pyx_L3;
   }
 
-  /* "cython_ext/replace_cython.pyx":51
+  /* "cython_ext/replace_cython.pyx":52
  *     if regex:
  *         pat = re.compile(pattern, flags)
  *     elif word:             # <<<<<<<<<<<<<<
  *         pat = re.compile(r"\b%s\b" % re.escape(pattern), flags)
  *     else:
 */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_word); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_word); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 52, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "cython_ext/replace_cython.pyx":52
+    /* "cython_ext/replace_cython.pyx":53
  *         pat = re.compile(pattern, flags)
  *     elif word:
  *         pat = re.compile(r"\b%s\b" % re.escape(pattern), flags)             # <<<<<<<<<<<<<<
@@ -3769,15 +3778,15 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
  *         pat = re.compile(re.escape(pattern), flags)
 */
     __pyx_t_5 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 53, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_t_7 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 53, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_escape); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_escape); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 53, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __pyx_t_6 = 1;
@@ -3797,10 +3806,10 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
       __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_9, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 52, __pyx_L1_error)
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 53, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
     }
-    __pyx_t_9 = __Pyx_PyUnicode_FormatSafe(__pyx_mstate_global->__pyx_kp_u_b_s_b, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyUnicode_FormatSafe(__pyx_mstate_global->__pyx_kp_u_b_s_b, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 53, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_t_6 = 1;
@@ -3821,13 +3830,13 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     }
     __pyx_v_pat = __pyx_t_1;
     __pyx_t_1 = 0;
 
-    /* "cython_ext/replace_cython.pyx":51
+    /* "cython_ext/replace_cython.pyx":52
  *     if regex:
  *         pat = re.compile(pattern, flags)
  *     elif word:             # <<<<<<<<<<<<<<
@@ -3837,24 +3846,24 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
     goto __pyx_L3;
   }
 
-  /* "cython_ext/replace_cython.pyx":54
+  /* "cython_ext/replace_cython.pyx":55
  *         pat = re.compile(r"\b%s\b" % re.escape(pattern), flags)
  *     else:
  *         pat = re.compile(re.escape(pattern), flags)             # <<<<<<<<<<<<<<
- * 
- *     replaced_lines = []
+ *     # Literal replacements: escape backslashes so re does not expand them
+ *     template = replacement if regex else replacement.replace("\\", r"\\")
 */
   /*else*/ {
     __pyx_t_3 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 54, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 54, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_compile); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __pyx_t_4 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 54, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_re); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_escape); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 54, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_escape); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __pyx_t_6 = 1;
@@ -3874,7 +3883,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
       __pyx_t_9 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 54, __pyx_L1_error)
+      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 55, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
     }
     __pyx_t_6 = 1;
@@ -3895,7 +3904,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 54, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     }
     __pyx_v_pat = __pyx_t_1;
@@ -3903,19 +3912,42 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   }
   __pyx_L3:;
 
-  /* "cython_ext/replace_cython.pyx":56
+  /* "cython_ext/replace_cython.pyx":57
  *         pat = re.compile(re.escape(pattern), flags)
+ *     # Literal replacements: escape backslashes so re does not expand them
+ *     template = replacement if regex else replacement.replace("\\", r"\\")             # <<<<<<<<<<<<<<
+ * 
+ *     replaced_lines = []
+*/
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_regex); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 57, __pyx_L1_error)
+  if (__pyx_t_2) {
+    __Pyx_INCREF(__pyx_v_replacement);
+    __pyx_t_1 = __pyx_v_replacement;
+  } else {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_replacement, __pyx_mstate_global->__pyx_n_u_replace); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 57, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_mstate_global->__pyx_tuple[0], NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 57, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_1 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_template = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "cython_ext/replace_cython.pyx":59
+ *     template = replacement if regex else replacement.replace("\\", r"\\")
  * 
  *     replaced_lines = []             # <<<<<<<<<<<<<<
  *     replacements_done = 0
  * 
 */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_replaced_lines = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cython_ext/replace_cython.pyx":57
+  /* "cython_ext/replace_cython.pyx":60
  * 
  *     replaced_lines = []
  *     replacements_done = 0             # <<<<<<<<<<<<<<
@@ -3925,7 +3957,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
   __pyx_v_replacements_done = __pyx_mstate_global->__pyx_int_0;
 
-  /* "cython_ext/replace_cython.pyx":59
+  /* "cython_ext/replace_cython.pyx":62
  *     replacements_done = 0
  * 
  *     for line in lines:             # <<<<<<<<<<<<<<
@@ -3937,9 +3969,9 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
     __pyx_t_10 = 0;
     __pyx_t_11 = NULL;
   } else {
-    __pyx_t_10 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_lines); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
+    __pyx_t_10 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_lines); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_11 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 59, __pyx_L1_error)
+    __pyx_t_11 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 62, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_11)) {
@@ -3947,96 +3979,96 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
           #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 59, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
           #endif
           if (__pyx_t_10 >= __pyx_temp) break;
         }
-        __pyx_t_5 = __Pyx_PyList_GetItemRef(__pyx_t_1, __pyx_t_10);
+        __pyx_t_9 = __Pyx_PyList_GetItemRef(__pyx_t_1, __pyx_t_10);
         ++__pyx_t_10;
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
           #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 59, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
           #endif
           if (__pyx_t_10 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_10));
+        __pyx_t_9 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_10));
         #else
-        __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_10);
+        __pyx_t_9 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_10);
         #endif
         ++__pyx_t_10;
       }
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 59, __pyx_L1_error)
+      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 62, __pyx_L1_error)
     } else {
-      __pyx_t_5 = __pyx_t_11(__pyx_t_1);
-      if (unlikely(!__pyx_t_5)) {
+      __pyx_t_9 = __pyx_t_11(__pyx_t_1);
+      if (unlikely(!__pyx_t_9)) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
-          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 59, __pyx_L1_error)
+          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 62, __pyx_L1_error)
           PyErr_Clear();
         }
         break;
       }
     }
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_5);
-    __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_9);
+    __pyx_t_9 = 0;
 
-    /* "cython_ext/replace_cython.pyx":61
+    /* "cython_ext/replace_cython.pyx":64
  *     for line in lines:
  *         # Syntax-aware filtering
  *         if syntax_aware and not is_syntax_match(line, syntax_mode):             # <<<<<<<<<<<<<<
  *             replaced_lines.append(line)
  *             continue
 */
-    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_v_syntax_aware); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 61, __pyx_L1_error)
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_v_syntax_aware); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 64, __pyx_L1_error)
     if (__pyx_t_12) {
     } else {
       __pyx_t_2 = __pyx_t_12;
       goto __pyx_L7_bool_binop_done;
     }
-    __pyx_t_9 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_is_syntax_match); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
+    __pyx_t_5 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_is_syntax_match); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_6 = 1;
     #if CYTHON_UNPACK_METHODS
     if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
-      assert(__pyx_t_9);
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      assert(__pyx_t_5);
       PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(__pyx__function);
       __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
       __pyx_t_6 = 0;
     }
     #endif
     {
-      PyObject *__pyx_callargs[3] = {__pyx_t_9, __pyx_v_line, __pyx_v_syntax_mode};
-      __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_line, __pyx_v_syntax_mode};
+      __pyx_t_9 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 61, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
     }
-    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 61, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __pyx_t_13 = (!__pyx_t_12);
     __pyx_t_2 = __pyx_t_13;
     __pyx_L7_bool_binop_done:;
     if (__pyx_t_2) {
 
-      /* "cython_ext/replace_cython.pyx":62
+      /* "cython_ext/replace_cython.pyx":65
  *         # Syntax-aware filtering
  *         if syntax_aware and not is_syntax_match(line, syntax_mode):
  *             replaced_lines.append(line)             # <<<<<<<<<<<<<<
  *             continue
  * 
 */
-      __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 62, __pyx_L1_error)
+      __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 65, __pyx_L1_error)
 
-      /* "cython_ext/replace_cython.pyx":63
+      /* "cython_ext/replace_cython.pyx":66
  *         if syntax_aware and not is_syntax_match(line, syntax_mode):
  *             replaced_lines.append(line)
  *             continue             # <<<<<<<<<<<<<<
@@ -4045,7 +4077,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
       goto __pyx_L4_continue;
 
-      /* "cython_ext/replace_cython.pyx":61
+      /* "cython_ext/replace_cython.pyx":64
  *     for line in lines:
  *         # Syntax-aware filtering
  *         if syntax_aware and not is_syntax_match(line, syntax_mode):             # <<<<<<<<<<<<<<
@@ -4054,36 +4086,36 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
     }
 
-    /* "cython_ext/replace_cython.pyx":65
+    /* "cython_ext/replace_cython.pyx":68
  *             continue
  * 
  *         if max_replacements and replacements_done >= max_replacements:             # <<<<<<<<<<<<<<
  *             replaced_lines.append(line)
  *             continue
 */
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 65, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 68, __pyx_L1_error)
     if (__pyx_t_13) {
     } else {
       __pyx_t_2 = __pyx_t_13;
       goto __pyx_L10_bool_binop_done;
     }
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_replacements_done, __pyx_v_max_replacements, Py_GE); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_9 = PyObject_RichCompare(__pyx_v_replacements_done, __pyx_v_max_replacements, Py_GE); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __pyx_t_2 = __pyx_t_13;
     __pyx_L10_bool_binop_done:;
     if (__pyx_t_2) {
 
-      /* "cython_ext/replace_cython.pyx":66
+      /* "cython_ext/replace_cython.pyx":69
  * 
  *         if max_replacements and replacements_done >= max_replacements:
  *             replaced_lines.append(line)             # <<<<<<<<<<<<<<
  *             continue
  * 
 */
-      __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 66, __pyx_L1_error)
+      __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 69, __pyx_L1_error)
 
-      /* "cython_ext/replace_cython.pyx":67
+      /* "cython_ext/replace_cython.pyx":70
  *         if max_replacements and replacements_done >= max_replacements:
  *             replaced_lines.append(line)
  *             continue             # <<<<<<<<<<<<<<
@@ -4092,7 +4124,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
       goto __pyx_L4_continue;
 
-      /* "cython_ext/replace_cython.pyx":65
+      /* "cython_ext/replace_cython.pyx":68
  *             continue
  * 
  *         if max_replacements and replacements_done >= max_replacements:             # <<<<<<<<<<<<<<
@@ -4101,115 +4133,115 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
     }
 
-    /* "cython_ext/replace_cython.pyx":70
+    /* "cython_ext/replace_cython.pyx":73
  * 
  *         # Only replace up to the remaining allowed replacements
  *         remaining = max_replacements - replacements_done if max_replacements else 0             # <<<<<<<<<<<<<<
  * 
  *         if regex or word:
 */
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 73, __pyx_L1_error)
     if (__pyx_t_2) {
-      __pyx_t_3 = PyNumber_Subtract(__pyx_v_max_replacements, __pyx_v_replacements_done); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_3 = PyNumber_Subtract(__pyx_v_max_replacements, __pyx_v_replacements_done); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __pyx_t_3;
+      __pyx_t_9 = __pyx_t_3;
       __pyx_t_3 = 0;
     } else {
       __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
-      __pyx_t_5 = __pyx_mstate_global->__pyx_int_0;
+      __pyx_t_9 = __pyx_mstate_global->__pyx_int_0;
     }
-    __Pyx_XDECREF_SET(__pyx_v_remaining, __pyx_t_5);
-    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_remaining, __pyx_t_9);
+    __pyx_t_9 = 0;
 
-    /* "cython_ext/replace_cython.pyx":72
+    /* "cython_ext/replace_cython.pyx":75
  *         remaining = max_replacements - replacements_done if max_replacements else 0
  * 
  *         if regex or word:             # <<<<<<<<<<<<<<
  *             if max_replacements:
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
 */
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_regex); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_regex); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
     if (!__pyx_t_13) {
     } else {
       __pyx_t_2 = __pyx_t_13;
       goto __pyx_L13_bool_binop_done;
     }
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_word); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_word); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
     __pyx_t_2 = __pyx_t_13;
     __pyx_L13_bool_binop_done:;
     if (__pyx_t_2) {
 
-      /* "cython_ext/replace_cython.pyx":73
+      /* "cython_ext/replace_cython.pyx":76
  * 
  *         if regex or word:
  *             if max_replacements:             # <<<<<<<<<<<<<<
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
 */
-      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 73, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 76, __pyx_L1_error)
       if (__pyx_t_2) {
 
-        /* "cython_ext/replace_cython.pyx":74
+        /* "cython_ext/replace_cython.pyx":77
  *         if regex or word:
  *             if max_replacements:
- *                 new_line, n = pat.subn(replacement, line, count=remaining)             # <<<<<<<<<<<<<<
+ *                 new_line, n = pat.subn(template, line, count=remaining)             # <<<<<<<<<<<<<<
  *             else:
- *                 new_line, n = pat.subn(replacement, line)
+ *                 new_line, n = pat.subn(template, line)
 */
         __pyx_t_3 = __pyx_v_pat;
         __Pyx_INCREF(__pyx_t_3);
         __pyx_t_6 = 0;
         {
-          PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_v_replacement, __pyx_v_line};
-          __pyx_t_9 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 74, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
-          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_count, __pyx_v_remaining, __pyx_t_9, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 74, __pyx_L1_error)
-          __pyx_t_5 = __Pyx_Object_VectorcallMethod_CallFromBuilder(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_9);
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 74, __pyx_L1_error)
+          PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_v_template, __pyx_v_line};
+          __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_5);
+          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_count, __pyx_v_remaining, __pyx_t_5, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
+          __pyx_t_9 = __Pyx_Object_VectorcallMethod_CallFromBuilder(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 77, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-          PyObject* sequence = __pyx_t_5;
+        if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+          PyObject* sequence = __pyx_t_9;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 74, __pyx_L1_error)
+            __PYX_ERR(0, 77, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
-            __pyx_t_9 = PyTuple_GET_ITEM(sequence, 0);
-            __Pyx_INCREF(__pyx_t_9);
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0);
+            __Pyx_INCREF(__pyx_t_5);
             __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1);
             __Pyx_INCREF(__pyx_t_3);
           } else {
-            __pyx_t_9 = __Pyx_PyList_GetItemRef(sequence, 0);
-            if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 74, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_9);
+            __pyx_t_5 = __Pyx_PyList_GetItemRef(sequence, 0);
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+            __Pyx_XGOTREF(__pyx_t_5);
             __pyx_t_3 = __Pyx_PyList_GetItemRef(sequence, 1);
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
             __Pyx_XGOTREF(__pyx_t_3);
           }
           #else
-          __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 74, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
-          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+          __pyx_t_5 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           #endif
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 74, __pyx_L1_error)
+          __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 77, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
           __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
-          index = 0; __pyx_t_9 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_9)) goto __pyx_L16_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_9);
+          index = 0; __pyx_t_5 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L16_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
           index = 1; __pyx_t_3 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L16_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_3);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 74, __pyx_L1_error)
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
           __pyx_t_15 = NULL;
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           goto __pyx_L17_unpacking_done;
@@ -4217,28 +4249,28 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           __pyx_t_15 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 74, __pyx_L1_error)
+          __PYX_ERR(0, 77, __pyx_L1_error)
           __pyx_L17_unpacking_done:;
         }
-        __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_9);
-        __pyx_t_9 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_5);
+        __pyx_t_5 = 0;
         __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_3);
         __pyx_t_3 = 0;
 
-        /* "cython_ext/replace_cython.pyx":73
+        /* "cython_ext/replace_cython.pyx":76
  * 
  *         if regex or word:
  *             if max_replacements:             # <<<<<<<<<<<<<<
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
 */
         goto __pyx_L15;
       }
 
-      /* "cython_ext/replace_cython.pyx":76
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+      /* "cython_ext/replace_cython.pyx":79
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
- *                 new_line, n = pat.subn(replacement, line)             # <<<<<<<<<<<<<<
+ *                 new_line, n = pat.subn(template, line)             # <<<<<<<<<<<<<<
  *         else:
  *             if max_replacements:
 */
@@ -4247,52 +4279,52 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
         __Pyx_INCREF(__pyx_t_3);
         __pyx_t_6 = 0;
         {
-          PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_replacement, __pyx_v_line};
-          __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_template, __pyx_v_line};
+          __pyx_t_9 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 76, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-          PyObject* sequence = __pyx_t_5;
+        if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+          PyObject* sequence = __pyx_t_9;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 76, __pyx_L1_error)
+            __PYX_ERR(0, 79, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
             __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0);
             __Pyx_INCREF(__pyx_t_3);
-            __pyx_t_9 = PyTuple_GET_ITEM(sequence, 1);
-            __Pyx_INCREF(__pyx_t_9);
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1);
+            __Pyx_INCREF(__pyx_t_5);
           } else {
             __pyx_t_3 = __Pyx_PyList_GetItemRef(sequence, 0);
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
             __Pyx_XGOTREF(__pyx_t_3);
-            __pyx_t_9 = __Pyx_PyList_GetItemRef(sequence, 1);
-            if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 76, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_9);
+            __pyx_t_5 = __Pyx_PyList_GetItemRef(sequence, 1);
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
+            __Pyx_XGOTREF(__pyx_t_5);
           }
           #else
-          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 76, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_5 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
           #endif
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 76, __pyx_L1_error)
+          __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 79, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
           __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
           index = 0; __pyx_t_3 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L18_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_3);
-          index = 1; __pyx_t_9 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_9)) goto __pyx_L18_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_9);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
+          index = 1; __pyx_t_5 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L18_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
           __pyx_t_15 = NULL;
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           goto __pyx_L19_unpacking_done;
@@ -4300,98 +4332,98 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           __pyx_t_15 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 76, __pyx_L1_error)
+          __PYX_ERR(0, 79, __pyx_L1_error)
           __pyx_L19_unpacking_done:;
         }
         __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_3);
         __pyx_t_3 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_9);
-        __pyx_t_9 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_5);
+        __pyx_t_5 = 0;
       }
       __pyx_L15:;
 
-      /* "cython_ext/replace_cython.pyx":72
+      /* "cython_ext/replace_cython.pyx":75
  *         remaining = max_replacements - replacements_done if max_replacements else 0
  * 
  *         if regex or word:             # <<<<<<<<<<<<<<
  *             if max_replacements:
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
 */
       goto __pyx_L12;
     }
 
-    /* "cython_ext/replace_cython.pyx":78
- *                 new_line, n = pat.subn(replacement, line)
+    /* "cython_ext/replace_cython.pyx":81
+ *                 new_line, n = pat.subn(template, line)
  *         else:
  *             if max_replacements:             # <<<<<<<<<<<<<<
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
 */
     /*else*/ {
-      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 78, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
       if (__pyx_t_2) {
 
-        /* "cython_ext/replace_cython.pyx":79
+        /* "cython_ext/replace_cython.pyx":82
  *         else:
  *             if max_replacements:
- *                 new_line, n = pat.subn(replacement, line, count=remaining)             # <<<<<<<<<<<<<<
+ *                 new_line, n = pat.subn(template, line, count=remaining)             # <<<<<<<<<<<<<<
  *             else:
- *                 new_line, n = pat.subn(replacement, line)
+ *                 new_line, n = pat.subn(template, line)
 */
-        __pyx_t_9 = __pyx_v_pat;
-        __Pyx_INCREF(__pyx_t_9);
+        __pyx_t_5 = __pyx_v_pat;
+        __Pyx_INCREF(__pyx_t_5);
         __pyx_t_6 = 0;
         {
-          PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_9, __pyx_v_replacement, __pyx_v_line};
-          __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+          PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_v_template, __pyx_v_line};
+          __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
-          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_count, __pyx_v_remaining, __pyx_t_3, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
-          __pyx_t_5 = __Pyx_Object_VectorcallMethod_CallFromBuilder(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_count, __pyx_v_remaining, __pyx_t_3, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 82, __pyx_L1_error)
+          __pyx_t_9 = __Pyx_Object_VectorcallMethod_CallFromBuilder(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 82, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-          PyObject* sequence = __pyx_t_5;
+        if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+          PyObject* sequence = __pyx_t_9;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 79, __pyx_L1_error)
+            __PYX_ERR(0, 82, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
             __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0);
             __Pyx_INCREF(__pyx_t_3);
-            __pyx_t_9 = PyTuple_GET_ITEM(sequence, 1);
-            __Pyx_INCREF(__pyx_t_9);
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1);
+            __Pyx_INCREF(__pyx_t_5);
           } else {
             __pyx_t_3 = __Pyx_PyList_GetItemRef(sequence, 0);
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
             __Pyx_XGOTREF(__pyx_t_3);
-            __pyx_t_9 = __Pyx_PyList_GetItemRef(sequence, 1);
-            if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 79, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_9);
+            __pyx_t_5 = __Pyx_PyList_GetItemRef(sequence, 1);
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+            __Pyx_XGOTREF(__pyx_t_5);
           }
           #else
-          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 79, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_5 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
           #endif
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 82, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
           __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
           index = 0; __pyx_t_3 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L21_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_3);
-          index = 1; __pyx_t_9 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_9)) goto __pyx_L21_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_9);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+          index = 1; __pyx_t_5 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L21_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 82, __pyx_L1_error)
           __pyx_t_15 = NULL;
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           goto __pyx_L22_unpacking_done;
@@ -4399,82 +4431,82 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           __pyx_t_15 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 79, __pyx_L1_error)
+          __PYX_ERR(0, 82, __pyx_L1_error)
           __pyx_L22_unpacking_done:;
         }
         __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_3);
         __pyx_t_3 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_9);
-        __pyx_t_9 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_5);
+        __pyx_t_5 = 0;
 
-        /* "cython_ext/replace_cython.pyx":78
- *                 new_line, n = pat.subn(replacement, line)
+        /* "cython_ext/replace_cython.pyx":81
+ *                 new_line, n = pat.subn(template, line)
  *         else:
  *             if max_replacements:             # <<<<<<<<<<<<<<
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
 */
         goto __pyx_L20;
       }
 
-      /* "cython_ext/replace_cython.pyx":81
- *                 new_line, n = pat.subn(replacement, line, count=remaining)
+      /* "cython_ext/replace_cython.pyx":84
+ *                 new_line, n = pat.subn(template, line, count=remaining)
  *             else:
- *                 new_line, n = pat.subn(replacement, line)             # <<<<<<<<<<<<<<
+ *                 new_line, n = pat.subn(template, line)             # <<<<<<<<<<<<<<
  * 
  *         replaced_lines.append(new_line)
 */
       /*else*/ {
-        __pyx_t_9 = __pyx_v_pat;
-        __Pyx_INCREF(__pyx_t_9);
+        __pyx_t_5 = __pyx_v_pat;
+        __Pyx_INCREF(__pyx_t_5);
         __pyx_t_6 = 0;
         {
-          PyObject *__pyx_callargs[3] = {__pyx_t_9, __pyx_v_replacement, __pyx_v_line};
-          __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
+          PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_template, __pyx_v_line};
+          __pyx_t_9 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_subn, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-          PyObject* sequence = __pyx_t_5;
+        if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+          PyObject* sequence = __pyx_t_9;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 81, __pyx_L1_error)
+            __PYX_ERR(0, 84, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
-            __pyx_t_9 = PyTuple_GET_ITEM(sequence, 0);
-            __Pyx_INCREF(__pyx_t_9);
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0);
+            __Pyx_INCREF(__pyx_t_5);
             __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1);
             __Pyx_INCREF(__pyx_t_3);
           } else {
-            __pyx_t_9 = __Pyx_PyList_GetItemRef(sequence, 0);
-            if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 81, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_9);
+            __pyx_t_5 = __Pyx_PyList_GetItemRef(sequence, 0);
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 84, __pyx_L1_error)
+            __Pyx_XGOTREF(__pyx_t_5);
             __pyx_t_3 = __Pyx_PyList_GetItemRef(sequence, 1);
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
             __Pyx_XGOTREF(__pyx_t_3);
           }
           #else
-          __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 81, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
-          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_5 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           #endif
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 84, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
           __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
-          index = 0; __pyx_t_9 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_9)) goto __pyx_L23_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_9);
+          index = 0; __pyx_t_5 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L23_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
           index = 1; __pyx_t_3 = __pyx_t_15(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L23_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_3);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_8), 2) < 0) __PYX_ERR(0, 84, __pyx_L1_error)
           __pyx_t_15 = NULL;
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           goto __pyx_L24_unpacking_done;
@@ -4482,11 +4514,11 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
           __pyx_t_15 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 81, __pyx_L1_error)
+          __PYX_ERR(0, 84, __pyx_L1_error)
           __pyx_L24_unpacking_done:;
         }
-        __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_9);
-        __pyx_t_9 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_new_line, __pyx_t_5);
+        __pyx_t_5 = 0;
         __Pyx_XDECREF_SET(__pyx_v_n, __pyx_t_3);
         __pyx_t_3 = 0;
       }
@@ -4494,61 +4526,61 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
     }
     __pyx_L12:;
 
-    /* "cython_ext/replace_cython.pyx":83
- *                 new_line, n = pat.subn(replacement, line)
+    /* "cython_ext/replace_cython.pyx":86
+ *                 new_line, n = pat.subn(template, line)
  * 
  *         replaced_lines.append(new_line)             # <<<<<<<<<<<<<<
  *         replacements_done += n
  * 
 */
-    __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_new_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 83, __pyx_L1_error)
+    __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_replaced_lines, __pyx_v_new_line); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 86, __pyx_L1_error)
 
-    /* "cython_ext/replace_cython.pyx":84
+    /* "cython_ext/replace_cython.pyx":87
  * 
  *         replaced_lines.append(new_line)
  *         replacements_done += n             # <<<<<<<<<<<<<<
  * 
  *         if max_replacements and replacements_done >= max_replacements:
 */
-    __pyx_t_5 = PyNumber_InPlaceAdd(__pyx_v_replacements_done, __pyx_v_n); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 84, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF_SET(__pyx_v_replacements_done, __pyx_t_5);
-    __pyx_t_5 = 0;
+    __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_v_replacements_done, __pyx_v_n); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF_SET(__pyx_v_replacements_done, __pyx_t_9);
+    __pyx_t_9 = 0;
 
-    /* "cython_ext/replace_cython.pyx":86
+    /* "cython_ext/replace_cython.pyx":89
  *         replacements_done += n
  * 
  *         if max_replacements and replacements_done >= max_replacements:             # <<<<<<<<<<<<<<
  *             # If we've hit the limit, just append the rest of the lines unchanged
  *             replaced_lines.extend(lines[len(replaced_lines):])
 */
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_v_max_replacements); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 89, __pyx_L1_error)
     if (__pyx_t_13) {
     } else {
       __pyx_t_2 = __pyx_t_13;
       goto __pyx_L26_bool_binop_done;
     }
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_replacements_done, __pyx_v_max_replacements, Py_GE); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
-    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 86, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_9 = PyObject_RichCompare(__pyx_v_replacements_done, __pyx_v_max_replacements, Py_GE); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 89, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __pyx_t_2 = __pyx_t_13;
     __pyx_L26_bool_binop_done:;
     if (__pyx_t_2) {
 
-      /* "cython_ext/replace_cython.pyx":88
+      /* "cython_ext/replace_cython.pyx":91
  *         if max_replacements and replacements_done >= max_replacements:
  *             # If we've hit the limit, just append the rest of the lines unchanged
  *             replaced_lines.extend(lines[len(replaced_lines):])             # <<<<<<<<<<<<<<
  *             break
  * 
 */
-      __pyx_t_16 = __Pyx_PyList_GET_SIZE(__pyx_v_replaced_lines); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 88, __pyx_L1_error)
-      __pyx_t_5 = __Pyx_PyObject_GetSlice(__pyx_v_lines, __pyx_t_16, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_14 = __Pyx_PyList_Extend(__pyx_v_replaced_lines, __pyx_t_5); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 88, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_16 = __Pyx_PyList_GET_SIZE(__pyx_v_replaced_lines); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 91, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_GetSlice(__pyx_v_lines, __pyx_t_16, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_14 = __Pyx_PyList_Extend(__pyx_v_replaced_lines, __pyx_t_9); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 91, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "cython_ext/replace_cython.pyx":89
+      /* "cython_ext/replace_cython.pyx":92
  *             # If we've hit the limit, just append the rest of the lines unchanged
  *             replaced_lines.extend(lines[len(replaced_lines):])
  *             break             # <<<<<<<<<<<<<<
@@ -4557,7 +4589,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
       goto __pyx_L5_break;
 
-      /* "cython_ext/replace_cython.pyx":86
+      /* "cython_ext/replace_cython.pyx":89
  *         replacements_done += n
  * 
  *         if max_replacements and replacements_done >= max_replacements:             # <<<<<<<<<<<<<<
@@ -4566,7 +4598,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
 */
     }
 
-    /* "cython_ext/replace_cython.pyx":59
+    /* "cython_ext/replace_cython.pyx":62
  *     replacements_done = 0
  * 
  *     for line in lines:             # <<<<<<<<<<<<<<
@@ -4582,7 +4614,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   goto __pyx_L28_for_end;
   __pyx_L28_for_end:;
 
-  /* "cython_ext/replace_cython.pyx":91
+  /* "cython_ext/replace_cython.pyx":94
  *             break
  * 
  *     return replaced_lines             # <<<<<<<<<<<<<<
@@ -4614,6 +4646,7 @@ static PyObject *__pyx_pf_10cython_ext_14replace_cython_8batch_replace(CYTHON_UN
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_flags);
   __Pyx_XDECREF(__pyx_v_pat);
+  __Pyx_XDECREF(__pyx_v_template);
   __Pyx_XDECREF(__pyx_v_replaced_lines);
   __Pyx_XDECREF(__pyx_v_replacements_done);
   __Pyx_XDECREF(__pyx_v_line);
@@ -5055,7 +5088,7 @@ __Pyx_RefNannySetupContext("PyInit_replace_cython", 0);
 */
   __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_10cython_ext_14replace_cython_9batch_replace, 0, __pyx_mstate_global->__pyx_n_u_batch_replace, NULL, __pyx_mstate_global->__pyx_n_u_cython_ext_replace_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[1]);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_batch_replace, __pyx_t_2) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
@@ -5133,6 +5166,8 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__3 */
   {__pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__4 */
   {__pyx_k__5, sizeof(__pyx_k__5), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__5 */
+  {__pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__6 */
+  {__pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__7 */
   {__pyx_k_all, sizeof(__pyx_k_all), 0, 1, 1}, /* PyObject cname: __pyx_n_u_all */
   {__pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_asyncio_coroutines */
   {__pyx_k_b_s_b, sizeof(__pyx_k_b_s_b), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_b_s_b */
@@ -5170,6 +5205,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_re, sizeof(__pyx_k_re), 0, 1, 1}, /* PyObject cname: __pyx_n_u_re */
   {__pyx_k_regex, sizeof(__pyx_k_regex), 0, 1, 1}, /* PyObject cname: __pyx_n_u_regex */
   {__pyx_k_remaining, sizeof(__pyx_k_remaining), 0, 1, 1}, /* PyObject cname: __pyx_n_u_remaining */
+  {__pyx_k_replace, sizeof(__pyx_k_replace), 0, 1, 1}, /* PyObject cname: __pyx_n_u_replace */
   {__pyx_k_replaced_lines, sizeof(__pyx_k_replaced_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_replaced_lines */
   {__pyx_k_replacement, sizeof(__pyx_k_replacement), 0, 1, 1}, /* PyObject cname: __pyx_n_u_replacement */
   {__pyx_k_replacements_done, sizeof(__pyx_k_replacements_done), 0, 1, 1}, /* PyObject cname: __pyx_n_u_replacements_done */
@@ -5181,6 +5217,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_subn, sizeof(__pyx_k_subn), 0, 1, 1}, /* PyObject cname: __pyx_n_u_subn */
   {__pyx_k_syntax_aware, sizeof(__pyx_k_syntax_aware), 0, 1, 1}, /* PyObject cname: __pyx_n_u_syntax_aware */
   {__pyx_k_syntax_mode, sizeof(__pyx_k_syntax_mode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_syntax_mode */
+  {__pyx_k_template, sizeof(__pyx_k_template), 0, 1, 1}, /* PyObject cname: __pyx_n_u_template */
   {__pyx_k_test, sizeof(__pyx_k_test), 0, 1, 1}, /* PyObject cname: __pyx_n_u_test */
   {__pyx_k_word, sizeof(__pyx_k_word), 0, 1, 1}, /* PyObject cname: __pyx_n_u_word */
   {0, 0, 0, 0, 0}
@@ -5201,6 +5238,17 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
+  /* "cython_ext/replace_cython.pyx":57
+ *         pat = re.compile(re.escape(pattern), flags)
+ *     # Literal replacements: escape backslashes so re does not expand them
+ *     template = replacement if regex else replacement.replace("\\", r"\\")             # <<<<<<<<<<<<<<
+ * 
+ *     replaced_lines = []
+*/
+  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_kp_u__5, __pyx_mstate_global->__pyx_kp_u__6); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+
   /* "cython_ext/replace_cython.pyx":31
  * # --- Main batch replace ---
  * 
@@ -5208,9 +5256,9 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
  *     lines,
  *     pattern,
 */
-  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(6, ((PyObject*)Py_False), ((PyObject*)Py_False), ((PyObject*)Py_False), ((PyObject*)__pyx_mstate_global->__pyx_int_0), ((PyObject*)Py_False), ((PyObject*)__pyx_mstate_global->__pyx_n_u_all)); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(6, ((PyObject*)Py_False), ((PyObject*)Py_False), ((PyObject*)Py_False), ((PyObject*)__pyx_mstate_global->__pyx_int_0), ((PyObject*)Py_False), ((PyObject*)__pyx_mstate_global->__pyx_n_u_all)); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -5275,9 +5323,9 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_replace_cython_pyx, __pyx_mstate->__pyx_n_u_is_syntax_match, __pyx_k_3a_aq_S_Qa_S_1A_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {9, 0, 0, 17, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 31, 332};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_pattern, __pyx_mstate->__pyx_n_u_replacement, __pyx_mstate->__pyx_n_u_regex, __pyx_mstate->__pyx_n_u_ignore_case, __pyx_mstate->__pyx_n_u_word, __pyx_mstate->__pyx_n_u_max_replacements, __pyx_mstate->__pyx_n_u_syntax_aware, __pyx_mstate->__pyx_n_u_syntax_mode, __pyx_mstate->__pyx_n_u_flags, __pyx_mstate->__pyx_n_u_pat, __pyx_mstate->__pyx_n_u_replaced_lines, __pyx_mstate->__pyx_n_u_replacements_done, __pyx_mstate->__pyx_n_u_line, __pyx_mstate->__pyx_n_u_remaining, __pyx_mstate->__pyx_n_u_new_line, __pyx_mstate->__pyx_n_u_n};
-    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_replace_cython_pyx, __pyx_mstate->__pyx_n_u_batch_replace, __pyx_k_Bo_a_q_b_b_2Rwaz_b_7_Q_Q_D_q_a, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {9, 0, 0, 18, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 31, 349};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_pattern, __pyx_mstate->__pyx_n_u_replacement, __pyx_mstate->__pyx_n_u_regex, __pyx_mstate->__pyx_n_u_ignore_case, __pyx_mstate->__pyx_n_u_word, __pyx_mstate->__pyx_n_u_max_replacements, __pyx_mstate->__pyx_n_u_syntax_aware, __pyx_mstate->__pyx_n_u_syntax_mode, __pyx_mstate->__pyx_n_u_flags, __pyx_mstate->__pyx_n_u_pat, __pyx_mstate->__pyx_n_u_template, __pyx_mstate->__pyx_n_u_replaced_lines, __pyx_mstate->__pyx_n_u_replacements_done, __pyx_mstate->__pyx_n_u_line, __pyx_mstate->__pyx_n_u_remaining, __pyx_mstate->__pyx_n_u_new_line, __pyx_mstate->__pyx_n_u_n};
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_ext_replace_cython_pyx, __pyx_mstate->__pyx_n_u_batch_replace, __pyx_k_Bo_a_q_b_b_2Rwaz_b_7_Q_k_HAV1_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -8559,7 +8607,7 @@ __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
         result = name;
         name = NULL;
     } else {
-        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__5);
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__7);
     }
     goto done;
 }
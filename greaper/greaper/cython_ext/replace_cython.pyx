@@ -41,7 +41,8 @@ def batch_replace(
 ):
     """
     Batch replace occurrences of pattern in lines.
-    Supports plain, word, and regex replacement.
+    Supports plain, word, and regex replacement. replacement is inserted
+    as is, unless regex is set: then it is an re replacement string.
     Optionally restricts replacement to certain syntax contexts.
     Returns a list of replaced lines.
     """
@@ -52,6 +53,8 @@ def batch_replace(
         pat = re.compile(r"\b%s\b" % re.escape(pattern), flags)
     else:
         pat = re.compile(re.escape(pattern), flags)
+    # Literal replacements: escape backslashes so re does not expand them
+    template = replacement if regex else replacement.replace("\\", r"\\")
 
     replaced_lines = []
     replacements_done = 0
@@ -71,14 +74,14 @@ def batch_replace(
 
         if regex or word:
             if max_replacements:
-                new_line, n = pat.subn(replacement, line, count=remaining)
+                new_line, n = pat.subn(template, line, count=remaining)
             else:
-                new_line, n = pat.subn(replacement, line)
+                new_line, n = pat.subn(template, line)
         else:
             if max_replacements:
-                new_line, n = pat.subn(replacement, line, count=remaining)
+                new_line, n = pat.subn(template, line, count=remaining)
             else:
-                new_line, n = pat.subn(replacement, line)
+                new_line, n = pat.subn(template, line)
 
         replaced_lines.append(new_line)
         replacements_done += n
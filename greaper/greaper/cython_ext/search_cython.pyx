@@ -1,6 +1,8 @@
 # cython: language_level=3
 
 import re
+from array import array
+from libc.string cimport memchr, memcmp
 from cython_ext.fuzzy_cython import similarity_ratio
 
 # --- Syntax-aware helpers ---
@@ -55,16 +57,20 @@ def search_lines_cython(
     regex,
     syntax_aware=False,
     syntax_mode="comment",  # "comment", "string", "code", or "all"
+    compiled=None,
 ):
     """
     Cython-accelerated search loop with advanced syntax-aware filtering.
+    compiled is an already compiled pattern (e.g. Query.compiled) to reuse across calls.
     Returns a list of (line_number, match, context_before, context_after)
     """
     results = []
     n_lines = len(lines)
 
     # Compile pattern for regex/word/plain
-    if regex:
+    if compiled is not None:
+        pat = compiled
+    elif regex:
         try:
             pat = re.compile(pattern, pat_flags)
         except Exception:
@@ -94,4 +100,98 @@ def search_lines_cython(
             results.append((i+1, line.strip(), before, after))
             if len(results) >= max_results:
                 return results
-    return results
\ No newline at end of file
+    return results
+# --- Literal kernel over bytes buffers ---
+
+# Hits collected per GIL-released pass before they are copied out
+cdef enum:
+    HIT_BATCH = 4096
+
+cdef Py_ssize_t _find_literal(const unsigned char *hay, Py_ssize_t n, const unsigned char *needle,
+                              Py_ssize_t m, const Py_ssize_t *skip) nogil:
+    """
+    Offset of the first needle in hay, or -1. memchr on the first byte for
+    short needles, Boyer-Moore-Horspool for longer ones.
+    """
+    cdef Py_ssize_t i = 0
+    cdef const unsigned char *p
+    cdef unsigned char last
+    if m == 0:
+        return 0
+    if m < 4:
+        while i + m <= n:
+            p = <const unsigned char *>memchr(hay + i, needle[0], n - i - m + 1)
+            if p == NULL:
+                return -1
+            i = p - hay
+            if memcmp(p, needle, m) == 0:
+                return i
+            i += 1
+        return -1
+    last = needle[m - 1]
+    while i + m <= n:
+        if hay[i + m - 1] == last and memcmp(hay + i, needle, m - 1) == 0:
+            return i
+        i += skip[hay[i + m - 1]]
+    return -1
+
+def scan_literal(const unsigned char[::1] buf, bytes needle, Py_ssize_t pos=0, Py_ssize_t line_number=1,
+                 Py_ssize_t max_hits=HIT_BATCH):
+    """
+    Find up to max_hits lines of buf containing needle, starting at pos
+    (which must be the start of line line_number).
+    Returns (line_numbers, line_starts, line_ends, next_pos, next_line_number)
+    where the first three are array('q') and line_ends exclude the newline.
+    Line boundaries are only computed for lines that hit.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t m = len(needle)
+    cdef const unsigned char *base = &buf[0] if n else NULL
+    cdef const unsigned char *pat = needle
+    cdef Py_ssize_t skip[256]
+    cdef Py_ssize_t numbers[HIT_BATCH]
+    cdef Py_ssize_t starts[HIT_BATCH]
+    cdef Py_ssize_t ends[HIT_BATCH]
+    cdef Py_ssize_t i, hit, start, end, count
+    cdef const unsigned char *p
+    out_numbers = array("q")
+    out_starts = array("q")
+    out_ends = array("q")
+
+    for i in range(256):
+        skip[i] = m if m else 1
+    for i in range(m - 1):
+        skip[pat[i]] = m - 1 - i
+
+    while max_hits > 0 and pos < n:
+        count = 0
+        with nogil:
+            while count < HIT_BATCH and count < max_hits and pos < n:
+                hit = _find_literal(base + pos, n - pos, pat, m, skip)
+                if hit < 0:
+                    pos = n
+                    break
+                hit += pos
+                # Count the newlines up to the hit; the last one starts its line
+                start = pos
+                p = <const unsigned char *>memchr(base + pos, 10, hit - pos)
+                while p != NULL:
+                    line_number += 1
+                    start = p - base + 1
+                    p = <const unsigned char *>memchr(base + start, 10, hit - start)
+                p = <const unsigned char *>memchr(base + hit, 10, n - hit)
+                end = n if p == NULL else p - base
+                numbers[count] = line_number
+                starts[count] = start
+                ends[count] = end
+                count += 1
+                pos = end + 1
+                line_number += 1
+        for i in range(count):
+            out_numbers.append(numbers[i])
+            out_starts.append(starts[i])
+            out_ends.append(ends[i])
+        max_hits -= count
+        if count < HIT_BATCH:
+            break
+    return out_numbers, out_starts, out_ends, pos, line_number
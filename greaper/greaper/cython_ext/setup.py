@@ -1,11 +1,18 @@
 from setuptools import setup, Extension, find_packages
 from Cython.Build import cythonize
 import numpy
+import sys
+
+# fuzzy_score_block(parallel=True) uses OpenMP
+OPENMP_FLAGS = ["/openmp"] if sys.platform == "win32" else ["-fopenmp"]
 
 ext_modules = cythonize([
     Extension(
         "cython_ext.fuzzy_cython",
         ["cython_ext/fuzzy_cython.pyx"],
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=OPENMP_FLAGS,
+        extra_link_args=[] if sys.platform == "win32" else OPENMP_FLAGS,
     ),
     Extension(
         "cython_ext.search_cython",
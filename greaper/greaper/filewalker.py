@@ -1,24 +1,422 @@
-from pathlib import Path
+import fnmatch
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path, PurePath
 from greaper.archive import is_archive, list_archive_files
+from greaper.config import CACHE_DIR
 
-def is_text_file(filepath, blocksize=2048):
-    """Robust check to skip binary files using heuristics and file extension."""
-    text_extensions = {'.py', '.js', '.ts', '.java', '.c', '.cpp', '.h', '.hpp', '.sh', '.md', '.txt', '.json', '.yaml', '.yml', '.toml', '.ini'}
-    ext = Path(filepath).suffix.lower()
-    if ext in text_extensions:
+# --- Text/binary classification ---
+# These tables are module-level so callers can extend them at runtime.
+
+# Always treated as text; never opened for sniffing
+TEXT_EXTENSIONS = {
+    '.py', '.js', '.ts', '.java', '.c', '.cpp', '.h', '.hpp', '.sh', '.md', '.txt',
+    '.json', '.yaml', '.yml', '.toml', '.ini',
+}
+# Always treated as binary; never opened for sniffing
+BINARY_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.pdf', '.exe', '.dll',
+    '.so', '.dylib', '.o', '.a', '.lib', '.obj', '.pyc', '.pyo', '.pyd', '.class',
+    '.db', '.sqlite', '.woff', '.woff2', '.ttf', '.otf', '.mp3', '.mp4', '.wav', '.avi',
+}
+# File signature -> is_text, checked before the printable-ratio heuristic
+MAGIC_NUMBERS = {
+    b"\x7fELF": False,
+    b"\x89PNG\r\n\x1a\n": False,
+    b"GIF87a": False,
+    b"GIF89a": False,
+    b"\xff\xd8\xff": False,
+    b"%PDF-": False,
+    b"\xca\xfe\xba\xbe": False,
+    b"SQLite format 3\x00": False,
+    b"\xef\xbb\xbf": True,  # UTF-8 byte order mark
+    b"#!": True,
+}
+_TEXT_CHARACTERS = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)))
+
+class FileTypeCache:
+    """
+    Persistent text/binary classification cache keyed by (path, size, mtime).
+    Backed by SQLite in the Greaper cache directory, so it is shared across
+    queries and processes. New entries are written in batches; call flush()
+    when a walk finishes.
+    """
+
+    FLUSH_EVERY = 1000
+
+    def __init__(self, db_path=None):
+        self.db_path = str(db_path or CACHE_DIR / "filetypes.db")
+        self._conn = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS filetypes ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, is_text INTEGER)"
+            )
+        return self._conn
+
+    def get(self, path, size, mtime_ns):
+        """Return the cached classification, or None if unknown or stale."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT size, mtime_ns, is_text FROM filetypes WHERE path = ?", (path,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None or row[0] != size or row[1] != mtime_ns:
+            return None
+        return bool(row[2])
+
+    def put(self, path, size, mtime_ns, is_text):
+        with self._lock:
+            self._pending.append((path, size, mtime_ns, int(is_text)))
+            full = len(self._pending) >= self.FLUSH_EVERY
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            try:
+                conn = self._connect()
+                conn.executemany("INSERT OR REPLACE INTO filetypes VALUES (?, ?, ?, ?)", pending)
+                conn.commit()
+            except sqlite3.Error:
+                pass  # the cache is an optimization; never fail a search over it
+
+_file_type_cache = None
+
+def get_file_type_cache():
+    """Return the process-wide FileTypeCache."""
+    global _file_type_cache
+    if _file_type_cache is None:
+        _file_type_cache = FileTypeCache()
+    return _file_type_cache
+
+def sniff_is_text(chunk):
+    """Classify the first bytes of a file using MAGIC_NUMBERS, then the printable-ratio heuristic."""
+    for magic, is_text in MAGIC_NUMBERS.items():
+        if chunk.startswith(magic):
+            return is_text
+    if b"\0" in chunk:
+        return False
+    # Heuristic: if >95% printable, treat as text
+    nontext = chunk.translate(None, _TEXT_CHARACTERS)
+    return float(len(nontext)) / float(len(chunk) or 1) < 0.05
+
+def is_text_file(filepath, blocksize=2048, cache=None):
+    """
+    Robust check to skip binary files using heuristics and file extension.
+    Files that need sniffing are looked up in (and added to) cache, a
+    FileTypeCache; pass cache=None to always sniff.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in TEXT_EXTENSIONS:
         return True
+    if ext in BINARY_EXTENSIONS:
+        return False
     try:
+        if cache is not None:
+            st = os.stat(filepath)
+            key = os.path.abspath(filepath)
+            cached = cache.get(key, st.st_size, st.st_mtime_ns)
+            if cached is not None:
+                return cached
         with open(filepath, "rb") as f:
-            chunk = f.read(blocksize)
-            if b"\0" in chunk:
-                return False
-            # Heuristic: if >95% printable, treat as text
-            text_characters = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)))
-            nontext = chunk.translate(None, text_characters)
-            return float(len(nontext)) / float(len(chunk) or 1) < 0.05
+            is_text = sniff_is_text(f.read(blocksize))
+        if cache is not None:
+            cache.put(key, st.st_size, st.st_mtime_ns, is_text)
+        return is_text
     except Exception:
         return False
 
+# --- Ignore files ---
+
+IGNORE_FILES = (".gitignore", ".ignore")
+# VCS metadata is never searched when ignore files are honored
+VCS_DIRS = {".git", ".hg", ".svn"}
+
+def _translate_ignore_glob(glob):
+    """Translate a gitignore glob (without anchoring or negation) to a regex body."""
+    out = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = glob.find("]", i + 2)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = glob[i+1:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(glob[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+def parse_ignore_file(lines, base=""):
+    """
+    Parse .gitignore-style lines into rules relative to base (a '/'-separated
+    directory relative to the search root).
+    Each rule is (base, compiled_regex, negate, dir_only).
+    """
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip("\r")
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        negate = line.startswith("!")
+        if negate or line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        body = _translate_ignore_glob(line.lstrip("/"))
+        regex = re.compile(("^" if anchored else "^(?:.*/)?") + body + "$")
+        rules.append((base, regex, negate, dir_only))
+    return rules
+
+def is_ignored(rel_path, is_dir, rules):
+    """Return True if the last rule matching rel_path ('/'-separated, relative to the root) ignores it."""
+    ignored = False
+    for base, regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + "/"):
+                continue
+            sub = rel_path[len(base)+1:]
+        else:
+            sub = rel_path
+        if regex.match(sub):
+            ignored = not negate
+    return ignored
+
+def _load_ignore_rules(dir_path, rel_dir):
+    rules = []
+    for name in IGNORE_FILES:
+        try:
+            with open(os.path.join(dir_path, name), encoding="utf-8", errors="ignore") as f:
+                rules.extend(parse_ignore_file(f, base=rel_dir))
+        except OSError:
+            continue
+    return rules
+
+# --- Directory walker ---
+
+def _is_file_glob(ex):
+    """Excludes with a wildcard in their last part ('*.log') apply to files only, as before pruning."""
+    return not ex.endswith("/") and any(c in ex.rsplit("/", 1)[-1] for c in "*?[")
+
+def _excluded_dir(dir_path, exclude):
+    """
+    A directory is pruned if an exclude names it ('node_modules', 'build/',
+    'src/gen') or excludes its contents ('dir/*', 'dir/**'). File globs such
+    as '*.log' never prune a directory.
+    """
+    p = PurePath(dir_path)
+    for ex in exclude:
+        if ex.endswith("/**"):
+            ex = ex[:-3]
+        elif ex.endswith("/*"):
+            ex = ex[:-2]
+        elif _is_file_glob(ex):
+            continue
+        ex = ex.rstrip("/")
+        if ex and p.match(ex):
+            return True
+    return False
+
+def _pruned_dir(dir_path, rel_dir, rules, exclude, ignore_files):
+    """True if walk_files() does not descend into dir_path, given its parent's ignore rules."""
+    if ignore_files and (os.path.basename(dir_path) in VCS_DIRS or is_ignored(rel_dir, True, rules)):
+        return True
+    return bool(exclude) and _excluded_dir(dir_path, exclude)
+
+def _ignored_below(root, path):
+    """
+    The .gitignore/.ignore check of walk_files(root) for one path under root:
+    True if the rules loaded from root down to its directory ignore path or
+    one of its parent directories.
+    """
+    rel = PurePath(os.path.relpath(path, root)).as_posix()
+    if rel == "." or rel == ".." or rel.startswith("../"):
+        return False
+    rules = []
+    dir_path, rel_dir = root, ""
+    for name in rel.split("/")[:-1]:
+        rules = rules + _load_ignore_rules(dir_path, rel_dir)
+        dir_path = os.path.join(dir_path, name)
+        rel_dir = f"{rel_dir}/{name}" if rel_dir else name
+        if _pruned_dir(dir_path, rel_dir, rules, None, True):
+            return True
+    rules = rules + _load_ignore_rules(dir_path, rel_dir)
+    return is_ignored(rel, os.path.isdir(path), rules)
+
+def _scan_dir(dir_path, rel_dir, rules, include, exclude, ignore_files):
+    """
+    List one directory.
+    Returns (files, subdirs): matching file paths in name order, and
+    (path, rel_path, rules) for every subdirectory that survived pruning.
+    """
+    if ignore_files:
+        rules = rules + _load_ignore_rules(dir_path, rel_dir)
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return [], []
+    files = []
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        child = name if dir_path == "." else os.path.join(dir_path, name)
+        rel = f"{rel_dir}/{name}" if rel_dir else name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            if not _pruned_dir(child, rel, rules, exclude, ignore_files):
+                subdirs.append((child, rel, rules))
+            continue
+        if ignore_files and rules and is_ignored(rel, False, rules):
+            continue
+        if not any(fnmatch.fnmatch(name, inc) if "/" not in inc else PurePath(rel).match(inc) for inc in include):
+            continue
+        if exclude and any(PurePath(child).match(ex) for ex in exclude if not ex.endswith("/")):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+        files.append(child)
+    return files, subdirs
+
+def walk_files(path=".", include=None, exclude=None, ignore_files=True, threads=1):
+    """
+    Single-pass os.scandir walk yielding file paths that match include globs.
+    Excluded and ignored directories are pruned before they are descended into;
+    .gitignore/.ignore files are honored when ignore_files is True.
+    threads > 1 lists directories concurrently (yield order is then not stable).
+    """
+    include = include or ["*"]
+    exclude = exclude or []
+    root = str(Path(path))
+    if os.path.isfile(root):
+        yield root
+        return
+    if threads <= 1:
+        stack = [(root, "", [])]
+        while stack:
+            dir_path, rel_dir, rules = stack.pop()
+            files, subdirs = _scan_dir(dir_path, rel_dir, rules, include, exclude, ignore_files)
+            yield from files
+            stack.extend(reversed(subdirs))
+        return
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        pending = {pool.submit(_scan_dir, root, "", [], include, exclude, ignore_files)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for dir_path, rel_dir, rules in subdirs:
+                    pending.add(pool.submit(_scan_dir, dir_path, rel_dir, rules, include, exclude, ignore_files))
+                yield from files
+
+def iter_files_to_search(
+    path=".",
+    include=None,
+    exclude=None,
+    archives=True,
+    ignore_files=True,
+    threads=1,
+    stats=None,
+    type_cache=True,
+):
+    """
+    Yield text files and archive members to search as they are discovered, applying include/exclude globs.
+    Archive members are yielded as (archive_path, inner_path) tuples; archives=False skips archives entirely.
+    If a stats dict is given, time spent walking and classifying is added to
+    stats["walk_time"] and the number of yielded entries to stats["files"].
+    type_cache=True reuses the shared text/binary classification cache
+    (see FileTypeCache); pass a FileTypeCache to use another, or False to sniff every file.
+    """
+    if type_cache is True:
+        type_cache = get_file_type_cache()
+    elif not type_cache:
+        type_cache = None
+    clock = time.perf_counter
+    walk_time = 0.0
+    count = 0
+    started = clock()
+    try:
+        for f in walk_files(path=path, include=include, exclude=exclude, ignore_files=ignore_files, threads=threads):
+            if is_archive(f):
+                if not archives:
+                    continue
+                entries = [(f, inner) for inner in list_archive_files(f)]
+            elif is_text_file(f, cache=type_cache):
+                entries = [f]
+            else:
+                continue
+            walk_time += clock() - started
+            started = None
+            for entry in entries:
+                # Optionally, filter archive members by extension or name here
+                count += 1
+                yield entry
+            started = clock()
+    finally:
+        if type_cache is not None:
+            type_cache.flush()
+        if started is not None:
+            walk_time += clock() - started
+        if stats is not None:
+            stats["walk_time"] = stats.get("walk_time", 0.0) + walk_time
+            stats["files"] = stats.get("files", 0) + count
+
 def get_files_to_search(
     path=".",
     include=None,
@@ -28,22 +426,4 @@ def get_files_to_search(
     Returns a list of text files and archive members to search, applying include/exclude globs.
     Archive members are returned as (archive_path, inner_path) tuples.
     """
-    include = include or ["*"]
-    exclude = exclude or []
-    root = Path(path)
-    files_to_search = set()
-    for inc in include:
-        files_to_search.update(root.rglob(inc))
-
-    result = []
-    for f in files_to_search:
-        if any(f.match(ex) for ex in exclude) or not f.is_file():
-            continue
-        if is_archive(f):
-            # Add each file inside the archive as a tuple
-            for inner in list_archive_files(str(f)):
-                # Optionally, filter archive members by extension or name here
-                result.append((str(f), inner))
-        elif is_text_file(f):
-            result.append(str(f))
-    return result
\ No newline at end of file
+    return list(iter_files_to_search(path=path, include=include, exclude=exclude))
@@ -4,6 +4,7 @@ from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from textual import events
 from textual.screen import ModalScreen
+from textual.worker import get_current_worker
 
 from greaper.utils import list_utilities, run_utility, get_utility_doc
 from greaper.themes import THEMES
@@ -62,6 +63,7 @@ class GreaperApp(App):
         self.theme_index = 0
         self.theme_name = self.theme_names[self.theme_index]
         self._current_theme = THEMES[self.theme_name]
+        self._watch_rows = {}  # file -> row keys shown for it in watch mode
 
     @classmethod
     def from_cli_args(cls, args):
@@ -97,6 +99,7 @@ class GreaperApp(App):
                 yield Checkbox("Fuzzy", id="fuzzy_checkbox")
                 yield Checkbox("Syntax Aware", id="syntax_checkbox")
                 yield Checkbox("Whole Word", id="wholeword_checkbox")
+                yield Checkbox("Watch", id="watch_checkbox")
                 yield Input(placeholder="Context lines (e.g. 2)", id="context_input")
                 yield Input(placeholder="Include globs (e.g. *.py *.md)", id="include_input")
                 yield Input(placeholder="Exclude globs (e.g. *.log *.tmp)", id="exclude_input")
@@ -202,8 +205,7 @@ class GreaperApp(App):
             await self.action_quit()
             return
         if value == "back":
-            table = self.query_one("#results_table", DataTable)
-            table.clear()
+            self.clear_results()
             self.query_one("#search_input", Input).focus()
             return
         await self.perform_search()
@@ -252,8 +254,6 @@ class GreaperApp(App):
         # Add more widgets here as needed
 
     async def perform_search(self):
-        from greaper.core import search_files
-
         pattern = self.query_one("#search_input", Input).value
         if not pattern:
             await self.push_screen(ErrorModal("Please enter a search pattern."))
@@ -280,40 +280,88 @@ class GreaperApp(App):
 
         syntax_mode = self.query_one("#syntaxmode_select", Select).value
 
+        self.clear_results()
+        search_kwargs = dict(
+            pattern=pattern,
+            path=path,
+            fuzzy=fuzzy,
+            ignore_case=case,
+            word=whole_word,
+            context=context,
+            include=include,
+            exclude=exclude,
+            max_results=max_results,
+            syntax_aware=syntax_aware,
+            syntax_mode=syntax_mode,
+            regex=regex,
+            result_cache=True,
+        )
+        stream = self._stream_search
+        if self.query_one("#watch_checkbox", Checkbox).value:
+            stream = self._stream_watch
+        # Stream hits into the table from a thread so rows appear while the tree is still being searched
+        self.run_worker(
+            lambda: stream(search_kwargs),
+            thread=True,
+            exclusive=True,
+            group="search",
+        )
+
+    def _stream_search(self, search_kwargs):
+        from greaper.core import iter_search_files
+
+        worker = get_current_worker()
         try:
-            results = search_files(
-                pattern=pattern,
-                path=path,
-                fuzzy=fuzzy,
-                ignore_case=case,
-                word=whole_word,
-                context=context,
-                include=include,
-                exclude=exclude,
-                max_results=max_results,
-                syntax_aware=syntax_aware,
-                syntax_mode=syntax_mode,
-                regex=regex,
-            )
+            for result in iter_search_files(**search_kwargs):
+                if worker.is_cancelled:
+                    return
+                self.call_from_thread(self.add_result_row, result)
         except Exception as e:
-            await self.push_screen(ErrorModal(f"Search error: {e}"))
-            return
+            self.call_from_thread(self.push_screen, ErrorModal(f"Search error: {e}"))
+
+    def _stream_watch(self, search_kwargs):
+        from greaper.watch import watch_search
+
+        worker = get_current_worker()
+        # Checked after every poll, so a cancelled watch stops without waiting for a file event
+        updates = watch_search(**search_kwargs, interval=0.5, cancelled=lambda: worker.is_cancelled)
+        try:
+            for file, results in updates:
+                if worker.is_cancelled:
+                    return
+                self.call_from_thread(self.replace_file_rows, file, results)
+        except Exception as e:
+            self.call_from_thread(self.push_screen, ErrorModal(f"Watch error: {e}"))
+        finally:
+            updates.close()  # closes the watcher (and its inotify descriptor)
+
+    def clear_results(self):
+        """Empty the results table, and forget the rows watch mode tracks in it."""
+        self.query_one("#results_table", DataTable).clear()
+        self.search_results = []
+        self._watch_rows = {}
+
+    def add_result_row(self, result, key=None):
+        file, line, match, before, after = result[:5]
+        self.search_results.append(result)
+        table = self.query_one("#results_table", DataTable)
+        return table.add_row(
+            str(file),
+            str(line),
+            match,
+            "\n".join(before) if before else "",
+            "\n".join(after) if after else "",
+            key=key,
+        )
 
-        self.search_results = results
+    def replace_file_rows(self, file, results):
+        """Swap the rows of one file for its updated hits (watch mode)."""
         table = self.query_one("#results_table", DataTable)
-        table.clear()
-        alt = False
-        for file, line, match, before, after in results:
-            before_text = "\n".join(before) if before else ""
-            after_text = "\n".join(after) if after else ""
-            table.add_row(
-                str(file),
-                str(line),
-                match,
-                before_text,
-                after_text
-            )
-            alt = not alt
+        rows = self._watch_rows
+        for key in rows.pop(file, []):
+            table.remove_row(key)
+        self.search_results = [r for r in self.search_results if os.path.normpath(str(r[0]).split("::", 1)[0]) != file]
+        rows[file] = [self.add_result_row(result) for result in results]
 
     async def action_quit(self) -> None:
         await self.shutdown()
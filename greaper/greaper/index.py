@@ -0,0 +1,313 @@
+"""
+Persistent trigram index for Greaper.
+Maps every trigram of a file's (casefolded) text to the file, so literal and
+regex searches only open files that can possibly match. Refreshes are
+incremental: files whose size, mtime and inode are unchanged are skipped.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from greaper.config import CACHE_DIR
+from greaper.filewalker import iter_files_to_search
+
+# Bigger files are recorded but never filtered out
+MAX_INDEXED_FILE_SIZE = 64 * 1024 * 1024
+# Files per transaction while (re)indexing
+COMMIT_EVERY = 500
+# SQLite host-parameter limit is 999 on older builds
+_SQL_CHUNK = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    indexed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+"""
+
+def default_index_path(root):
+    """Location of the index for a search root, inside the Greaper cache directory."""
+    digest = hashlib.sha1(os.path.abspath(root).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / "index" / f"{digest}.db"
+
+def text_trigrams(text):
+    """Return the set of trigram keys of text (casefolded, so one index serves -i and case-sensitive queries)."""
+    text = text.casefold()
+    grams = {text[i:i+3] for i in range(len(text) - 2)}
+    return {(ord(g[0]) << 42) | (ord(g[1]) << 21) | ord(g[2]) for g in grams}
+
+# --- Query planning ---
+# A plan is None (no usable trigrams: every file is a candidate),
+# ("tri", keys) (file must contain all keys), or ("and"/"or", [plans]).
+
+def _plan_literal(text):
+    keys = text_trigrams(text)
+    return ("tri", frozenset(keys)) if keys else None
+
+def _plan_and(plans):
+    plans = [p for p in plans if p is not None]
+    if not plans:
+        return None
+    return plans[0] if len(plans) == 1 else ("and", plans)
+
+def _plan_or(plans):
+    if not plans or any(p is None for p in plans):
+        return None
+    return ("or", plans)
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, "POSSESSIVE_REPEAT"):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+
+def _plan_sequence(items):
+    parts = []
+    run = []
+
+    def flush():
+        if run:
+            parts.append(_plan_literal("".join(run)))
+            run.clear()
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+        elif op is sre_constants.AT:
+            # Anchors are zero-width: literals on both sides stay adjacent
+            continue
+        elif op is sre_constants.SUBPATTERN:
+            flush()
+            parts.append(_plan_sequence(av[-1]))
+        elif op in _REPEATS:
+            flush()
+            low, _high, item = av
+            if low >= 1:
+                parts.append(_plan_sequence(item))
+        elif op is sre_constants.BRANCH:
+            flush()
+            parts.append(_plan_or([_plan_sequence(branch) for branch in av[1]]))
+        else:
+            # Character classes, wildcards, backrefs, lookarounds: nothing required
+            flush()
+    flush()
+    return _plan_and(parts)
+
+def plan_query(pattern, regex=False):
+    """
+    Return the trigram plan for a search pattern, or None if the pattern has
+    no usable trigrams and a full scan is needed.
+    """
+    if not regex:
+        return _plan_literal(pattern)
+    try:
+        return _plan_sequence(sre_parse.parse(pattern))
+    except Exception:
+        return None
+
+class TrigramIndex:
+    """
+    On-disk trigram index (SQLite) for one search root.
+    Paths are stored relative to the root.
+    """
+
+    def __init__(self, root=".", index_path=None):
+        self.root = os.path.abspath(root)
+        self.index_path = str(index_path or default_index_path(self.root))
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.index_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def exists(self):
+        return os.path.exists(self.index_path)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def build(self, include=None, exclude=None):
+        """Discard the index and index the whole tree again."""
+        conn = self.conn
+        conn.execute("DELETE FROM postings")
+        conn.execute("DELETE FROM files")
+        conn.commit()
+        return self.update(include=include, exclude=exclude)
+
+    def update(self, include=None, exclude=None):
+        """
+        Bring the index up to date with the tree.
+        Only new files and files whose size/mtime/inode changed are re-read.
+        Returns a dict of counters: added, updated, removed, unchanged, seconds.
+        """
+        start = time.perf_counter()
+        conn = self.conn
+        known = {
+            path: (file_id, (size, mtime_ns, inode))
+            for file_id, path, size, mtime_ns, inode in conn.execute(
+                "SELECT id, path, size, mtime_ns, inode FROM files"
+            )
+        }
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        pending = 0
+        for file in iter_files_to_search(path=self.root, include=include, exclude=exclude, archives=False):
+            rel = os.path.relpath(file, self.root)
+            seen.add(rel)
+            try:
+                st = os.stat(file)
+            except OSError:
+                continue
+            signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+            entry = known.get(rel)
+            if entry is not None and entry[1] == signature:
+                stats["unchanged"] += 1
+                continue
+
+            indexed = st.st_size <= MAX_INDEXED_FILE_SIZE
+            keys = ()
+            if indexed:
+                try:
+                    with open(file, encoding="utf-8", errors="ignore") as f:
+                        keys = text_trigrams(f.read())
+                except Exception:
+                    indexed = False
+            if entry is None:
+                file_id = conn.execute(
+                    "INSERT INTO files (path, size, mtime_ns, inode, indexed) VALUES (?, ?, ?, ?, ?)",
+                    (rel, *signature, int(indexed)),
+                ).lastrowid
+                stats["added"] += 1
+            else:
+                file_id = entry[0]
+                conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                conn.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ?, inode = ?, indexed = ? WHERE id = ?",
+                    (*signature, int(indexed), file_id),
+                )
+                stats["updated"] += 1
+            conn.executemany(
+                "INSERT INTO postings (trigram, file_id) VALUES (?, ?)",
+                ((key, file_id) for key in keys),
+            )
+            pending += 1
+            if pending >= COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+
+        for rel, (file_id, _sig) in known.items():
+            if rel not in seen:
+                conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                stats["removed"] += 1
+        conn.commit()
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
+    def stats(self):
+        """Return the number of files and postings in the index."""
+        conn = self.conn
+        files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        postings = conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+        return {"files": files, "postings": postings, "index_path": self.index_path}
+
+    def _lookup(self, keys):
+        """Return the ids of files containing every trigram in keys."""
+        keys = list(keys)
+        result = None
+        for i in range(0, len(keys), _SQL_CHUNK):
+            chunk = keys[i:i+_SQL_CHUNK]
+            rows = self.conn.execute(
+                "SELECT file_id FROM postings WHERE trigram IN (%s) "
+                "GROUP BY file_id HAVING COUNT(*) = ?" % ",".join("?" * len(chunk)),
+                (*chunk, len(chunk)),
+            )
+            ids = {row[0] for row in rows}
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def _evaluate(self, plan):
+        kind, value = plan
+        if kind == "tri":
+            return self._lookup(value)
+        sets = [self._evaluate(p) for p in value]
+        if kind == "and":
+            return set.intersection(*sets)
+        return set().union(*sets)
+
+    def candidate_filter(self, pattern, regex=False):
+        """
+        Return a predicate telling whether a file may contain pattern (or any
+        pattern of a list), or None when the pattern has no usable trigrams
+        (or there is no index) and every file must be scanned.
+        Files missing from the index or changed since it was refreshed, large
+        unindexed files and archive members always pass.
+        """
+        if isinstance(pattern, (list, tuple)):
+            # Several patterns: a file is a candidate if it may hold any of them
+            plans = [plan_query(p, regex=regex) for p in pattern]
+            plan = None if None in plans else plans[0] if len(plans) == 1 else ("or", plans)
+        else:
+            plan = plan_query(pattern, regex=regex)
+        if plan is None or not self.exists():
+            return None
+        candidates = self._evaluate(plan)
+        files = {
+            path: (file_id, size, mtime_ns, indexed)
+            for file_id, path, size, mtime_ns, indexed in self.conn.execute(
+                "SELECT id, path, size, mtime_ns, indexed FROM files"
+            )
+        }
+        root = self.root
+
+        def is_candidate(file):
+            if isinstance(file, tuple):
+                return True
+            entry = files.get(os.path.relpath(file, root))
+            if entry is None:
+                return True
+            file_id, size, mtime_ns, indexed = entry
+            if not indexed:
+                return True
+            try:
+                st = os.stat(file)
+            except OSError:
+                return True
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                return True
+            return file_id in candidates
+
+        return is_candidate
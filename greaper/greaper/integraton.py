@@ -3,76 +3,122 @@ Integration layer for Greaper.
 Provides high-level functions to connect Greaper's core features with external tools, editors, and scripts.
 """
 
-from greaper.core import search_files
+from greaper.core import iter_search_files
 
 import json
 import csv
 import io
+import sys
+from itertools import chain
+
+# --- Result line formats (shared by the exporters and the stream_* writers) ---
+def _vscode_line(r):
+    return f"{r[0]}:{r[1]}: {r[2]}"
+
+def _jetbrains_line(r):
+    return f"{r[0]}({r[1]}): {r[2]}"
+
+def _quickfix_line(r):
+    # Quickfix columns are 1-based
+    return f"{r[0]}:{r[1]}:{getattr(r, 'column', 0) + 1}: {r[2]}"
+
+def _iter_sublime_lines(results):
+    last_file = None
+    for r in results:
+        if r[0] != last_file:
+            yield f"{r[0]}:"
+            last_file = r[0]
+        yield f"  {r[1]}: {r[2]}"
+
+def _ndjson_line(r):
+    record = {"file": r[0], "line": r[1], "column": getattr(r, "column", 0), "match": r[2], "before": r[3], "after": r[4]}
+    if len(r) > 5:
+        record["patterns"] = r[5]
+    return json.dumps(record, ensure_ascii=False)
+
+def _iter_markdown_lines(results):
+    yield "| File | Line | Match |"
+    yield "|------|------|-------|"
+    for r in results:
+        yield f"| `{r[0]}` | {r[1]} | `{r[2]}` |"
+
+CSV_HEADER = ["file", "line_number", "line", "before", "after"]
+
+def _csv_header(kwargs):
+    """CSV_HEADER, plus a pattern column when the search (patterns=) names the patterns hit."""
+    return CSV_HEADER + ["pattern"] if kwargs.get("patterns") else CSV_HEADER
+
+def _csv_row(r):
+    # The patterns hit, joined like an alternation
+    return list(r[:5]) + ["|".join(r[5])] if len(r) > 5 else r
 
 # --- VS Code Integration ---
 def export_for_vscode(pattern, path=".", **kwargs):
     """
     Export results in VS Code 'problems' format: file:line: matched line
     """
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    return "\n".join(f"{r[0]}:{r[1]}: {r[2]}" for r in results)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return "\n".join(map(_vscode_line, results))
 
 # --- Sublime Text Integration ---
 def export_for_sublime(pattern, path=".", **kwargs):
     """
     Export results in Sublime Text 'Find Results' format.
     """
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    output = []
-    last_file = None
-    for r in results:
-        if r[0] != last_file:
-            output.append(f"{r[0]}:")
-            last_file = r[0]
-        output.append(f"  {r[1]}: {r[2]}")
-    return "\n".join(output)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return "\n".join(_iter_sublime_lines(results))
 
 # --- JetBrains IDEs (PyCharm, IntelliJ, etc.) Integration ---
 def export_for_jetbrains(pattern, path=".", **kwargs):
     """
     Export results in JetBrains 'Find in Path' format: file(line): matched line
     """
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    return "\n".join(f"{r[0]}({r[1]}): {r[2]}" for r in results)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return "\n".join(map(_jetbrains_line, results))
 
 # --- Vim/Neovim Quickfix Integration ---
 def export_for_vim_quickfix(pattern, path=".", **kwargs):
     """
     Export results in Vim/Neovim quickfix format: file:line:col: matched line
-    (col is always 1 for now; can be improved with match highlighting)
+    (col is the 1-based column where the match starts)
     """
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    return "\n".join(f"{r[0]}:{r[1]}:1: {r[2]}" for r in results)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return "\n".join(map(_quickfix_line, results))
 
 # --- Emacs Compilation Buffer Integration ---
 def export_for_emacs(pattern, path=".", **kwargs):
     """
     Export results in Emacs compilation buffer format: file:line: matched line
     """
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    return "\n".join(f"{r[0]}:{r[1]}: {r[2]}" for r in results)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return "\n".join(map(_vscode_line, results))
 
 # --- JSON/CSV/Markdown Export for Data Science/Reporting ---
+def _iter_json_array(results):
+    """
+    Encode results one at a time, producing the same text as json.dumps(list(results), indent=2).
+    """
+    first = True
+    for r in results:
+        yield ("[\n  " if first else ",\n  ") + json.dumps(list(r), indent=2).replace("\n", "\n  ")
+        first = False
+    yield "[]" if first else "\n]"
+
 def export_as_json(pattern, path=".", export_path=None, **kwargs):
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    output = json.dumps(results, indent=2)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    output = "".join(_iter_json_array(results))
     if export_path:
         with open(export_path, "w", encoding="utf-8") as f:
             f.write(output)
     return output
 
 def export_as_csv(pattern, path=".", export_path=None, **kwargs):
-    results = search_files(pattern=pattern, path=path, **kwargs)
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
     output_io = io.StringIO()
     writer = csv.writer(output_io)
-    writer.writerow(["file", "line_number", "line", "before", "after"])
+    writer.writerow(_csv_header(kwargs))
     for row in results:
-        writer.writerow(row)
+        writer.writerow(_csv_row(row))
     output = output_io.getvalue()
     if export_path:
         with open(export_path, "w", encoding="utf-8") as f:
@@ -80,21 +126,107 @@ def export_as_csv(pattern, path=".", export_path=None, **kwargs):
     return output
 
 def export_as_markdown(pattern, path=".", export_path=None, **kwargs):
-    results = search_files(pattern=pattern, path=path, **kwargs)
-    output = "| File | Line | Match |\n|------|------|-------|\n"
-    for r in results:
-        output += f"| `{r[0]}` | {r[1]} | `{r[2]}` |\n"
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    output = "".join(line + "\n" for line in _iter_markdown_lines(results))
     if export_path:
         with open(export_path, "w", encoding="utf-8") as f:
             f.write(output)
     return output
 
+# --- Streaming exporters ---
+# Lines written per out.write() call once the first line is out
+STREAM_BATCH = 512
+
+def _write_lines(lines, out):
+    """
+    Write lines to out as they are produced. The first line is flushed
+    at once; after that, lines are written in batches of STREAM_BATCH.
+    Returns the number of lines written.
+    """
+    count = 0
+    batch = []
+    for line in lines:
+        batch.append(line)
+        count += 1
+        if count == 1 or len(batch) >= STREAM_BATCH:
+            out.write("\n".join(batch) + "\n")
+            out.flush()
+            batch = []
+    if batch:
+        out.write("\n".join(batch) + "\n")
+    out.flush()
+    return count
+
+def _stream(lines, out, export_path):
+    if export_path:
+        with open(export_path, "w", encoding="utf-8", newline="") as f:
+            return _write_lines(lines, f)
+    return _write_lines(lines, out if out is not None else sys.stdout)
+
+def stream_ndjson(pattern, path=".", out=None, export_path=None, **kwargs):
+    """
+    Write one JSON object per result (JSON Lines) to out (default stdout) or
+    export_path while the search runs. Memory stays flat however many hits
+    there are. Returns the number of results written.
+    """
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return _stream(map(_ndjson_line, results), out, export_path)
+
+def stream_csv(pattern, path=".", out=None, export_path=None, **kwargs):
+    """
+    Streaming export_as_csv() (same columns, one row per line): rows are
+    written as they are found.
+    Returns the number of results written.
+    """
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    row_io = io.StringIO()
+    writer = csv.writer(row_io, lineterminator="")
+
+    def rows():
+        for row in chain([_csv_header(kwargs)], map(_csv_row, results)):
+            row_io.seek(0)
+            row_io.truncate()
+            writer.writerow(row)
+            yield row_io.getvalue()
+    return _stream(rows(), out, export_path) - 1
+
+def stream_quickfix(pattern, path=".", out=None, export_path=None, **kwargs):
+    """
+    Streaming export_for_vim_quickfix(), e.g. for :cgetexpr system(...).
+    Returns the number of results written.
+    """
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return _stream(map(_quickfix_line, results), out, export_path)
+
+def stream_sublime(pattern, path=".", out=None, export_path=None, **kwargs):
+    """
+    Streaming export_for_sublime(). Returns the number of lines written
+    (file headers included).
+    """
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return _stream(_iter_sublime_lines(results), out, export_path)
+
+# --- Columnar export (Arrow / Parquet / packed binary) ---
+def export_as_columnar(pattern, path=".", export_path=None, format="auto", **kwargs):
+    """
+    Write results to export_path column by column for analytics tools:
+    Arrow IPC or Parquet when pyarrow is installed, otherwise greaper's
+    packed binary format, which columnar.read_packed() memory-maps without
+    parsing. format is "auto", "arrow", "parquet" or "packed".
+    Returns (format_used, number_of_hits).
+    """
+    from greaper.columnar import write_columnar
+    if not export_path:
+        raise ValueError("columnar export needs an export_path")
+    results = iter_search_files(pattern=pattern, path=path, **kwargs)
+    return write_columnar(results, export_path, format=format)
+
 # --- Batch Replace Integration (for scripting/editors) ---
 def batch_replace_and_export(pattern, replacement, path=".", export_path=None, **kwargs):
     """
     Run batch replace and export a report of changes.
     """
-    from greaper.core import batch_replace_files  # You'd implement this in core.py
+    from greaper.core import batch_replace_files
     changes = batch_replace_files(pattern, replacement, path=path, **kwargs)
     output = json.dumps(changes, indent=2)
     if export_path:
@@ -103,18 +235,16 @@ def batch_replace_and_export(pattern, replacement, path=".", export_path=None, *
     return output
 
 # --- HuggingFace Transformers Integration ---
-try:
-    from transformers import pipeline
-except ImportError:
-    pipeline = None
-
 def hf_summarize_code(code, model_name="Salesforce/codet5-base-multi-sum"):
     """
     Use HuggingFace Transformers to summarize code locally or via HuggingFace Hub.
     Example model: Salesforce/codet5-base-multi-sum
     """
-    if pipeline is None:
-        raise ImportError("transformers package not installed. Run 'pip install transformers'")
+    # Imported here: loading transformers takes seconds and most callers never summarize
+    try:
+        from transformers import pipeline
+    except ImportError:
+        raise ImportError("transformers package not installed. Run 'pip install transformers'") from None
     summarizer = pipeline("summarization", model=model_name)
     # HuggingFace models may have input length limits; truncate if needed
     code = code[:1024]
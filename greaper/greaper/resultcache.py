@@ -0,0 +1,173 @@
+import hashlib
+import marshal
+import os
+import sqlite3
+import threading
+import time
+
+from greaper.config import CACHE_DIR, RESULT_CACHE_MB
+
+# Layout of the stored per-file results, and the line-splitting rules they
+# were found with (universal newlines since version 3); part of every query
+# key, so entries written by an older version are simply never hit
+RECORD_VERSION = 3
+
+def query_key(options):
+    """
+    Normalize the options that decide a file's matches into a short key.
+    bytes_mode is included: both modes should agree, but a difference must
+    never be served from one mode to the other. Options that only affect
+    speed (jobs, chunk_size, ...) are left out.
+    """
+    query = options.get("query")
+    patterns = getattr(query, "patterns", None) or (options.get("pattern"),)
+    fields = (
+        RECORD_VERSION,
+        tuple(patterns),
+        bool(options.get("fuzzy")),
+        bool(options.get("ignore_case")),
+        bool(options.get("word")),
+        bool(options.get("regex")),
+        int(options.get("context") or 0),
+        options.get("syntax_mode", "all") if options.get("syntax_aware") else "all",
+        float(options.get("fuzzy_threshold", 0.7)) if options.get("fuzzy") else None,
+        options.get("fuzzy_mode", "line") if options.get("fuzzy") else None,
+        bool(options.get("bytes_mode", True)),
+    )
+    return hashlib.sha1(repr(fields).encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """
+    Per-file search results keyed by (query key, path, size, mtime).
+    Backed by SQLite in the Greaper cache directory, so re-running a query
+    only rescans files that changed. Least recently used entries are evicted
+    once the stored results exceed budget_mb. hits and misses count lookups
+    made by this process.
+    """
+
+    FLUSH_EVERY = 200
+
+    def __init__(self, db_path=None, budget_mb=RESULT_CACHE_MB):
+        self.db_path = str(db_path or CACHE_DIR / "results.db")
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._pending = []
+        self._touched = {}
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "query TEXT, path TEXT, size INTEGER, mtime_ns INTEGER, "
+                "used REAL, bytes INTEGER, data BLOB, PRIMARY KEY (query, path))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        return self._conn
+
+    def get(self, key, path, size, mtime_ns):
+        """Return the cached result list, or None if unknown or stale."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT size, mtime_ns, data FROM results WHERE query = ? AND path = ?", (key, path)
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is None or row[0] != size or row[1] != mtime_ns:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[(key, path)] = time.time()
+        try:
+            return marshal.loads(row[2])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def put(self, key, path, size, mtime_ns, results):
+        data = marshal.dumps(results)
+        with self._lock:
+            self._pending.append((key, path, size, mtime_ns, time.time(), len(data), data))
+            full = len(self._pending) >= self.FLUSH_EVERY
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write pending entries and access times, then evict down to the budget."""
+        with self._lock:
+            if not self._pending and not self._touched:
+                return
+            pending, self._pending = self._pending, []
+            touched, self._touched = self._touched, {}
+            try:
+                conn = self._connect()
+                conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", pending)
+                conn.executemany(
+                    "UPDATE results SET used = ? WHERE query = ? AND path = ?",
+                    [(used, key, path) for (key, path), used in touched.items()],
+                )
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error:
+                pass  # the cache is an optimization; never fail a search over it
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM results").fetchone()[0]
+        if total <= self.budget_bytes:
+            return
+        # Drop the least recently used entries until 90% of the budget is left
+        excess = total - int(self.budget_bytes * 0.9)
+        freed = 0
+        doomed = []
+        for query, path, size in conn.execute("SELECT query, path, bytes FROM results ORDER BY used"):
+            doomed.append((query, path))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM results WHERE query = ? AND path = ?", doomed)
+
+    def stats(self):
+        """Return hits, misses, entries and stored megabytes."""
+        self.flush()
+        entries, stored = 0, 0
+        with self._lock:
+            try:
+                entries, stored = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM results"
+                ).fetchone()
+            except sqlite3.Error:
+                pass
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "mb": stored / (1024 * 1024),
+            "budget_mb": self.budget_bytes / (1024 * 1024),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._pending = []
+            self._touched = {}
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM results")
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+_result_cache = None
+
+def get_result_cache(budget_mb=None):
+    """Return the process-wide ResultCache (budget_mb updates its budget)."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(budget_mb=budget_mb or RESULT_CACHE_MB)
+    elif budget_mb:
+        _result_cache.budget_bytes = int(budget_mb * 1024 * 1024)
+    return _result_cache
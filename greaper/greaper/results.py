@@ -0,0 +1,162 @@
+"""
+Compact search result records.
+
+A Match stores an interned file ID instead of the file label, the match's
+column and span, and resolves its context lines only when they are read,
+from a LineTable shared by every match in the same file. Matches still
+behave like the (file, line_number, match, context_before, context_after)
+tuples Greaper used to return: they unpack, index and compare equal to them.
+"""
+import io
+import threading
+
+_FILE_LABELS = []
+_FILE_IDS = {}
+_FILE_LOCK = threading.Lock()
+
+def intern_file(label):
+    """Return the process-wide ID of a file label, assigning one on first use."""
+    file_id = _FILE_IDS.get(label)
+    if file_id is None:
+        with _FILE_LOCK:
+            file_id = _FILE_IDS.get(label)
+            if file_id is None:
+                file_id = _FILE_IDS[label] = len(_FILE_LABELS)
+                _FILE_LABELS.append(label)
+    return file_id
+
+def file_label(file_id):
+    return _FILE_LABELS[file_id]
+
+class LineTable:
+    """
+    The lines of one file, for resolving context. Either wraps lines the
+    search already has (archive members, line-by-line searches) or reads
+    the file from disk the first time a match asks for context.
+    """
+
+    __slots__ = ("path", "_lines")
+
+    def __init__(self, path, lines=None):
+        self.path = path
+        self._lines = lines
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            try:
+                with open(self.path, "rb") as f:
+                    text = f.read().decode("utf-8", errors="ignore")
+            except OSError:
+                text = ""
+            # Same line split as text-mode reads: universal newlines, no empty last line
+            lines = io.StringIO(text, newline=None).read().split("\n")
+            if lines and not lines[-1]:
+                lines.pop()
+            self._lines = lines
+        return self._lines
+
+    def context(self, index, n):
+        """Stripped (before, after) lists of up to n lines around the 0-based index."""
+        lines = self.lines
+        before = [lines[j].strip() for j in range(max(0, index - n), min(index, len(lines)))]
+        after = [lines[j].strip() for j in range(index + 1, min(len(lines), index + 1 + n))]
+        return before, after
+
+class Match:
+    """
+    One search hit. column and end are 0-based offsets of the match within
+    the original (unstripped) line; text is the stripped line. patterns is
+    the tuple of patterns that hit the line for multi-pattern searches,
+    else None.
+    """
+
+    __slots__ = ("file_id", "line_number", "column", "end", "text", "patterns", "_context", "_table")
+
+    def __init__(self, file_id, line_number, column, end, text, context=0, table=None, patterns=None):
+        self.file_id = file_id
+        self.line_number = line_number
+        self.column = column
+        self.end = end
+        self.text = text
+        self.patterns = patterns
+        # An int (lines each side, read from _table on demand) or a (before, after) pair
+        self._context = context
+        self._table = table
+
+    @classmethod
+    def from_record(cls, label, record):
+        """Rebuild a Match from to_record() output (used when unpickling)."""
+        line_number, column, end, text, before, after, patterns = record
+        return cls(intern_file(label), line_number, column, end, text, (before, after), None, patterns)
+
+    def to_record(self):
+        """Plain (line_number, column, end, text, before, after, patterns) tuple."""
+        before, after = self.context
+        return (self.line_number, self.column, self.end, self.text, before, after, self.patterns)
+
+    @property
+    def file(self):
+        return _FILE_LABELS[self.file_id]
+
+    @property
+    def span(self):
+        return self.column, self.end
+
+    @property
+    def context(self):
+        """(context_before, context_after), resolved on first access."""
+        context = self._context
+        if isinstance(context, tuple):
+            return context
+        if not context or self._table is None:
+            return [], []
+        context = self._context = self._table.context(self.line_number - 1, context)
+        self._table = None
+        return context
+
+    @property
+    def before(self):
+        return self.context[0]
+
+    @property
+    def after(self):
+        return self.context[1]
+
+    def as_tuple(self):
+        before, after = self.context
+        result = (self.file, self.line_number, self.text, before, after)
+        return result if self.patterns is None else result + (self.patterns,)
+
+    def __len__(self):
+        return 5 if self.patterns is None else 6
+
+    def __getitem__(self, index):
+        # Plain fields without building the tuple (or reading context lines)
+        if index == 0:
+            return self.file
+        if index == 1:
+            return self.line_number
+        if index == 2:
+            return self.text
+        return self.as_tuple()[index]
+
+    def __iter__(self):
+        return iter(self.as_tuple())
+
+    def __eq__(self, other):
+        if isinstance(other, (Match, tuple)):
+            return self.as_tuple() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # File IDs are per process: send the label and the resolved context
+        return _rebuild_match, (self.file, self.to_record())
+
+    def __repr__(self):
+        return f"Match({self.file!r}, {self.line_number}, column={self.column}, text={self.text!r})"
+
+def _rebuild_match(label, record):
+    return Match.from_record(label, record)
@@ -0,0 +1,72 @@
+"""
+Startup profiling: what importing Greaper costs, measured with Python's
+-X importtime in a fresh interpreter (so nothing is already cached in
+sys.modules). Used by `greaper --profile-startup` and by the import-time
+regression test.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Module a search has to import before it reads a file
+STARTUP_MODULE = "greaper.core"
+# Import-time budget for STARTUP_MODULE, in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("GREAPER_IMPORT_BUDGET_MS") or 400)
+# Optional backends that must only be imported by the feature that needs them
+HEAVY_MODULES = ("rich", "textual", "transformers", "torch", "pyarrow", "rarfile", "py7zr")
+
+def profile_imports(module=STARTUP_MODULE, python=None):
+    """
+    Import module in a new interpreter under -X importtime. Returns a list
+    of (name, self_us, cumulative_us, depth) in the order Python reports
+    them (children before their parent).
+    """
+    env = dict(os.environ)
+    # Profile this copy of greaper, wherever the child process starts
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (package_root, env.get("PYTHONPATH"))))
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    if proc.returncode != 0:
+        error = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"importing {module} failed: {error[-1] if error else proc.returncode}")
+    return records
+
+def import_time_ms(records, module=STARTUP_MODULE):
+    """Cumulative import time of module (its top-level entry), in milliseconds."""
+    for name, _, cumulative, depth in records:
+        if name == module and depth == 0:
+            return cumulative / 1000
+    return 0.0
+
+def heavy_imports(records):
+    """Top-level names of HEAVY_MODULES that were imported."""
+    loaded = {name.split(".", 1)[0] for name, *_ in records}
+    return [name for name in HEAVY_MODULES if name in loaded]
+
+def startup_report(records, module=STARTUP_MODULE, top=15):
+    """Text report of profile_imports() records: total, slowest imports, heavy backends loaded."""
+    total = import_time_ms(records, module)
+    lines = [f"Import time of {module}: {total:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"]
+    lines.append(f"Slowest {top} imports (self / cumulative ms):")
+    for name, self_us, cumulative, depth in sorted(records, key=lambda r: r[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:8.1f} {cumulative / 1000:8.1f}  {name}")
+    heavy = heavy_imports(records)
+    lines.append("Optional backends loaded at startup: " + (", ".join(heavy) if heavy else "none"))
+    return "\n".join(lines)
@@ -0,0 +1,290 @@
+"""
+Incremental per-file syntax classification for syntax-aware search.
+Lines are lexed in order with state carried across them (open block
+comments and multi-line strings), and each line gets one of the KIND_*
+codes in a compact bytearray.
+"""
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# Per-line classification codes (index into KIND_NAMES)
+KIND_CODE = 0
+KIND_COMMENT = 1
+KIND_STRING = 2
+KIND_MIXED = 3
+KIND_NAMES = ("code", "comment", "string", "mixed")
+
+# Delimiters per language. "multiline" strings may span lines; other
+# strings end at the end of the line unless it ends in a backslash.
+LANGUAGES = {
+    "python": {
+        "line": ("#",),
+        "block": (),
+        "strings": ('"""', "'''", '"', "'"),
+        "multiline": ('"""', "'''"),
+        "prefixes": "rRbBuUfF",
+    },
+    "c": {
+        "line": ("//",),
+        "block": (("/*", "*/"),),
+        "strings": ('"', "'"),
+        "multiline": (),
+    },
+    "javascript": {
+        "line": ("//",),
+        "block": (("/*", "*/"),),
+        "strings": ('"', "'", "`"),
+        "multiline": ("`",),
+    },
+    "go": {
+        "line": ("//",),
+        "block": (("/*", "*/"),),
+        "strings": ('"', "'", "`"),
+        "multiline": ("`",),
+    },
+    "shell": {
+        "line": ("#",),
+        "block": (),
+        "strings": ('"', "'"),
+        "multiline": (),
+    },
+    "sql": {
+        "line": ("--",),
+        "block": (("/*", "*/"),),
+        "strings": ("'", '"'),
+        "multiline": (),
+    },
+    "lua": {
+        "line": ("--",),
+        "block": (("--[[", "]]"),),
+        "strings": ('"', "'"),
+        "multiline": (),
+    },
+    "markup": {
+        "line": (),
+        "block": (("<!--", "-->"),),
+        "strings": (),
+        "multiline": (),
+    },
+    # Unknown files: the delimiters tokenization.TOKEN_REGEX recognizes
+    "generic": {
+        "line": ("#", "//"),
+        "block": (("/*", "*/"),),
+        "strings": ('"""', "'''", '"', "'"),
+        "multiline": ('"""', "'''"),
+    },
+}
+
+EXTENSIONS = {
+    ".py": "python", ".pyw": "python", ".pyi": "python", ".pyx": "python", ".pxd": "python",
+    ".c": "c", ".h": "c", ".cc": "c", ".cpp": "c", ".cxx": "c", ".hpp": "c", ".hh": "c",
+    ".java": "c", ".cs": "c", ".kt": "c", ".scala": "c", ".swift": "c", ".rs": "c",
+    ".css": "c", ".scss": "c", ".less": "c", ".php": "c",
+    ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript", ".cjs": "javascript",
+    ".ts": "javascript", ".tsx": "javascript",
+    ".go": "go",
+    ".sh": "shell", ".bash": "shell", ".zsh": "shell", ".rb": "shell", ".pl": "shell",
+    ".r": "shell", ".yaml": "shell", ".yml": "shell", ".toml": "shell", ".cfg": "shell",
+    ".ini": "shell", ".conf": "shell", ".mk": "shell", ".cmake": "shell",
+    ".sql": "sql", ".hs": "sql",
+    ".lua": "lua",
+    ".html": "markup", ".htm": "markup", ".xml": "markup", ".svg": "markup", ".md": "markup",
+}
+
+# Files whose line kinds are kept by file_syntax()
+SYNTAX_CACHE_SIZE = 64
+
+_BASENAMES = {"Makefile": "shell", "Dockerfile": "shell", "CMakeLists.txt": "shell"}
+
+_COMPILED = {}
+
+def language_for(path):
+    """Return the LANGUAGES key for a file path (archive labels use their inner name)."""
+    name = os.path.basename(str(path).rsplit("::", 1)[-1])
+    if name in _BASENAMES:
+        return _BASENAMES[name]
+    return EXTENSIONS.get(os.path.splitext(name)[1].lower(), "generic")
+
+def _compile(language):
+    """Build (opener_regex, kinds) for a language; kinds maps each delimiter to its role."""
+    if language in _COMPILED:
+        return _COMPILED[language]
+    spec = LANGUAGES.get(language, LANGUAGES["generic"])
+    kinds = {}
+    for start, end in spec["block"]:
+        kinds[start] = ("block", end)
+    for start in spec["line"]:
+        kinds.setdefault(start, ("line", None))
+    for quote in spec["strings"]:
+        kinds.setdefault(quote, ("string", quote))
+    alternatives = []
+    # Longest delimiters first so '"""' wins over '"' and '--[[' over '--'
+    for delim in sorted(kinds, key=len, reverse=True):
+        escaped = re.escape(delim)
+        if kinds[delim][0] == "string" and spec.get("prefixes"):
+            escaped = rf"(?<!\w)[{spec['prefixes']}]{{0,2}}{escaped}"
+        alternatives.append(escaped)
+    opener = re.compile("|".join(alternatives)) if alternatives else None
+    _COMPILED[language] = opener, kinds, frozenset(spec["multiline"])
+    return _COMPILED[language]
+
+_ESCAPE_OR_QUOTE = {}
+
+def _closer(quote):
+    pattern = _ESCAPE_OR_QUOTE.get(quote)
+    if pattern is None:
+        pattern = _ESCAPE_OR_QUOTE[quote] = re.compile(r"\\.|" + re.escape(quote), re.DOTALL)
+    return pattern
+
+class Lexer:
+    """
+    Line-at-a-time lexer that remembers open block comments and strings.
+    feed(line) returns the line's KIND_* code.
+    """
+
+    def __init__(self, language="generic"):
+        self.language = language
+        self._opener, self._kinds, self._multiline = _compile(language)
+        self._prefixes = LANGUAGES.get(language, LANGUAGES["generic"]).get("prefixes", "")
+        self._close = None      # delimiter that ends the open comment/string
+        self._in_string = False
+
+    def feed(self, line):
+        seen_code = seen_comment = seen_string = False
+        pos = 0
+        n = len(line)
+        while pos < n:
+            if self._close is not None:
+                if self._in_string:
+                    end = -1
+                    for m in _closer(self._close).finditer(line, pos):
+                        if m.group() == self._close:
+                            end = m.start()
+                            break
+                else:
+                    end = line.find(self._close, pos)
+                stop = n if end < 0 else end + len(self._close)
+                if end >= 0 or line[pos:stop].strip():
+                    if self._in_string:
+                        seen_string = True
+                    else:
+                        seen_comment = True
+                if end < 0:
+                    if self._in_string and self._close not in self._multiline and not line.rstrip("\r\n").endswith("\\"):
+                        self._close = None  # unterminated one-line string ends with the line
+                    break
+                self._close = None
+                pos = stop
+                continue
+            m = self._opener.search(line, pos) if self._opener is not None else None
+            start = n if m is None else m.start()
+            if line[pos:start].strip():
+                seen_code = True
+            if m is None:
+                break
+            token = m.group()
+            # Drop a string prefix such as r or b to find the delimiter
+            role, close = self._kinds[token.lstrip(self._prefixes) if self._prefixes else token]
+            if role == "line":
+                seen_comment = True
+                break
+            self._close = close
+            self._in_string = role == "string"
+            pos = m.end()
+            if self._in_string:
+                seen_string = True
+            else:
+                seen_comment = True
+        kinds = seen_code + seen_comment + seen_string
+        if kinds == 0 or (kinds == 1 and seen_code):
+            return KIND_CODE
+        if kinds > 1:
+            return KIND_MIXED
+        return KIND_COMMENT if seen_comment else KIND_STRING
+
+def classify_lines(lines, language="generic"):
+    """Lex lines in order and return a bytearray of KIND_* codes, one per line."""
+    lexer = Lexer(language)
+    feed = lexer.feed
+    return bytearray(feed(line) for line in lines)
+
+def kind_matches(kind, syntax_mode):
+    """Whether a KIND_* code satisfies a syntax mode (all/comment/string/code/mixed)."""
+    if syntax_mode == "all":
+        return True
+    return KIND_NAMES[kind] == syntax_mode
+
+class FileSyntax:
+    """
+    Line kinds of one file, lexed on the first lookup and then kept.
+    lines may be a list or a callable returning one.
+    """
+
+    def __init__(self, path, lines):
+        self.language = language_for(path)
+        self._lines = lines
+        self._kinds = None
+
+    @property
+    def kinds(self):
+        if self._kinds is None:
+            lines = self._lines() if callable(self._lines) else self._lines
+            self._kinds = classify_lines(lines, self.language)
+            self._lines = None  # the lines are not needed once classified
+        return self._kinds
+
+    def kind(self, index):
+        """KIND_* code of the line at 0-based index (KIND_CODE past the end)."""
+        kinds = self.kinds
+        return kinds[index] if index < len(kinds) else KIND_CODE
+
+    def matches(self, index, syntax_mode):
+        return syntax_mode == "all" or kind_matches(self.kind(index), syntax_mode)
+
+_FILE_CACHE = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+def _cache_key(path):
+    label = str(path)
+    target = label
+    if "::" in label and not os.path.exists(label):
+        target = label.split("::", 1)[0]  # archive member: the archive's stat
+    try:
+        st = os.stat(target)
+    except OSError:
+        return label, None, None
+    return label, st.st_mtime_ns, st.st_size
+
+def _read_source(label):
+    if "::" in label and not os.path.exists(label):
+        from greaper.archive import extract_file_from_archive
+        archive_path, inner = label.split("::", 1)
+        # Universal newlines, the line split the search uses for archive members
+        return io.StringIO(extract_file_from_archive(archive_path, inner), newline=None).read().split("\n")
+    with open(label, encoding="utf-8", errors="ignore") as f:
+        return f.read().split("\n")
+
+def file_syntax(path, lines=None):
+    """
+    Return the memoized FileSyntax for path. The search loop registers the
+    lines it already has, so rendering context lines later does not lex the
+    file again; without lines, the file is read when first needed.
+    """
+    key = _cache_key(path)
+    with _FILE_CACHE_LOCK:
+        syntax = _FILE_CACHE.get(key)
+        if syntax is not None:
+            _FILE_CACHE.move_to_end(key)
+            return syntax
+        syntax = FileSyntax(path, lines if lines is not None else (lambda: _read_source(key[0])))
+        _FILE_CACHE[key] = syntax
+        if len(_FILE_CACHE) > SYNTAX_CACHE_SIZE:
+            _FILE_CACHE.popitem(last=False)
+    return syntax
+
+def line_kind(path, line_number):
+    """Kind name ("code", "comment", ...) of a 1-based line, e.g. for rendering context."""
+    return KIND_NAMES[file_syntax(path).kind(line_number - 1)]
@@ -0,0 +1,270 @@
+"""
+Watch mode: search a tree once, then re-scan only the files that change.
+Changes come from inotify on Linux and from periodic stat() snapshots
+elsewhere (or when inotify is unavailable).
+"""
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import PurePath
+
+from greaper.core import iter_search_files
+from greaper.filewalker import (
+    VCS_DIRS, _excluded_dir, _ignored_below, _load_ignore_rules, _pruned_dir, _scan_dir, walk_files,
+)
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+_EVENT = struct.Struct("iIII")
+# Editors write a file in several steps; wait this long for the burst to end
+DEBOUNCE_SECONDS = 0.05
+
+class InotifyWatcher:
+    """
+    Recursive inotify watch on a directory tree. poll(timeout) returns the
+    set of file paths that changed, or None if the kernel queue overflowed
+    and the whole tree has to be re-scanned. Directories walk_files() would
+    prune (excluded, ignored or VCS) are not watched.
+    """
+
+    def __init__(self, root, include=None, exclude=None, ignore_files=True):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self._walk = (include or ["*"], exclude or [], ignore_files)
+        # watch descriptor -> (directory path, path relative to root, inherited ignore rules)
+        self._dirs = {}
+        self._add_tree(root, "", [])
+
+    def _add_tree(self, root, rel_dir, rules, found=None):
+        """
+        Watch root and the subdirectories walk_files() descends into; the
+        files it would list are added to found.
+        """
+        stack = [(root, rel_dir, rules)]
+        while stack:
+            dir_path, rel_dir, rules = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), _WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = (dir_path, rel_dir, rules)
+            files, subdirs = _scan_dir(dir_path, rel_dir, rules, *self._walk)
+            if found is not None:
+                found.update(files)
+            stack.extend(subdirs)
+
+    def _add_subdir(self, parent, name, found):
+        """Watch a directory created in (or moved into) a watched one, unless it is pruned."""
+        dir_path, rel_dir, rules = parent
+        _, exclude, ignore_files = self._walk
+        if ignore_files:
+            rules = rules + _load_ignore_rules(dir_path, rel_dir)
+        path = os.path.join(dir_path, name)
+        rel = f"{rel_dir}/{name}" if rel_dir else name
+        if not _pruned_dir(path, rel, rules, exclude, ignore_files):
+            self._add_tree(path, rel, rules, found)
+
+    def _read_events(self, changed):
+        overflow = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return overflow
+            pos = 0
+            while pos < len(data):
+                wd, mask, _, size = _EVENT.unpack_from(data, pos)
+                name = data[pos + _EVENT.size:pos + _EVENT.size + size].rstrip(b"\0")
+                pos += _EVENT.size + size
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None or not name:
+                    continue
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_subdir(parent, os.fsdecode(name), changed)  # report its files too
+                    continue
+                changed.add(os.path.join(parent[0], os.fsdecode(name)))
+
+    def poll(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        overflow = self._read_events(changed)
+        time.sleep(DEBOUNCE_SECONDS)
+        overflow = self._read_events(changed) or overflow
+        return None if overflow else changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+class PollingWatcher:
+    """
+    Portable fallback: compares (size, mtime) snapshots of the files
+    walk_files() lists, once per poll().
+    """
+
+    def __init__(self, root, include=None, exclude=None, ignore_files=True):
+        self.root = root
+        self._walk = dict(include=include, exclude=exclude, ignore_files=ignore_files)
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for path in walk_files(path=self.root, **self._walk):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def poll(self, timeout):
+        time.sleep(timeout)
+        snapshot = self._scan()
+        old, self._snapshot = self._snapshot, snapshot
+        changed = {path for path, stamp in snapshot.items() if old.get(path) != stamp}
+        changed.update(path for path in old if path not in snapshot)
+        return changed
+
+    def close(self):
+        pass
+
+def open_watcher(path=".", include=None, exclude=None, ignore_files=True, polling=False):
+    """
+    Return an InotifyWatcher for path on Linux, else (or with polling=True,
+    or if inotify cannot be set up) a PollingWatcher.
+    """
+    root = path if os.path.isdir(path) else (os.path.dirname(path) or ".")
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, include=include, exclude=exclude, ignore_files=ignore_files)
+        except (OSError, AttributeError):
+            pass  # no inotify (or out of watches): fall back to polling
+    return PollingWatcher(path, include=include, exclude=exclude, ignore_files=ignore_files)
+
+def _wanted(path, include, exclude, root=None):
+    """
+    Apply walk_files()' include/exclude globs to a single changed path, and,
+    with root, the .gitignore/.ignore rules found from root down to it.
+    """
+    p = PurePath(path)
+    if any(part in VCS_DIRS for part in p.parts):
+        return False
+    if root is not None and _ignored_below(root, path):
+        return False
+    if include and not any(
+        fnmatch.fnmatch(p.name, inc) if "/" not in inc else p.match(inc) for inc in include
+    ):
+        return False
+    if exclude:
+        if any(p.match(ex) for ex in exclude if not ex.endswith("/")):
+            return False
+        if any(_excluded_dir(str(parent), exclude) for parent in p.parents if parent.name):
+            return False
+    return True
+
+def _file_key(label):
+    """Results are grouped by the file on disk (archive members by their archive)."""
+    return os.path.normpath(str(label).split("::", 1)[0])
+
+def _scan(pattern, path, search_kwargs):
+    """Return {file: results} for everything under path."""
+    hits = {}
+    for result in iter_search_files(pattern, path=path, **search_kwargs):
+        hits.setdefault(_file_key(result[0]), []).append(result)
+    return hits
+
+def watch_search(
+    pattern=None,
+    path=".",
+    include=None,
+    exclude=None,
+    ignore_files=True,
+    interval=1.0,
+    polling=False,
+    cancelled=None,
+    **search_kwargs,
+):
+    """
+    Search path, then keep watching it. Yields (file, results) for every file
+    with hits after the first full search, and again whenever a file's hits
+    change; results is then the file's complete new list (empty when its hits
+    are gone). Only changed files are re-scanned. Runs until the generator is
+    closed (e.g. on KeyboardInterrupt), or until cancelled(), which is checked
+    after every poll of at most interval seconds, returns true.
+
+    Takes the options of core.iter_search_files(); max_results applies to the
+    first search and then to each re-scanned file. Changed files are filtered
+    like the first search's walk (include, exclude, and .gitignore rules when
+    ignore_files is set), and pruned directories are not watched.
+    """
+    search_kwargs = dict(search_kwargs, include=include, exclude=exclude, ignore_files=ignore_files)
+    # Watch before the first search so no change made during it is lost
+    watcher = open_watcher(path, include=include, exclude=exclude, ignore_files=ignore_files, polling=polling)
+    # Single files are searched serially and without the (now stale) index
+    rescan_kwargs = dict(search_kwargs, jobs=1, index=None, stats=None)
+    only = os.path.normpath(path) if os.path.isfile(path) else None
+    ignore_root = path if ignore_files and only is None else None
+    try:
+        hits = _scan(pattern, path, search_kwargs)
+        for file, results in hits.items():
+            yield file, results
+        while True:
+            changed = watcher.poll(interval)
+            if cancelled is not None and cancelled():
+                return
+            if changed is None:
+                fresh = _scan(pattern, path, rescan_kwargs)
+                for file in sorted(set(hits) | set(fresh)):
+                    if hits.get(file, []) != fresh.get(file, []):
+                        yield file, fresh.get(file, [])
+                hits = fresh
+                continue
+            for changed_path in sorted(changed):
+                file = os.path.normpath(changed_path)
+                if only is not None and file != only:
+                    continue
+                if not _wanted(file, include, exclude, ignore_root) and file not in hits:
+                    continue
+                results = _scan(pattern, changed_path, rescan_kwargs).get(file, []) if os.path.isfile(changed_path) else []
+                if results != hits.get(file, []):
+                    if results:
+                        hits[file] = results
+                    else:
+                        hits.pop(file, None)
+                    yield file, results
+    finally:
+        watcher.close()
@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+import pytest
+
+# Keep indexes and caches written by the tests out of the user's cache directory
+os.environ.setdefault("GREAPER_CACHE_DIR", tempfile.mkdtemp(prefix="greaper-tests-"))
+
+
+@pytest.fixture
+def make_tree():
+    """Factory: make_tree(root, n_files) writes mod_NN.py files with five "needle" lines each."""
+    def make(root, n_files=12):
+        for i in range(n_files):
+            (root / f"mod_{i:02d}.py").write_text(
+                "".join(f"value_{j} = {i * j}  # needle {j}\n" for j in range(5)),
+                encoding="utf-8",
+            )
+    return make
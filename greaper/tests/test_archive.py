@@ -0,0 +1,89 @@
+import io
+import tarfile
+import zipfile
+
+from greaper.archive import ArchivePool, ArchiveSession, extract_file_from_archive, list_archive_files
+from greaper.core import search_files
+
+
+def make_bundle(tmp_path):
+    inner = io.BytesIO()
+    with zipfile.ZipFile(inner, "w") as z:
+        z.writestr("deep/a.txt", "needle in deep\n")
+    bundle = tmp_path / "bundle.tar.gz"
+    with tarfile.open(bundle, "w:gz") as t:
+        for name, data in [("in/inner.zip", inner.getvalue()), ("t.txt", b"tar needle\n")]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            t.addfile(info, io.BytesIO(data))
+    return bundle
+
+
+def test_nested_listing_and_extraction(tmp_path):
+    bundle = make_bundle(tmp_path)
+    assert list_archive_files(bundle) == ["in/inner.zip::deep/a.txt", "t.txt"]
+    assert extract_file_from_archive(bundle, "in/inner.zip::deep/a.txt") == "needle in deep\n"
+
+
+def test_session_streams_members_once(tmp_path):
+    bundle = make_bundle(tmp_path)
+    with ArchiveSession(bundle) as session:
+        members = dict(session.iter_members())
+    assert members == {"in/inner.zip::deep/a.txt": b"needle in deep\n", "t.txt": b"tar needle\n"}
+    hits = search_files("needle", path=str(tmp_path))
+    assert [(h[0].split("::", 1)[1], h[1]) for h in hits] == [("in/inner.zip::deep/a.txt", 1), ("t.txt", 1)]
+
+
+def test_nested_archives_spool_and_respect_limits(tmp_path):
+    bundle = make_bundle(tmp_path)
+    with ArchiveSession(bundle, spool_threshold=1) as session:
+        assert dict(session.iter_texts())["in/inner.zip::deep/a.txt"] == "needle in deep\n"
+    with ArchiveSession(bundle, max_member_size=5) as session:
+        assert list(session.iter_members()) == []
+    with ArchiveSession(bundle, max_depth=0) as session:
+        assert [name for name, _ in session.iter_members()] == ["in/inner.zip", "t.txt"]
+
+
+def test_archive_pool_matches_inline_reads(tmp_path):
+    make_bundle(tmp_path)
+    with zipfile.ZipFile(tmp_path / "many.zip", "w", zipfile.ZIP_DEFLATED) as z:
+        for i in range(200):
+            z.writestr(f"f{i:03}.txt", f"line {i}\n" + ("needle\n" if i % 3 == 0 else ""))
+    wanted = list_archive_files(tmp_path / "many.zip")
+    with ArchivePool(workers=3, max_inflight_bytes=64) as pool:
+        assert len(pool.submit(tmp_path / "many.zip")._queues) > 1
+        assert list(pool.submit(tmp_path / "many.zip", wanted)) == [
+            (name, extract_file_from_archive(tmp_path / "many.zip", name)) for name in wanted
+        ]
+    pooled = search_files("needle", path=str(tmp_path), max_results=10**6)
+    assert pooled == search_files("needle", path=str(tmp_path), max_results=10**6, archive_workers=0)
+    assert len(pooled) == 69
+
+
+def test_prefetch_passes_plain_files_on_immediately(tmp_path):
+    bundle = make_bundle(tmp_path)
+    pulled = []
+
+    def units():
+        for unit in [(None, "a.py"), (None, "b.py"), (str(bundle), None), (None, "c.py")]:
+            pulled.append(unit)
+            yield unit
+
+    with ArchivePool(workers=2) as pool:
+        stream = pool.prefetch(units())
+        assert next(stream) == (None, "a.py") and len(pulled) == 1
+        assert next(stream) == (None, "b.py") and len(pulled) == 2
+        archive_path, job = next(stream)
+        # Read ahead while the archive was pending
+        assert archive_path == str(bundle) and len(pulled) == 4
+        assert [name for name, _ in job] == ["in/inner.zip::deep/a.txt", "t.txt"]
+        assert list(stream) == [(None, "c.py")]
+
+
+def test_archive_members_split_lines_like_plain_files(tmp_path):
+    text = "a\x0cb c\r\nd\rneedle\n"
+    (tmp_path / "plain.txt").write_text(text, encoding="utf-8", newline="")
+    with zipfile.ZipFile(tmp_path / "m.zip", "w") as z:
+        z.writestr("plain.txt", text)
+    for workers in (None, 0):
+        assert [r[1] for r in search_files("needle", path=str(tmp_path), archive_workers=workers)] == [3, 3]
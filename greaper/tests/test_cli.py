@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from greaper.cli import EXIT_ERROR, EXIT_MATCH, EXIT_NO_MATCH, main
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\nneedle = 2\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("needle\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_search_exit_codes(tree, capsys):
+    for _ in range(2):  # the second run reads the result cache
+        assert main(["search", "needle", str(tree), "--cache"]) == EXIT_MATCH
+        out = capsys.readouterr().out
+        assert "a.py:2:" in out and "b.txt:1:" in out
+    assert main(["search", "absent", str(tree)]) == EXIT_NO_MATCH
+    assert main(["search", "(", str(tree), "-E"]) == EXIT_ERROR
+    assert main(["search", "needle", str(tree / "missing")]) == EXIT_ERROR
+
+
+def test_search_ndjson_with_include(tree, capsys):
+    code = main(["search", "needle", str(tree), "--include", "*.py", "--jobs", "2", "--format", "ndjson"])
+    assert code == EXIT_MATCH
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["line"], r["column"]) for r in records] == [(2, 0)]
+    assert records[0]["file"].endswith("a.py")
+
+
+def test_profile_startup_over_budget_is_an_error(monkeypatch, capsys):
+    monkeypatch.setattr("greaper.startup.IMPORT_BUDGET_MS", 0.0)
+    assert main(["--profile-startup"]) == EXIT_ERROR
+    assert "Import time of greaper.core" in capsys.readouterr().out
@@ -0,0 +1,271 @@
+import pytest
+
+from greaper.core import iter_search_files, search_files
+
+
+def test_parallel_deterministic_matches_serial(tmp_path, make_tree):
+    make_tree(tmp_path)
+    serial = search_files("needle", path=str(tmp_path), max_results=10000)
+    parallel = search_files(
+        "needle", path=str(tmp_path), max_results=10000,
+        jobs=3, chunk_size=2, deterministic=True,
+    )
+    assert len(serial) == 60
+    assert parallel == serial
+
+
+def test_parallel_honors_max_results(tmp_path, make_tree):
+    make_tree(tmp_path)
+    serial = search_files("needle", path=str(tmp_path), max_results=7)
+    parallel = search_files(
+        "needle", path=str(tmp_path), max_results=7,
+        jobs=2, chunk_size=1, deterministic=True,
+    )
+    assert parallel == serial
+    unordered = search_files("needle", path=str(tmp_path), max_results=7, jobs=2, chunk_size=1)
+    assert len(unordered) == 7
+
+
+def test_iter_search_files_streams_same_results(tmp_path, make_tree):
+    make_tree(tmp_path, n_files=3)
+    stream = iter_search_files("needle", path=str(tmp_path), max_results=4)
+    first = next(stream)
+    assert [first, *stream] == search_files("needle", path=str(tmp_path), max_results=4)
+
+
+def test_bytes_mode_matches_line_mode(tmp_path):
+    (tmp_path / "app.log").write_text(
+        "first line\nNeedle here\n\nneedles everywhere\ncafé needle\nlast needle", encoding="utf-8"
+    )
+    for options in ({}, {"ignore_case": True}, {"word": True}, {"context": 2}):
+        expected = search_files("needle", path=str(tmp_path), bytes_mode=False, **options)
+        assert search_files("needle", path=str(tmp_path), **options) == expected
+
+
+def test_bytes_mode_folds_unicode_case_and_lone_cr(tmp_path):
+    # U+212A KELVIN SIGN folds to "k"; a lone "\r" ends a line in text mode
+    (tmp_path / "a.txt").write_bytes("\u212a here\r\nx\rk here\ny\n".encode("utf-8"))
+    for options in ({"ignore_case": True}, {}):
+        expected = search_files("k here", path=str(tmp_path), bytes_mode=False, context=1, **options)
+        assert search_files("k here", path=str(tmp_path), context=1, **options) == expected
+    assert [r[1] for r in expected] == [3]
+    assert [r[1] for r in search_files("k here", path=str(tmp_path), ignore_case=True)] == [1, 3]
+
+
+def test_bytes_mode_finds_non_ascii_words(tmp_path):
+    (tmp_path / "a.txt").write_text("élan vital\nsans élan\nélans\nnaïve\n", encoding="utf-8")
+    for patterns in ((), ("naïve",)):
+        expected = search_files("élan", path=str(tmp_path), patterns=patterns, word=True, bytes_mode=False)
+        assert search_files("élan", path=str(tmp_path), patterns=patterns, word=True) == expected
+    assert [r[1] for r in expected] == [1, 2, 4]
+
+
+def _find_hit_lines(buf, needle):
+    from greaper.core import _iter_hit_lines
+
+    def find(buf, pos):
+        start = buf.find(needle, pos)
+        return None if start < 0 else (start, start + len(needle))
+    return list(_iter_hit_lines(buf, len(buf), find))
+
+
+def _kernel_hit_lines(scan_literal, buf, needle, max_hits):
+    hits, pos, line_number = [], 0, 1
+    while True:
+        numbers, starts, ends, pos, line_number = scan_literal(buf, needle, pos, line_number, max_hits)
+        hits += zip(numbers, starts, ends)
+        if len(numbers) < max_hits:
+            return hits
+
+
+def test_scan_literal_kernel_matches_bytes_find():
+    from greaper import core
+    if not core.CYTHON_KERNEL:
+        pytest.skip("search_cython extension not built")
+    buffers = [
+        b"needle",  # whole buffer, no trailing newline
+        b"a needle and a needle\n\nneedle\nnope\nlast needle",  # several hits per line
+        b"\n\nxneedlex\n" * 3 + b"needl",  # partial needle at the very end
+        b"".join(b"line %d%s\n" % (i, b" needle" if i % 3 else b"") for i in range(10000)),  # > HIT_BATCH hits
+    ]
+    for buf in buffers:
+        for needle in (b"n", b"ne", b"nee", b"needle", b"a needle"):
+            expected = _find_hit_lines(buf, needle)
+            # Caller batches of every size, down to one hit per call
+            for max_hits in (1, 7, 4096, 10 ** 6):
+                assert _kernel_hit_lines(core.scan_literal, buf, needle, max_hits) == expected
+    assert _find_hit_lines(buffers[1], b"needle") == [(1, 0, 21), (3, 23, 29), (5, 35, 46)]
+
+
+def test_query_compiled_once_and_picks_engine():
+    from greaper.algorithms.regex import compile_query, regex_search
+    import pickle
+    assert compile_query("needle") is compile_query("needle")
+    assert compile_query("needle").engine == "find"
+    assert compile_query("needle", ignore_case=True).engine == "re"
+    query = compile_query(r"ne+dle", regex=True)
+    assert pickle.loads(pickle.dumps(query)) is query
+    assert regex_search(query, ["a needle", "nope", "neeedle"]) == [(0, "a needle"), (2, "neeedle")]
+
+
+def test_fuzzy_matcher_agrees_with_similarity_ratio():
+    from greaper.algorithms.fuzzy import FuzzyMatcher, bounded_levenshtein, levenshtein, similarity_ratio
+    words = ["", "kitten", "sitting", "kitchen", "mitten", "x" * 80 + "kitten", "kïtten"]
+    for threshold in (0.0, 0.5, 0.7, 1.0):
+        matcher = FuzzyMatcher("kitten", threshold)
+        for word in words:
+            ratio = similarity_ratio("kitten", word)
+            assert matcher.score(word) == (ratio if ratio > threshold else None)
+    assert levenshtein("kitten", "sitting") == 3
+    assert bounded_levenshtein("kitten", "sitting", 2) == 3
+
+
+def test_fuzzy_score_block_prunes_below_threshold():
+    from greaper.algorithms.fuzzy import fuzzy_score_block, similarity_ratio
+    lines = ["kitten", "sitting", "", "completely different"]
+    assert [float(s) for s in fuzzy_score_block("kitten", lines)] == [similarity_ratio("kitten", l) for l in lines]
+    assert [float(s) for s in fuzzy_score_block("kitten", lines, 0.5)] == [1.0, similarity_ratio("kitten", "sitting"), -1.0, -1.0]
+
+
+def test_compiled_fuzzy_score_block_serial_and_parallel_agree():
+    np = pytest.importorskip("numpy")
+    fuzzy_cython = pytest.importorskip("greaper.cython_ext.fuzzy_cython")
+    lines = ["kitten", "sitting", "", "kïtten", "mitten" * 20, "x" * 90 + "kitten", "ключ kitten"] * 50
+    packed = fuzzy_cython.encode_lines(lines)
+    # One pattern per kernel: Myers (<= 64 chars, ASCII and not) and the banded DP (longer)
+    for pattern in ("kitten", "kïtten", "mitten" * 12):
+        expected = [fuzzy_cython.similarity_ratio(pattern, line) for line in lines]
+        for threshold in (0.0, 0.6):
+            serial = fuzzy_cython.fuzzy_score_block(pattern, lines, threshold)
+            parallel = fuzzy_cython.fuzzy_score_block(pattern, packed, threshold, parallel=True)
+            assert isinstance(serial, np.ndarray) and serial.dtype == np.float64
+            assert serial.tolist() == parallel.tolist()
+            assert serial.tolist() == [r if r >= threshold else -1.0 for r in expected]
+
+
+def test_window_fuzzy_mode_matches_inside_long_lines(tmp_path):
+    from greaper.algorithms.fuzzy import fuzzy_search_window
+    line = "    result = compute_totl(values, weights)  # and a long trailing comment\n"
+    (tmp_path / "a.py").write_text(line, encoding="utf-8")
+    assert search_files("compute_total", path=str(tmp_path), fuzzy=True) == []
+    hits = search_files("compute_total", path=str(tmp_path), fuzzy=True, fuzzy_mode="window", fuzzy_threshold=0.9)
+    assert [h[1] for h in hits] == [1]
+    (_, _, _, _, score, start, end), = fuzzy_search_window("compute_total", [line], threshold=0.9)
+    assert line[start:end] == "compute_totl" and score == 1 - 1 / 13
+
+
+def test_multi_pattern_search_reports_patterns_per_line(tmp_path):
+    (tmp_path / "api.py").write_text("old_api()\nnew_api()\nold_api(); legacy_call()\nnothing\n", encoding="utf-8")
+    for bytes_mode in (True, False):
+        hits = search_files(path=str(tmp_path), patterns=["legacy_call", "old_api"], bytes_mode=bytes_mode)
+        assert [(h[1], h[5]) for h in hits] == [(1, ("old_api",)), (3, ("legacy_call", "old_api"))]
+    words = search_files("api", path=str(tmp_path), patterns=["nothing"], word=True)
+    assert [(h[1], h[5]) for h in words] == [(4, ("nothing",))]
+
+
+def test_result_cache_reuses_unchanged_files(tmp_path, make_tree):
+    import os
+    from greaper.resultcache import ResultCache
+    import greaper.resultcache as resultcache
+
+    make_tree(tmp_path, n_files=4)
+    resultcache._result_cache = ResultCache(db_path=tmp_path / "cache" / "results.db")
+    try:
+        fresh = search_files("needle 3", path=str(tmp_path), context=1)
+        cache = resultcache.get_result_cache()
+        assert (cache.hits, cache.misses) == (0, 0)  # opt-in
+        first = search_files("needle 3", path=str(tmp_path), context=1, result_cache=True)
+        again = search_files("needle 3", path=str(tmp_path), context=1, result_cache=True)
+        assert (cache.hits, cache.misses) == (4, 4)
+        # Cached hits still resolve their context lines only when asked
+        assert all(isinstance(m._context, int) for m in again)
+        assert first == again == fresh
+
+        search_files("needle 3", path=str(tmp_path), context=1, result_cache=True, bytes_mode=False)
+        assert (cache.hits, cache.misses) == (4, 8)
+
+        changed = tmp_path / "mod_01.py"
+        changed.write_text("needle 3 moved\n", encoding="utf-8")
+        os.utime(changed, ns=(0, 12345))
+        rerun = search_files("needle 3", path=str(tmp_path), context=1, result_cache=True)
+        assert rerun == search_files("needle 3", path=str(tmp_path), context=1)
+        assert (cache.hits, cache.misses) == (7, 9)
+    finally:
+        resultcache._result_cache = None
+
+
+def test_batch_replace_files_previews_then_writes(tmp_path, make_tree):
+    from greaper.core import batch_replace_files
+
+    make_tree(tmp_path, n_files=4)
+    (tmp_path / "other.py").write_text("no hits here\n", encoding="utf-8")
+    before = (tmp_path / "mod_02.py").read_text(encoding="utf-8")
+
+    preview = batch_replace_files("needle 3", "pin 3", path=str(tmp_path), write=False, diff=True)
+    assert [c["lines"] for c in preview] == [[4]] * 4
+    assert not any(c["written"] for c in preview)
+    assert "+value_3 = 6  # pin 3" in preview[2]["diff"]
+    assert (tmp_path / "mod_02.py").read_text(encoding="utf-8") == before
+
+    changes = batch_replace_files(r"needle (\d)", r"pin \1", path=str(tmp_path), regex=True, jobs=2, chunk_size=1)
+    assert len(changes) == 4 and all(c["written"] for c in changes)
+    assert (tmp_path / "mod_02.py").read_text(encoding="utf-8") == before.replace("needle", "pin")
+    assert search_files("needle", path=str(tmp_path)) == []
+
+
+def test_batch_replace_inserts_literal_replacements_as_is():
+    from greaper.algorithms.replace import batch_replace
+
+    lines = ["x = a.b\n"]
+    for word in (False, True):
+        assert batch_replace(lines, "a", r"x\ty\1\g<0>", word=word) == ["x = x\\ty\\1\\g<0>.b\n"]
+    assert batch_replace(lines, r"(\w)\.", r"\1\t", regex=True) == ["x = a\tb\n"]
+
+
+def test_batch_replace_files_writes_through_symlinks_once(tmp_path):
+    from greaper.core import batch_replace_files
+
+    (tmp_path / "a.py").write_text("x = needle\n", encoding="utf-8")
+    (tmp_path / "link.py").symlink_to("a.py")
+    changes = batch_replace_files("needle", "needle2", path=str(tmp_path))
+    assert len(changes) == 1 and changes[0]["written"]
+    assert (tmp_path / "link.py").is_symlink()
+    assert (tmp_path / "a.py").read_text(encoding="utf-8") == "x = needle2\n"
+
+
+def test_syntax_aware_replace_keeps_line_breaks_in_step_with_search(tmp_path):
+    from greaper.core import batch_replace_files
+
+    # Form feeds and U+2028 are not line breaks for the search, so not for replace either
+    texts = {
+        "ff.py": "a\x0cb\x0cc\n# needle here\nneedle = 1\n",
+        "ls.py": "s = 'x\u2028y'\r\n# needle here\r\nneedle = 1\r\n",
+    }
+    for name, text in texts.items():
+        (tmp_path / name).write_text(text, encoding="utf-8", newline="")
+    options = dict(path=str(tmp_path), syntax_aware=True, syntax_mode="comment")
+    assert [r[1] for r in search_files("needle", **options)] == [2, 2]
+
+    preview = batch_replace_files("needle", "pin", write=False, diff=True, **options)
+    assert [c["lines"] for c in preview] == [[2], [2]]
+    batch_replace_files("needle", "pin", **options)
+    for name, text in texts.items():
+        assert (tmp_path / name).read_bytes() == text.replace("# needle", "# pin").encode("utf-8")
+
+
+def test_results_are_match_records_with_columns(tmp_path):
+    from greaper.integraton import export_for_vim_quickfix
+    from greaper.results import Match
+
+    (tmp_path / "a.py").write_text("first\n    x = needle\nlast\n", encoding="utf-8")
+    for bytes_mode in (True, False):
+        [match] = search_files(
+            "needle", path=str(tmp_path), context=1, bytes_mode=bytes_mode, result_cache=False,
+        )
+        assert isinstance(match, Match)
+        assert match.span == (8, 14) and match.file.endswith("a.py")
+        assert match._table is not None  # context not read yet
+        assert match == (match.file, 2, "x = needle", ["first"], ["last"])
+        file, line, text, before, after = match
+        assert (line, before, after) == (2, ["first"], ["last"])
+    assert export_for_vim_quickfix("needle", str(tmp_path)).endswith("a.py:2:9: x = needle")
@@ -0,0 +1,38 @@
+import os
+
+from greaper.filewalker import is_ignored, parse_ignore_file, walk_files
+
+
+def test_ignore_rules_follow_gitignore_semantics():
+    rules = parse_ignore_file(["*.log", "!keep.log", "/build/", "docs/**/tmp"])
+    assert is_ignored("a/b.log", False, rules)
+    assert not is_ignored("a/keep.log", False, rules)
+    assert is_ignored("build", True, rules)
+    assert not is_ignored("src/build", True, rules)
+    assert not is_ignored("build", False, rules)
+    assert is_ignored("docs/x/y/tmp", False, rules)
+
+
+def test_walk_prunes_excluded_and_ignored_dirs(tmp_path):
+    for rel in ["src/app.py", "src/app.log", "node_modules/pkg/index.js", ".git/HEAD", "out/gen.py"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x\n", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text("*.log\nout/\n", encoding="utf-8")
+
+    found = {os.path.relpath(f, tmp_path) for f in walk_files(tmp_path, exclude=["node_modules"])}
+    assert found == {".gitignore", os.path.join("src", "app.py")}
+    threaded = {os.path.relpath(f, tmp_path) for f in walk_files(tmp_path, exclude=["node_modules"], threads=4)}
+    assert threaded == found
+    assert os.path.join("out", "gen.py") in {
+        os.path.relpath(f, tmp_path) for f in walk_files(tmp_path, ignore_files=False)
+    }
+
+
+def test_file_globs_do_not_prune_directories(tmp_path):
+    for rel in ["x.log/app.py", "run.log", "cache/data.py", "src/cache"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x\n", encoding="utf-8")
+
+    found = {os.path.relpath(f, tmp_path) for f in walk_files(tmp_path, exclude=["*.log", "cache/"])}
+    # '*.log' only drops files; 'cache/' only drops the directory
+    assert found == {os.path.join("x.log", "app.py"), os.path.join("src", "cache")}
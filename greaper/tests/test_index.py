@@ -0,0 +1,30 @@
+from greaper.core import search_files
+from greaper.index import TrigramIndex, plan_query
+
+
+def test_plan_query_falls_back_without_trigrams():
+    assert plan_query("ab") is None
+    assert plan_query(r"a.b|c", regex=True) is None
+    assert plan_query(r"needle\d+", regex=True) is not None
+
+
+def test_index_filters_candidates_and_refreshes(tmp_path):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "a.txt").write_text("alpha needle\n", encoding="utf-8")
+    (tree / "b.txt").write_text("beta haystack\n", encoding="utf-8")
+    db = tmp_path / "index.db"
+    with TrigramIndex(tree, index_path=db) as index:
+        assert index.build()["added"] == 2
+        is_candidate = index.candidate_filter("needle")
+        assert is_candidate(str(tree / "a.txt"))
+        assert not is_candidate(str(tree / "b.txt"))
+
+    (tree / "b.txt").write_text("beta needle, longer now\n", encoding="utf-8")
+    # Stale entries are scanned even before the index is refreshed
+    hits = search_files("needle", path=str(tree), index=str(db))
+    assert sorted(h[0] for h in hits) == sorted([str(tree / "a.txt"), str(tree / "b.txt")])
+
+    with TrigramIndex(tree, index_path=db) as index:
+        stats = index.update()
+    assert (stats["updated"], stats["unchanged"]) == (1, 1)
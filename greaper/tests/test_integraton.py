@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+
+from greaper.integraton import (
+    export_as_csv, export_as_markdown, export_for_sublime, export_for_vim_quickfix,
+    stream_csv, stream_ndjson, stream_quickfix, stream_sublime,
+)
+
+
+def test_streaming_exporters_match_buffered_ones(tmp_path, make_tree):
+    make_tree(tmp_path, n_files=3)
+    path = str(tmp_path)
+
+    out = io.StringIO()
+    assert stream_quickfix("needle", path, out=out) == 15
+    assert out.getvalue() == export_for_vim_quickfix("needle", path) + "\n"
+
+    out = io.StringIO()
+    stream_sublime("needle", path, out=out)
+    assert out.getvalue() == export_for_sublime("needle", path) + "\n"
+
+    out = io.StringIO()
+    assert stream_ndjson("needle", path, out=out) == 15
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(r["line"], r["match"]) for r in records[:2]] == [(1, "value_0 = 0  # needle 0"), (2, "value_1 = 0  # needle 1")]
+
+    assert export_as_markdown("needle", path).count("\n") == 17
+
+    target = tmp_path / "hits.csv"
+    assert stream_csv("needle", path, export_path=str(target), include=["*.py"]) == 15
+    assert target.read_text(encoding="utf-8").splitlines()[0] == "file,line_number,line,before,after"
+
+
+def test_packed_columnar_export_round_trips(tmp_path, make_tree):
+    from greaper.columnar import read_packed
+    from greaper.core import search_files
+    from greaper.integraton import export_as_columnar
+
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    make_tree(tree, n_files=3)
+    target = tmp_path / "hits.grc"
+    assert export_as_columnar("needle", str(tree), export_path=str(target), format="packed", context=1) == ("packed", 15)
+    with read_packed(str(target)) as packed:
+        assert len(packed) == 15 and len(packed.files) == 3
+        assert list(packed.line) == [1, 2, 3, 4, 5] * 3
+        assert list(packed) == search_files("needle", path=str(tree), context=1)
+
+
+def test_csv_exports_name_the_patterns_hit(tmp_path):
+    (tmp_path / "api.py").write_text("old_api()\nold_api(); legacy_call()\n", encoding="utf-8")
+    options = dict(path=str(tmp_path), patterns=["legacy_call", "old_api"])
+    rows = list(csv.reader(io.StringIO(export_as_csv(None, **options))))
+    assert rows[0] == ["file", "line_number", "line", "before", "after", "pattern"]
+    assert [row[5] for row in rows[1:]] == ["old_api", "legacy_call|old_api"]
+
+    out = io.StringIO()
+    assert stream_csv(None, out=out, **options) == 2
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == rows
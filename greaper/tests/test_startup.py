@@ -0,0 +1,12 @@
+from greaper.startup import (
+    IMPORT_BUDGET_MS, STARTUP_MODULE, heavy_imports, import_time_ms, profile_imports, startup_report,
+)
+
+
+def test_core_import_budget():
+    # Best of three fresh interpreters, so one slow disk read does not fail the run
+    runs = [profile_imports(STARTUP_MODULE) for _ in range(3)]
+    for records in runs:
+        assert heavy_imports(records) == []
+    best = min(import_time_ms(records) for records in runs)
+    assert 0 < best <= IMPORT_BUDGET_MS, startup_report(min(runs, key=import_time_ms))
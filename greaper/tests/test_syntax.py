@@ -0,0 +1,38 @@
+from greaper.core import search_files
+from greaper.syntax import KIND_NAMES, classify_lines, language_for
+
+
+def kinds(source, language):
+    return [KIND_NAMES[k] for k in classify_lines(source.splitlines(keepends=True), language)]
+
+
+def test_state_carries_across_lines():
+    python = 'x = 1  # note\n"""Doc\nneedle here\n"""\n# needle\ns = "a # b"\n'
+    assert kinds(python, "python") == ["mixed", "string", "string", "string", "comment", "mixed"]
+    c = "int a; /* open\nneedle */\nchar *s = \"/* no */\";\n// done\n"
+    assert kinds(c, "c") == ["mixed", "comment", "mixed", "comment"]
+    assert language_for("pkg.zip::src/mod.py") == "python"
+
+
+def test_syntax_aware_search_sees_multiline_strings(tmp_path):
+    (tmp_path / "m.py").write_text('"""\nneedle in docstring\n"""\nneedle = 1\n', encoding="utf-8")
+    for bytes_mode in (True, False):
+        strings = search_files("needle", path=str(tmp_path), syntax_aware=True, syntax_mode="string", bytes_mode=bytes_mode)
+        code = search_files("needle", path=str(tmp_path), syntax_aware=True, syntax_mode="code", bytes_mode=bytes_mode)
+        assert [h[1] for h in strings] == [2]
+        assert [h[1] for h in code] == [4]
+
+
+def test_classification_is_lazy_and_memoized(tmp_path, monkeypatch):
+    from greaper import syntax
+    calls = []
+    feed = syntax.Lexer.feed
+    monkeypatch.setattr(syntax.Lexer, "feed", lambda self, line: calls.append(line) or feed(self, line))
+    (tmp_path / "hit.py").write_text("# needle\nx = 1\n", encoding="utf-8")
+    (tmp_path / "miss.py").write_text("# nothing\n" * 50, encoding="utf-8")
+    search_files("needle", path=str(tmp_path), syntax_aware=True, syntax_mode="all")
+    assert calls == []
+    assert len(search_files("needle", path=str(tmp_path), syntax_aware=True, syntax_mode="comment")) == 1
+    assert len(calls) == 3  # only hit.py was lexed
+    assert syntax.line_kind(tmp_path / "hit.py", 2) == "code"
+    assert len(calls) == 3
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+from greaper.watch import watch_search
+
+# Longest a test waits for a change to be reported
+DEADLINE_SECONDS = 10
+
+
+def watch_until_deadline(pattern, path, **kwargs):
+    """watch_search() that ends, instead of blocking forever, once the deadline passes."""
+    deadline = time.monotonic() + DEADLINE_SECONDS
+    return watch_search(pattern, path=path, interval=0.05, cancelled=lambda: time.monotonic() > deadline, **kwargs)
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_rescans_changed_files(tmp_path, polling):
+    (tmp_path / "a.py").write_text("needle\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("nothing\n", encoding="utf-8")
+    updates = watch_until_deadline("needle", str(tmp_path), polling=polling)
+    try:
+        file, results = next(updates)
+        assert file.endswith("a.py") and [r[1] for r in results] == [1]
+
+        # The watcher is already running, so edits made now are reported
+        (tmp_path / "b.py").write_text("x\nneedle\nneedle\n", encoding="utf-8")
+        file, results = next(updates, (None, None))
+        assert file is not None and file.endswith("b.py") and [r[1] for r in results] == [2, 3]
+
+        (tmp_path / "a.py").unlink()
+        file, results = next(updates, (None, None))
+        assert file is not None and file.endswith("a.py") and results == []
+    finally:
+        updates.close()
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_stops_when_cancelled_without_file_events(tmp_path, polling):
+    (tmp_path / "a.py").write_text("needle\n", encoding="utf-8")
+    stop = []
+    updates = watch_search("needle", path=str(tmp_path), interval=0.05, polling=polling, cancelled=lambda: bool(stop))
+    assert next(updates)[0].endswith("a.py")
+    stop.append(True)
+    # Nothing changes on disk: the generator still ends after the next poll
+    assert list(updates) == []
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_skips_ignored_and_excluded_trees(tmp_path, polling):
+    from greaper.watch import InotifyWatcher, open_watcher
+
+    (tmp_path / ".gitignore").write_text("node_modules/\nbuild/\n*.log\n", encoding="utf-8")
+    for name in ("node_modules", "vendor"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "dep.py").write_text("nothing\n", encoding="utf-8")
+    (tmp_path / "a.py").write_text("needle\n", encoding="utf-8")
+    watcher = open_watcher(str(tmp_path), exclude=["vendor"], polling=polling)
+    if isinstance(watcher, InotifyWatcher):
+        # Only the root is watched: both subdirectories are pruned
+        assert [rel_dir for _, rel_dir, _ in watcher._dirs.values()] == [""]
+    watcher.close()
+
+    updates = watch_until_deadline("needle", str(tmp_path), exclude=["vendor"], polling=polling)
+    try:
+        assert next(updates)[0].endswith("a.py")
+        (tmp_path / "build").mkdir()
+        for ignored in ("node_modules/dep.py", "vendor/dep.py", "build/out.py", "debug.log"):
+            (tmp_path / ignored).write_text("needle\n", encoding="utf-8")
+        (tmp_path / "z.py").write_text("needle\n", encoding="utf-8")
+        file, results = next(updates, (None, None))
+        assert file is not None and file.endswith("z.py")
+    finally:
+        updates.close()